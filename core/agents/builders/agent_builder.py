@@ -8,7 +8,12 @@ from typing import Any, Dict, List, Optional, Type, TYPE_CHECKING
 
 from ..enum import AgentType, AgentInputType, AgentOutputType, AgentOutputFormat
 from ..spec.agent_spec import AgentSpec
-from ..constants import DEFAULT_MAX_ITERATIONS, DEFAULT_TIMEOUT_SECONDS
+from ..constants import (
+    DEFAULT_MAX_ITERATIONS,
+    DEFAULT_TIMEOUT_SECONDS,
+    DEFAULT_PARALLEL_ACTIONS,
+    DEFAULT_MAX_PARALLEL_ACTIONS,
+)
 from ..exceptions import AgentBuildError
 
 if TYPE_CHECKING:
@@ -100,6 +105,9 @@ class AgentBuilder:
         # Constraints
         self._max_iterations: int = DEFAULT_MAX_ITERATIONS
         self._timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+        self._parallel_actions: bool = DEFAULT_PARALLEL_ACTIONS
+        self._max_parallel_actions: int = DEFAULT_MAX_PARALLEL_ACTIONS
+        self._tool_timeout_seconds: Optional[float] = None
         
         # Input/Output types
         self._supported_input_types: List[AgentInputType] = [AgentInputType.TEXT]
@@ -269,6 +277,17 @@ class AgentBuilder:
         self._timeout_seconds = timeout_seconds
         return self
     
+    def with_parallel_actions(
+        self,
+        max_concurrency: int = DEFAULT_MAX_PARALLEL_ACTIONS,
+        tool_timeout_seconds: Optional[float] = None,
+    ) -> 'AgentBuilder':
+        """Run all actions of an LLM turn concurrently."""
+        self._parallel_actions = True
+        self._max_parallel_actions = max_concurrency
+        self._tool_timeout_seconds = tool_timeout_seconds
+        return self
+    
     # ==================== Input/Output ====================
     
     def with_input_types(self, types: List[AgentInputType]) -> 'AgentBuilder':
@@ -381,6 +400,9 @@ class AgentBuilder:
             output_schema=self._output_schema,
             max_iterations=self._max_iterations,
             timeout_seconds=self._timeout_seconds,
+            parallel_actions=self._parallel_actions,
+            max_parallel_actions=self._max_parallel_actions,
+            tool_timeout_seconds=self._tool_timeout_seconds,
             system_prompt=self._system_prompt,
             system_prompt_label=self._system_prompt_label,
             version=self._version,
@@ -91,6 +91,9 @@ CONFIG_TIMEOUT = "timeout"
 
 DEFAULT_MAX_ITERATIONS = 10
 DEFAULT_TIMEOUT_SECONDS = 300
+DEFAULT_PARALLEL_ACTIONS = False
+DEFAULT_MAX_PARALLEL_ACTIONS = 4
+DEFAULT_TOOL_TIMEOUT_SECONDS = 30.0
 DEFAULT_AGENT_TYPE = "react"
 DEFAULT_LOCALE = "en-US"
 DEFAULT_TIMEZONE = "UTC"
@@ -175,6 +178,7 @@ REACT_ACTION = "action"
 REACT_ACTION_INPUT = "action_input"
 REACT_OBSERVATION = "observation"
 REACT_FINAL_ANSWER = "final_answer"
+REACT_ACTIONS = "actions"
 
 # ============================================================================
 # MODEL CONFIG
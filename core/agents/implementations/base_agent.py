@@ -5,7 +5,10 @@ Provides an abstract base class for all agent implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, TYPE_CHECKING
+import asyncio
+import json
+import re
 import time
 
 from ..interfaces.agent_interfaces import IAgent
@@ -19,6 +22,7 @@ from ..exceptions import (
     ToolExecutionError,
     ToolNotFoundError,
 )
+from ..constants import DEFAULT_TOOL_TIMEOUT_SECONDS
 
 if TYPE_CHECKING:
     from ...llms.interfaces.llm_interfaces import ILLM
@@ -474,6 +478,21 @@ class BaseAgent(IAgent, ABC):
             raise ToolNotFoundError(tool_name, list(self._tool_map.keys()))
         return tool
     
+    def _is_speculative_tool(self, tool_name: str) -> bool:
+        """
+        Check whether a tool opted in to speculative execution.
+    
+        Speculative tools may be started before the LLM has finished its
+        response, so only side-effect-free tools should opt in.
+        """
+        tool = self._tool_map.get(tool_name)
+        if tool is None:
+            return False
+        execution = getattr(getattr(tool, 'spec', None), 'execution', None)
+        if execution is not None:
+            return bool(getattr(execution, 'speculative', False))
+        return bool(getattr(tool, 'speculative', False))
+    
     async def _execute_tool(
         self,
         tool_name: str,
@@ -521,6 +540,111 @@ class BaseAgent(IAgent, ABC):
         except Exception as e:
             raise ToolExecutionError(tool_name, e)
     
+    def _get_tool_timeout(self, tool_name: str) -> float:
+        """
+        Timeout for one parallel action.
+        
+        The agent's tool_timeout_seconds when set, else the tool spec's
+        timeout_s, else DEFAULT_TOOL_TIMEOUT_SECONDS.
+        """
+        if self.spec.tool_timeout_seconds is not None:
+            return self.spec.tool_timeout_seconds
+        tool = self._tool_map.get(tool_name)
+        timeout = getattr(getattr(tool, 'spec', None), 'timeout_s', None)
+        return timeout or DEFAULT_TOOL_TIMEOUT_SECONDS
+    
+    async def _execute_tools_parallel(
+        self,
+        actions: List[Tuple[str, Dict[str, Any]]],
+        ctx: AgentContext
+    ) -> List[Any]:
+        """
+        Execute several tool calls concurrently.
+        
+        At most spec.max_parallel_actions calls run at once and each call is
+        bounded by its tool timeout. A failing call does not affect the others.
+        
+        Args:
+            actions: (tool_name, args) pairs
+            ctx: Agent context
+            
+        Returns:
+            One entry per action, in the order of `actions`: the tool result,
+            or the exception the call raised
+        """
+        semaphore = asyncio.Semaphore(self.spec.max_parallel_actions)
+        
+        async def run(tool_name: str, args: Dict[str, Any]) -> Any:
+            async with semaphore:
+                timeout = self._get_tool_timeout(tool_name)
+                try:
+                    return await asyncio.wait_for(
+                        self._execute_tool(tool_name, args, ctx), timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    return ToolExecutionError(
+                        tool_name, details={"error": f"Timed out after {timeout}s"}
+                    )
+                except Exception as e:
+                    return e
+        
+        return list(await asyncio.gather(*(run(name, args) for name, args in actions)))
+    
+    def _parse_actions(self, content: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Parse every `Action:` / `Action Input:` pair of a response, in order.
+        
+        Inputs that are not valid JSON are wrapped as {"input": <text>}. Actions
+        after a model-written `Observation:` are ignored, since they depend on
+        a result the model imagined.
+        """
+        observation = re.search(r'Observation:', content, re.IGNORECASE)
+        if observation:
+            content = content[:observation.start()]
+        matches = list(re.finditer(r'Action:\s*(\w+)', content, re.IGNORECASE))
+        actions = []
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            segment = content[match.end():end]
+            action_input: Dict[str, Any] = {}
+            input_match = re.search(
+                r'Action Input:\s*(.+?)(?=Observation:|Thought:|$)', segment, re.DOTALL | re.IGNORECASE
+            )
+            if input_match:
+                input_str = input_match.group(1).strip()
+                try:
+                    action_input = json.loads(input_str)
+                except json.JSONDecodeError:
+                    action_input = {"input": input_str}
+            actions.append((match.group(1), action_input))
+        return actions
+    
+    def _parse_tool_calls(self, response: Any) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Convert native LLM tool calls (OpenAI/Azure `tool_calls`) to (name, args) pairs.
+        
+        Returns:
+            Tool calls in response order; empty if the response has none
+        """
+        actions = []
+        for call in getattr(response, 'tool_calls', None) or []:
+            function = call.get('function', call)
+            arguments = function.get('arguments') or {}
+            if isinstance(arguments, str):
+                try:
+                    arguments = json.loads(arguments)
+                except json.JSONDecodeError:
+                    arguments = {"input": arguments}
+            actions.append((function.get('name', ''), arguments))
+        return actions
+    
+    @staticmethod
+    def _format_observation(result: Any) -> str:
+        """Format a tool result, or the exception it raised, as an observation."""
+        if isinstance(result, Exception):
+            return f"Error: {str(result)}"
+        return str(result.content) if hasattr(result, 'content') else str(result)
+    
     def _get_tool_descriptions(self) -> str:
         """Get formatted tool descriptions for prompts."""
         descriptions = []
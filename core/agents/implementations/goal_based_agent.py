@@ -5,7 +5,7 @@ An agent that works towards achieving specific goals using a checklist.
 Uses the prompt registry for prompt management with fallback to built-in defaults.
 """
 
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 
 from .base_agent import BaseAgent
 from ..spec.agent_context import AgentContext
@@ -86,6 +86,30 @@ Complete this task. If you need to use a tool, respond with:
 Action: <tool_name>
 Action Input: <json parameters>
 
+If you can complete without a tool, respond with:
+Result: <your answer or output>'''
+
+    # Task execution prompt when spec.parallel_actions is set: independent
+    # tool calls of one task may be requested together
+    DEFAULT_PARALLEL_TASK_EXECUTION_PROMPT = '''You are working on the following goal: {goal}
+
+Current task: {task}
+
+{context}
+
+{tools_available}
+
+Complete this task. If you need to use a tool, respond with:
+Action: <tool_name>
+Action Input: <json parameters>
+
+If the task needs several tool calls that do not depend on each other's
+results, list one Action/Action Input pair per call; they run at the same time:
+Action: <tool_name>
+Action Input: <json parameters>
+Action: <other_tool_name>
+Action Input: <json parameters>
+
 If you can complete without a tool, respond with:
 Result: <your answer or output>'''
 
@@ -280,7 +304,8 @@ Final Answer:'''
         # Get prompt from registry or use default
         execution_template = await self._get_prompt(
             self.EXECUTION_PROMPT_LABEL,
-            self.DEFAULT_TASK_EXECUTION_PROMPT
+            self.DEFAULT_PARALLEL_TASK_EXECUTION_PROMPT if self.spec.parallel_actions
+            else self.DEFAULT_TASK_EXECUTION_PROMPT
         )
         
         prompt = execution_template.format(
@@ -294,6 +319,12 @@ Final Answer:'''
         response = await self._call_llm(messages, ctx)
         content = response.content if hasattr(response, 'content') else str(response)
         
+        # Parallel mode: run every action (or native tool call) of the task at once
+        if self.spec.parallel_actions:
+            actions = self._parse_tool_calls(response) or self._parse_actions(content)
+            if actions:
+                return await self._execute_actions_parallel(actions, ctx)
+        
         # Check if tool use is indicated
         if "Action:" in content:
             import re
@@ -322,6 +353,31 @@ Final Answer:'''
         
         return content
     
+    async def _execute_actions_parallel(
+        self,
+        actions: List[Tuple[str, Dict[str, Any]]],
+        ctx: AgentContext
+    ) -> str:
+        """
+        Execute a task's actions concurrently.
+        
+        Returns:
+            Observations in action order, one "<tool>: <observation>" line each
+            
+        Raises:
+            The first action's error if every action failed
+        """
+        results = await self._execute_tools_parallel(actions, ctx)
+        errors = [r for r in results if isinstance(r, Exception)]
+        if len(errors) == len(results):
+            raise errors[0]
+        if len(results) == 1:
+            return self._format_observation(results[0])
+        return "\n".join(
+            f"{name}: {self._format_observation(result)}"
+            for (name, _), result in zip(actions, results)
+        )
+    
     async def _generate_final_result(self, goal: str, ctx: AgentContext) -> str:
         """Generate final result after all tasks complete."""
         context = ""
@@ -5,13 +5,15 @@ Implements the Reason-Act pattern: Thought -> Action -> Observation -> Thought.
 Uses the prompt registry for prompt management with fallback to built-in defaults.
 """
 
+import asyncio
 import json
 import re
-from typing import Any, Optional, Dict, AsyncIterator
+from typing import Any, Optional, Dict, AsyncIterator, List, Tuple
 
 from .base_agent import BaseAgent
 from ..spec.agent_context import AgentContext
 from ..spec.agent_result import AgentStreamChunk
+from ..runtimes.react_stream_parser import IncrementalReactParser, ReactActionCandidate
 from ..enum import AgentState
 from ..constants import (
     REACT_THOUGHT,
@@ -64,6 +66,14 @@ class ReactAgent(BaseAgent):
         Action: <tool_name>
         Action Input: <json parameters>
         
+        OR (with spec.parallel_actions, all actions run concurrently)
+        
+        Thought: <reasoning>
+        Action: <tool_name>
+        Action Input: <json parameters>
+        Action: <other_tool_name>
+        Action Input: <json parameters>
+        
         OR
         
         Thought: <reasoning>
@@ -89,6 +99,30 @@ Final Answer: the final answer to the original input question
 
 Begin!
 
+Question: {question}
+{scratchpad}'''
+    
+    # Default prompt template when spec.parallel_actions is set: several
+    # independent actions may be requested in one turn
+    DEFAULT_PARALLEL_REACT_PROMPT_TEMPLATE = '''You are a helpful AI assistant that can use tools to answer questions.
+
+Available tools:
+{tools}
+
+Use the following format:
+
+Question: the input question you must answer
+Thought: you should always think about what to do
+Action: the action to take, should be one of [{tool_names}]
+Action Input: the input to the action (as valid JSON)
+... (list several Action/Action Input pairs when the actions do not depend on each other's results; they run at the same time)
+Observation: the result of each action, in the same order
+... (this Thought/Action/Action Input/Observation can repeat N times)
+Thought: I now know the final answer
+Final Answer: the final answer to the original input question
+
+Begin!
+
 Question: {question}
 {scratchpad}'''
     
@@ -129,9 +163,15 @@ Question: {question}
                 pass
         
         # Use default
-        self._cached_prompt_template = self.DEFAULT_REACT_PROMPT_TEMPLATE
+        self._cached_prompt_template = self._get_default_prompt_template()
         return self._cached_prompt_template
     
+    def _get_default_prompt_template(self) -> str:
+        """Built-in template matching the agent's action mode."""
+        if self.spec.parallel_actions:
+            return self.DEFAULT_PARALLEL_REACT_PROMPT_TEMPLATE
+        return self.DEFAULT_REACT_PROMPT_TEMPLATE
+    
     async def _execute_iteration(
         self,
         input_data: Any,
@@ -171,18 +211,23 @@ Question: {question}
                 else:
                     self.scratchpad.append(f"{SCRATCHPAD_THOUGHT_PREFIX}{parsed[REACT_THOUGHT]}")
         
+        # Parallel mode: run every action (or native tool call) of this turn at once
+        if self.spec.parallel_actions:
+            actions = self._parse_tool_calls(response) or self._parse_actions(response_text)
+            if actions:
+                results = await self._execute_tools_parallel(actions, ctx)
+                # Record in response order, independent of completion order
+                for (action_name, action_input), result in zip(actions, results):
+                    self._record_action(action_name, action_input)
+                    self._record_observation(self._format_observation(result))
+                return None, True
+        
         # Process action
         if parsed.get(REACT_ACTION):
             action_name = parsed[REACT_ACTION]
             action_input = parsed.get(REACT_ACTION_INPUT, {})
             
-            if self.scratchpad:
-                if hasattr(self.scratchpad, 'add_action'):
-                    self.scratchpad.add_action(action_name, action_input)
-                else:
-                    self.scratchpad.append(f"{SCRATCHPAD_ACTION_PREFIX}{action_name}")
-                    if action_input:
-                        self.scratchpad.append(f"Action Input: {json.dumps(action_input)}")
+            self._record_action(action_name, action_input)
             
             # Execute tool
             try:
@@ -198,11 +243,7 @@ Question: {question}
                 observation = f"Error: {str(e)}"
             
             # Add observation to scratchpad
-            if self.scratchpad:
-                if hasattr(self.scratchpad, 'add_observation'):
-                    self.scratchpad.add_observation(observation)
-                else:
-                    self.scratchpad.append(f"{SCRATCHPAD_OBSERVATION_PREFIX}{observation}")
+            self._record_observation(observation)
             
             # Continue iteration
             return None, True
@@ -211,6 +252,24 @@ Question: {question}
         # Try to extract any content as final answer
         return response_text, False
     
+    def _record_action(self, action_name: str, action_input: Dict[str, Any]) -> None:
+        """Add an action to the scratchpad."""
+        if self.scratchpad:
+            if hasattr(self.scratchpad, 'add_action'):
+                self.scratchpad.add_action(action_name, action_input)
+            else:
+                self.scratchpad.append(f"{SCRATCHPAD_ACTION_PREFIX}{action_name}")
+                if action_input:
+                    self.scratchpad.append(f"Action Input: {json.dumps(action_input)}")
+    
+    def _record_observation(self, observation: str) -> None:
+        """Add an observation to the scratchpad."""
+        if self.scratchpad:
+            if hasattr(self.scratchpad, 'add_observation'):
+                self.scratchpad.add_observation(observation)
+            else:
+                self.scratchpad.append(f"{SCRATCHPAD_OBSERVATION_PREFIX}{observation}")
+    
     async def _stream_iteration(
         self,
         input_data: Any,
@@ -218,39 +277,131 @@ Question: {question}
         iteration: int,
         system_prompt: Optional[str]
     ) -> AsyncIterator[AgentStreamChunk]:
-        """Stream a ReAct iteration."""
+        """
+        Stream a ReAct iteration.
+        
+        If the response names a tool that opted in to speculative execution
+        (ExecutionConfig.speculative), the tool is started as soon as its
+        Action Input JSON is complete, while the rest of the response is
+        still streaming. The speculative result is used only if the final
+        parse yields the same action and arguments; otherwise it is cancelled
+        and the parsed action runs normally.
+        
+        With spec.parallel_actions, a response with several actions runs them
+        concurrently once it has finished streaming (speculation is dropped);
+        observations are yielded and recorded in response order.
+        """
         prompt = await self._build_react_prompt(input_data, system_prompt)
         messages = [{"role": "user", "content": prompt}]
         
-        # Stream LLM response
-        response_text = ""
-        async for chunk in self.llm.stream_answer(messages, ctx):
-            response_text += chunk.content
-            yield AgentStreamChunk(
-                content=chunk.content,
-                chunk_type="thought",
-                iteration=iteration,
-                is_final=False,
-                state=AgentState.RUNNING,
-            )
-        
-        # Parse completed response
-        parsed = self._parse_react_response(response_text)
-        
-        if parsed.get(REACT_FINAL_ANSWER):
-            yield AgentStreamChunk(
-                content=parsed[REACT_FINAL_ANSWER],
-                chunk_type="output",
-                iteration=iteration,
-                is_final=True,
-                state=AgentState.COMPLETED,
-            )
-            return
-        
-        if parsed.get(REACT_ACTION):
-            action_name = parsed[REACT_ACTION]
-            action_input = parsed.get(REACT_ACTION_INPUT, {})
+        parser = IncrementalReactParser() if self._has_speculative_tools() else None
+        candidate: Optional[ReactActionCandidate] = None
+        speculative_task: Optional[asyncio.Task] = None
+        
+        try:
+            # Stream LLM response
+            response_text = ""
+            async for chunk in self.llm.stream_answer(messages, ctx):
+                response_text += chunk.content
+                if parser is not None and not parser.is_done:
+                    found = parser.feed(chunk.content)
+                    if found is not None and self._is_speculative_tool(found.action):
+                        candidate = found
+                        speculative_task = asyncio.ensure_future(
+                            self._execute_tool(found.action, found.action_input, ctx)
+                        )
+                yield AgentStreamChunk(
+                    content=chunk.content,
+                    chunk_type="thought",
+                    iteration=iteration,
+                    is_final=False,
+                    state=AgentState.RUNNING,
+                )
+            
+            # Parse completed response
+            parsed = self._parse_react_response(response_text)
+            
+            if parsed.get(REACT_FINAL_ANSWER):
+                yield AgentStreamChunk(
+                    content=parsed[REACT_FINAL_ANSWER],
+                    chunk_type="output",
+                    iteration=iteration,
+                    is_final=True,
+                    state=AgentState.COMPLETED,
+                )
+                return
             
+            if self.spec.parallel_actions:
+                actions = self._parse_actions(response_text)
+                if len(actions) > 1:
+                    self._discard_speculation(speculative_task)
+                    speculative_task = None
+                    async for out in self._stream_parallel_actions(actions, parsed, ctx, iteration):
+                        yield out
+                    return
+            
+            if parsed.get(REACT_ACTION):
+                action_name = parsed[REACT_ACTION]
+                action_input = parsed.get(REACT_ACTION_INPUT, {})
+                
+                speculated = (
+                    speculative_task is not None
+                    and candidate.action == action_name
+                    and candidate.action_input == action_input
+                )
+                
+                yield AgentStreamChunk(
+                    content=f"Executing tool: {action_name}",
+                    chunk_type="action",
+                    iteration=iteration,
+                    is_final=False,
+                    state=AgentState.RUNNING,
+                    tool_name=action_name,
+                    tool_args=action_input,
+                    metadata={"speculative": True} if speculated else {},
+                )
+                
+                try:
+                    if speculated:
+                        task, speculative_task = speculative_task, None
+                        result = await task
+                    else:
+                        self._discard_speculation(speculative_task)
+                        speculative_task = None
+                        result = await self._execute_tool(action_name, action_input, ctx)
+                    observation = str(result.content) if hasattr(result, 'content') else str(result)
+                except Exception as e:
+                    observation = f"Error: {str(e)}"
+                
+                # Update scratchpad
+                if self.scratchpad:
+                    if hasattr(self.scratchpad, 'add_thought'):
+                        self.scratchpad.add_thought(parsed.get(REACT_THOUGHT, ""))
+                        self.scratchpad.add_action(action_name, action_input)
+                        self.scratchpad.add_observation(observation)
+                
+                yield AgentStreamChunk(
+                    content=observation,
+                    chunk_type="observation",
+                    iteration=iteration,
+                    is_final=False,
+                    state=AgentState.RUNNING,
+                    tool_name=action_name,
+                    tool_result=observation,
+                )
+        finally:
+            # Speculation that was not adopted (final answer, mismatch, closed stream)
+            self._discard_speculation(speculative_task)
+    
+    async def _stream_parallel_actions(
+        self,
+        actions: List[Tuple[str, Dict[str, Any]]],
+        parsed: Dict[str, Any],
+        ctx: AgentContext,
+        iteration: int
+    ) -> AsyncIterator[AgentStreamChunk]:
+        """Run the actions of one streamed turn concurrently and yield their chunks."""
+        for action_name, action_input in actions:
             yield AgentStreamChunk(
                 content=f"Executing tool: {action_name}",
                 chunk_type="action",
@@ -260,20 +411,15 @@ Question: {question}
                 tool_name=action_name,
                 tool_args=action_input,
             )
-            
-            try:
-                result = await self._execute_tool(action_name, action_input, ctx)
-                observation = str(result.content) if hasattr(result, 'content') else str(result)
-            except Exception as e:
-                observation = f"Error: {str(e)}"
-            
-            # Update scratchpad
-            if self.scratchpad:
-                if hasattr(self.scratchpad, 'add_thought'):
-                    self.scratchpad.add_thought(parsed.get(REACT_THOUGHT, ""))
-                    self.scratchpad.add_action(action_name, action_input)
-                    self.scratchpad.add_observation(observation)
-            
+        
+        results = await self._execute_tools_parallel(actions, ctx)
+        
+        if self.scratchpad and hasattr(self.scratchpad, 'add_thought'):
+            self.scratchpad.add_thought(parsed.get(REACT_THOUGHT, ""))
+        for (action_name, action_input), result in zip(actions, results):
+            observation = self._format_observation(result)
+            self._record_action(action_name, action_input)
+            self._record_observation(observation)
             yield AgentStreamChunk(
                 content=observation,
                 chunk_type="observation",
@@ -284,6 +430,20 @@ Question: {question}
                 tool_result=observation,
             )
     
+    def _has_speculative_tools(self) -> bool:
+        """Check whether any tool opted in to speculative execution."""
+        return any(self._is_speculative_tool(name) for name in self._tool_map)
+    
+    @staticmethod
+    def _discard_speculation(task: Optional[asyncio.Task]) -> None:
+        """Cancel an unused speculative tool call and swallow its outcome."""
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+    
     async def _build_react_prompt(
         self,
         input_data: Any,
@@ -326,7 +486,7 @@ Question: {question}
         else:
             # If custom system prompt doesn't have our variables,
             # use default template
-            return self.DEFAULT_REACT_PROMPT_TEMPLATE.format(**variables)
+            return self._get_default_prompt_template().format(**variables)
     
     def _parse_react_response(self, response: str) -> Dict[str, Any]:
         """
@@ -15,6 +15,9 @@ from .scratchpad import BasicScratchpad, StructuredScratchpad, ScratchpadFactory
 from .checklist import BasicChecklist, ChecklistFactory
 from .observers import NoOpObserver, LoggingObserver, ObserverFactory
 
+# Streaming ReAct parser (speculative tool execution)
+from .react_stream_parser import IncrementalReactParser, ReactActionCandidate
+
 # Agent factory (remains in agents module)
 from .agent_factory import AgentFactory, AgentTypeRegistration
 
@@ -34,6 +37,9 @@ __all__ = [
     "NoOpObserver",
     "LoggingObserver",
     "ObserverFactory",
+    # Streaming Parser
+    "IncrementalReactParser",
+    "ReactActionCandidate",
     # Agent Factory
     "AgentFactory",
     "AgentTypeRegistration",
@@ -0,0 +1,139 @@
+"""
+Incremental ReAct Parser.
+
+Detects a complete tool call in a ReAct response while it is still streaming,
+so the tool can be started before the model finishes its turn.
+
+A call is complete once the stream contains `Action: <tool_name>` followed by
+`Action Input:` and a syntactically complete JSON object. The JSON is parsed
+incrementally (O(delta) per chunk) with IncrementalJSONParser.
+
+The parser never reports a call if `Final Answer:` appears first, or if the
+action input is not a JSON object.
+"""
+
+import copy
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from utils.converters.incremental_json_parser import IncrementalJSONParser
+
+
+# An action name is complete once a non-word character follows it
+_ACTION_RE = re.compile(r'Action:\s*(\w+)(?=\W)', re.IGNORECASE)
+_PARTIAL_ACTION_RE = re.compile(r'Action:\s*\w*$', re.IGNORECASE)
+_ACTION_INPUT_RE = re.compile(r'Action Input:', re.IGNORECASE)
+_FINAL_ANSWER_RE = re.compile(r'Final Answer:', re.IGNORECASE)
+
+# Markers may be split across chunks; re-scan this many trailing characters
+_RESCAN_CHARS = 16
+
+_SEEK_ACTION, _SEEK_INPUT, _SEEK_JSON, _IN_JSON, _DONE = range(5)
+
+
+@dataclass
+class ReactActionCandidate:
+    """Tool call detected before the ReAct response finished streaming."""
+    action: str
+    action_input: Dict[str, Any]
+
+
+class IncrementalReactParser:
+    """
+    Streaming detector for the first `Action` / `Action Input` pair.
+
+    Usage:
+        parser = IncrementalReactParser()
+        async for chunk in llm.stream_answer(messages, ctx):
+            candidate = parser.feed(chunk.content)
+            if candidate:
+                task = asyncio.ensure_future(run_tool(candidate.action, candidate.action_input))
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all state and start a new response."""
+        self._text = ""
+        self._scan_from = 0
+        self._action_scan = 0
+        self._stage = _SEEK_ACTION
+        self._action: Optional[str] = None
+        self._json: Optional[IncrementalJSONParser] = None
+        self._json_fed = 0
+        self.candidate: Optional[ReactActionCandidate] = None
+
+    @property
+    def is_done(self) -> bool:
+        """True once a candidate was found or speculation was ruled out."""
+        return self._stage == _DONE
+
+    def feed(self, delta: str) -> Optional[ReactActionCandidate]:
+        """
+        Consume the next streamed chunk.
+
+        Args:
+            delta: Newly streamed text
+
+        Returns:
+            The tool call, on the chunk that completes it; None otherwise
+        """
+        if self._stage == _DONE or not delta:
+            return None
+
+        self._text += delta
+        scan_from = self._scan_from
+        self._scan_from = max(0, len(self._text) - _RESCAN_CHARS)
+
+        if self._stage != _IN_JSON and _FINAL_ANSWER_RE.search(self._text, scan_from):
+            self._stage = _DONE
+            return None
+
+        if self._stage == _SEEK_ACTION:
+            match = _ACTION_RE.search(self._text, self._action_scan)
+            if not match:
+                # Keep an unfinished "Action: name" in the next scan window
+                partial = _PARTIAL_ACTION_RE.search(self._text, self._action_scan)
+                self._action_scan = partial.start() if partial else self._scan_from
+                return None
+            self._action = match.group(1)
+            self._stage = _SEEK_INPUT
+            scan_from = match.end()
+
+        if self._stage == _SEEK_INPUT:
+            match = _ACTION_INPUT_RE.search(self._text, scan_from)
+            if not match:
+                return None
+            self._json_fed = match.end()
+            self._stage = _SEEK_JSON
+
+        if self._stage == _SEEK_JSON:
+            rest = self._text[self._json_fed:]
+            stripped = rest.lstrip()
+            if not stripped:
+                return None
+            if not stripped.startswith("{"):
+                self._stage = _DONE
+                return None
+            self._json_fed += len(rest) - len(stripped)
+            self._json = IncrementalJSONParser()
+            self._stage = _IN_JSON
+
+        return self._feed_json()
+
+    def _feed_json(self) -> Optional[ReactActionCandidate]:
+        update = self._json.feed(self._text[self._json_fed:])
+        self._json_fed = len(self._text)
+        if update.error is not None:
+            self._stage = _DONE
+            return None
+        if not update.is_complete:
+            return None
+        self._stage = _DONE
+        self.candidate = ReactActionCandidate(
+            action=self._action,
+            action_input=copy.deepcopy(update.value),
+        )
+        return self.candidate
@@ -13,6 +13,8 @@ from ..enum import AgentType, AgentInputType, AgentOutputType, AgentOutputFormat
 from ..constants import (
     DEFAULT_MAX_ITERATIONS,
     DEFAULT_TIMEOUT_SECONDS,
+    DEFAULT_PARALLEL_ACTIONS,
+    DEFAULT_MAX_PARALLEL_ACTIONS,
     ARBITRARY_TYPES_ALLOWED,
 )
 
@@ -38,6 +40,9 @@ class AgentSpec(BaseModel):
         Constraints:
         - max_iterations: Maximum iterations before stopping
         - timeout_seconds: Execution timeout
+        - parallel_actions: Run every action of an LLM turn concurrently
+        - max_parallel_actions: Concurrency bound for parallel actions
+        - tool_timeout_seconds: Timeout of every parallel action (overrides tool specs)
         
         Metadata:
         - version: Agent version
@@ -105,6 +110,20 @@ class AgentSpec(BaseModel):
         gt=0,
         description="Execution timeout in seconds"
     )
+    parallel_actions: bool = Field(
+        default=DEFAULT_PARALLEL_ACTIONS,
+        description="Accept several actions (or tool_calls) per LLM turn and run them concurrently"
+    )
+    max_parallel_actions: int = Field(
+        default=DEFAULT_MAX_PARALLEL_ACTIONS,
+        ge=1,
+        description="Maximum number of actions executing at once"
+    )
+    tool_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout per parallel action; None uses each tool spec's timeout_s"
+    )
     
     # System prompt / instructions
     system_prompt: Optional[str] = Field(
@@ -76,6 +76,8 @@ from .enum import (
     LLMType,
     StreamEventType,
     FinishReason,
+    EndpointSelectionStrategy,
+    CacheKeyMode,
 )
 
 # Exceptions
@@ -133,6 +135,10 @@ from .runtimes import (
     BasicStructuredHandler,
     NoOpStructuredHandler,
     StructuredHandlerFactory,
+    # Response Cache
+    LLMResponseCache,
+    InMemoryResponseCache,
+    SQLiteResponseCache,
 )
 
 # Runtimes - Model Registry and Factory
@@ -184,6 +190,8 @@ __all__ = [
     "LLMType",
     "StreamEventType",
     "FinishReason",
+    "EndpointSelectionStrategy",
+    "CacheKeyMode",
     # Exceptions
     "LLMError",
     "InputValidationError",
@@ -231,6 +239,10 @@ __all__ = [
     "BasicStructuredHandler",
     "NoOpStructuredHandler",
     "StructuredHandlerFactory",
+    # Response Cache
+    "LLMResponseCache",
+    "InMemoryResponseCache",
+    "SQLiteResponseCache",
     # Runtimes
     "BaseLLM",
     "BaseConnector",
@@ -96,6 +96,9 @@ CONFIG_API_VERSION = "api_version"
 CONFIG_TIMEOUT = "timeout"
 CONFIG_MAX_RETRIES = "max_retries"
 CONFIG_RETRY_DELAY = "retry_delay"
+CONFIG_SHARED_POOL = "shared_pool"  # Use the process-wide pooled transport
+CONFIG_ENDPOINT_SELECTION = "endpoint_selection"
+CONFIG_HEDGE_REQUESTS = "hedge_requests"
 
 # Model configuration
 CONFIG_MODEL_NAME = "model_name"
@@ -116,6 +119,21 @@ DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY_SECONDS = 1
 DEFAULT_BACKOFF_FACTOR = 2
+DEFAULT_SHARED_POOL = True
+
+# Endpoint selection (primary + backups)
+DEFAULT_ENDPOINT_SELECTION = "failover"
+DEFAULT_HEDGE_REQUESTS = False
+DEFAULT_ENDPOINT_LATENCY_WINDOW = 100  # Latency samples kept per endpoint
+DEFAULT_ENDPOINT_OUTCOME_WINDOW = 50  # Success/failure outcomes kept per endpoint
+DEFAULT_ENDPOINT_PRIOR_LATENCY_S = 1.0  # Assumed latency when no endpoint has samples
+DEFAULT_ENDPOINT_ERROR_PENALTY = 4.0  # Score multiplier per unit of error rate
+DEFAULT_ENDPOINT_IN_FLIGHT_PENALTY = 0.1  # Score multiplier per in-flight request
+DEFAULT_ENDPOINT_THROTTLE_COOLDOWN_S = 5.0  # 429 cooldown without Retry-After
+DEFAULT_ENDPOINT_FAILURE_THRESHOLD = 3  # Consecutive failures before a cooldown
+DEFAULT_ENDPOINT_FAILURE_COOLDOWN_S = 10.0
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_MIN_SAMPLES = 10  # Samples required before hedging an endpoint
 
 # Parameter defaults
 DEFAULT_TEMPERATURE = 0.7
@@ -262,6 +280,21 @@ METRIC_LLM_COST = "llm.cost"
 CHARS_PER_TOKEN_ESTIMATE = 4
 TOKENS_PER_MESSAGE_OVERHEAD = 4  # Approximate per-message formatting tokens
 
+# Response cache
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 3600.0
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 10000
+DEFAULT_RESPONSE_CACHE_MMAP_BYTES = 64 * 1024 * 1024  # SQLite memory-mapped I/O
+RESPONSE_CACHE_PRUNE_INTERVAL = 100  # SQLite writes between expiry/size pruning
+
+# Token counting
+DEFAULT_TIKTOKEN_ENCODING = "o200k_base"  # GPT-4o / GPT-4.1 family
+# BPE files of single-file encodings, for checking tiktoken's local cache
+TIKTOKEN_ENCODING_URLS = {
+    "o200k_base": "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken",
+    "cl100k_base": "https://openaipublic.blob.core.windows.net/encodings/cl100k_base.tiktoken",
+}
+TOKEN_COUNT_CACHE_SIZE = 4096  # Cached per-content token counts
+
 # Retry limits
 MAX_RETRY_ATTEMPTS = 5
 MIN_RETRY_DELAY_MS = 100
@@ -457,6 +490,20 @@ FINISH_REASON_FUNCTION_CALL = "function_call"
 FINISH_REASON_ERROR = "error"
 FINISH_REASON_TIMEOUT = "timeout"
 
+# ============================================================================
+# ENUM VALUES (Endpoint Selection)
+# ============================================================================
+
+ENDPOINT_SELECTION_FAILOVER = "failover"
+ENDPOINT_SELECTION_HEALTH_SCORED = "health_scored"
+
+# ============================================================================
+# ENUM VALUES (Response Cache)
+# ============================================================================
+
+CACHE_KEY_MODE_EXACT = "exact"
+CACHE_KEY_MODE_NORMALIZED = "normalized"
+
 # ============================================================================
 # CONFIGURATION CATEGORIES
 # ============================================================================
@@ -63,6 +63,12 @@ from .constants import (
     FINISH_REASON_FUNCTION_CALL,
     FINISH_REASON_ERROR,
     FINISH_REASON_TIMEOUT,
+    # Endpoint Selection
+    ENDPOINT_SELECTION_FAILOVER,
+    ENDPOINT_SELECTION_HEALTH_SCORED,
+    # Response Cache
+    CACHE_KEY_MODE_EXACT,
+    CACHE_KEY_MODE_NORMALIZED,
     # Model Display Names
     DISPLAY_NAME_GPT_4,
     DISPLAY_NAME_GPT_4_1_MINI,
@@ -181,6 +187,18 @@ class FinishReason(str, Enum):
     TIMEOUT = FINISH_REASON_TIMEOUT
 
 
+class EndpointSelectionStrategy(str, Enum):
+    """How a connector picks among its primary and backup endpoints."""
+    FAILOVER = ENDPOINT_SELECTION_FAILOVER  # Primary first, switch on errors
+    HEALTH_SCORED = ENDPOINT_SELECTION_HEALTH_SCORED  # Best latency/error score per request
+
+
+class CacheKeyMode(str, Enum):
+    """How response cache keys treat message text."""
+    EXACT = CACHE_KEY_MODE_EXACT  # Byte-identical messages only
+    NORMALIZED = CACHE_KEY_MODE_NORMALIZED  # Whitespace runs collapsed, ends stripped
+
+
 # Helper function to get all values
 def get_all_providers() -> list[str]:
     """Get list of all provider identifiers."""
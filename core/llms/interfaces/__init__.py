@@ -10,6 +10,8 @@ from .llm_interfaces import (
     IParameterTransformer,
     IResponseParser,
     IStructuredOutputHandler,
+    ITokenCounter,
+    IResponseCacheBackend,
     IPayloadBuilder,
     IConnector,
     IModelRegistry,
@@ -25,6 +27,8 @@ __all__ = [
     "IParameterTransformer",
     "IResponseParser",
     "IStructuredOutputHandler",
+    "ITokenCounter",
+    "IResponseCacheBackend",
     "IPayloadBuilder",
     # Infrastructure interfaces
     "IConnector",
@@ -9,6 +9,8 @@ Pluggable Components:
 - IParameterTransformer: Parameter transformations (model-specific mappings)
 - IResponseParser: Response parsing and content extraction
 - IStructuredOutputHandler: Structured output validation and retry logic
+- ITokenCounter: Token counting for limits, usage and history trimming
+- IResponseCacheBackend: Storage for cached provider responses
 """
 
 from __future__ import annotations
@@ -19,6 +21,7 @@ if TYPE_CHECKING:
     from ..spec.llm_schema import ModelMetadata
     from ..spec.llm_context import LLMContext
     from ..spec.llm_output_config import OutputConfig, ParseResult
+    from ..spec.llm_request_state import LLMRequestState
 
 # Type aliases for clarity
 Messages = List[Dict[str, Any]]
@@ -311,13 +314,16 @@ class IStructuredOutputHandler(Protocol):
     Handlers manage structured output (JSON/Pydantic) validation,
     retries, and error handling.
     
+    One handler instance is shared by every call of an LLM, so per-call
+    data belongs on the LLMRequestState passed as `state`, not on the handler.
+    
     Built-in implementations:
     - BasicStructuredHandler: Full validation with retries
     - NoOpHandler: Return raw content without validation
     
     Example:
         class CustomHandler(IStructuredOutputHandler):
-            async def validate_output(self, content, output_config):
+            def validate_output(self, content, output_config, state=None):
                 # Custom validation logic
                 return ParseResult(success=True, parsed_output=obj)
     """
@@ -325,7 +331,8 @@ class IStructuredOutputHandler(Protocol):
     def prepare_request(
         self,
         params: Parameters,
-        output_config: 'OutputConfig'
+        output_config: 'OutputConfig',
+        state: Optional['LLMRequestState'] = None
     ) -> Parameters:
         """
         Prepare request parameters for structured output.
@@ -333,6 +340,7 @@ class IStructuredOutputHandler(Protocol):
         Args:
             params: Request parameters
             output_config: Output configuration
+            state: Request state of the call (receives the resolved schema)
             
         Returns:
             Modified parameters with response_format
@@ -342,7 +350,8 @@ class IStructuredOutputHandler(Protocol):
     def validate_output(
         self,
         content: str,
-        output_config: 'OutputConfig'
+        output_config: 'OutputConfig',
+        state: Optional['LLMRequestState'] = None
     ) -> 'ParseResult':
         """
         Validate response content against output configuration.
@@ -350,6 +359,7 @@ class IStructuredOutputHandler(Protocol):
         Args:
             content: Response content
             output_config: Output configuration with schema
+            state: Request state of the call
             
         Returns:
             ParseResult with validation status and parsed output
@@ -376,6 +386,103 @@ class IStructuredOutputHandler(Protocol):
         ...
 
 
+@runtime_checkable
+class ITokenCounter(Protocol):
+    """
+    Interface for token counting.
+    
+    Used for token limit validation, streaming usage and trimming
+    conversation history to the context window.
+    
+    Built-in implementations:
+    - HeuristicTokenCounter: ~4 chars per token (no dependencies)
+    - TiktokenTokenCounter: BPE encoder (requires tiktoken)
+    """
+    
+    def count_text(self, text: str) -> int:
+        """
+        Count tokens in a piece of text.
+        
+        Args:
+            text: Text to count
+            
+        Returns:
+            Token count
+        """
+        ...
+    
+    def count_messages(self, messages: Messages) -> int:
+        """
+        Count tokens of chat messages, including per-message overhead.
+        
+        Args:
+            messages: Messages to count
+            
+        Returns:
+            Token count
+        """
+        ...
+    
+    def start_stream(self) -> Any:
+        """
+        Start an incremental count for streamed text.
+        
+        Returns:
+            Object with add(text) and a running `count`
+        """
+        ...
+
+
+@runtime_checkable
+class IResponseCacheBackend(Protocol):
+    """
+    Interface for response cache storage.
+    
+    Stores JSON-serializable values (raw provider responses, streamed
+    lines) under opaque string keys, with a per-entry TTL.
+    
+    Built-in implementations:
+    - InMemoryResponseCache: Process-local LRU
+    - SQLiteResponseCache: On-disk, shared across processes and restarts
+    """
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        ...
+    
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Time to live (None: never expires)
+        """
+        ...
+    
+    async def delete(self, key: str) -> None:
+        """
+        Remove a value if present.
+        
+        Args:
+            key: Cache key
+        """
+        ...
+    
+    async def clear(self) -> None:
+        """Remove all values."""
+        ...
+
+
 @runtime_checkable
 class IPayloadBuilder(Protocol):
     """
@@ -6,6 +6,7 @@ and model-specific configurations.
 """
 
 from .connector import AzureConnector
+from .endpoint_selector import EndpointSelector, EndpointHealth
 from .base_implementation import AzureBaseLLM
 from .models.gpt_4_1_mini import GPT_4_1_MiniMetadata, GPT_4_1_MiniLLM
 from .models.registry import register_azure_models
@@ -87,6 +88,8 @@ def create_azure_llm(
 
 __all__ = [
     "AzureConnector",
+    "EndpointSelector",
+    "EndpointHealth",
     "AzureBaseLLM",
     "GPT_4_1_MiniMetadata",
     "GPT_4_1_MiniLLM",
@@ -11,6 +11,13 @@ Pluggable Components:
 - IStructuredOutputHandler: Structured output handling
 
 Model-specific implementations can override components or hook methods.
+
+Per-call state (output configuration, resolved response schema) lives in an
+LLMRequestState created by get_answer/stream_answer and passed through the
+pipeline, so one instance can serve concurrent calls.
+
+With a response cache set (set_response_cache), deterministic requests are
+served from cached raw responses / stream lines before the connector.
 """
 
 import json
@@ -21,6 +28,7 @@ from ..base.implementation import BaseLLM
 from ...spec.llm_result import LLMResponse, LLMStreamChunk, LLMUsage
 from ...spec.llm_context import LLMContext
 from ...spec.llm_output_config import OutputConfig, ResponseMode
+from ...spec.llm_request_state import LLMRequestState
 from ...enum import FinishReason
 from ...interfaces.llm_interfaces import (
     ILLMValidator,
@@ -41,6 +49,7 @@ from ...constants import (
     PARAM_MAX_TOKENS,
     PARAM_MAX_COMPLETION_TOKENS,
 )
+from utils.converters.incremental_json_parser import IncrementalJSONParser
 from utils.logging.LoggerAdaptor import LoggerAdaptor
 
 
@@ -104,9 +113,6 @@ class AzureBaseLLM(BaseLLM):
             deployment_name=getattr(connector, 'deployment_name', None)
         )
         self.structured_handler = structured_handler or StructuredHandlerFactory.get_handler("basic")
-        
-        # State
-        self._output_config: Optional[OutputConfig] = None
     
     # ============================================================================
     # MAIN API METHODS
@@ -143,8 +149,8 @@ class AzureBaseLLM(BaseLLM):
             # 1. Check output support
             self._check_text_output_support()
             
-            # 2. Setup output configuration
-            self._setup_output_config(output_config, kwargs)
+            # 2. Setup output configuration (request-scoped)
+            state = self._setup_output_config(output_config, kwargs)
             
             # 3. Validate using pluggable validator
             await self.validator.validate_messages(messages, self.metadata)
@@ -159,8 +165,8 @@ class AzureBaseLLM(BaseLLM):
             params = self._transform_parameters(params)  # Model-specific hook
             
             # 6. Prepare for structured output
-            if self._output_config and self._output_config.expects_structured_output:
-                params = self.structured_handler.prepare_request(params, self._output_config)
+            if state.expects_structured_output:
+                params = self.structured_handler.prepare_request(params, state.output_config, state=state)
             
             # 7. Validate token limits
             max_tokens = params.get(PARAM_MAX_COMPLETION_TOKENS) or params.get(PARAM_MAX_TOKENS, self.metadata.max_output_tokens)
@@ -174,7 +180,7 @@ class AzureBaseLLM(BaseLLM):
             payload = self._build_model_payload(payload)  # Model-specific hook
             
             # 10. Execute with retry logic
-            llm_response = await self._execute_with_retry(messages, payload, start_time)
+            llm_response = await self._execute_with_retry(messages, payload, start_time, state)
             
             return llm_response
             
@@ -186,9 +192,6 @@ class AzureBaseLLM(BaseLLM):
             # 11. Record prompt usage if registry is set
             latency_ms = (time.time() - start_time) * 1000
             await self._record_prompt_usage(ctx, llm_response, latency_ms, success)
-            
-            # 12. Reset state
-            self._reset_output_state()
     
     async def stream_answer(
         self,
@@ -220,8 +223,8 @@ class AzureBaseLLM(BaseLLM):
             # 1. Check output support
             self._check_text_output_support()
             
-            # 2. Setup output configuration
-            self._setup_output_config(output_config, kwargs)
+            # 2. Setup output configuration (request-scoped)
+            state = self._setup_output_config(output_config, kwargs)
             
             # 3. Validate
             await self.validator.validate_messages(messages, self.metadata)
@@ -234,8 +237,8 @@ class AzureBaseLLM(BaseLLM):
             params = self._transform_parameters(params)
             
             # 5. Prepare for structured output
-            if self._output_config and self._output_config.expects_structured_output:
-                params = self.structured_handler.prepare_request(params, self._output_config)
+            if state.expects_structured_output:
+                params = self.structured_handler.prepare_request(params, state.output_config, state=state)
             
             # 6. Validate token limits
             max_tokens = params.get(PARAM_MAX_COMPLETION_TOKENS) or params.get(PARAM_MAX_TOKENS, self.metadata.max_output_tokens)
@@ -248,8 +251,8 @@ class AzureBaseLLM(BaseLLM):
             payload[STREAM_PARAM_TRUE] = True
             
             # 8. Stream with structured output handling if needed
-            if self._output_config and self._output_config.expects_structured_output:
-                async for chunk in self._stream_with_structured_output(messages, payload, start_time):
+            if state.expects_structured_output:
+                async for chunk in self._stream_with_structured_output(messages, payload, start_time, state):
                     if chunk.is_final and chunk.usage:
                         final_usage = chunk.usage
                     yield chunk
@@ -273,9 +276,6 @@ class AzureBaseLLM(BaseLLM):
                 await self._record_prompt_usage(ctx, mock_response, latency_ms, success)
             else:
                 await self._record_prompt_usage(ctx, None, latency_ms, success)
-            
-            # 10. Reset state
-            self._reset_output_state()
     
     # ============================================================================
     # HOOK METHODS - Override in model-specific implementations
@@ -335,26 +335,29 @@ class AzureBaseLLM(BaseLLM):
         self,
         output_config: Optional[OutputConfig],
         kwargs: Dict[str, Any]
-    ) -> None:
-        """Setup output configuration."""
+    ) -> LLMRequestState:
+        """
+        Setup output configuration for one call.
+        
+        Args:
+            output_config: Output configuration passed by the caller
+            kwargs: Call parameters (response_format is added or read here)
+            
+        Returns:
+            New request state; nothing is stored on the instance
+        """
+        state = LLMRequestState()
         if output_config:
-            self._output_config = output_config
+            state.output_config = output_config
             if output_config.response_format:
                 kwargs["response_format"] = output_config.response_format
         elif "response_format" in kwargs:
-            self._output_config = OutputConfig(
+            state.output_config = OutputConfig(
                 response_format=kwargs["response_format"],
                 max_retries=0,
                 response_mode=ResponseMode.BEST_EFFORT
             )
-    
-    def _reset_output_state(self) -> None:
-        """Reset output configuration state."""
-        self._output_config = None
-        if hasattr(self.structured_handler, 'reset'):
-            self.structured_handler.reset()
-        if hasattr(self.transformer, 'reset'):
-            self.transformer.reset()
+        return state
     
     # ============================================================================
     # RETRY LOGIC
@@ -364,27 +367,38 @@ class AzureBaseLLM(BaseLLM):
         self,
         messages: List[Dict[str, Any]],
         payload: Dict[str, Any],
-        start_time: float
+        start_time: float,
+        state: LLMRequestState
     ) -> LLMResponse:
         """Execute request with retry logic for structured output."""
+        output_config = state.output_config
         max_attempts = 1
-        if self._output_config and self._output_config.should_retry_on_parse_failure:
-            max_attempts = self._output_config.max_retries + 1
+        if output_config and output_config.should_retry_on_parse_failure:
+            max_attempts = output_config.max_retries + 1
         
+        cache_key = self._response_cache_key(payload)
         last_error = None
         last_response = None
         
         for attempt in range(max_attempts):
             try:
-                response = await self.connector.request("chat/completions", payload)
+                # Retries after a failed validation always go to the provider
+                response = None
+                if cache_key and attempt == 0:
+                    response = await self.response_cache.get_response(cache_key)
+                from_cache = response is not None
+                if not from_cache:
+                    response = await self.connector.request("chat/completions", payload)
+                
                 llm_response = self.parser.parse_response(response, start_time, self.metadata)
                 last_response = llm_response
                 
                 # Validate structured output
-                if self._output_config and self._output_config.expects_structured_output:
+                if state.expects_structured_output:
                     parse_result = self.structured_handler.validate_output(
                         llm_response.content,
-                        self._output_config
+                        output_config,
+                        state=state
                     )
                     
                     if parse_result.success:
@@ -394,31 +408,38 @@ class AzureBaseLLM(BaseLLM):
                     else:
                         raise ValueError(parse_result.error or "Validation failed")
                 
+                if from_cache:
+                    llm_response.metadata["cache_hit"] = True
+                elif cache_key:
+                    # Only responses that passed validation are cached
+                    await self.response_cache.store_response(cache_key, response)
+                
                 return llm_response
                 
             except Exception as e:
                 last_error = e
                 self.logger.warning(f"Attempt {attempt + 1}/{max_attempts} failed", error=str(e))
                 
-                if self._output_config and self.structured_handler.handle_validation_failure(
-                    e, self._output_config, attempt + 1
+                if output_config and self.structured_handler.handle_validation_failure(
+                    e, output_config, attempt + 1
                 ):
                     continue
                 
-                return self._handle_final_parse_failure(last_response, last_error)
+                return self._handle_final_parse_failure(last_response, last_error, state)
         
-        return self._handle_final_parse_failure(last_response, last_error)
+        return self._handle_final_parse_failure(last_response, last_error, state)
     
     def _handle_final_parse_failure(
         self,
         llm_response: Optional[LLMResponse],
-        error: Exception
+        error: Exception,
+        state: LLMRequestState
     ) -> LLMResponse:
         """Handle final parsing failure based on response mode."""
-        if not self._output_config:
+        if not state.output_config:
             raise error
         
-        response_mode = self._output_config.response_mode
+        response_mode = state.output_config.response_mode
         
         if response_mode == ResponseMode.STRICT:
             raise error
@@ -439,11 +460,20 @@ class AzureBaseLLM(BaseLLM):
         self,
         messages: List[Dict[str, Any]],
         payload: Dict[str, Any],
-        start_time: float
+        start_time: float,
+        state: LLMRequestState
     ) -> AsyncIterator[LLMStreamChunk]:
-        """Stream with structured output validation at the end."""
+        """
+        Stream with optional incremental partial parsing and validation at the end.
+        
+        With output_config.stream_partial_output set, each non-final chunk
+        carries the current partial object in metadata["partial_output"] (a
+        live object, updated in place by later chunks) and the top-level fields
+        finished by that chunk in metadata["completed_fields"].
+        """
         accumulated_content = []
         final_chunk = None
+        partial_parser = IncrementalJSONParser() if state.output_config.stream_partial_output else None
         
         async for chunk in self._stream_azure_response(messages, payload, start_time):
             if chunk.content:
@@ -452,15 +482,21 @@ class AzureBaseLLM(BaseLLM):
             if chunk.is_final:
                 final_chunk = chunk
             else:
+                if partial_parser is not None and chunk.content:
+                    update = partial_parser.feed(chunk.content)
+                    chunk.metadata["partial_output"] = update.value
+                    if update.completed_fields:
+                        chunk.metadata["completed_fields"] = update.completed_fields
                 yield chunk
         
         if final_chunk and accumulated_content:
             full_content = "".join(accumulated_content)
             
-            if self._output_config:
+            if state.output_config:
                 parse_result = self.structured_handler.validate_output(
                     full_content,
-                    self._output_config
+                    state.output_config,
+                    state=state
                 )
                 
                 if final_chunk.metadata is None:
@@ -483,10 +519,15 @@ class AzureBaseLLM(BaseLLM):
         payload: Dict[str, Any],
         start_time: float
     ) -> AsyncIterator[LLMStreamChunk]:
-        """Stream Azure OpenAI response."""
-        accumulated_content = []
+        """
+        Stream Azure OpenAI response.
         
-        async for line in self.connector.stream_request("chat/completions", payload):
+        Completion tokens are counted per chunk as it arrives; prompt tokens
+        come from the token counter's per-message cache.
+        """
+        completion_tokens = self.token_counter.start_stream()
+        
+        async for line in self._stream_lines(payload):
             line = line.strip()
             if not line:
                 continue
@@ -502,7 +543,7 @@ class AzureBaseLLM(BaseLLM):
                     finish_reason=FinishReason.STOP,
                     usage=LLMUsage(
                         prompt_tokens=self._estimate_tokens(messages),
-                        completion_tokens=self._estimate_tokens([{"content": "".join(accumulated_content)}]),
+                        completion_tokens=completion_tokens.count,
                         duration_ms=duration_ms
                     )
                 )
@@ -514,13 +555,13 @@ class AzureBaseLLM(BaseLLM):
                 
                 if chunk:
                     if chunk.content:
-                        accumulated_content.append(chunk.content)
+                        completion_tokens.add(chunk.content)
                     
                     if chunk.is_final:
                         duration_ms = int((time.time() - start_time) * 1000)
                         chunk.usage = LLMUsage(
                             prompt_tokens=self._estimate_tokens(messages),
-                            completion_tokens=self._estimate_tokens([{"content": "".join(accumulated_content)}]),
+                            completion_tokens=completion_tokens.count,
                             duration_ms=duration_ms
                         )
                     
@@ -529,10 +570,47 @@ class AzureBaseLLM(BaseLLM):
             except json.JSONDecodeError:
                 continue
     
+    async def _stream_lines(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Raw stream lines, replayed from the response cache when possible.
+        
+        A stream is cached once its done marker arrives; interrupted streams
+        are not cached.
+        """
+        cache_key = self._response_cache_key(payload)
+        if cache_key:
+            cached_lines = await self.response_cache.get_stream(cache_key)
+            if cached_lines is not None:
+                for line in cached_lines:
+                    yield line
+                return
+        
+        received: Optional[List[str]] = [] if cache_key else None
+        async for line in self.connector.stream_request("chat/completions", payload):
+            if received is not None:
+                received.append(line)
+                data = line.strip()
+                if data.startswith(STREAM_DATA_PREFIX):
+                    data = data[STREAM_DATA_PREFIX_LENGTH:]
+                if data == STREAM_DONE_TOKEN:
+                    # Store before yielding: the consumer stops reading here
+                    await self.response_cache.store_stream(cache_key, received)
+                    received = None
+            yield line
+    
     # ============================================================================
     # HELPER METHODS
     # ============================================================================
     
+    def _response_cache_key(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Response cache key of a request, or None if it is not cached."""
+        if self.response_cache is None:
+            return None
+        # Primary deployment: failover to a backup must not change keys
+        deployment = getattr(self.connector, 'primary_deployment_name', None) or getattr(self.connector, 'deployment_name', '')
+        model = f"{self.metadata.model_name}/{deployment}"
+        return self.response_cache.make_key(model, payload)
+    
     def _build_azure_payload(
         self,
         messages: List[Dict[str, Any]],
@@ -5,10 +5,14 @@ This module provides the connector for Azure OpenAI Service with backup/failover
 """
 
 import os
+import time
 import asyncio
 from typing import Dict, Any, Optional, List
 import aiohttp
+from utils.http import PooledTransport, get_shared_transport
+from utils.converters.schema_registry import dumps_payload
 from ..base.connector import BaseConnector
+from .endpoint_selector import EndpointSelector
 from ...exceptions import (
     ConfigurationError,
     AuthenticationError,
@@ -23,7 +27,23 @@ from ...constants import (
     ENV_AZURE_OPENAI_DEPLOYMENT,
     ENV_AZURE_OPENAI_API_VERSION,
     PROVIDER_AZURE,
+    CONFIG_SHARED_POOL,
+    DEFAULT_SHARED_POOL,
+    CONFIG_ENDPOINT_SELECTION,
+    DEFAULT_ENDPOINT_SELECTION,
+    CONFIG_HEDGE_REQUESTS,
+    DEFAULT_HEDGE_REQUESTS,
 )
+from ...enum import EndpointSelectionStrategy
+
+
+# Errors after which a request is retried on another endpoint
+_FAILOVER_ERRORS = (ServiceUnavailableError, RateLimitError, TimeoutError)
+
+
+def _should_fail_over(error: Exception) -> bool:
+    """True for endpoint-level failures (incl. connection errors raised as ProviderError)."""
+    return isinstance(error, _FAILOVER_ERRORS) or isinstance(error.__cause__, aiohttp.ClientError)
 
 
 class AzureConnector(BaseConnector):
@@ -41,6 +61,15 @@ class AzureConnector(BaseConnector):
         - api_version: API version (default: 2024-02-15-preview)
         - timeout: Request timeout in seconds
         - max_retries: Maximum retry attempts
+        - shared_pool: Use the process-wide per-endpoint connection pools
+          (default: True); False gives the connector its own session
+        - endpoint_selection: "failover" (default) always starts at the
+          current endpoint and switches only after errors; "health_scored"
+          routes each request to the endpoint with the best latency/error
+          score (backups then also serve healthy traffic)
+        - hedge_requests: Re-send a slow non-streaming request to the next best
+          endpoint after the first endpoint's p95 latency (default: False;
+          a hedged request may be billed twice)
         
     Backup Configuration (optional):
         - backups: List of backup configurations, each containing:
@@ -111,8 +140,20 @@ class AzureConnector(BaseConnector):
         self.current_config_index = 0  # 0 = primary, 1+ = backups
         self.failed_endpoints: set = set()  # Track failed endpoints
         
-        # Session management
+        # Session management: shared per-endpoint pools, or an owned session
+        self._transport: Optional[PooledTransport] = (
+            get_shared_transport() if config.get(CONFIG_SHARED_POOL, DEFAULT_SHARED_POOL) else None
+        )
         self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Endpoint selection
+        self.endpoint_selection = EndpointSelectionStrategy(
+            config.get(CONFIG_ENDPOINT_SELECTION, DEFAULT_ENDPOINT_SELECTION)
+        )
+        self.hedge_requests = config.get(CONFIG_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS)
+        self.endpoint_selector = EndpointSelector(
+            config["endpoint"] for config in self._get_all_configs()
+        )
     
     def _validate_config(self) -> None:
         """Validate Azure-specific configuration."""
@@ -247,22 +288,27 @@ class AzureConnector(BaseConnector):
         for i in range(self.current_config_index + 1, len(all_configs)):
             config = all_configs[i]
             if config["endpoint"] not in self.failed_endpoints:
-                # Switch to this config
-                self.endpoint = config["endpoint"]
-                self.deployment_name = config["deployment_name"]
-                self.api_key = config["api_key"]
-                self.api_version = config["api_version"]
-                self.current_config_index = i
-                
-                # Close existing session (will be recreated with new config)
-                if self._session and not self._session.closed:
-                    asyncio.create_task(self._session.close())
-                self._session = None
-                
+                self._activate(i)
+                # Auth headers are sent per request and pools are per
+                # endpoint, so connections to the previous endpoint stay warm
                 return True
         
         return False
     
+    def _activate(self, index: int) -> None:
+        """
+        Make the endpoint at `index` the current one.
+        
+        Args:
+            index: Config index (0 = primary, 1+ = backups)
+        """
+        config = self._get_all_configs()[index]
+        self.endpoint = config["endpoint"]
+        self.deployment_name = config["deployment_name"]
+        self.api_key = config["api_key"]
+        self.api_version = config["api_version"]
+        self.current_config_index = index
+    
     def get_current_endpoint_info(self) -> Dict[str, Any]:
         """
         Get information about currently active endpoint.
@@ -280,9 +326,13 @@ class AzureConnector(BaseConnector):
         Get status of all endpoints (primary + backups).
         
         Returns:
-            Status information including failed endpoints
+            Status information including failed endpoints and, per endpoint,
+            the health score used by health-scored selection
         """
         all_configs = self._get_all_configs()
+        scores = self.endpoint_selector.status()
+        for entry in scores:
+            entry["type"] = all_configs[entry["index"]]["type"]
         return {
             "total_endpoints": len(all_configs),
             "current_index": self.current_config_index,
@@ -290,45 +340,91 @@ class AzureConnector(BaseConnector):
             "current_type": all_configs[self.current_config_index]["type"] if self.current_config_index < len(all_configs) else "unknown",
             "failed_endpoints": list(self.failed_endpoints),
             "available_backups": len(self.backup_configs),
-            "has_backups": len(self.backup_configs) > 0
+            "has_backups": len(self.backup_configs) > 0,
+            "selection_strategy": self.endpoint_selection.value,
+            "hedging": self.hedge_requests,
+            "endpoint_scores": scores,
         }
     
-    def _build_url(self, operation: str) -> str:
+    def _build_url(self, operation: str, config: Optional[Dict[str, Any]] = None) -> str:
         """
         Build full URL for Azure OpenAI API.
         
         Args:
             operation: API operation (e.g., "chat/completions")
+            config: Endpoint config to target (defaults to the current endpoint)
             
         Returns:
             Full URL with deployment and API version
         """
+        if config is None:
+            return (
+                f"{self.endpoint}/openai/deployments/{self.deployment_name}/"
+                f"{operation}?api-version={self.api_version}"
+            )
         return (
-            f"{self.endpoint}/openai/deployments/{self.deployment_name}/"
-            f"{operation}?api-version={self.api_version}"
+            f"{config['endpoint']}/openai/deployments/{config['deployment_name']}/"
+            f"{operation}?api-version={config['api_version']}"
         )
     
-    def _get_session(self) -> aiohttp.ClientSession:
+    def _get_headers(self, api_key: Optional[str] = None) -> Dict[str, str]:
         """
-        Get or create aiohttp session (lazy initialization).
+        Get request headers for the active endpoint.
+        
+        Args:
+            api_key: API key to send (defaults to the active endpoint's key)
+        
+        Returns:
+            Headers including the active endpoint's API key
+        """
+        return {
+            "api-key": api_key or self.api_key,
+            "Content-Type": "application/json",
+        }
+    
+    def _get_session(self, endpoint: Optional[str] = None) -> aiohttp.ClientSession:
+        """
+        Get the session for the active endpoint (lazy initialization).
+        
+        With the shared transport, each endpoint has its own connection pool
+        that is reused by every connector talking to it.
+        
+        Args:
+            endpoint: Endpoint to get the session for (defaults to the active one)
         
         Returns:
             Active aiohttp session
         """
+        if self._transport is not None:
+            return self._transport.get_session(endpoint or self.endpoint)
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.get_timeout())
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={
-                    "api-key": self.api_key,
-                    "Content-Type": "application/json",
-                }
-            )
+            self._session = aiohttp.ClientSession(timeout=timeout)
         return self._session
     
+    async def warm_up(self) -> Dict[str, bool]:
+        """
+        Pre-establish connections to the primary and all backup endpoints.
+        
+        Call during application startup so the first requests (and the
+        first failover) do not pay for DNS resolution and TLS handshakes.
+        
+        Returns:
+            {origin: True if a connection was established}; empty when the
+            connector does not use the shared transport
+        """
+        if self._transport is None:
+            return {}
+        return await self._transport.warm_up(
+            [config["endpoint"] for config in self._get_all_configs()]
+        )
+    
     async def close(self) -> None:
         """
         Close session and clean up resources (optional cleanup).
+        
+        Shared pools outlive the connector and are closed with
+        utils.http.shutdown_shared_transport().
         """
         if self._session and not self._session.closed:
             await self._session.close()
@@ -354,7 +450,12 @@ class AzureConnector(BaseConnector):
             }
             session = self._get_session()
             
-            async with session.post(url, json=test_payload) as response:
+            async with session.post(
+                url,
+                json=test_payload,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.get_timeout()),
+            ) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Invalid Azure OpenAI API key",
@@ -417,6 +518,9 @@ class AzureConnector(BaseConnector):
             AuthenticationError: If authentication fails
             ProviderError: For other API errors
         """
+        if self.endpoint_selection == EndpointSelectionStrategy.HEALTH_SCORED:
+            return await self._request_scored(endpoint, payload, **kwargs)
+        
         auto_failover = kwargs.get("auto_failover", True)
         last_error = None
         
@@ -429,7 +533,12 @@ class AzureConnector(BaseConnector):
             current_info = self.get_current_endpoint_info()
             
             try:
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                async with session.post(
+                    url,
+                    data=dumps_payload(payload),  # Splices cached response_format JSON
+                    headers=self._get_headers(),
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as response:
                     # Handle error status codes
                     if response.status == 401:
                         raise AuthenticationError(
@@ -532,6 +641,12 @@ class AzureConnector(BaseConnector):
             TimeoutError: If request times out on all endpoints
             ProviderError: For API errors
         """
+        if self.endpoint_selection == EndpointSelectionStrategy.HEALTH_SCORED:
+            payload["stream"] = True
+            async for chunk in self._stream_scored(endpoint, payload, **kwargs):
+                yield chunk
+            return
+        
         auto_failover = kwargs.get("auto_failover", True)
         last_error = None
         
@@ -549,7 +664,8 @@ class AzureConnector(BaseConnector):
             try:
                 async with session.post(
                     url,
-                    json=payload,
+                    data=dumps_payload(payload),
+                    headers=self._get_headers(),
                     timeout=aiohttp.ClientTimeout(total=timeout)
                 ) as response:
                     # Check for errors
@@ -615,4 +731,251 @@ class AzureConnector(BaseConnector):
         # Should not reach here
         if last_error:
             raise last_error
-
+    
+    # =========================================================================
+    # Health-scored endpoint selection
+    # =========================================================================
+    
+    async def _raise_for_status(self, response: aiohttp.ClientResponse, index: int) -> None:
+        """
+        Raise the provider error for an HTTP error status and record it.
+        
+        Args:
+            response: Response to check
+            index: Config index of the endpoint that answered
+            
+        Raises:
+            AuthenticationError: On 401
+            RateLimitError: On 429 (endpoint is throttled until Retry-After)
+            ServiceUnavailableError: On 5xx (counted as an endpoint failure)
+            ProviderError: On other 4xx
+        """
+        endpoint = self.endpoint_selector.endpoints[index].endpoint
+        if response.status < 400:
+            return
+        if response.status == 401:
+            raise AuthenticationError(
+                "Authentication failed",
+                provider=PROVIDER_AZURE,
+                details={"status_code": 401, "endpoint": endpoint}
+            )
+        if response.status == 429:
+            retry_after = response.headers.get("Retry-After")
+            retry_after = int(retry_after) if retry_after and retry_after.isdigit() else None
+            self.endpoint_selector.record_throttle(index, retry_after)
+            raise RateLimitError(
+                "Rate limit exceeded",
+                provider=PROVIDER_AZURE,
+                details={"status_code": 429, "endpoint": endpoint},
+                retry_after=retry_after
+            )
+        if response.status >= 500:
+            self.endpoint_selector.record_failure(index)
+            raise ServiceUnavailableError(
+                f"Service unavailable at endpoint {index}",
+                provider=PROVIDER_AZURE,
+                details={"status_code": response.status, "endpoint": endpoint}
+            )
+        error_body = await response.text()
+        raise ProviderError(
+            f"Azure OpenAI API error: {response.status}",
+            provider=PROVIDER_AZURE,
+            details={"status_code": response.status, "error_body": error_body, "endpoint": endpoint}
+        )
+    
+    def _transport_error(self, error: Exception, index: int, timeout: float) -> Exception:
+        """Record a timeout/connection error and convert it to a provider error."""
+        endpoint = self.endpoint_selector.endpoints[index].endpoint
+        self.endpoint_selector.record_failure(index)
+        if isinstance(error, asyncio.TimeoutError):
+            return TimeoutError(
+                f"Request timed out after {timeout} seconds at endpoint {index}",
+                provider=PROVIDER_AZURE,
+                details={"timeout_seconds": timeout, "endpoint": endpoint}
+            )
+        return ProviderError(
+            f"Request failed: {str(error)}",
+            provider=PROVIDER_AZURE,
+            details={"error": str(error), "endpoint": endpoint}
+        )
+    
+    async def _post(self, index: int, operation: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send a non-streaming request to one endpoint and record the outcome.
+        
+        Args:
+            index: Config index of the endpoint
+            operation: API operation
+            payload: Request payload
+            timeout: Request timeout in seconds
+            
+        Returns:
+            Response dictionary
+        """
+        config = self._get_all_configs()[index]
+        session = self._get_session(config["endpoint"])
+        selector = self.endpoint_selector
+        selector.start(index)
+        start = time.monotonic()
+        try:
+            async with session.post(
+                self._build_url(operation, config),
+                data=dumps_payload(payload),
+                headers=self._get_headers(config["api_key"]),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                await self._raise_for_status(response, index)
+                result = await response.json()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise self._transport_error(e, index, timeout) from e
+        finally:
+            selector.finish(index)
+        
+        selector.record_success(index, time.monotonic() - start)
+        self._activate(index)
+        return result
+    
+    async def _post_hedged(
+        self,
+        index: int,
+        tried: set,
+        operation: str,
+        payload: Dict[str, Any],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """
+        Send a request and hedge it to the next best endpoint if it is slow.
+        
+        The hedge is sent once the first endpoint exceeds its p95 latency;
+        whichever response succeeds first wins and the other is cancelled.
+        
+        Args:
+            index: Config index of the first endpoint
+            tried: Indices already used for this request (updated in place)
+            operation: API operation
+            payload: Request payload
+            timeout: Request timeout in seconds
+            
+        Returns:
+            Response dictionary
+        """
+        first = asyncio.ensure_future(self._post(index, operation, payload, timeout))
+        pending = {first}
+        try:
+            delay = self.endpoint_selector.hedge_delay(index)
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if done:
+                    # Finished inside the hedge delay: no hedge is needed, and
+                    # a fast failure goes back to the caller's failover loop.
+                    return first.result()
+                second = self.endpoint_selector.select(exclude=tried)
+                if second is not None and self.endpoint_selector.endpoints[second].is_available(time.monotonic()):
+                    tried.add(second)
+                    pending.add(asyncio.ensure_future(self._post(second, operation, payload, timeout)))
+            
+            error: Optional[Exception] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Retrieve every outcome so a failure next to a success is not left unretrieved
+                errors = [task.exception() for task in done]
+                for task, task_error in zip(done, errors):
+                    if task_error is None:
+                        return task.result()
+                error = error or errors[0]
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let cancelled requests run their cleanup (in-flight accounting)
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _request_scored(self, endpoint: str, payload: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        """
+        Make a request to the best-scored endpoint, failing over by score.
+        
+        Args:
+            endpoint: API operation (e.g., "chat/completions")
+            payload: Request payload
+            **kwargs: Additional options (auto_failover=True, timeout)
+            
+        Returns:
+            Response dictionary
+        """
+        auto_failover = kwargs.get("auto_failover", True)
+        timeout = kwargs.get("timeout", self.get_timeout())
+        tried: set = set()
+        last_error: Optional[Exception] = None
+        
+        while True:
+            index = self.endpoint_selector.select(exclude=tried)
+            if index is None:
+                raise last_error
+            tried.add(index)
+            try:
+                if self.hedge_requests:
+                    return await self._post_hedged(index, tried, endpoint, payload, timeout)
+                return await self._post(index, endpoint, payload, timeout)
+            except (*_FAILOVER_ERRORS, ProviderError) as e:
+                if not auto_failover or not _should_fail_over(e):
+                    raise
+                last_error = e
+    
+    async def _stream_scored(self, endpoint: str, payload: Dict[str, Any], **kwargs: Any):
+        """
+        Stream from the best-scored endpoint, failing over by score.
+        
+        Latency is recorded as time to response headers. Failover only
+        happens before the first chunk is yielded; a stream that breaks
+        after that raises, since restarting would repeat output.
+        
+        Args:
+            endpoint: API operation
+            payload: Request payload (stream=True)
+            **kwargs: Additional options (auto_failover=True, timeout)
+            
+        Yields:
+            Response chunks as they arrive
+        """
+        auto_failover = kwargs.get("auto_failover", True)
+        timeout = kwargs.get("timeout", self.get_timeout())
+        selector = self.endpoint_selector
+        tried: set = set()
+        last_error: Optional[Exception] = None
+        yielded = False
+        
+        while True:
+            index = selector.select(exclude=tried)
+            if index is None:
+                raise last_error
+            tried.add(index)
+            config = self._get_all_configs()[index]
+            session = self._get_session(config["endpoint"])
+            selector.start(index)
+            start = time.monotonic()
+            try:
+                async with session.post(
+                    self._build_url(endpoint, config),
+                    data=dumps_payload(payload),
+                    headers=self._get_headers(config["api_key"]),
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    await self._raise_for_status(response, index)
+                    selector.record_success(index, time.monotonic() - start)
+                    self._activate(index)
+                    async for line in response.content:
+                        if line:
+                            yielded = True
+                            yield line.decode('utf-8')
+                    return
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                error = self._transport_error(e, index, timeout)
+                if not auto_failover or yielded:
+                    raise error from e
+                last_error = error
+            except _FAILOVER_ERRORS as e:
+                if not auto_failover or yielded:
+                    raise
+                last_error = e
+            finally:
+                selector.finish(index)
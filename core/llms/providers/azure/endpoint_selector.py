@@ -0,0 +1,310 @@
+"""
+Endpoint Selector for Azure OpenAI Backups.
+
+Tracks the health of every configured endpoint (primary + backups) and picks
+the best one per request instead of failing over sequentially.
+
+Per endpoint:
+- Rolling latency window (p50 / p95)
+- Rolling success/failure window (error rate)
+- Cooldown windows from 429 Retry-After and from consecutive failures
+- Requests currently in flight
+
+Score (lower is better):
+    p50_latency * (1 + error_penalty * error_rate) * (1 + in_flight_penalty * in_flight)
+
+Endpoints without latency samples are scored with the mean p50 of the
+sampled endpoints, so ties fall back to configuration order (primary first)
+and load spreads to backups as in-flight requests pile up.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from ...constants import (
+    DEFAULT_ENDPOINT_LATENCY_WINDOW,
+    DEFAULT_ENDPOINT_OUTCOME_WINDOW,
+    DEFAULT_ENDPOINT_PRIOR_LATENCY_S,
+    DEFAULT_ENDPOINT_ERROR_PENALTY,
+    DEFAULT_ENDPOINT_IN_FLIGHT_PENALTY,
+    DEFAULT_ENDPOINT_THROTTLE_COOLDOWN_S,
+    DEFAULT_ENDPOINT_FAILURE_THRESHOLD,
+    DEFAULT_ENDPOINT_FAILURE_COOLDOWN_S,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+)
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percentile / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class EndpointHealth:
+    """
+    Rolling health statistics of a single endpoint.
+
+    Attributes:
+        endpoint: Endpoint URL
+        in_flight: Requests currently running against the endpoint
+        cooldown_until: Monotonic time before which the endpoint is skipped
+        consecutive_failures: Failures since the last success
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        latency_window: int = DEFAULT_ENDPOINT_LATENCY_WINDOW,
+        outcome_window: int = DEFAULT_ENDPOINT_OUTCOME_WINDOW,
+    ):
+        self.endpoint = endpoint
+        self.latencies: deque = deque(maxlen=latency_window)
+        self.outcomes: deque = deque(maxlen=outcome_window)
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.consecutive_failures = 0
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Latency percentile in seconds, or None without samples."""
+        if not self.latencies:
+            return None
+        return _percentile(list(self.latencies), percentile)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed requests in the outcome window."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def is_available(self, now: float) -> bool:
+        """True if the endpoint is not cooling down."""
+        return now >= self.cooldown_until
+
+
+class EndpointSelector:
+    """
+    Health-scored, latency-aware selection among endpoints.
+
+    Endpoints are referred to by their index in the connector's config list
+    (0 = primary). The selector is not tied to a connector and has no I/O.
+
+    Usage:
+        selector = EndpointSelector(["https://eastus...", "https://westeurope..."])
+
+        index = selector.select()
+        selector.start(index)
+        try:
+            ...
+            selector.record_success(index, latency_s)
+        except RateLimitError as e:
+            selector.record_throttle(index, e.retry_after)
+        finally:
+            selector.finish(index)
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        latency_window: int = DEFAULT_ENDPOINT_LATENCY_WINDOW,
+        outcome_window: int = DEFAULT_ENDPOINT_OUTCOME_WINDOW,
+        prior_latency_s: float = DEFAULT_ENDPOINT_PRIOR_LATENCY_S,
+        error_penalty: float = DEFAULT_ENDPOINT_ERROR_PENALTY,
+        in_flight_penalty: float = DEFAULT_ENDPOINT_IN_FLIGHT_PENALTY,
+        throttle_cooldown_s: float = DEFAULT_ENDPOINT_THROTTLE_COOLDOWN_S,
+        failure_threshold: int = DEFAULT_ENDPOINT_FAILURE_THRESHOLD,
+        failure_cooldown_s: float = DEFAULT_ENDPOINT_FAILURE_COOLDOWN_S,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+    ):
+        """
+        Initialize selector.
+
+        Args:
+            endpoints: Endpoint URLs in configuration order
+            latency_window: Latency samples kept per endpoint
+            outcome_window: Success/failure outcomes kept per endpoint
+            prior_latency_s: Latency assumed when no endpoint has samples
+            error_penalty: Score multiplier per unit of error rate
+            in_flight_penalty: Score multiplier per in-flight request
+            throttle_cooldown_s: Cooldown after a 429 without Retry-After
+            failure_threshold: Consecutive failures that trigger a cooldown
+            failure_cooldown_s: Cooldown after failure_threshold failures
+            hedge_percentile: Latency percentile used as hedge delay
+            hedge_min_samples: Samples required before hedging an endpoint
+        """
+        self.endpoints = [
+            EndpointHealth(endpoint, latency_window, outcome_window) for endpoint in endpoints
+        ]
+        self.prior_latency_s = prior_latency_s
+        self.error_penalty = error_penalty
+        self.in_flight_penalty = in_flight_penalty
+        self.throttle_cooldown_s = throttle_cooldown_s
+        self.failure_threshold = failure_threshold
+        self.failure_cooldown_s = failure_cooldown_s
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+
+    # ------------------------------------------------------------------
+    # Scoring and selection
+    # ------------------------------------------------------------------
+
+    def _prior(self) -> float:
+        medians = [p for p in (h.percentile(50) for h in self.endpoints) if p is not None]
+        return sum(medians) / len(medians) if medians else self.prior_latency_s
+
+    def score(self, index: int, prior: Optional[float] = None) -> float:
+        """
+        Score an endpoint (lower is better).
+
+        Args:
+            index: Endpoint index
+            prior: Latency used when the endpoint has no samples
+
+        Returns:
+            Expected latency in seconds, inflated by errors and load
+        """
+        health = self.endpoints[index]
+        latency = health.percentile(50)
+        if latency is None:
+            latency = self._prior() if prior is None else prior
+        return (
+            latency
+            * (1 + self.error_penalty * health.error_rate)
+            * (1 + self.in_flight_penalty * health.in_flight)
+        )
+
+    def select(self, exclude: Iterable[int] = ()) -> Optional[int]:
+        """
+        Pick the best available endpoint.
+
+        Endpoints that are cooling down are skipped; if every remaining
+        endpoint is cooling down, the one that recovers first is returned.
+
+        Args:
+            exclude: Endpoint indices not to consider (e.g. already tried)
+
+        Returns:
+            Endpoint index, or None if all endpoints are excluded
+        """
+        excluded = set(exclude)
+        candidates = [i for i in range(len(self.endpoints)) if i not in excluded]
+        if not candidates:
+            return None
+
+        now = time.monotonic()
+        available = [i for i in candidates if self.endpoints[i].is_available(now)]
+        if not available:
+            return min(candidates, key=lambda i: self.endpoints[i].cooldown_until)
+
+        prior = self._prior()
+        # min() keeps the first of equal scores, i.e. configuration order
+        return min(available, key=lambda i: self.score(i, prior))
+
+    def hedge_delay(self, index: int) -> Optional[float]:
+        """
+        Delay after which a request to `index` should be hedged.
+
+        Args:
+            index: Endpoint index
+
+        Returns:
+            The endpoint's latency percentile in seconds, or None if there are
+            too few samples to hedge safely
+        """
+        health = self.endpoints[index]
+        if len(health.latencies) < self.hedge_min_samples:
+            return None
+        return health.percentile(self.hedge_percentile)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def start(self, index: int) -> None:
+        """Mark a request to `index` as in flight."""
+        self.endpoints[index].in_flight += 1
+
+    def finish(self, index: int) -> None:
+        """Mark a request to `index` as finished."""
+        health = self.endpoints[index]
+        health.in_flight = max(0, health.in_flight - 1)
+
+    def record_success(self, index: int, latency_s: float) -> None:
+        """
+        Record a successful request.
+
+        Args:
+            index: Endpoint index
+            latency_s: Request latency in seconds
+        """
+        health = self.endpoints[index]
+        health.latencies.append(latency_s)
+        health.outcomes.append(True)
+        health.consecutive_failures = 0
+
+    def record_failure(self, index: int) -> None:
+        """
+        Record a failed request (5xx, timeout, connection error).
+
+        The endpoint cools down after `failure_threshold` consecutive failures.
+
+        Args:
+            index: Endpoint index
+        """
+        health = self.endpoints[index]
+        health.outcomes.append(False)
+        health.consecutive_failures += 1
+        if health.consecutive_failures >= self.failure_threshold:
+            health.cooldown_until = max(
+                health.cooldown_until, time.monotonic() + self.failure_cooldown_s
+            )
+
+    def record_throttle(self, index: int, retry_after_s: Optional[float] = None) -> None:
+        """
+        Record a 429 response; the endpoint is skipped until Retry-After passes.
+
+        Throttling is not counted as an error: the endpoint is healthy, just busy.
+
+        Args:
+            index: Endpoint index
+            retry_after_s: Retry-After header value in seconds
+        """
+        cooldown = retry_after_s if retry_after_s is not None else self.throttle_cooldown_s
+        health = self.endpoints[index]
+        health.cooldown_until = max(health.cooldown_until, time.monotonic() + cooldown)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Get the health and score of every endpoint.
+
+        Returns:
+            One dict per endpoint in configuration order
+        """
+        now = time.monotonic()
+        prior = self._prior()
+        status = []
+        for index, health in enumerate(self.endpoints):
+            p50 = health.percentile(50)
+            p95 = health.percentile(95)
+            status.append({
+                "index": index,
+                "endpoint": health.endpoint,
+                "score": round(self.score(index, prior), 4),
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "error_rate": round(health.error_rate, 4),
+                "samples": len(health.latencies),
+                "in_flight": health.in_flight,
+                "available": health.is_available(now),
+                "cooldown_remaining_s": round(max(0.0, health.cooldown_until - now), 2),
+            })
+        return status
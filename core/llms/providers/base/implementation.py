@@ -24,8 +24,6 @@ from ...exceptions import InputValidationError, TokenLimitError, UnsupportedOper
 from ...enum import OutputMediaType
 from .connector import BaseConnector
 from ...constants import (
-    CHARS_PER_TOKEN_ESTIMATE,
-    TOKENS_PER_MESSAGE_OVERHEAD,
     META_PROVIDER,
     META_MODEL_NAME,
     MESSAGE_FIELD_ROLE,
@@ -37,6 +35,8 @@ from ...constants import (
 )
 
 if TYPE_CHECKING:
+    from ...interfaces.llm_interfaces import ITokenCounter
+    from ...runtimes.cache import LLMResponseCache
     from core.promptregistry.interfaces.prompt_registry_interfaces import IPromptRegistry
 
 
@@ -71,6 +71,8 @@ class BaseLLM(ABC):
         self.metadata = metadata
         self.connector = connector
         self._prompt_registry: Optional['IPromptRegistry'] = None
+        self._token_counter: Optional['ITokenCounter'] = None
+        self.response_cache: Optional['LLMResponseCache'] = None
     
     def set_prompt_registry(self, registry: 'IPromptRegistry') -> 'BaseLLM':
         """
@@ -323,21 +325,93 @@ class BaseLLM(ABC):
                     model_name=self.metadata.model_name
                 )
     
+    def set_response_cache(self, cache: Optional['LLMResponseCache']) -> 'BaseLLM':
+        """
+        Set the response cache for deterministic calls (None disables caching).
+        
+        Providers consult it before calling the connector; a cache can be
+        shared by several LLM instances.
+        
+        Args:
+            cache: Response cache
+            
+        Returns:
+            Self for method chaining
+            
+        Example:
+            llm.set_response_cache(LLMResponseCache(InMemoryResponseCache()))
+            response = await llm.get_answer(messages, ctx, temperature=0)
+        """
+        self.response_cache = cache
+        return self
+    
+    @property
+    def token_counter(self) -> 'ITokenCounter':
+        """
+        Token counter used for limits and usage (default: TokenCounterFactory 'auto').
+        """
+        if getattr(self, '_token_counter', None) is None:
+            # Imported here: runtimes imports the providers
+            from ...runtimes.token_counters import TokenCounterFactory
+            self._token_counter = TokenCounterFactory.get_counter()
+        return self._token_counter
+    
+    def set_token_counter(self, counter: 'ITokenCounter') -> 'BaseLLM':
+        """
+        Set a custom token counter.
+        
+        Args:
+            counter: Counter implementing ITokenCounter
+            
+        Returns:
+            Self for method chaining
+        """
+        self._token_counter = counter
+        return self
+    
     def _estimate_tokens(self, messages: List[Dict[str, Any]]) -> int:
         """
-        Estimate token count for messages.
+        Count tokens for messages with the token counter.
+        
+        Per-message counts are cached by the counter, so repeated
+        conversation history is not re-tokenized.
+        
+        Args:
+            messages: Messages to count
+            
+        Returns:
+            Token count including message overhead
+        """
+        return self.token_counter.count_messages(messages)
+    
+    def fit_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        max_output_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Trim the oldest conversation turns so messages fit the context window.
         
-        Uses simple heuristic: ~4 chars per token + message overhead.
+        Call before get_answer/stream_answer for long conversations. System
+        messages and the last message are always kept.
         
         Args:
-            messages: Messages to estimate
+            messages: Messages in conversation order
+            max_output_tokens: Tokens reserved for the response
+                (default: model max_output_tokens)
             
         Returns:
-            Estimated token count
+            Messages that fit in max_context_length - max_output_tokens
+            (unchanged if they already fit)
+            
+        Example:
+            messages = llm.fit_messages(history + [user_message], max_output_tokens=1024)
+            response = await llm.get_answer(messages, ctx, max_tokens=1024)
         """
-        total_chars = sum(len(str(msg.get(MESSAGE_FIELD_CONTENT, ""))) for msg in messages)
-        estimated_tokens = (total_chars // CHARS_PER_TOKEN_ESTIMATE) + (len(messages) * TOKENS_PER_MESSAGE_OVERHEAD)
-        return estimated_tokens
+        from ...runtimes.token_counters import trim_messages
+        reserved = max_output_tokens or self.metadata.max_output_tokens
+        budget = self.metadata.max_context_length - reserved
+        return trim_messages(messages, budget, self.token_counter)
     
     def _validate_token_limits(
         self,
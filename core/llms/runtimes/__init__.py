@@ -7,6 +7,8 @@ This module provides:
    - transformers: Parameter transformations
    - parsers: Response parsing
    - handlers: Structured output handling
+   - token_counters: Token counting (BPE or heuristic)
+   - cache: Response cache for deterministic calls (memory or SQLite)
 
 2. Core infrastructure:
    - Model Registry: Registration and lookup of models
@@ -28,6 +30,8 @@ from .handlers import (
     NoOpStructuredHandler,
     StructuredHandlerFactory,
 )
+from .token_counters import HeuristicTokenCounter, TiktokenTokenCounter, TokenCounterFactory
+from .cache import LLMResponseCache, InMemoryResponseCache, SQLiteResponseCache
 
 # Core Infrastructure
 from .model_registry import ModelRegistry, get_model_registry, reset_registry
@@ -50,6 +54,14 @@ __all__ = [
     "BasicStructuredHandler",
     "NoOpStructuredHandler",
     "StructuredHandlerFactory",
+    # Token Counters
+    "HeuristicTokenCounter",
+    "TiktokenTokenCounter",
+    "TokenCounterFactory",
+    # Response Cache
+    "LLMResponseCache",
+    "InMemoryResponseCache",
+    "SQLiteResponseCache",
     # Core Infrastructure
     "ModelRegistry",
     "get_model_registry",
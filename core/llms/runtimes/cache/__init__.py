@@ -0,0 +1,26 @@
+"""
+LLM Response Cache - Cached Provider Responses for Deterministic Calls.
+
+Backends:
+- InMemoryResponseCache: Process-local LRU with TTL
+- SQLiteResponseCache: On-disk (memory-mapped reads), shared across processes
+
+Usage:
+    from core.llms.runtimes.cache import LLMResponseCache, SQLiteResponseCache
+    
+    cache = LLMResponseCache(SQLiteResponseCache("cache/llm.sqlite"), ttl_seconds=86400)
+    llm.set_response_cache(cache)
+    
+    cache.get_metrics()  # hits, misses, hit_rate, ...
+"""
+
+from .llm_response_cache import LLMResponseCache, ResponseCacheMetrics
+from .memory_cache import InMemoryResponseCache
+from .sqlite_cache import SQLiteResponseCache
+
+__all__ = [
+    "LLMResponseCache",
+    "ResponseCacheMetrics",
+    "InMemoryResponseCache",
+    "SQLiteResponseCache",
+]
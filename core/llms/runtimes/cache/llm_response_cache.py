@@ -0,0 +1,237 @@
+"""
+LLM Response Cache.
+
+Caches provider responses for deterministic requests, keyed by a canonical
+hash of model, messages and parameters. Sits between the LLM and its
+connector, so parsing, structured output validation and usage reporting run
+unchanged on cached responses:
+
+- Non-streaming: the raw provider response is cached
+- Streaming: the raw stream lines are cached and replayed chunk by chunk
+- Only requests with temperature 0 are cached unless deterministic_only=False
+- Key modes: EXACT (byte-identical messages) or NORMALIZED (whitespace runs
+  collapsed, so prompts differing only in formatting share an entry)
+
+Usage:
+    cache = LLMResponseCache(InMemoryResponseCache(), ttl_seconds=600)
+    llm.set_response_cache(cache)
+
+    response = await llm.get_answer(messages, ctx, temperature=0)
+    cache.get_metrics()  # {"hits": ..., "misses": ..., "hit_rate": ...}
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+
+from ...interfaces.llm_interfaces import IResponseCacheBackend
+from ...enum import CacheKeyMode
+from ...constants import (
+    DEFAULT_RESPONSE_CACHE_TTL_SECONDS,
+    MESSAGE_FIELD_CONTENT,
+    OPENAI_FIELD_MESSAGES,
+    PARAM_TEMPERATURE,
+)
+from .memory_cache import InMemoryResponseCache
+from utils.logging.LoggerAdaptor import LoggerAdaptor
+
+
+@dataclass
+class ResponseCacheMetrics:
+    """
+    Counters of an LLMResponseCache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Cacheable lookups that went to the provider
+        stores: Responses written to the cache
+        bypassed: Requests not cacheable (e.g. temperature > 0)
+        errors: Backend failures (the request continues uncached)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    bypassed: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Hits over cacheable lookups (0.0 before the first lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters and hit rate as a dict."""
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class LLMResponseCache:
+    """
+    Response cache front-end used by LLM implementations.
+
+    Attributes:
+        backend: Storage backend
+        ttl_seconds: Time to live of new entries (None: never expire)
+        key_mode: How message text is keyed
+        deterministic_only: Only cache requests with temperature 0
+        namespace: Prefix separating caches that share a backend
+        metrics: Hit/miss counters
+    """
+
+    def __init__(
+        self,
+        backend: Optional[IResponseCacheBackend] = None,
+        ttl_seconds: Optional[float] = DEFAULT_RESPONSE_CACHE_TTL_SECONDS,
+        key_mode: CacheKeyMode = CacheKeyMode.EXACT,
+        deterministic_only: bool = True,
+        namespace: str = "",
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            backend: Storage backend (default: InMemoryResponseCache)
+            ttl_seconds: Time to live of new entries
+            key_mode: EXACT or NORMALIZED message keys
+            deterministic_only: Only cache requests with temperature 0
+            namespace: Key prefix (e.g. a prompt version or tenant)
+        """
+        self.backend = backend if backend is not None else InMemoryResponseCache()
+        self.ttl_seconds = ttl_seconds
+        self.key_mode = CacheKeyMode(key_mode)
+        self.deterministic_only = deterministic_only
+        self.namespace = namespace
+        self.metrics = ResponseCacheMetrics()
+        self.logger = LoggerAdaptor.get_logger("llm.response-cache")
+
+    # ============================================================================
+    # KEYS
+    # ============================================================================
+
+    def is_cacheable(self, payload: Dict[str, Any]) -> bool:
+        """Whether a request payload may be served from the cache."""
+        return not self.deterministic_only or payload.get(PARAM_TEMPERATURE) == 0
+
+    def make_key(self, model: str, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the cache key of a request.
+
+        Args:
+            model: Model/deployment identifier
+            payload: Provider request payload (messages and parameters)
+
+        Returns:
+            Hex digest, or None if the request is not cacheable
+        """
+        if not self.is_cacheable(payload):
+            self.metrics.bypassed += 1
+            return None
+        if self.key_mode is CacheKeyMode.NORMALIZED:
+            payload = _normalized_payload(payload)
+        canonical = json.dumps(
+            {"namespace": self.namespace, "model": model, "payload": payload},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    # ============================================================================
+    # LOOKUPS
+    # ============================================================================
+
+    async def get_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached provider response."""
+        return await self._get(key)
+
+    async def store_response(self, key: str, response: Dict[str, Any]) -> None:
+        """Cache a provider response."""
+        await self._set(key, response)
+
+    async def get_stream(self, key: str) -> Optional[List[str]]:
+        """Get cached stream lines, in the order they were received."""
+        return await self._get(key)
+
+    async def store_stream(self, key: str, lines: List[str]) -> None:
+        """Cache the lines of a completed stream."""
+        await self._set(key, lines)
+
+    async def invalidate(self, key: str) -> None:
+        """Remove an entry."""
+        try:
+            await self.backend.delete(key)
+        except Exception as e:
+            self._record_error("delete", e)
+
+    async def clear(self) -> None:
+        """Remove all entries and reset metrics."""
+        await self.backend.clear()
+        self.reset_metrics()
+
+    # ============================================================================
+    # METRICS
+    # ============================================================================
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dict with hits, misses, stores, bypassed, errors and hit_rate
+        """
+        return self.metrics.to_dict()
+
+    def reset_metrics(self) -> None:
+        """Reset all counters."""
+        self.metrics = ResponseCacheMetrics()
+
+    # ============================================================================
+    # INTERNALS
+    # ============================================================================
+
+    async def _get(self, key: str) -> Optional[Any]:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self._record_error("get", e)
+            value = None
+        if value is None:
+            self.metrics.misses += 1
+        else:
+            self.metrics.hits += 1
+        return value
+
+    async def _set(self, key: str, value: Any) -> None:
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+            self.metrics.stores += 1
+        except Exception as e:
+            self._record_error("set", e)
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        self.metrics.errors += 1
+        self.logger.warning("Response cache backend failed", operation=operation, error=str(error))
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _normalized_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload copy with whitespace-normalized message text."""
+    messages = []
+    for message in payload.get(OPENAI_FIELD_MESSAGES, []):
+        content = message.get(MESSAGE_FIELD_CONTENT)
+        if isinstance(content, str):
+            message = {**message, MESSAGE_FIELD_CONTENT: _normalize_text(content)}
+        elif isinstance(content, list):
+            message = {**message, MESSAGE_FIELD_CONTENT: [
+                {**item, "text": _normalize_text(item["text"])}
+                if isinstance(item, dict) and isinstance(item.get("text"), str) else item
+                for item in content
+            ]}
+        messages.append(message)
+    return {**payload, OPENAI_FIELD_MESSAGES: messages}
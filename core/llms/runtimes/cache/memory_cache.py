@@ -0,0 +1,67 @@
+"""
+In-Memory Response Cache.
+
+Process-local LRU backend for the LLM response cache.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from ...interfaces.llm_interfaces import IResponseCacheBackend
+from ...constants import DEFAULT_RESPONSE_CACHE_MAX_ENTRIES
+
+
+class InMemoryResponseCache(IResponseCacheBackend):
+    """
+    LRU cache with per-entry expiry.
+
+    All operations run on the event loop without awaiting, so no lock is
+    needed between coroutines.
+
+    Usage:
+        backend = InMemoryResponseCache(max_entries=5000)
+        cache = LLMResponseCache(backend, ttl_seconds=600)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries; least recently used
+                entries are evicted first
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove all values."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,139 @@
+"""
+SQLite Response Cache.
+
+On-disk backend for the LLM response cache, shared by every process that
+points at the same file and kept across restarts. Reads use SQLite's
+memory-mapped I/O; queries run in a worker thread so the event loop is not
+blocked by disk access.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ...interfaces.llm_interfaces import IResponseCacheBackend
+from ...constants import (
+    DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_MMAP_BYTES,
+    RESPONSE_CACHE_PRUNE_INTERVAL,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    created_at REAL NOT NULL
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_created ON llm_response_cache (created_at)"
+
+
+class SQLiteResponseCache(IResponseCacheBackend):
+    """
+    SQLite-backed cache with per-entry expiry.
+
+    Values are stored as JSON. Expired entries are skipped on read and
+    removed, together with the oldest entries above max_entries, every
+    RESPONSE_CACHE_PRUNE_INTERVAL writes.
+
+    Usage:
+        backend = SQLiteResponseCache("cache/llm_responses.sqlite")
+        cache = LLMResponseCache(backend, ttl_seconds=86400)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        mmap_bytes: int = DEFAULT_RESPONSE_CACHE_MMAP_BYTES,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Database file (":memory:" for a private in-memory database)
+            max_entries: Maximum number of entries kept after pruning
+            mmap_bytes: Size of SQLite's memory-mapped I/O region (0 disables)
+        """
+        self.path = str(path)
+        self.max_entries = max_entries
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_INDEX)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value."""
+        await asyncio.to_thread(self._set, key, json.dumps(value), ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        await asyncio.to_thread(self._execute, "DELETE FROM llm_response_cache WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        """Remove all values."""
+        await asyncio.to_thread(self._execute, "DELETE FROM llm_response_cache", ())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return json.loads(value)
+
+    def _set(self, key: str, value: str, ttl_seconds: Optional[float]) -> None:
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % RESPONSE_CACHE_PRUNE_INTERVAL == 0:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Remove expired entries and the oldest entries above max_entries."""
+        self._conn.execute(
+            "DELETE FROM llm_response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        self._conn.execute(
+            "DELETE FROM llm_response_cache WHERE key IN ("
+            "SELECT key FROM llm_response_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
@@ -8,7 +8,8 @@ from typing import Optional, Type
 from pydantic import BaseModel
 from ...interfaces.llm_interfaces import IStructuredOutputHandler, Parameters
 from ...spec.llm_output_config import OutputConfig, OutputFormat, ParseResult
-from utils.converters import pydantic_to_openai_schema, parse_structured_response
+from ...spec.llm_request_state import LLMRequestState
+from utils.converters import parse_structured_response, get_schema_registry
 from utils.logging.LoggerAdaptor import LoggerAdaptor
 
 
@@ -22,10 +23,13 @@ class BasicStructuredHandler(IStructuredOutputHandler):
     - Response mode handling (STRICT, IMMEDIATE, BEST_EFFORT)
     - Retry logic for validation failures
     
+    Safe to share between concurrent calls when each call passes its own
+    LLMRequestState; without one, the resolved schema is kept on the handler.
+    
     Usage:
-        handler = BasicStructuredHandler()
-        params = handler.prepare_request(params, output_config)
-        result = handler.validate_output(content, output_config)
+        state = LLMRequestState(output_config=output_config)
+        params = handler.prepare_request(params, output_config, state=state)
+        result = handler.validate_output(content, output_config, state=state)
     """
     
     def __init__(self):
@@ -36,16 +40,20 @@ class BasicStructuredHandler(IStructuredOutputHandler):
     def prepare_request(
         self,
         params: Parameters,
-        output_config: OutputConfig
+        output_config: OutputConfig,
+        state: Optional[LLMRequestState] = None
     ) -> Parameters:
         """
         Prepare request parameters for structured output.
         
-        Converts Pydantic models to OpenAI schema format.
+        Pydantic models are converted to OpenAI schema format once per
+        (model, strict) by the schema registry; later calls reuse the cached,
+        pre-serialized response_format.
         
         Args:
             params: Request parameters
             output_config: Output configuration
+            state: Request state that receives the resolved schema
             
         Returns:
             Modified parameters with response_format
@@ -58,15 +66,18 @@ class BasicStructuredHandler(IStructuredOutputHandler):
         
         # If it's a Pydantic model class, convert to OpenAI schema
         if isinstance(response_format, type) and issubclass(response_format, BaseModel):
-            self.logger.info(
-                "Converting Pydantic model to OpenAI schema",
+            self.logger.debug(
+                "Using OpenAI schema for Pydantic model",
                 model_name=response_format.__name__
             )
-            self._response_schema = response_format
-            result["response_format"] = pydantic_to_openai_schema(
+            if state is not None:
+                state.response_schema = response_format
+            else:
+                self._response_schema = response_format
+            result["response_format"] = get_schema_registry().get(
                 response_format,
                 strict=output_config.strict_schema
-            )
+            ).response_format
         elif isinstance(response_format, dict):
             # Already in OpenAI format
             result["response_format"] = response_format
@@ -77,7 +88,8 @@ class BasicStructuredHandler(IStructuredOutputHandler):
     def validate_output(
         self,
         content: str,
-        output_config: OutputConfig
+        output_config: OutputConfig,
+        state: Optional[LLMRequestState] = None
     ) -> ParseResult:
         """
         Validate response content against output configuration.
@@ -85,6 +97,7 @@ class BasicStructuredHandler(IStructuredOutputHandler):
         Args:
             content: Response content
             output_config: Output configuration with schema
+            state: Request state of the call
             
         Returns:
             ParseResult with validation status and parsed output
@@ -100,13 +113,13 @@ class BasicStructuredHandler(IStructuredOutputHandler):
         
         try:
             if output_type == OutputFormat.PYDANTIC:
-                schema = self._response_schema or output_config.response_format
+                resolved = state.response_schema if state is not None else self._response_schema
+                schema = resolved or output_config.response_format
                 if isinstance(schema, type) and issubclass(schema, BaseModel):
-                    validated_obj = parse_structured_response(
-                        content,
+                    validated_obj = get_schema_registry().get(
                         schema,
-                        partial=False
-                    )
+                        strict=output_config.strict_schema
+                    ).validate(content)
                     
                     self.logger.info(
                         "Structured output validated successfully",
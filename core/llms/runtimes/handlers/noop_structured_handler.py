@@ -4,8 +4,10 @@ No-Op Structured Output Handler.
 Returns content without validation (for debugging/testing).
 """
 
+from typing import Optional
 from ...interfaces.llm_interfaces import IStructuredOutputHandler, Parameters
 from ...spec.llm_output_config import OutputConfig, ParseResult
+from ...spec.llm_request_state import LLMRequestState
 
 
 class NoOpStructuredHandler(IStructuredOutputHandler):
@@ -25,7 +27,8 @@ class NoOpStructuredHandler(IStructuredOutputHandler):
     def prepare_request(
         self,
         params: Parameters,
-        output_config: OutputConfig
+        output_config: OutputConfig,
+        state: Optional[LLMRequestState] = None
     ) -> Parameters:
         """Return parameters unchanged."""
         return params.copy()
@@ -33,7 +36,8 @@ class NoOpStructuredHandler(IStructuredOutputHandler):
     def validate_output(
         self,
         content: str,
-        output_config: OutputConfig
+        output_config: OutputConfig,
+        state: Optional[LLMRequestState] = None
     ) -> ParseResult:
         """Return content without validation."""
         return ParseResult(
@@ -0,0 +1,35 @@
+"""
+LLM Token Counters - Token Counting for Limits, Usage and Trimming.
+
+Available counters:
+- HeuristicTokenCounter: ~4 chars per token (no dependencies)
+- TiktokenTokenCounter: BPE encoder with a cached encoding (requires tiktoken)
+
+Usage:
+    from core.llms.runtimes.token_counters import TokenCounterFactory
+    
+    # BPE counter if available, heuristic otherwise
+    counter = TokenCounterFactory.get_counter()
+    
+    # Streamed completion tokens, counted per chunk
+    stream = counter.start_stream()
+    stream.add(chunk.content)
+    
+    # Fit history to a token budget before sending
+    messages = counter.trim_messages(messages, max_tokens=8000)
+"""
+
+from .base_token_counter import BaseTokenCounter, TokenStream, trim_messages
+from .heuristic_token_counter import HeuristicTokenCounter
+from .tiktoken_token_counter import TiktokenTokenCounter, TIKTOKEN_AVAILABLE
+from .token_counter_factory import TokenCounterFactory
+
+__all__ = [
+    "BaseTokenCounter",
+    "TokenStream",
+    "trim_messages",
+    "HeuristicTokenCounter",
+    "TiktokenTokenCounter",
+    "TIKTOKEN_AVAILABLE",
+    "TokenCounterFactory",
+]
@@ -0,0 +1,228 @@
+"""
+Base Token Counter.
+
+Shared logic for token counters: per-content count cache, message
+overhead, incremental counting of streamed text and history trimming.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ...interfaces.llm_interfaces import ITokenCounter, Messages
+from ...constants import (
+    MESSAGE_FIELD_ROLE,
+    MESSAGE_FIELD_CONTENT,
+    TOKENS_PER_MESSAGE_OVERHEAD,
+    TOKEN_COUNT_CACHE_SIZE,
+)
+
+# Shorter texts are counted directly; a cache lookup would cost as much
+_MIN_CACHED_LENGTH = 64
+
+_ROLE_SYSTEM = "system"
+_ROLE_TOOL = "tool"
+
+
+def message_texts(message: Dict[str, Any]) -> Iterator[str]:
+    """
+    Yield the text parts of a message.
+
+    Args:
+        message: Message dict (text or multimodal content)
+
+    Yields:
+        Text content; multimodal items without text are skipped
+    """
+    content = message.get(MESSAGE_FIELD_CONTENT, "")
+    if isinstance(content, str):
+        yield content
+    elif isinstance(content, list):
+        # Multimodal content
+        for item in content:
+            if isinstance(item, dict) and 'text' in item:
+                yield item['text']
+    elif content is not None:
+        yield str(content)
+
+
+def trim_messages(messages: Messages, max_tokens: int, counter: ITokenCounter) -> List[Dict[str, Any]]:
+    """
+    Drop the oldest conversation turns until messages fit in max_tokens.
+
+    System messages and the last message are always kept. A message and
+    the tool results that follow it are kept or dropped as one group, so
+    no tool message is left without the assistant call that requested it
+    (a trailing tool result keeps its call).
+
+    Args:
+        messages: Messages in conversation order
+        max_tokens: Token budget for the messages
+        counter: Token counter
+
+    Returns:
+        New list of messages; may still exceed max_tokens if the kept
+        messages alone do
+    """
+    counts = [counter.count_messages([message]) for message in messages]
+    total = sum(counts)
+    if total <= max_tokens or len(messages) < 2:
+        return list(messages)
+
+    # Groups: a message plus the tool results that follow it
+    groups: List[List[int]] = []
+    for index, message in enumerate(messages):
+        if groups and message.get(MESSAGE_FIELD_ROLE) == _ROLE_TOOL:
+            groups[-1].append(index)
+        else:
+            groups.append([index])
+
+    dropped = set()
+    for group in groups[:-1]:  # The group holding the last message is kept
+        if total <= max_tokens:
+            break
+        if messages[group[0]].get(MESSAGE_FIELD_ROLE) == _ROLE_SYSTEM:
+            continue
+        dropped.update(group)
+        total -= sum(counts[index] for index in group)
+
+    return [message for i, message in enumerate(messages) if i not in dropped]
+
+
+class TokenStream:
+    """
+    Running token count of streamed text.
+
+    Each chunk is counted once as it arrives, so the total never requires
+    joining the accumulated content.
+
+    Attributes:
+        count: Tokens counted so far
+    """
+
+    def __init__(self, counter: 'BaseTokenCounter'):
+        self._counter = counter
+        self.count = 0
+
+    def add(self, text: str) -> int:
+        """
+        Count a streamed chunk.
+
+        Args:
+            text: Chunk content
+
+        Returns:
+            Total tokens counted so far
+        """
+        if text:
+            self.count += self._counter.count_chunk(text)
+        return self.count
+
+
+class BaseTokenCounter(ITokenCounter, ABC):
+    """
+    Base implementation of ITokenCounter.
+
+    Subclasses implement count_chunk(). Counts of longer texts are cached by
+    (hash, length) of the content, so conversation history that is sent again
+    on every turn is only tokenized once.
+
+    Usage:
+        counter = TokenCounterFactory.get_counter()
+        prompt_tokens = counter.count_messages(messages)
+
+        stream = counter.start_stream()
+        for chunk in chunks:
+            stream.add(chunk)
+        completion_tokens = stream.count
+
+        messages = counter.trim_messages(messages, max_tokens=8000)
+    """
+
+    def __init__(self, cache_size: int = TOKEN_COUNT_CACHE_SIZE):
+        """
+        Initialize counter.
+
+        Args:
+            cache_size: Maximum number of cached content counts (0 disables)
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def count_chunk(self, text: str) -> int:
+        """
+        Count tokens in text without caching.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Token count
+        """
+
+    def count_text(self, text: str) -> int:
+        """
+        Count tokens in text, using the content cache for longer texts.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Token count
+        """
+        if len(text) < _MIN_CACHED_LENGTH or not self.cache_size:
+            return self.count_chunk(text)
+
+        key = (hash(text), len(text))
+        with self._lock:
+            count = self._cache.get(key)
+            if count is not None:
+                self._cache.move_to_end(key)
+                return count
+
+        count = self.count_chunk(text)
+        with self._lock:
+            self._cache[key] = count
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return count
+
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """
+        Count tokens of one message, including formatting overhead.
+
+        Args:
+            message: Message dict (text or multimodal content)
+
+        Returns:
+            Token count
+        """
+        return TOKENS_PER_MESSAGE_OVERHEAD + sum(self.count_text(text) for text in message_texts(message))
+
+    def count_messages(self, messages: Messages) -> int:
+        """
+        Count tokens of messages, including per-message overhead.
+
+        Args:
+            messages: Messages to count
+
+        Returns:
+            Token count
+        """
+        return sum(self.count_message(message) for message in messages)
+
+    def start_stream(self) -> TokenStream:
+        """Start an incremental count for streamed text."""
+        return TokenStream(self)
+
+    def trim_messages(self, messages: Messages, max_tokens: int) -> List[Dict[str, Any]]:
+        """Drop the oldest conversation turns until messages fit (see trim_messages())."""
+        return trim_messages(messages, max_tokens, self)
+
+    def clear_cache(self) -> None:
+        """Drop all cached counts."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,52 @@
+"""
+Heuristic Token Counter.
+
+Estimates tokens as ~4 characters per token. No dependencies; used when no
+BPE encoder is available.
+"""
+
+from ...interfaces.llm_interfaces import Messages
+from ...constants import CHARS_PER_TOKEN_ESTIMATE, TOKENS_PER_MESSAGE_OVERHEAD
+from .base_token_counter import BaseTokenCounter, TokenStream, message_texts
+
+
+class HeuristicTokenStream(TokenStream):
+    """Streamed count over the total character count (no per-chunk rounding)."""
+
+    def __init__(self, counter: 'HeuristicTokenCounter'):
+        super().__init__(counter)
+        self._chars = 0
+
+    def add(self, text: str) -> int:
+        self._chars += len(text)
+        self.count = self._chars // CHARS_PER_TOKEN_ESTIMATE
+        return self.count
+
+
+class HeuristicTokenCounter(BaseTokenCounter):
+    """
+    Character-based token estimate.
+
+    Counting is O(1) per text, so nothing is cached.
+
+    Usage:
+        counter = HeuristicTokenCounter()
+        tokens = counter.count_messages(messages)
+    """
+
+    def __init__(self):
+        """Initialize counter (no cache)."""
+        super().__init__(cache_size=0)
+
+    def count_chunk(self, text: str) -> int:
+        """Estimate tokens as characters / CHARS_PER_TOKEN_ESTIMATE."""
+        return len(text) // CHARS_PER_TOKEN_ESTIMATE
+
+    def count_messages(self, messages: Messages) -> int:
+        """Estimate over the total character count, plus message overhead."""
+        total_chars = sum(len(text) for message in messages for text in message_texts(message))
+        return (total_chars // CHARS_PER_TOKEN_ESTIMATE) + (len(messages) * TOKENS_PER_MESSAGE_OVERHEAD)
+
+    def start_stream(self) -> HeuristicTokenStream:
+        """Start an incremental count for streamed text."""
+        return HeuristicTokenStream(self)
@@ -0,0 +1,109 @@
+"""
+Tiktoken Token Counter.
+
+Counts tokens with a BPE encoder from the optional `tiktoken` package.
+Encoders are loaded once per encoding name and shared by all counters.
+
+tiktoken downloads an encoding's BPE file the first time it is loaded on a
+host; is_encoding_cached() tells whether loading would stay local.
+"""
+
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import Any
+
+from ...constants import DEFAULT_TIKTOKEN_ENCODING, TIKTOKEN_ENCODING_URLS, TOKEN_COUNT_CACHE_SIZE
+from .base_token_counter import BaseTokenCounter
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def get_encoding(encoding_name: str) -> Any:
+    """
+    Load a tiktoken encoding (cached per name).
+
+    Args:
+        encoding_name: Encoding name, e.g. "o200k_base" or "cl100k_base"
+
+    Returns:
+        tiktoken Encoding
+
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    if not TIKTOKEN_AVAILABLE:
+        raise ImportError("tiktoken is not installed. Install with: pip install tiktoken")
+    return tiktoken.get_encoding(encoding_name)
+
+
+def is_encoding_cached(encoding_name: str) -> bool:
+    """
+    Check whether an encoding can be loaded without a download.
+
+    Mirrors tiktoken's cache location (TIKTOKEN_CACHE_DIR, DATA_GYM_CACHE_DIR,
+    else <tempdir>/data-gym-cache). Encodings whose BPE file is unknown here
+    are reported as not cached.
+
+    Args:
+        encoding_name: Encoding name, e.g. "o200k_base"
+
+    Returns:
+        True if tiktoken is installed and the encoding's BPE file is cached locally
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return False
+    url = TIKTOKEN_ENCODING_URLS.get(encoding_name)
+    if url is None:
+        return False
+    if "TIKTOKEN_CACHE_DIR" in os.environ:
+        cache_dir = os.environ["TIKTOKEN_CACHE_DIR"]
+    elif "DATA_GYM_CACHE_DIR" in os.environ:
+        cache_dir = os.environ["DATA_GYM_CACHE_DIR"]
+    else:
+        cache_dir = os.path.join(tempfile.gettempdir(), "data-gym-cache")
+    if not cache_dir:
+        return False  # Caching disabled: every load downloads
+    return os.path.exists(os.path.join(cache_dir, hashlib.sha1(url.encode()).hexdigest()))
+
+
+class TiktokenTokenCounter(BaseTokenCounter):
+    """
+    Exact token counts from a BPE encoder.
+
+    Special-token markers in the text are counted as ordinary text.
+
+    Usage:
+        counter = TiktokenTokenCounter("o200k_base")
+        tokens = counter.count_messages(messages)
+    """
+
+    def __init__(
+        self,
+        encoding_name: str = DEFAULT_TIKTOKEN_ENCODING,
+        cache_size: int = TOKEN_COUNT_CACHE_SIZE
+    ):
+        """
+        Initialize counter.
+
+        Args:
+            encoding_name: tiktoken encoding name
+            cache_size: Maximum number of cached content counts
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        super().__init__(cache_size=cache_size)
+        self.encoding_name = encoding_name
+        self._encoding = get_encoding(encoding_name)
+
+    def count_chunk(self, text: str) -> int:
+        """Count BPE tokens of text."""
+        return len(self._encoding.encode_ordinary(text))
@@ -0,0 +1,123 @@
+"""
+Token Counter Factory.
+
+Provides a centralized way to get and register token counters by name.
+"""
+
+from typing import Callable, Dict
+from ...interfaces.llm_interfaces import ITokenCounter
+from .heuristic_token_counter import HeuristicTokenCounter
+from .tiktoken_token_counter import TiktokenTokenCounter, is_encoding_cached
+from ...constants import DEFAULT_TIKTOKEN_ENCODING
+from utils.logging.LoggerAdaptor import LoggerAdaptor
+
+
+# Constants
+AUTO = "auto"
+HEURISTIC = "heuristic"
+TIKTOKEN = "tiktoken"
+
+
+def _auto_counter() -> ITokenCounter:
+    """
+    BPE counter if its encoding is available locally, heuristic otherwise.
+    
+    The auto counter is built lazily inside a live request, so it never
+    triggers tiktoken's first-use download (blocking, and a hang offline).
+    """
+    if not is_encoding_cached(DEFAULT_TIKTOKEN_ENCODING):
+        LoggerAdaptor.get_logger("llm.token_counter").info(
+            "BPE encoding not cached locally, using heuristic token counts",
+            encoding=DEFAULT_TIKTOKEN_ENCODING
+        )
+        return TokenCounterFactory.get_counter(HEURISTIC)
+    try:
+        return TokenCounterFactory.get_counter(TIKTOKEN)
+    except Exception as e:
+        LoggerAdaptor.get_logger("llm.token_counter").info(
+            "BPE encoder unavailable, using heuristic token counts",
+            error=str(e)
+        )
+        return TokenCounterFactory.get_counter(HEURISTIC)
+
+
+class TokenCounterFactory:
+    """
+    Factory for token counter instances.
+    
+    Counters are created on first use and shared, so their content caches
+    are shared by every LLM and validator.
+    
+    Built-in Counters:
+        - 'auto': 'tiktoken' if its encoding is cached locally, else
+          'heuristic' (default)
+        - 'heuristic': HeuristicTokenCounter - ~4 chars per token
+        - 'tiktoken': TiktokenTokenCounter - BPE encoder (requires tiktoken;
+          downloads the encoding on first use if it is not cached)
+    
+    Usage:
+        counter = TokenCounterFactory.get_counter()
+        
+        # Register custom counter
+        TokenCounterFactory.register('my_counter', MyTokenCounter())
+    """
+    
+    _counters: Dict[str, ITokenCounter] = {
+        HEURISTIC: HeuristicTokenCounter(),
+    }
+    
+    _builders: Dict[str, Callable[[], ITokenCounter]] = {
+        AUTO: _auto_counter,
+        TIKTOKEN: TiktokenTokenCounter,
+    }
+    
+    @classmethod
+    def get_counter(cls, name: str = AUTO) -> ITokenCounter:
+        """
+        Get a token counter by name.
+        
+        Args:
+            name: Counter name ('auto', 'heuristic', 'tiktoken', etc.)
+            
+        Returns:
+            ITokenCounter instance
+            
+        Raises:
+            ValueError: If counter name is not registered
+            ImportError: If 'tiktoken' is requested but not installed
+        """
+        counter = cls._counters.get(name)
+        if counter is not None:
+            return counter
+        
+        builder = cls._builders.get(name)
+        if not builder:
+            available = ", ".join(cls.list_counters())
+            raise ValueError(
+                f"Unknown token counter: '{name}'. Available counters: {available}"
+            )
+        
+        counter = builder()
+        cls._counters[name] = counter
+        return counter
+    
+    @classmethod
+    def register(cls, name: str, counter: ITokenCounter) -> None:
+        """
+        Register a custom token counter.
+        
+        Args:
+            name: Name to register the counter under
+            counter: Counter instance implementing ITokenCounter
+        """
+        cls._counters[name] = counter
+    
+    @classmethod
+    def list_counters(cls) -> list:
+        """
+        List all registered counter names.
+        
+        Returns:
+            List of counter names
+        """
+        return list(dict.fromkeys([*cls._counters, *cls._builders]))
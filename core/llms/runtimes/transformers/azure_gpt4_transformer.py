@@ -4,7 +4,7 @@ Azure GPT-4 Parameter Transformer.
 Transforms standard parameters to Azure GPT-4.x specific format.
 """
 
-from typing import List, Optional, Type
+from typing import List
 from pydantic import BaseModel
 from ...interfaces.llm_interfaces import IParameterTransformer, Parameters
 from ...spec.llm_schema import ModelMetadata
@@ -13,7 +13,7 @@ from ...constants import (
     PARAM_MAX_COMPLETION_TOKENS,
     PARAM_TEMPERATURE,
 )
-from utils.converters import pydantic_to_openai_schema
+from utils.converters import get_schema_registry
 from utils.logging.LoggerAdaptor import LoggerAdaptor
 
 
@@ -26,6 +26,9 @@ class AzureGPT4Transformer(IParameterTransformer):
     - Temperature removal (if not supported)
     - Response format conversion (Pydantic → OpenAI schema)
     
+    Stateless, so one instance is shared by concurrent calls; the response
+    model of a call is kept on its LLMRequestState by the structured handler.
+    
     Usage:
         transformer = AzureGPT4Transformer()
         params = transformer.transform(params, metadata)
@@ -46,7 +49,6 @@ class AzureGPT4Transformer(IParameterTransformer):
         self.remove_temperature = remove_temperature
         self.convert_response_format = convert_response_format
         self.logger = LoggerAdaptor.get_logger("llm.transformer.azure_gpt4")
-        self._response_schema: Optional[Type[BaseModel]] = None
     
     def transform(
         self,
@@ -92,12 +94,11 @@ class AzureGPT4Transformer(IParameterTransformer):
             
             # If it's a Pydantic model class, convert to OpenAI schema
             if isinstance(response_format, type) and issubclass(response_format, BaseModel):
-                self.logger.info(
-                    "Converting Pydantic model to OpenAI schema",
+                self.logger.debug(
+                    "Using OpenAI schema for Pydantic model",
                     model_name=response_format.__name__
                 )
-                self._response_schema = response_format
-                transformed["response_format"] = pydantic_to_openai_schema(response_format)
+                transformed["response_format"] = get_schema_registry().get(response_format).response_format
                 self.logger.debug(
                     "Structured output schema configured",
                     schema_name=response_format.__name__
@@ -126,17 +127,4 @@ class AzureGPT4Transformer(IParameterTransformer):
             PARAM_TEMPERATURE,
             "response_format",
         ]
-    
-    def get_response_schema(self) -> Optional[Type[BaseModel]]:
-        """
-        Get the response schema if a Pydantic model was converted.
-        
-        Returns:
-            Pydantic model class or None
-        """
-        return self._response_schema
-    
-    def reset(self) -> None:
-        """Reset transformer state."""
-        self._response_schema = None
 
@@ -5,7 +5,8 @@ Provides comprehensive validation for messages and parameters.
 This is the default validator used by all LLM implementations.
 """
 
-from ...interfaces.llm_interfaces import ILLMValidator, Messages, Parameters
+from typing import Optional
+from ...interfaces.llm_interfaces import ILLMValidator, ITokenCounter, Messages, Parameters
 from ...spec.llm_schema import ModelMetadata
 from ...exceptions import InputValidationError, TokenLimitError
 from ...constants import (
@@ -15,9 +16,8 @@ from ...constants import (
     ERROR_MSG_MESSAGE_NOT_DICT,
     ERROR_MSG_MISSING_ROLE,
     ERROR_MSG_MISSING_CONTENT,
-    CHARS_PER_TOKEN_ESTIMATE,
-    TOKENS_PER_MESSAGE_OVERHEAD,
 )
+from ..token_counters import TokenCounterFactory
 
 
 class BasicLLMValidator(ILLMValidator):
@@ -39,6 +39,23 @@ class BasicLLMValidator(ILLMValidator):
         await validator.validate_token_limits(messages, 1000, metadata)
     """
     
+    def __init__(self, token_counter: Optional[ITokenCounter] = None):
+        """
+        Initialize validator.
+        
+        Args:
+            token_counter: Counter for token limits
+                (default: TokenCounterFactory 'auto', resolved on first use)
+        """
+        self._token_counter = token_counter
+    
+    @property
+    def token_counter(self) -> ITokenCounter:
+        """Token counter used for limit validation."""
+        if self._token_counter is None:
+            self._token_counter = TokenCounterFactory.get_counter()
+        return self._token_counter
+    
     async def validate_messages(
         self,
         messages: Messages,
@@ -143,7 +160,7 @@ class BasicLLMValidator(ILLMValidator):
         """
         Validate that token limits won't be exceeded.
         
-        Uses simple heuristic: ~4 chars per token + message overhead.
+        Counts with the token counter (cached per message content).
         
         Args:
             messages: Input messages
@@ -174,27 +191,12 @@ class BasicLLMValidator(ILLMValidator):
     
     def _estimate_tokens(self, messages: Messages) -> int:
         """
-        Estimate token count for messages.
-        
-        Uses simple heuristic: ~4 chars per token + message overhead.
+        Count tokens for messages.
         
         Args:
-            messages: Messages to estimate
+            messages: Messages to count
             
         Returns:
-            Estimated token count
+            Token count including message overhead
         """
-        total_chars = 0
-        for msg in messages:
-            content = msg.get(MESSAGE_FIELD_CONTENT, "")
-            if isinstance(content, str):
-                total_chars += len(content)
-            elif isinstance(content, list):
-                # Multimodal content
-                for item in content:
-                    if isinstance(item, dict) and 'text' in item:
-                        total_chars += len(item['text'])
-        
-        estimated_tokens = (total_chars // CHARS_PER_TOKEN_ESTIMATE) + (len(messages) * TOKENS_PER_MESSAGE_OVERHEAD)
-        return estimated_tokens
-
+        return self.token_counter.count_messages(messages)
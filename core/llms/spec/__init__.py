@@ -30,6 +30,7 @@ from .llm_output_config import (
     ResponseMode,
     ParseResult,
 )
+from .llm_request_state import LLMRequestState
 
 __all__ = [
     # Types
@@ -58,5 +59,7 @@ __all__ = [
     "OutputFormat",
     "ResponseMode",
     "ParseResult",
+    # Request State
+    "LLMRequestState",
 ]
 
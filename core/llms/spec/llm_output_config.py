@@ -46,6 +46,8 @@ class OutputConfig(BaseModel):
         max_retries: Maximum retries if structured output parsing fails
         response_mode: How to handle parsing failures
         strict_schema: Whether to enforce strict schema validation
+        stream_partial_output: Whether streamed chunks carry the partially
+            parsed object and completed fields in their metadata
         
     Example:
         # Simple text output
@@ -93,6 +95,11 @@ class OutputConfig(BaseModel):
         description="Whether to enforce strict schema validation"
     )
     
+    stream_partial_output: bool = Field(
+        default=False,
+        description="Parse streamed structured output incrementally and attach partial_output to each chunk"
+    )
+    
     model_config = {"arbitrary_types_allowed": True}
     
     @property
@@ -0,0 +1,39 @@
+"""
+LLM Request State.
+
+Per-call state of an LLM request (output configuration, resolved response
+schema). Created by get_answer/stream_answer and passed explicitly through
+the execution pipeline and the structured output handler, so a single LLM
+instance can serve many concurrent calls without sharing mutable state.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+from .llm_output_config import OutputConfig
+
+
+@dataclass
+class LLMRequestState:
+    """
+    State owned by one get_answer/stream_answer call.
+
+    Attributes:
+        output_config: Output configuration of the call (None for plain text)
+        response_schema: Pydantic model resolved by the structured handler
+
+    Example:
+        state = LLMRequestState(output_config=OutputConfig(response_format=Story))
+        params = handler.prepare_request(params, state.output_config, state=state)
+        result = handler.validate_output(content, state.output_config, state=state)
+    """
+
+    output_config: Optional[OutputConfig] = None
+    response_schema: Optional[Type[BaseModel]] = None
+
+    @property
+    def expects_structured_output(self) -> bool:
+        """Whether the call requests structured output."""
+        return self.output_config is not None and self.output_config.expects_structured_output
@@ -187,6 +187,8 @@ from .agent import (
 # ============================================================================
 from .cache import (
     NoOpCache,
+    LRUCache,
+    TieredCache,
     CacheFactory,
     # Backward compatibility aliases
     NoOpMemory,
@@ -304,6 +306,8 @@ __all__ = [
     # Cache Components
     # =========================================================================
     "NoOpCache",
+    "LRUCache",
+    "TieredCache",
     "CacheFactory",
     # Backward compatibility
     "NoOpMemory",
@@ -5,6 +5,8 @@ Provides cache/memory operations with TTL and locking support.
 """
 
 from .noop_cache import NoOpCache
+from .lru_cache import LRUCache
+from .tiered_cache import TieredCache
 from .cache_factory import CacheFactory
 
 # Aliases for backward compatibility
@@ -13,6 +15,8 @@ MemoryFactory = CacheFactory
 
 __all__ = [
     "NoOpCache",
+    "LRUCache",
+    "TieredCache",
     "CacheFactory",
     # Backward compatibility aliases
     "NoOpMemory",
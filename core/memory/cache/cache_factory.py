@@ -7,8 +7,13 @@ Provides a centralized way to create and register cache implementations by name.
 from typing import Dict
 
 from ..interfaces import ICache
-from ..constants import NOOP, UNKNOWN_MEMORY_ERROR, COMMA, SPACE
+from ..constants import NOOP, LRU, TIERED, UNKNOWN_MEMORY_ERROR, COMMA, SPACE
 from .noop_cache import NoOpCache
+from .lru_cache import LRUCache
+from .tiered_cache import TieredCache
+
+# Shared in-process store behind 'lru' (and the default L2 of 'tiered')
+_SHARED_LRU = LRUCache()
 
 
 class CacheFactory:
@@ -17,6 +22,12 @@ class CacheFactory:
     
     Built-in Cache Implementations:
         - 'noop': NoOpCache - No caching (for stateless execution)
+        - 'lru': LRUCache - Shared in-process LRU cache with TTL
+        - 'tiered': TieredCache - Bounded L1 in front of the shared 'lru' store
+    
+    Both 'lru' and 'tiered' serve early idempotency lookups (get_local).
+    To front a remote cache with the L1, replace the 'tiered' entry:
+        CacheFactory.register('tiered', TieredCache(remote=RedisCache()))
     
     Usage:
         # Get built-in cache
@@ -29,6 +40,8 @@ class CacheFactory:
     
     _caches: Dict[str, ICache] = {
         NOOP: NoOpCache(),
+        LRU: _SHARED_LRU,
+        TIERED: TieredCache(remote=_SHARED_LRU),
     }
     
     @classmethod
@@ -47,7 +60,7 @@ class CacheFactory:
         """
         cache = cls._caches.get(name)
         
-        if not cache:
+        if cache is None:
             available = (COMMA + SPACE).join(cls._caches.keys())
             raise ValueError(
                 UNKNOWN_MEMORY_ERROR.format(MEMORY_NAME=name, AVAILABLE_MEMORIES=available)
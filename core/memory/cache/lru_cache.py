@@ -0,0 +1,214 @@
+"""
+In-Process LRU Cache Implementation.
+
+Bounded cache with per-entry TTL and least-recently-used eviction.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, Dict, Optional, Tuple
+
+from ..interfaces import ICache
+from ..constants import DEFAULT_LRU_CACHE_MAX_ENTRIES
+
+
+class LRUCache(ICache):
+    """
+    In-process implementation of ICache with LRU eviction and TTL expiry.
+    
+    Entries expire lazily on access. When the cache is full, the least
+    recently used entry is evicted. Locks are asyncio locks and therefore
+    only exclude callers in the same process.
+    
+    Useful for:
+    - Single-process deployments and development
+    - The L1 tier in front of a remote cache (see TieredCache)
+    
+    Usage:
+        cache = LRUCache(max_entries=1000, default_ttl_s=300)
+        
+        await cache.set("key", {"result": 1}, ttl_s=60)
+        value = await cache.get("key")
+        
+        async with cache.lock("resource"):
+            ...
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_LRU_CACHE_MAX_ENTRIES,
+        default_ttl_s: Optional[int] = None,
+    ):
+        """
+        Initialize LRU cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept
+            default_ttl_s: TTL used when set() is called without one (None = no expiry)
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.default_ttl_s = default_ttl_s
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._locks: Dict[str, list] = {}  # key -> [lock, holders]
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        """Find a live entry, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        return True, value
+    
+    def _store(self, key: str, value: Any, ttl_s: Optional[float]) -> None:
+        ttl_s = self.default_ttl_s if ttl_s is None else ttl_s
+        expires_at = time.monotonic() + ttl_s if ttl_s is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+    
+    async def get(self, key: str) -> Any:
+        """
+        Get value from cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found/expired
+        """
+        found, value = self._lookup(key)
+        if not found:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+    
+    async def get_local(self, key: str) -> Any:
+        """
+        Get value from cache (alias of get: the cache is its own local tier).
+        
+        Lets early idempotency lookups use an LRUCache directly.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found/expired
+        """
+        return await self.get(key)
+    
+    async def get_ttl(self, key: str) -> Optional[float]:
+        """
+        Get the remaining time-to-live of an entry.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Seconds until the entry expires, or None if it has no expiry
+            or is not cached
+        """
+        found, _ = self._lookup(key)
+        if not found:
+            return None
+        expires_at = self._entries[key][0]
+        return None if expires_at is None else expires_at - time.monotonic()
+    
+    async def set(self, key: str, value: Any, ttl_s: Optional[int] = None) -> None:
+        """
+        Set value in cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_s: Time-to-live in seconds (default: default_ttl_s)
+        """
+        self._store(key, value, ttl_s)
+    
+    async def set_if_absent(self, key: str, value: Any, ttl_s: Optional[int] = None) -> bool:
+        """
+        Set value only if key is absent or expired.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_s: Time-to-live in seconds (default: default_ttl_s)
+            
+        Returns:
+            True if value was set, False if key already exists
+        """
+        found, _ = self._lookup(key)
+        if found:
+            return False
+        self._store(key, value, ttl_s)
+        return True
+    
+    async def delete(self, key: str) -> None:
+        """
+        Delete value from cache.
+        
+        Args:
+            key: Cache key to delete
+        """
+        self._entries.pop(key, None)
+    
+    @asynccontextmanager
+    async def lock(self, key: str, ttl_s: int = 10) -> AsyncContextManager[None]:
+        """
+        Acquire an in-process lock.
+        
+        Args:
+            key: Lock key
+            ttl_s: Lock time-to-live in seconds (unused; released on exit)
+            
+        Yields:
+            None
+        """
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        # Reference count so the lock is dropped once nobody holds or awaits it
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __bool__(self) -> bool:
+        # An empty cache is still a configured cache (`if ctx.memory:` checks)
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
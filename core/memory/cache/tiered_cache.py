@@ -0,0 +1,148 @@
+"""
+Tiered Cache Implementation.
+
+Fronts a remote cache (L2) with a bounded in-process LRU cache (L1).
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, Dict, Optional
+
+from ..interfaces import ICache
+from ..constants import DEFAULT_LRU_CACHE_MAX_ENTRIES, DEFAULT_TIERED_CACHE_L1_TTL_S
+from .lru_cache import LRUCache
+
+
+class TieredCache(ICache):
+    """
+    Two-level ICache: in-process LRU (L1) in front of a remote store (L2).
+    
+    - get: L1, then L2; L2 hits are copied into L1 for at most the entry's
+      remaining L2 TTL (remote.get_ttl); remotes without get_ttl are not
+      mirrored on read, since L1 could outlive the L2 entry
+    - set / delete: write through to both tiers
+    - set_if_absent / lock: decided by L2 (the shared source of truth)
+    
+    L1 entries live at most `l1_ttl_s` (or the entry TTL if shorter), which
+    bounds how stale L1 can be relative to writes made by other processes.
+    
+    Usage:
+        memory = TieredCache(remote=RedisCache(...), l1_max_entries=5000)
+        ctx = ToolContext(memory=memory)
+        
+        # L1-only lookup (no network), used for early idempotency hits
+        value = await memory.get_local("key")
+    """
+    
+    def __init__(
+        self,
+        remote: ICache,
+        l1_max_entries: int = DEFAULT_LRU_CACHE_MAX_ENTRIES,
+        l1_ttl_s: int = DEFAULT_TIERED_CACHE_L1_TTL_S,
+    ):
+        """
+        Initialize tiered cache.
+        
+        Args:
+            remote: L2 cache shared across processes
+            l1_max_entries: Maximum number of L1 entries
+            l1_ttl_s: Maximum time an entry is served from L1
+        """
+        self.remote = remote
+        self.l1_ttl_s = l1_ttl_s
+        self.local = LRUCache(max_entries=l1_max_entries, default_ttl_s=l1_ttl_s)
+    
+    def _l1_ttl(self, ttl_s: Optional[int]) -> int:
+        return self.l1_ttl_s if ttl_s is None else min(ttl_s, self.l1_ttl_s)
+    
+    async def get_local(self, key: str) -> Any:
+        """
+        Get value from L1 only.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not in L1
+        """
+        return await self.local.get(key)
+    
+    async def get(self, key: str) -> Any:
+        """
+        Get value from L1, falling back to L2.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found/expired
+        """
+        value = await self.local.get(key)
+        if value is not None:
+            return value
+        value = await self.remote.get(key)
+        if value is not None:
+            get_ttl = getattr(self.remote, "get_ttl", None)
+            if get_ttl is not None:
+                remaining = await get_ttl(key)
+                l1_ttl = self._l1_ttl(remaining)
+                if l1_ttl > 0:
+                    await self.local.set(key, value, ttl_s=l1_ttl)
+        return value
+    
+    async def set(self, key: str, value: Any, ttl_s: Optional[int] = None) -> None:
+        """
+        Set value in both tiers.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_s: Time-to-live in seconds
+        """
+        await self.remote.set(key, value, ttl_s=ttl_s)
+        await self.local.set(key, value, ttl_s=self._l1_ttl(ttl_s))
+    
+    async def set_if_absent(self, key: str, value: Any, ttl_s: Optional[int] = None) -> bool:
+        """
+        Set value if absent in L2; mirrors the value into L1 when set.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_s: Time-to-live in seconds
+            
+        Returns:
+            True if value was set, False if key already exists
+        """
+        was_set = await self.remote.set_if_absent(key, value, ttl_s=ttl_s)
+        if was_set:
+            await self.local.set(key, value, ttl_s=self._l1_ttl(ttl_s))
+        return was_set
+    
+    async def delete(self, key: str) -> None:
+        """
+        Delete value from both tiers.
+        
+        Args:
+            key: Cache key to delete
+        """
+        await self.local.delete(key)
+        await self.remote.delete(key)
+    
+    @asynccontextmanager
+    async def lock(self, key: str, ttl_s: int = 10) -> AsyncContextManager[None]:
+        """
+        Acquire the L2 (distributed) lock.
+        
+        Args:
+            key: Lock key
+            ttl_s: Lock time-to-live in seconds
+            
+        Yields:
+            None
+        """
+        async with self.remote.lock(key, ttl_s=ttl_s):
+            yield
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get L1 statistics."""
+        return {"l1": self.local.get_stats()}
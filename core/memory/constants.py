@@ -48,8 +48,10 @@ UNKNOWN_OBSERVER_ERROR = "Unknown observer implementation: {OBSERVER_NAME}. Avai
 # ============================================================================
 
 NOOP = "noop"
+LRU = "lru"
+TIERED = "tiered"
 COMMA = ","
 SPACE = " "
 
-
-
+DEFAULT_LRU_CACHE_MAX_ENTRIES = 10_000
+DEFAULT_TIERED_CACHE_L1_TTL_S = 60  # Upper bound on how long L1 may serve a value
@@ -22,10 +22,11 @@ class ICache(Protocol):
     
     Built-in implementations:
     - NoOpCache: No-op implementation for stateless execution
+    - LRUCache: In-process cache with LRU eviction and TTL
+    - TieredCache: LRUCache (L1) in front of a remote cache (L2)
     
     Future implementations:
     - RedisCache: Redis-based distributed cache
-    - MemCache: In-memory cache with TTL
     
     Example:
         class RedisCache(ICache):
@@ -42,6 +43,12 @@ class ICache(Protocol):
                     yield
                 finally:
                     await lock.release()
+            
+            # Optional: lets TieredCache mirror reads into L1 without
+            # outliving the remote entry
+            async def get_ttl(self, key: str) -> Optional[float]:
+                ttl_ms = await self.redis.pttl(key)
+                return ttl_ms / 1000 if ttl_ms >= 0 else None
     """
     
     async def get(self, key: str) -> Any:
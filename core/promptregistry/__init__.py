@@ -94,12 +94,15 @@ from .spec import (
     PromptTemplate,
     PromptRetrievalResult,
     RuntimeMetrics,
+    UsageDelta,
 )
 
 from .runtimes import (
     LocalPromptRegistry,
     LocalFileStorage,
     PromptRegistryFactory,
+    PromptUsageRecorder,
+    PromptIndex,
     # Validators
     NoOpPromptValidator,
     BasicPromptValidator,
@@ -166,10 +169,13 @@ __all__ = [
     "PromptTemplate",
     "PromptRetrievalResult",
     "RuntimeMetrics",
+    "UsageDelta",
     # Runtimes
     "LocalPromptRegistry",
     "LocalFileStorage",
     "PromptRegistryFactory",
+    "PromptUsageRecorder",
+    "PromptIndex",
     # Validators
     "NoOpPromptValidator",
     "BasicPromptValidator",
@@ -16,6 +16,29 @@ JSON_EXTENSION = ".json"
 YAML_EXTENSION = ".yaml"
 YML_EXTENSION = ".yml"
 
+# Persisted secondary index (no prompt extension, so list_keys() skips it)
+PROMPT_INDEX_FILENAME = ".prompt_index"
+
+# Minimum seconds between index writes on save/delete (close() writes the rest)
+PROMPT_INDEX_PERSIST_INTERVAL_S = 5.0
+
+# Maximum seconds a read trusts an unchanged storage generation before it
+# revalidates every key (catches in-place edits by other processes)
+PROMPT_INDEX_REVALIDATE_INTERVAL_S = 5.0
+
+# A directory mtime this recent may still hide a change made in the same
+# timestamp tick, so it is not trusted as a generation
+PROMPT_INDEX_RACY_WINDOW_NS = 1_000_000_000
+
+# ============================================================================
+# USAGE RECORDING
+# ============================================================================
+
+# Background batching of record_usage() (see PromptUsageRecorder)
+DEFAULT_USAGE_FLUSH_INTERVAL_S = 5.0
+DEFAULT_USAGE_FLUSH_BATCH_SIZE = 100      # Pending events that trigger an early flush
+DEFAULT_USAGE_MAX_PENDING_PROMPTS = 1000  # Distinct prompt IDs held between flushes
+
 # ============================================================================
 # VERSIONING
 # ============================================================================
@@ -147,6 +170,9 @@ CONDITIONAL_BLOCK_PATTERN = r'\{\{#if\s+(.+?)\}\}(.*?)(?:\{\{#else\}\}(.*?))?\{\
 DEFAULT_RECURSIVE_REPLACE = False
 MAX_RECURSION_DEPTH = 3
 
+# Compiled templates shared across PromptTemplate instances (keyed by content hash)
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
 # Legacy pattern (for migration detection)
 LEGACY_VARIABLE_PATTERN = r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}'
 
@@ -555,7 +555,9 @@ class IPromptRegistry(Protocol):
         category: Optional[str] = None,
         tags: Optional[List[str]] = None,
         environment: Optional['PromptEnvironment'] = None,
-        prompt_type: Optional['PromptType'] = None
+        prompt_type: Optional['PromptType'] = None,
+        security_context: Optional[SecurityContext] = None,
+        model: Optional[str] = None
     ) -> List[str]:
         """
         List all prompt labels.
@@ -565,6 +567,8 @@ class IPromptRegistry(Protocol):
             tags: Optional tag filter (prompts must have all tags)
             environment: Optional environment filter
             prompt_type: Optional prompt type filter (system/user)
+            security_context: Optional security context for access filtering
+            model: Optional model filter (at least one version targets it)
             
         Returns:
             List of prompt labels
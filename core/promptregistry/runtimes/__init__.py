@@ -6,6 +6,8 @@ All components are pluggable:
 - Validators: NoOpPromptValidator, BasicPromptValidator, or custom
 - Security: NoOpPromptSecurity, RoleBasedPromptSecurity, or custom
 - BasePromptRegistry: Abstract base class for creating custom registries
+- PromptUsageRecorder: Background, batched record_usage() (enable_usage_batching)
+- PromptIndex: Secondary/inverted index behind ID lookup, list_prompts and search
 - ExpressionEngine: Safe Python expression evaluation for conditionals
 
 Note: LLM usage tracking is now handled directly in core/llms.
@@ -13,6 +15,8 @@ Note: LLM usage tracking is now handled directly in core/llms.
 """
 
 from .base_registry import BasePromptRegistry
+from .usage_recorder import PromptUsageRecorder
+from .prompt_index import PromptIndex
 from .storage import (
     LocalPromptRegistry,
     LocalFileStorage,
@@ -33,12 +37,15 @@ from .security import (
 
 from .expression_engine import (
     SafeExpressionEvaluator,
+    CompiledExpression,
     ExpressionError,
 )
 
 __all__ = [
     # Base
     "BasePromptRegistry",
+    "PromptUsageRecorder",
+    "PromptIndex",
     # Storage
     "LocalPromptRegistry",
     "LocalFileStorage",
@@ -53,6 +60,7 @@ __all__ = [
     "PromptSecurityFactory",
     # Expression Engine
     "SafeExpressionEvaluator",
+    "CompiledExpression",
     "ExpressionError",
 ]
 
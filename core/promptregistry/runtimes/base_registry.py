@@ -5,6 +5,8 @@ Provides common logic for all prompt registry implementations.
 Derived classes only need to implement storage-specific initialization.
 """
 
+import asyncio
+import time
 from abc import ABC
 from typing import Dict, List, Optional, Set, Any
 
@@ -21,7 +23,10 @@ from ..spec.prompt_models import (
     PromptVersion,
     PromptRetrievalResult,
     RuntimeMetrics,
+    UsageDelta,
 )
+from .usage_recorder import PromptUsageRecorder
+from .prompt_index import PromptIndex
 from core.llms.spec.llm_result import LLMUsage
 from ..enum import PromptEnvironment, PromptType
 from ..constants import (
@@ -30,6 +35,11 @@ from ..constants import (
     ERROR_PROMPT_NOT_FOUND,
     ERROR_IMMUTABLE_PROMPT,
     ERROR_NO_FALLBACK_FOUND,
+    DEFAULT_USAGE_FLUSH_INTERVAL_S,
+    DEFAULT_USAGE_FLUSH_BATCH_SIZE,
+    DEFAULT_USAGE_MAX_PENDING_PROMPTS,
+    PROMPT_INDEX_PERSIST_INTERVAL_S,
+    PROMPT_INDEX_REVALIDATE_INTERVAL_S,
 )
 
 
@@ -61,6 +71,13 @@ class BasePromptRegistry(IPromptRegistry, ABC):
     validator: Optional[IPromptValidator]
     security: Optional[IPromptSecurity]
     _prompt_id_cache: Dict[str, str]  # prompt_id -> label mapping
+    _usage_recorder: Optional[PromptUsageRecorder] = None  # set by enable_usage_batching()
+    _index: Optional[PromptIndex] = None  # built lazily by _get_index()
+    _index_lock: Optional[asyncio.Lock] = None
+    _index_dirty: bool = False  # changed since the index was persisted
+    _index_persisted_at: float = 0.0  # monotonic time of the last index write
+    _index_generation: Optional[Any] = None  # storage generation at the last revalidation
+    _index_checked_at: float = 0.0  # monotonic time of the last revalidation
     
     # =========================================================================
     # CORE CRUD OPERATIONS
@@ -165,7 +182,7 @@ class BasePromptRegistry(IPromptRegistry, ABC):
             entry.prompt_type = metadata.prompt_type
         
         # Save
-        await self.storage.save(label, entry.model_dump())
+        await self._save_entry(label, entry)
         
         # Cache the mapping
         self._prompt_id_cache[metadata.id] = label
@@ -307,6 +324,7 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         if version is None:
             # Delete entire prompt
             await self.storage.delete(label)
+            await self._unindex(label)
         else:
             # Delete specific version
             entry = await self.get_prompt_entry(label)
@@ -315,8 +333,9 @@ class BasePromptRegistry(IPromptRegistry, ABC):
             if not entry.versions:
                 # No versions left, delete entire entry
                 await self.storage.delete(label)
+                await self._unindex(label)
             else:
-                await self.storage.save(label, entry.model_dump())
+                await self._save_entry(label, entry)
     
     # =========================================================================
     # LIST AND SEARCH OPERATIONS
@@ -328,46 +347,24 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         tags: Optional[List[str]] = None,
         environment: Optional[PromptEnvironment] = None,
         prompt_type: Optional[PromptType] = None,
-        security_context: Optional[SecurityContext] = None
+        security_context: Optional[SecurityContext] = None,
+        model: Optional[str] = None
     ) -> List[str]:
-        """List all prompt labels with optional filters."""
-        keys = await self.storage.list_keys()
+        """List all prompt labels with optional filters (answered from the index)."""
+        index = await self._get_index()
+        keys = index.filter(
+            category=_enum_value(category),
+            tags=tags,
+            environment=_enum_value(environment),
+            prompt_type=_enum_value(prompt_type),
+            model=model,
+        )
         
         # Security filter
         if self.security and security_context:
             keys = self.security.filter_accessible(keys, security_context, "read")
         
-        if not category and not tags and not environment and not prompt_type:
-            return keys
-        
-        # Filter by criteria
-        filtered = []
-        for key in keys:
-            data = await self.storage.load(key)
-            if data:
-                entry = PromptEntry.from_dict(data)
-                
-                # Check category
-                if category and entry.category.value != category:
-                    continue
-                
-                # Check tags (must have all)
-                if tags and not all(t in entry.tags for t in tags):
-                    continue
-                
-                # Check prompt type
-                if prompt_type and entry.prompt_type != prompt_type:
-                    continue
-                
-                # Check environment (at least one version in this env)
-                if environment:
-                    has_env = any(v.environment == environment for v in entry.versions)
-                    if not has_env:
-                        continue
-                
-                filtered.append(key)
-        
-        return filtered
+        return keys
     
     async def list_versions(
         self,
@@ -396,44 +393,47 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         category: Optional[str] = None,
         environment: Optional[PromptEnvironment] = None
     ) -> List[PromptEntry]:
-        """Search prompts by content or label."""
-        results = []
-        keys = await self.storage.list_keys()
+        """
+        Search prompts by content or label.
+        
+        Candidates come from the inverted token index, so only entries that
+        can match are loaded.
+        """
+        index = await self._get_index()
+        candidates = index.search_candidates(query)
+        if category or environment:
+            candidates &= set(index.filter(
+                category=_enum_value(category), environment=_enum_value(environment)
+            ))
+        
+        # Word-only queries are answered exactly by the index; others are verified
+        verify = not index.is_exact_query(query)
         query_lower = query.lower()
         
-        for key in keys:
+        results = []
+        for key in sorted(candidates):
             data = await self.storage.load(key)
             if data:
                 entry = PromptEntry.from_dict(data)
-                
-                # Check category
-                if category and entry.category.value != category:
-                    continue
-                
-                # Check environment
-                if environment:
-                    has_env = any(v.environment == environment for v in entry.versions)
-                    if not has_env:
-                        continue
-                
-                # Search in label and description
-                if query_lower in entry.label.lower() or query_lower in entry.description.lower():
-                    results.append(entry)
-                    continue
-                
-                # Search in tags
-                if any(query_lower in tag.lower() for tag in entry.tags):
+                if not verify or self._matches_query(entry, query_lower):
                     results.append(entry)
-                    continue
-                
-                # Search in content
-                for version in entry.versions:
-                    if query_lower in version.content.lower():
-                        results.append(entry)
-                        break
         
         return results
     
+    @staticmethod
+    def _matches_query(entry: PromptEntry, query_lower: str) -> bool:
+        """Substring match of a lower-cased query against an entry."""
+        # Search in label and description
+        if query_lower in entry.label.lower() or query_lower in entry.description.lower():
+            return True
+        
+        # Search in tags
+        if any(query_lower in tag.lower() for tag in entry.tags):
+            return True
+        
+        # Search in content
+        return any(query_lower in version.content.lower() for version in entry.versions)
+    
     # =========================================================================
     # METRICS OPERATIONS
     # =========================================================================
@@ -447,7 +447,23 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         cost: float = 0.0,
         success: bool = True
     ) -> None:
-        """Record runtime usage metrics for a prompt."""
+        """
+        Record runtime usage metrics for a prompt.
+        
+        With usage batching enabled the event is only queued in memory and
+        persisted by the background recorder.
+        """
+        if self._usage_recorder is not None:
+            self._usage_recorder.record(
+                prompt_id,
+                latency_ms=latency_ms,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cost=cost,
+                success=success
+            )
+            return
+        
         # Find the prompt by ID
         label = await self._find_label_by_id(prompt_id)
         if not label:
@@ -469,9 +485,97 @@ class BasePromptRegistry(IPromptRegistry, ABC):
                     )
                     
                     # Save updated entry
-                    await self.storage.save(label, entry.model_dump())
+                    await self._save_entry(label, entry)
                     return
     
+    async def record_usage_batch(
+        self,
+        deltas: Dict[str, UsageDelta]
+    ) -> Dict[str, UsageDelta]:
+        """
+        Persist aggregated usage for several prompts.
+        
+        Each affected prompt entry is loaded and saved once, however many
+        prompt IDs and events it covers. Unknown prompt IDs are skipped.
+        
+        Args:
+            deltas: Aggregated usage by prompt ID
+            
+        Returns:
+            Deltas that could not be saved (storage errors), by prompt ID
+        """
+        by_label: Dict[str, Dict[str, UsageDelta]] = {}
+        for prompt_id, delta in deltas.items():
+            label = await self._find_label_by_id(prompt_id)
+            if label:
+                by_label.setdefault(label, {})[prompt_id] = delta
+        
+        failed: Dict[str, UsageDelta] = {}
+        for label, label_deltas in by_label.items():
+            try:
+                data = await self.storage.load(label)
+                if not data:
+                    continue
+                entry = PromptEntry.from_dict(data)
+                for version in entry.versions:
+                    delta = label_deltas.get(version.metadata.id) if version.metadata else None
+                    if delta is not None:
+                        version.metadata.merge_usage(delta)
+                await self._save_entry(label, entry)
+            except Exception:
+                failed.update(label_deltas)
+        
+        return failed
+    
+    def enable_usage_batching(
+        self,
+        flush_interval_s: float = DEFAULT_USAGE_FLUSH_INTERVAL_S,
+        max_batch_size: int = DEFAULT_USAGE_FLUSH_BATCH_SIZE,
+        max_pending_prompts: int = DEFAULT_USAGE_MAX_PENDING_PROMPTS,
+    ) -> PromptUsageRecorder:
+        """
+        Record usage in the background instead of on every call.
+        
+        record_usage() then only aggregates in memory; a PromptUsageRecorder
+        flushes batches on a timer or size threshold. Call close() on
+        shutdown to flush what is still pending.
+        
+        Args:
+            flush_interval_s: Seconds between background flushes
+            max_batch_size: Pending events that trigger an early flush
+            max_pending_prompts: Distinct prompt IDs held between flushes
+            
+        Returns:
+            The recorder (for flush() and get_stats())
+        """
+        if self._usage_recorder is None:
+            self._usage_recorder = PromptUsageRecorder(
+                self,
+                flush_interval_s=flush_interval_s,
+                max_batch_size=max_batch_size,
+                max_pending_prompts=max_pending_prompts,
+            )
+        return self._usage_recorder
+    
+    async def flush_usage(self) -> int:
+        """
+        Persist usage queued by the background recorder.
+        
+        Returns:
+            Number of usage events persisted (0 without usage batching)
+        """
+        if self._usage_recorder is None:
+            return 0
+        return await self._usage_recorder.flush()
+    
+    async def close(self) -> None:
+        """Flush pending usage, stop background recording and persist the index."""
+        if self._usage_recorder is not None:
+            recorder, self._usage_recorder = self._usage_recorder, None
+            await recorder.close()
+        if self._index is not None and self._index_dirty:
+            await self._persist_index()
+    
     async def record_usage_from_llm(
         self,
         prompt_id: str,
@@ -512,7 +616,7 @@ class BasePromptRegistry(IPromptRegistry, ABC):
                     version.metadata.performance_metrics.update(metrics)
                     version.metadata.update_timestamp()
                     
-                    await self.storage.save(label, entry.model_dump())
+                    await self._save_entry(label, entry)
                     return
         
         raise ValueError(f"Prompt not found with ID: {prompt_id}")
@@ -540,7 +644,7 @@ class BasePromptRegistry(IPromptRegistry, ABC):
                         version.metadata.human_eval_score = human_eval_score
                     version.metadata.update_timestamp()
                     
-                    await self.storage.save(label, entry.model_dump())
+                    await self._save_entry(label, entry)
                     return
         
         raise ValueError(f"Prompt not found with ID: {prompt_id}")
@@ -550,6 +654,9 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         prompt_id: str
     ) -> RuntimeMetrics:
         """Get runtime metrics for a prompt."""
+        # Include usage still queued by the background recorder
+        await self.flush_usage()
+        
         label = await self._find_label_by_id(prompt_id)
         if not label:
             raise ValueError(f"Prompt not found with ID: {prompt_id}")
@@ -611,19 +718,176 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         if prompt_id in self._prompt_id_cache:
             return self._prompt_id_cache[prompt_id]
         
-        # Search through all prompts
-        keys = await self.storage.list_keys()
+        # Then the secondary index (no storage scan)
+        index = await self._get_index()
+        key = index.label_for_id(prompt_id)
+        if key is None and not hasattr(self.storage, "fingerprints"):
+            # Changes to known keys are invisible without fingerprints: rescan
+            async with self._index_lock:
+                if await self._refresh_index(index, reload_all=True):
+                    await self._persist_index_throttled()
+            key = index.label_for_id(prompt_id)
+        if key is not None:
+            self._prompt_id_cache[prompt_id] = key
+        return key
+    
+    # =========================================================================
+    # SECONDARY INDEX
+    # =========================================================================
+    
+    def _storage_key(self, label: str) -> str:
+        """Key under which storage.list_keys() reports a label."""
+        storage_key = getattr(self.storage, "storage_key", None)
+        return storage_key(label) if storage_key else label
+    
+    async def _get_index(self) -> PromptIndex:
+        """
+        Get the secondary index, building it on first use.
+        
+        The index is revalidated against storage when the storage generation
+        changed (prompts added or deleted by other registries or processes)
+        or PROMPT_INDEX_REVALIDATE_INTERVAL_S has passed since the last check
+        (in-place edits). Other reads do not touch storage.
+        """
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+        async with self._index_lock:
+            if self._index is None:
+                await self._mark_index_checked()
+                self._index = await self._build_index(use_persisted=True)
+            elif await self._index_needs_check():
+                if await self._refresh_index(self._index):
+                    await self._persist_index_throttled()
+        return self._index
+    
+    async def _mark_index_checked(self) -> None:
+        """Record the storage generation and time of a revalidation about to run."""
+        generation = getattr(self.storage, "generation", None)
+        self._index_generation = await generation() if generation else None
+        self._index_checked_at = time.monotonic()
+    
+    async def _index_needs_check(self) -> bool:
+        """Check whether the index must be revalidated, marking it checked if so."""
+        now = time.monotonic()
+        generation = getattr(self.storage, "generation", None)
+        current = await generation() if generation else None
+        if now - self._index_checked_at < PROMPT_INDEX_REVALIDATE_INTERVAL_S:
+            if generation is None or (current is not None and current == self._index_generation):
+                return False
+        self._index_generation = current
+        self._index_checked_at = now
+        return True
+    
+    async def rebuild_index(self) -> int:
+        """
+        Rebuild the secondary index from storage, ignoring any persisted index.
+        
+        Returns:
+            Number of indexed prompts
+        """
+        await self._mark_index_checked()
+        self._index = await self._build_index(use_persisted=False)
+        return len(self._index)
+    
+    async def _build_index(self, use_persisted: bool) -> PromptIndex:
+        """
+        Load the persisted index and re-index keys whose storage changed.
+        
+        Storages exposing fingerprints() (LocalFileStorage) only have new or
+        modified keys loaded; others are scanned in full.
+        """
+        index = None
+        load_index = getattr(self.storage, "load_index", None)
+        if use_persisted and load_index is not None:
+            index = PromptIndex.from_dict(await load_index())
+        if index is None:
+            index = PromptIndex()
+        
+        changed = await self._refresh_index(index, reload_all=True)
+        self._index = index
+        if changed or not use_persisted:
+            await self._persist_index()
+        return index
+    
+    async def _refresh_index(self, index: PromptIndex, reload_all: bool = False) -> bool:
+        """
+        Bring an index in line with storage.
+        
+        Keys whose fingerprint changed are re-indexed and removed keys are
+        dropped. Without fingerprints only new keys are loaded, unless
+        reload_all is set.
         
-        for key in keys:
+        Returns:
+            True if the index changed
+        """
+        fingerprints = getattr(self.storage, "fingerprints", None)
+        if fingerprints is not None:
+            current = await fingerprints()
+        else:
+            current = {key: None for key in await self.storage.list_keys()}
+        
+        changed = False
+        for key in index.keys():
+            if key not in current:
+                index.remove(key)
+                changed = True
+        for key, fingerprint in current.items():
+            if key in index:
+                if fingerprint is None and not reload_all:
+                    continue
+                if fingerprint is not None and index.fingerprint(key) == fingerprint:
+                    continue
             data = await self.storage.load(key)
             if data:
-                entry = PromptEntry.from_dict(data)
-                for version in entry.versions:
-                    if version.metadata and version.metadata.id == prompt_id:
-                        self._prompt_id_cache[prompt_id] = key
-                        return key
+                index.update(key, PromptEntry.from_dict(data), fingerprint)
+            else:
+                index.remove(key)
+            changed = True
+        return changed
+    
+    async def _persist_index(self) -> None:
+        """Persist the index through storages that support it."""
+        save_index = getattr(self.storage, "save_index", None)
+        if save_index is not None:
+            await save_index(self._index.to_dict())
+        self._index_dirty = False
+        self._index_persisted_at = time.monotonic()
+    
+    async def _persist_index_throttled(self) -> None:
+        """
+        Persist the index at most once per PROMPT_INDEX_PERSIST_INTERVAL_S.
+        
+        Skipped writes leave the index dirty for the next write or close().
+        A stale persisted index only costs reloads: entries are revalidated
+        against storage fingerprints when it is loaded.
+        """
+        self._index_dirty = True
+        if time.monotonic() - self._index_persisted_at >= PROMPT_INDEX_PERSIST_INTERVAL_S:
+            await self._persist_index()
+    
+    async def _save_entry(self, label: str, entry: PromptEntry) -> None:
+        """Save an entry and keep the secondary index current."""
+        await self.storage.save(label, entry.model_dump())
+        if self._index is None:
+            return  # Picked up from storage when the index is first built
         
-        return None
+        key = self._storage_key(label)
+        fingerprint = getattr(self.storage, "fingerprint", None)
+        if self._index.update(key, entry, await fingerprint(key) if fingerprint else None):
+            await self._persist_index_throttled()
+        else:
+            # Metrics-only change: persist lazily (close() or next indexed change)
+            self._index_dirty = True
+    
+    async def _unindex(self, label: str) -> None:
+        """Drop a deleted entry from the ID cache and the secondary index."""
+        key = self._storage_key(label)
+        for prompt_id in [pid for pid, k in self._prompt_id_cache.items() if k in (label, key)]:
+            del self._prompt_id_cache[prompt_id]
+        if self._index is None:
+            return
+        self._index.remove(key)
+        await self._persist_index_throttled()
     
     def _increment_version(self, version: str) -> str:
         """Increment version string (simple patch increment)."""
@@ -637,3 +901,8 @@ class BasePromptRegistry(IPromptRegistry, ABC):
         
         # Fallback: append .1
         return f"{version}.1"
+
+
+def _enum_value(value: Any) -> Any:
+    """Plain value of an enum filter argument (strings pass through)."""
+    return getattr(value, "value", value)
@@ -24,6 +24,10 @@ NOT supported (for security):
 - Comprehensions
 - Async
 
+Expressions are validated once and lowered to closures (constant
+sub-expressions folded) that are cached process-wide, so repeated
+evaluations only bind the context.
+
 Example:
     evaluator = SafeExpressionEvaluator({"user_type": "premium", "days": 30})
     
@@ -32,8 +36,9 @@ Example:
 """
 
 import ast
+import functools
 import operator
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 
 # Allowed binary operators
@@ -101,6 +106,15 @@ SAFE_BUILTINS = {
 MAX_DEPTH = 20
 MAX_NODES = 100
 
+# Compiled expressions kept in the process-wide LRU cache
+EXPRESSION_CACHE_SIZE = 1024
+
+# Largest str/bytes/tuple produced by constant folding
+MAX_FOLDED_SIZE = 1024
+
+# Largest int (in bits) produced by constant folding
+MAX_FOLDED_BITS = 4096
+
 
 class ExpressionError(Exception):
     """Error during expression evaluation."""
@@ -149,14 +163,74 @@ class SafeExpressionEvaluator:
         Raises:
             ExpressionError: If expression is invalid or unsafe
         """
+        return self.evaluate_compiled(self.compile(expression))
+    
+    @staticmethod
+    def compile(expression: str) -> Optional["CompiledExpression"]:
+        """
+        Get the validated, compiled form of an expression.
+        
+        Compilations are kept in a process-wide LRU cache keyed by the
+        expression string (see get_cache_stats()).
+        
+        Args:
+            expression: Python expression string
+            
+        Returns:
+            Compiled expression, or None for a blank expression
+            
+        Raises:
+            ExpressionError: If the expression has invalid syntax
+        """
         if not expression or not expression.strip():
+            return None
+        
+        compiled = _compile_cached(expression)
+        if isinstance(compiled, ExpressionError):
+            raise compiled
+        return compiled
+    
+    def evaluate_compiled(self, compiled: Optional["CompiledExpression"]) -> Any:
+        """
+        Evaluate an expression returned by compile() against this context.
+        
+        Args:
+            compiled: Compiled expression (None evaluates to False)
+            
+        Returns:
+            Result of the expression
+            
+        Raises:
+            ExpressionError: If the expression is unsafe or fails
+        """
+        if compiled is None:
             return False
         
         try:
-            tree = ast.parse(expression, mode='eval')
-        except SyntaxError as e:
-            raise ExpressionError(f"Invalid expression syntax: {e}")
+            return compiled(self.context)
+        except ExpressionError:
+            raise
+        except Exception as e:
+            raise ExpressionError(f"Evaluation error: {e}") from e
+    
+    @staticmethod
+    def get_cache_stats() -> Dict[str, int]:
+        """
+        Get compiled-expression cache statistics.
         
+        Returns:
+            Dict with hits, misses, size and max_size
+        """
+        info = _compile_cached.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all compiled expressions and reset cache statistics."""
+        _compile_cached.cache_clear()
+    
+    def _walk(self, tree: ast.Expression) -> Any:
+        """Evaluate a parsed tree node by node (reference evaluator)."""
         self._node_count = 0
         
         try:
@@ -164,7 +238,7 @@ class SafeExpressionEvaluator:
         except ExpressionError:
             raise
         except Exception as e:
-            raise ExpressionError(f"Evaluation error: {e}")
+            raise ExpressionError(f"Evaluation error: {e}") from e
     
     def _eval_node(self, node: ast.AST, depth: int = 0) -> Any:
         """Recursively evaluate an AST node."""
@@ -375,5 +449,320 @@ class SafeExpressionEvaluator:
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            raise ExpressionError(f"Function call error: {e}")
+            raise ExpressionError(f"Function call error: {e}") from e
+
+
+# =============================================================================
+# COMPILATION
+# =============================================================================
+
+class CompiledExpression:
+    """
+    Validated expression lowered to a closure over the evaluation context.
+    
+    Safety checks, operator lookups and constant sub-expressions are resolved
+    at compile time; unsupported constructs compile to closures that raise
+    ExpressionError when reached, exactly as the node-by-node evaluator does.
+    Operands that may be skipped (right of and/or, IfExp branches) are never
+    folded, so compiling does no work that evaluation could short-circuit.
+    
+    Attributes:
+        expression: Source expression
+        is_constant: True if the whole expression was folded to a value
+    """
+    
+    __slots__ = ("expression", "is_constant", "_fn")
+    
+    def __init__(self, expression: str, fn: Callable[[Dict[str, Any]], Any], is_constant: bool = False):
+        self.expression = expression
+        self.is_constant = is_constant
+        self._fn = fn
+    
+    def __call__(self, context: Dict[str, Any]) -> Any:
+        return self._fn(context)
+
+
+# Lowered node: (closure, is_constant, constant value)
+_Lowered = Tuple[Callable[[Dict[str, Any]], Any], bool, Any]
+
+_SAFE_BUILTIN_IDS = {id(fn) for fn in SAFE_BUILTINS.values()}
+_FOLDABLE_SCALARS = (bool, int, float, complex, str, bytes, type(None))
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_cached(expression: str) -> Union[CompiledExpression, ExpressionError]:
+    """Compile an expression (errors are returned so they are cached too)."""
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        return ExpressionError(f"Invalid expression syntax: {e}")
+    
+    node_count = [0]
+    fn, is_constant, _ = _lower(tree.body, 0, node_count)
+    if node_count[0] > MAX_NODES:
+        # Only evaluated nodes count towards the limit; keep the exact
+        # short-circuit behavior for oversized expressions
+        return CompiledExpression(expression, lambda ctx: SafeExpressionEvaluator(ctx)._walk(tree))
+    return CompiledExpression(expression, fn, is_constant)
+
+
+def _constant(value: Any) -> _Lowered:
+    return (lambda ctx: value), True, value
+
+
+def _dynamic(fn: Callable[[Dict[str, Any]], Any]) -> _Lowered:
+    return fn, False, None
+
+
+def _raises(message: str) -> _Lowered:
+    def fn(ctx):
+        raise ExpressionError(message)
+    return _dynamic(fn)
+
+
+def _is_foldable(value: Any) -> bool:
+    """Only small immutable results may be shared across evaluations."""
+    if isinstance(value, (str, bytes, tuple)) and len(value) > MAX_FOLDED_SIZE:
+        return False
+    if isinstance(value, int) and value.bit_length() > MAX_FOLDED_BITS:
+        return False
+    if isinstance(value, tuple):
+        return all(_is_foldable(item) for item in value)
+    return isinstance(value, _FOLDABLE_SCALARS)
+
+
+def _bounded_binop(op_type: type, left: Any, right: Any) -> bool:
+    """Whether folding a binary operation stays within the folding size caps."""
+    if not (_is_foldable(left) and _is_foldable(right)):
+        return False
+    if op_type is ast.Pow:
+        if isinstance(left, int) and isinstance(right, int) and right > 0 and abs(left) > 1:
+            return left.bit_length() * right <= MAX_FOLDED_BITS
+        return True
+    if op_type is ast.Mult:
+        if isinstance(left, int) and isinstance(right, (str, bytes, tuple)):
+            left, right = right, left
+        if isinstance(left, (str, bytes, tuple)) and isinstance(right, int):
+            return len(left) * max(right, 0) <= MAX_FOLDED_SIZE
+        if isinstance(left, int) and isinstance(right, int):
+            return left.bit_length() + right.bit_length() <= MAX_FOLDED_BITS
+        return True
+    if op_type is ast.LShift:
+        if isinstance(left, int) and isinstance(right, int):
+            return left.bit_length() + right <= MAX_FOLDED_BITS
+    return True
+
+
+def _fold(compute: Callable[[], Any], fn: Callable[[Dict[str, Any]], Any]) -> _Lowered:
+    """Fold a constant sub-expression, or keep it dynamic if that is unsafe."""
+    try:
+        value = compute()
+    except Exception:
+        return _dynamic(fn)  # Raise at evaluation time, if reached
+    return _constant(value) if _is_foldable(value) else _dynamic(fn)
+
+
+def _lower(node: ast.AST, depth: int, node_count: List[int], fold: bool = True) -> _Lowered:
+    """
+    Lower an AST node to a closure (mirrors SafeExpressionEvaluator._eval_node).
+    
+    With fold=False (operands evaluation may skip) only literals and names
+    are constant; nothing is computed at compile time.
+    """
+    if depth > MAX_DEPTH:
+        return _raises("Expression too deeply nested")
+    node_count[0] += 1
+    depth += 1
+    
+    if isinstance(node, ast.Constant):
+        return _constant(node.value)
+    
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in SAFE_BUILTINS:
+            return _constant(SAFE_BUILTINS[name])
+        if name in ("True", "False", "None"):
+            return _constant({"True": True, "False": False, "None": None}[name])
+        return _dynamic(lambda ctx: ctx[name] if name in ctx else False)
+    
+    if isinstance(node, ast.BinOp):
+        op = BINARY_OPS.get(type(node.op))
+        if op is None:
+            return _raises(f"Unsupported operator: {type(node.op).__name__}")
+        (lf, lc, lv), (rf, rc, rv) = _lower(node.left, depth, node_count, fold), _lower(node.right, depth, node_count, fold)
+        
+        def fn(ctx):
+            return op(lf(ctx), rf(ctx))
+        if fold and lc and rc and _bounded_binop(type(node.op), lv, rv):
+            return _fold(lambda: op(lv, rv), fn)
+        return _dynamic(fn)
+    
+    if isinstance(node, ast.UnaryOp):
+        op = UNARY_OPS.get(type(node.op))
+        if op is None:
+            return _raises(f"Unsupported operator: {type(node.op).__name__}")
+        of, oc, ov = _lower(node.operand, depth, node_count, fold)
+        
+        def fn(ctx):
+            return op(of(ctx))
+        return _fold(lambda: op(ov), fn) if fold and oc else _dynamic(fn)
+    
+    if isinstance(node, ast.BoolOp):
+        return _lower_boolop(node, depth, node_count, fold)
+    
+    if isinstance(node, ast.Compare):
+        return _lower_compare(node, depth, node_count, fold)
+    
+    if isinstance(node, ast.IfExp):
+        tf, tc, tv = _lower(node.test, depth, node_count, fold)
+        body, orelse = _lower(node.body, depth, node_count, False), _lower(node.orelse, depth, node_count, False)
+        if tc:
+            return body if tv else orelse
+        bf, ef = body[0], orelse[0]
+        return _dynamic(lambda ctx: bf(ctx) if tf(ctx) else ef(ctx))
+    
+    if isinstance(node, ast.Subscript):
+        (vf, vc, _), (kf, kc, _) = _lower(node.value, depth, node_count, fold), _lower(node.slice, depth, node_count, fold)
+        
+        def subscript(ctx):
+            value, index = vf(ctx), kf(ctx)
+            try:
+                return value[index]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return _fold(lambda: subscript(None), subscript) if fold and vc and kc else _dynamic(subscript)
+    
+    if isinstance(node, ast.Attribute):
+        return _lower_attribute(node, depth, node_count, fold)
+    
+    if isinstance(node, ast.Call):
+        return _lower_call(node, depth, node_count, fold)
+    
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = [_lower(elt, depth, node_count, fold) for elt in node.elts]
+        fns = [f for f, _, _ in items]
+        if isinstance(node, ast.List):
+            return _dynamic(lambda ctx: [f(ctx) for f in fns])
+        if isinstance(node, ast.Set):
+            return _dynamic(lambda ctx: {f(ctx) for f in fns})
+        
+        def fn(ctx):
+            return tuple(f(ctx) for f in fns)
+        if fold and all(c for _, c, _ in items):
+            return _fold(lambda: tuple(v for _, _, v in items), fn)
+        return _dynamic(fn)
+    
+    if isinstance(node, ast.Dict):
+        keys = [_lower(k, depth, node_count, fold)[0] if k else None for k in node.keys]
+        values = [_lower(v, depth, node_count, fold)[0] for v in node.values]
+        return _dynamic(lambda ctx: dict(zip(
+            [k(ctx) if k else None for k in keys], [v(ctx) for v in values]
+        )))
+    
+    return _raises(f"Unsupported expression type: {type(node).__name__}")
 
+
+def _lower_boolop(node: ast.BoolOp, depth: int, node_count: List[int], fold: bool) -> _Lowered:
+    """Short-circuiting and/or; operands after the first are never folded."""
+    items = [_lower(v, depth, node_count, fold and i == 0) for i, v in enumerate(node.values)]
+    fns = [f for f, _, _ in items]
+    is_and = isinstance(node.op, ast.And)
+    
+    def fn(ctx):
+        for value_fn in fns:
+            result = value_fn(ctx)
+            if (not result) if is_and else result:
+                return result
+        return result
+    
+    # Unfolded operands are only constant if they are literals, so this is cheap
+    if fold and all(c for _, c, _ in items):
+        return _fold(lambda: fn(None), fn)
+    return _dynamic(fn)
+
+
+def _lower_compare(node: ast.Compare, depth: int, node_count: List[int], fold: bool) -> _Lowered:
+    """Comparison chain; unsupported operators raise when reached."""
+    left_fn, left_c, _ = _lower(node.left, depth, node_count, fold)
+    steps = []
+    constant = left_c
+    for op, comparator in zip(node.ops, node.comparators):
+        compare = COMPARE_OPS.get(type(op))
+        if compare is None:
+            steps.append((None, type(op).__name__))
+            constant = False
+            break
+        right_fn, right_c, _ = _lower(comparator, depth, node_count, fold)
+        steps.append((compare, right_fn))
+        constant = constant and right_c
+    
+    if len(steps) == 1 and steps[0][0] is not None:
+        compare, right_fn = steps[0]
+        
+        def fn(ctx):
+            return True if compare(left_fn(ctx), right_fn(ctx)) else False
+    else:
+        def fn(ctx):
+            left = left_fn(ctx)
+            for compare, right_fn in steps:
+                if compare is None:
+                    raise ExpressionError(f"Unsupported comparison: {right_fn}")
+                right = right_fn(ctx)
+                if not compare(left, right):
+                    return False
+                left = right
+            return True
+    
+    return _fold(lambda: fn(None), fn) if fold and constant else _dynamic(fn)
+
+
+def _lower_attribute(node: ast.Attribute, depth: int, node_count: List[int], fold: bool) -> _Lowered:
+    """Attribute access; private attributes are rejected."""
+    value_fn, value_c, _ = _lower(node.value, depth, node_count, fold)
+    attr = node.attr
+    
+    if attr.startswith('_'):
+        def private(ctx):
+            value_fn(ctx)
+            raise ExpressionError(f"Access to private attributes is not allowed: {attr}")
+        return _dynamic(private)
+    
+    def fn(ctx):
+        value = value_fn(ctx)
+        try:
+            return getattr(value, attr)
+        except AttributeError:
+            # Try dict access as fallback
+            if isinstance(value, dict):
+                return value.get(attr)
+            return None
+    
+    return _fold(lambda: fn(None), fn) if fold and value_c else _dynamic(fn)
+
+
+def _lower_call(node: ast.Call, depth: int, node_count: List[int], fold: bool) -> _Lowered:
+    """Function call; only safe builtins on size-capped arguments are folded."""
+    func_fn, func_c, func_v = _lower(node.func, depth, node_count, fold)
+    args = [_lower(arg, depth, node_count, fold) for arg in node.args]
+    kwargs = [(kw.arg, _lower(kw.value, depth, node_count, fold)) for kw in node.keywords]
+    arg_fns = [f for f, _, _ in args]
+    kwarg_fns = [(name, f) for name, (f, _, _) in kwargs]
+    
+    def fn(ctx):
+        func = func_fn(ctx)
+        if func not in SAFE_BUILTINS.values():
+            if not callable(func):
+                raise ExpressionError(f"Cannot call non-callable: {func}")
+        call_args = [f(ctx) for f in arg_fns]
+        call_kwargs = {name: f(ctx) for name, f in kwarg_fns}
+        try:
+            return func(*call_args, **call_kwargs)
+        except Exception as e:
+            raise ExpressionError(f"Function call error: {e}") from e
+    
+    foldable = (
+        fold and func_c and id(func_v) in _SAFE_BUILTIN_IDS
+        and all(c and _is_foldable(v) for _, c, v in args)
+        and all(c and _is_foldable(v) for _, (_, c, v) in kwargs)
+    )
+    return _fold(lambda: fn(None), fn) if foldable else _dynamic(fn)
@@ -0,0 +1,250 @@
+"""
+Prompt Registry Secondary Index.
+
+In-memory secondary and inverted index over stored prompt entries, so ID
+lookups, filtered listing and search do not load and parse every prompt.
+
+Per storage key it keeps:
+- Prompt IDs of all versions (id -> key)
+- Category, prompt type, environments, model targets and tags
+- Word tokens of label, description, tags and version contents (inverted)
+- An optional storage fingerprint, used to detect stale keys on startup
+
+The index holds no I/O; BasePromptRegistry keeps it current on save/delete
+and persists it through storages that implement load_index()/save_index()
+(LocalFileStorage).
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ..spec.prompt_models import PromptEntry
+
+
+INDEX_FORMAT_VERSION = 1
+
+# Searchable text is split into maximal word runs; any occurrence of a word-only
+# query lies inside one token, so such queries can be answered from the vocabulary
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lower-cased word tokens of a text."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+class PromptIndex:
+    """
+    Secondary and inverted index of a prompt registry.
+
+    Usage:
+        index = PromptIndex()
+        index.update("greeting", entry)
+
+        index.label_for_id(prompt_id)
+        index.filter(category="system", tags=["support"])
+        index.search_candidates("greet")
+    """
+
+    def __init__(self) -> None:
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._by_id: Dict[str, str] = {}
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_prompt_type: Dict[str, Set[str]] = {}
+        self._by_environment: Dict[str, Set[str]] = {}
+        self._by_model: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def update(self, key: str, entry: PromptEntry, fingerprint: Optional[List[int]] = None) -> bool:
+        """
+        Index (or re-index) a prompt entry.
+
+        Args:
+            key: Storage key of the entry
+            entry: Prompt entry
+            fingerprint: Storage fingerprint of the entry (e.g. [mtime_ns, size])
+
+        Returns:
+            True if any indexed field changed (fingerprint aside)
+        """
+        searchable = [entry.label, entry.description, *entry.tags]
+        searchable.extend(version.content for version in entry.versions)
+        tokens: Set[str] = set()
+        for text in searchable:
+            tokens |= tokenize(text)
+
+        doc = {
+            "ids": sorted({v.metadata.id for v in entry.versions if v.metadata}),
+            "category": entry.category.value,
+            "prompt_type": entry.prompt_type.value,
+            "environments": sorted({v.environment.value for v in entry.versions}),
+            "models": sorted({v.model_target for v in entry.versions}),
+            "tags": sorted(set(entry.tags)),
+            "tokens": sorted(tokens),
+            "fingerprint": fingerprint,
+        }
+        previous = self._docs.get(key)
+        if previous is not None and {**previous, "fingerprint": fingerprint} == doc:
+            previous["fingerprint"] = fingerprint  # Metrics-only change
+            return False
+        self._add(key, doc)
+        return True
+
+    def remove(self, key: str) -> None:
+        """Drop a key from the index."""
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for prompt_id in doc["ids"]:
+            if self._by_id.get(prompt_id) == key:
+                del self._by_id[prompt_id]
+        self._unlink(self._by_category, [doc["category"]], key)
+        self._unlink(self._by_prompt_type, [doc["prompt_type"]], key)
+        self._unlink(self._by_environment, doc["environments"], key)
+        self._unlink(self._by_model, doc["models"], key)
+        self._unlink(self._by_tag, doc["tags"], key)
+        self._unlink(self._by_token, doc["tokens"], key)
+
+    def _add(self, key: str, doc: Dict[str, Any]) -> None:
+        self.remove(key)
+        self._docs[key] = doc
+        for prompt_id in doc["ids"]:
+            self._by_id[prompt_id] = key
+        self._by_category.setdefault(doc["category"], set()).add(key)
+        self._by_prompt_type.setdefault(doc["prompt_type"], set()).add(key)
+        for name, values in (
+            ("environments", self._by_environment),
+            ("models", self._by_model),
+            ("tags", self._by_tag),
+            ("tokens", self._by_token),
+        ):
+            for value in doc[name]:
+                values.setdefault(value, set()).add(key)
+
+    @staticmethod
+    def _unlink(mapping: Dict[str, Set[str]], values: Iterable[str], key: str) -> None:
+        for value in values:
+            keys = mapping.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del mapping[value]
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def keys(self) -> List[str]:
+        """All indexed keys, sorted."""
+        return sorted(self._docs)
+
+    def fingerprint(self, key: str) -> Optional[List[int]]:
+        """Storage fingerprint recorded for a key."""
+        doc = self._docs.get(key)
+        return doc["fingerprint"] if doc else None
+
+    def label_for_id(self, prompt_id: str) -> Optional[str]:
+        """Storage key of the entry containing a prompt ID."""
+        return self._by_id.get(prompt_id)
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        environment: Optional[str] = None,
+        prompt_type: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Keys matching every given filter.
+
+        Args:
+            category: Entry category
+            tags: Tags the entry must all have
+            environment: Environment of at least one version
+            prompt_type: Entry prompt type
+            model: Model target of at least one version
+
+        Returns:
+            Matching keys, sorted
+        """
+        result: Optional[Set[str]] = None
+        constraints = [
+            (self._by_category, [category] if category else []),
+            (self._by_prompt_type, [prompt_type] if prompt_type else []),
+            (self._by_environment, [environment] if environment else []),
+            (self._by_model, [model] if model else []),
+            (self._by_tag, tags or []),
+        ]
+        for mapping, values in constraints:
+            for value in values:
+                keys = mapping.get(value, set())
+                result = set(keys) if result is None else result & keys
+        return sorted(self._docs if result is None else result)
+
+    def search_candidates(self, query: str) -> Set[str]:
+        """
+        Keys whose searchable text may contain `query` (case-insensitive).
+
+        For word-only queries the result is exact; otherwise it is a superset
+        that callers must verify against the entry.
+
+        Args:
+            query: Search text
+
+        Returns:
+            Candidate keys
+        """
+        words = _TOKEN_RE.findall(query.lower())
+        if not words:
+            return set(self._docs)
+
+        result: Optional[Set[str]] = None
+        for word in words:
+            matches: Set[str] = set()
+            for token, keys in self._by_token.items():
+                if word in token:
+                    matches |= keys
+            result = matches if result is None else result & matches
+            if not result:
+                break
+        return result or set()
+
+    @staticmethod
+    def is_exact_query(query: str) -> bool:
+        """True if search_candidates() needs no verification for `query`."""
+        return _TOKEN_RE.fullmatch(query.lower()) is not None
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index (inverted maps are rebuilt on load)."""
+        return {"format_version": INDEX_FORMAT_VERSION, "entries": self._docs}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["PromptIndex"]:
+        """
+        Restore a serialized index.
+
+        Returns:
+            The index, or None if the data has an unknown format
+        """
+        if not data or data.get("format_version") != INDEX_FORMAT_VERSION:
+            return None
+        index = cls()
+        for key, doc in data.get("entries", {}).items():
+            index._add(key, doc)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._docs
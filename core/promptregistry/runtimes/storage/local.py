@@ -10,6 +10,7 @@ or aiofiles when available.
 
 import asyncio
 import json
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Literal
 
@@ -24,6 +25,8 @@ from ...constants import (
     JSON_EXTENSION,
     YAML_EXTENSION,
     YML_EXTENSION,
+    PROMPT_INDEX_FILENAME,
+    PROMPT_INDEX_RACY_WINDOW_NS,
     STORAGE_FORMAT_YAML,
     DEFAULT_STORAGE_FORMAT,
     UTF_8,
@@ -91,14 +94,17 @@ class LocalFileStorage(IPromptStorage):
         """Get file extension for current format."""
         return YAML_EXTENSION if self.format == STORAGE_FORMAT_YAML else JSON_EXTENSION
     
+    def storage_key(self, key: str) -> str:
+        """Get the key under which list_keys() reports a stored key."""
+        return key.replace("/", "_").replace("\\", "_").replace(".", "_")
+    
     def _get_file_path(self, key: str) -> Path:
         """Get file path for a key."""
-        safe_key = key.replace("/", "_").replace("\\", "_").replace(".", "_")
-        return self.storage_path / f"{safe_key}{self._get_extension()}"
+        return self.storage_path / f"{self.storage_key(key)}{self._get_extension()}"
     
     def _find_existing_file(self, key: str) -> Optional[Path]:
         """Find existing file for key (checks both JSON and YAML)."""
-        safe_key = key.replace("/", "_").replace("\\", "_").replace(".", "_")
+        safe_key = self.storage_key(key)
         
         extensions = [self._get_extension()]
         for ext in [JSON_EXTENSION, YAML_EXTENSION, YML_EXTENSION]:
@@ -187,6 +193,76 @@ class LocalFileStorage(IPromptStorage):
                     keys.add(key)
         
         return sorted(keys)
+    
+    # =========================================================================
+    # INDEX SUPPORT
+    # =========================================================================
+    
+    async def fingerprints(self) -> Dict[str, List[int]]:
+        """
+        Get a cheap change fingerprint of every stored key.
+        
+        Returns:
+            Dict of key -> [mtime_ns, size] (stat only, no file reads)
+        """
+        return await asyncio.to_thread(self._sync_fingerprints)
+    
+    def _sync_fingerprints(self) -> Dict[str, List[int]]:
+        """Synchronous fingerprint helper for thread pool."""
+        fingerprints: Dict[str, List[int]] = {}
+        for key in self._sync_list_keys():
+            file_path = self._find_existing_file(key)
+            if file_path is None:
+                continue  # Deleted since it was listed
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
+            fingerprints[key] = [stat.st_mtime_ns, stat.st_size]
+        return fingerprints
+    
+    async def generation(self) -> Optional[int]:
+        """
+        Get a token that changes whenever a key is added or removed.
+        
+        This is the storage directory's mtime (one stat). In-place edits of
+        existing files do not change it.
+        
+        Returns:
+            The token, or None if it cannot be trusted (missing directory, or
+            an mtime so recent that a change in the same tick could be hidden)
+        """
+        # This is fast enough to be sync
+        try:
+            mtime_ns = self.storage_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if time.time_ns() - mtime_ns < PROMPT_INDEX_RACY_WINDOW_NS:
+            return None
+        return mtime_ns
+    
+    async def fingerprint(self, key: str) -> Optional[List[int]]:
+        """Get the change fingerprint of one key, or None if it is not stored."""
+        file_path = self._find_existing_file(key)
+        if file_path is None:
+            return None
+        stat = await asyncio.to_thread(file_path.stat)
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    async def load_index(self) -> Optional[Dict[str, Any]]:
+        """Load the persisted prompt index, or None if there is none."""
+        index_path = self.storage_path / PROMPT_INDEX_FILENAME
+        if not index_path.exists():
+            return None
+        try:
+            return json.loads(await asyncio.to_thread(self._sync_read, index_path))
+        except (OSError, ValueError):
+            return None  # Corrupt index is rebuilt
+    
+    async def save_index(self, data: Dict[str, Any]) -> None:
+        """Persist the prompt index."""
+        index_path = self.storage_path / PROMPT_INDEX_FILENAME
+        await asyncio.to_thread(self._sync_write, index_path, json.dumps(data, ensure_ascii=False))
 
 
 # =============================================================================
@@ -0,0 +1,250 @@
+"""
+Prompt Template Compiler.
+
+Compiles template content once into a segment tree so PromptTemplate.render()
+is a single linear pass instead of repeated regex substitution:
+
+- Text segments are emitted as-is
+- Variable segments ({{var}} / {{var|default:value}}) are looked up
+- Conditional segments ({{#if cond}}...{{#else}}...{{#endif}}) hold the
+  condition pre-compiled by SafeExpressionEvaluator.compile() and their branches
+  as nested segment lists (nested blocks are supported)
+
+Compiled templates are immutable and shared through an LRU cache keyed by
+the SHA-256 of the content, so every PromptVersion loaded with the same
+content reuses one compilation.
+
+With recursive replacement, inserted values containing "{{" are rendered in
+turn (non-strict) up to the recursion depth, which matches re-rendering the
+whole output while only scanning the inserted text.
+
+Usage:
+    compiled = compile_template("Hi {{name}}{{#if vip}}, welcome back{{#endif}}!")
+    compiled.render({"name": "Ada"}, {"vip": True})  # "Hi Ada, welcome back!"
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .expression_engine import SafeExpressionEvaluator, ExpressionError
+from ..constants import (
+    VARIABLE_PATTERN,
+    CONDITIONAL_IF_PATTERN,
+    CONDITIONAL_ELSE_PATTERN,
+    CONDITIONAL_ENDIF_PATTERN,
+    COMPILED_TEMPLATE_CACHE_SIZE,
+)
+
+
+# Segment kinds (first element of each segment)
+_TEXT = 0  # (_TEXT, text)
+_VAR = 1   # (_VAR, name, inline_default or None, raw)
+_IF = 2    # [_IF, condition, true_segments, false_segments or None, raw]
+
+# Condition that failed to parse; always takes the else branch
+_INVALID_CONDITION = object()
+
+# Groups: 1=if (2=condition), 3=else, 4=endif, 5=var (6=name, 7=default)
+_TOKEN_RE = re.compile(
+    rf'(?P<if>{CONDITIONAL_IF_PATTERN})'
+    rf'|(?P<else>{CONDITIONAL_ELSE_PATTERN})'
+    rf'|(?P<endif>{CONDITIONAL_ENDIF_PATTERN})'
+    rf'|(?P<var>{VARIABLE_PATTERN})',
+    re.DOTALL,
+)
+
+_cache: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class CompiledTemplate:
+    """
+    Immutable, pre-parsed form of a template's content.
+
+    Attributes:
+        content_hash: SHA-256 hex digest of the compiled content
+        segments: Top-level segment list
+    """
+
+    __slots__ = ("content_hash", "segments")
+
+    def __init__(self, content_hash: str, segments: List[Any]):
+        self.content_hash = content_hash
+        self.segments = segments
+
+    def render(
+        self,
+        variables: Dict[str, Any],
+        context: Dict[str, Any],
+        strict: bool = True,
+        max_recursion_depth: int = 0,
+    ) -> str:
+        """
+        Render in one pass.
+
+        Args:
+            variables: Values substituted for {{variables}}
+            context: Names visible to {{#if}} conditions
+            strict: Raise for variables without a value or default
+            max_recursion_depth: Levels of nested rendering of inserted values
+                (0 disables recursive replacement)
+
+        Returns:
+            Rendered string
+
+        Raises:
+            ValueError: If strict and a variable has no value or default
+        """
+        parts: List[str] = []
+        _Renderer(variables, context, strict, max_recursion_depth).render(self.segments, parts, 0)
+        return "".join(parts)
+
+
+class _Renderer:
+    """Per-render state: values, lazily created evaluator and settings."""
+
+    __slots__ = ("variables", "context", "strict", "max_depth", "_evaluator")
+
+    def __init__(self, variables: Dict[str, Any], context: Dict[str, Any], strict: bool, max_depth: int):
+        self.variables = variables
+        self.context = context
+        self.strict = strict
+        self.max_depth = max_depth
+        self._evaluator: Optional[SafeExpressionEvaluator] = None
+
+    def render(self, segments: List[Any], parts: List[str], depth: int) -> None:
+        for segment in segments:
+            kind = segment[0]
+            if kind == _TEXT:
+                parts.append(segment[1])
+            elif kind == _VAR:
+                _, name, default, raw = segment
+                if name in self.variables:
+                    value = str(self.variables[name])
+                elif default is not None:
+                    value = default
+                elif not self.strict or depth:
+                    parts.append(raw)  # Leave as-is
+                    continue
+                else:
+                    raise ValueError(f"Missing variable: {name}")
+
+                if depth < self.max_depth and "{{" in value:
+                    self.render(compile_template(value).segments, parts, depth + 1)
+                else:
+                    parts.append(value)
+            else:
+                _, condition, true_segments, false_segments, _ = segment
+                if self._test(condition):
+                    self.render(true_segments, parts, depth)
+                elif false_segments:
+                    self.render(false_segments, parts, depth)
+
+    def _test(self, condition: Any) -> bool:
+        if condition is _INVALID_CONDITION:
+            return False
+        if self._evaluator is None:
+            self._evaluator = SafeExpressionEvaluator(self.context)
+        try:
+            return bool(self._evaluator.evaluate_compiled(condition))
+        except Exception:
+            # On evaluation error, use the else branch (or nothing)
+            return False
+
+
+def compile_template(content: str) -> CompiledTemplate:
+    """
+    Get the compiled form of template content (cached by content hash).
+
+    Args:
+        content: Raw template content
+
+    Returns:
+        Shared CompiledTemplate
+    """
+    content_hash = hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+    with _cache_lock:
+        compiled = _cache.get(content_hash)
+        if compiled is not None:
+            _cache.move_to_end(content_hash)
+            return compiled
+
+    compiled = CompiledTemplate(content_hash, _parse(content))
+    with _cache_lock:
+        _cache[content_hash] = compiled
+        if len(_cache) > COMPILED_TEMPLATE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+
+def clear_template_cache() -> None:
+    """Drop all cached compilations."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _parse(content: str) -> List[Any]:
+    """Parse content into a segment tree; unbalanced tags stay literal text."""
+    root: List[Any] = []
+    current = root
+    stack: List[tuple] = []  # (if segment, list it was appended to)
+    position = 0
+
+    for match in _TOKEN_RE.finditer(content):
+        _append_text(current, content[position:match.start()])
+        position = match.end()
+        token = match.lastgroup
+
+        if token == "if":
+            try:
+                condition = SafeExpressionEvaluator.compile(match.group(2))
+            except ExpressionError:
+                condition = _INVALID_CONDITION
+            block = [_IF, condition, [], None, match.group(0)]
+            current.append(block)
+            stack.append((block, current))
+            current = block[2]
+        elif token == "else" and stack and stack[-1][0][3] is None:
+            block = stack[-1][0]
+            block[3] = []
+            current = block[3]
+        elif token == "endif" and stack:
+            current = stack.pop()[1]
+        elif token == "var":
+            current.append((_VAR, match.group(6), match.group(7), match.group(0)))
+        else:
+            _append_text(current, match.group(0))  # Stray else/endif
+    _append_text(current, content[position:])
+
+    # Unterminated blocks are literal text
+    while stack:
+        block, parent = stack.pop()
+        parent.pop()
+        _append_text(parent, block[4])
+        for segment in block[2]:
+            _append_segment(parent, segment)
+        if block[3] is not None:
+            _append_text(parent, "{{#else}}")
+            for segment in block[3]:
+                _append_segment(parent, segment)
+
+    return root
+
+
+def _append_text(segments: List[Any], text: str) -> None:
+    if not text:
+        return
+    if segments and segments[-1][0] == _TEXT:
+        segments[-1] = (_TEXT, segments[-1][1] + text)
+    else:
+        segments.append((_TEXT, text))
+
+
+def _append_segment(segments: List[Any], segment: Any) -> None:
+    if segment[0] == _TEXT:
+        _append_text(segments, segment[1])
+    else:
+        segments.append(segment)
@@ -0,0 +1,230 @@
+"""
+Background Prompt Usage Recorder.
+
+Takes record_usage() off the LLM hot path. Usage events are aggregated in
+memory per prompt ID (UsageDelta) and persisted in batches, so storage sees
+one read-modify-write per prompt label per flush instead of one per LLM call.
+
+Flushes happen:
+- Every `flush_interval_s` seconds (background task)
+- Early, once `max_batch_size` events are pending
+- On flush() / close() (call close() on shutdown)
+
+Memory is bounded: each pending prompt holds constant-size aggregates, and at
+most `max_pending_prompts` distinct prompt IDs are held; events for further IDs
+are dropped (and counted) until the next flush.
+
+Usage:
+    registry = LocalPromptRegistry(storage_path=".prompts")
+    registry.enable_usage_batching(flush_interval_s=5.0)
+
+    await registry.record_usage(prompt_id, latency_ms=150)  # returns immediately
+
+    await registry.close()  # flush pending usage on shutdown
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from utils.logging.LoggerAdaptor import LoggerAdaptor
+
+from ..spec.prompt_models import UsageDelta
+from ..constants import (
+    DEFAULT_USAGE_FLUSH_INTERVAL_S,
+    DEFAULT_USAGE_FLUSH_BATCH_SIZE,
+    DEFAULT_USAGE_MAX_PENDING_PROMPTS,
+)
+
+if TYPE_CHECKING:
+    from .base_registry import BasePromptRegistry
+
+
+class PromptUsageRecorder:
+    """
+    Aggregates prompt usage events in memory and flushes them in batches.
+
+    Attributes:
+        flush_interval_s: Seconds between background flushes
+        max_batch_size: Pending events that trigger an early flush
+        max_pending_prompts: Distinct prompt IDs held between flushes
+    """
+
+    def __init__(
+        self,
+        registry: "BasePromptRegistry",
+        flush_interval_s: float = DEFAULT_USAGE_FLUSH_INTERVAL_S,
+        max_batch_size: int = DEFAULT_USAGE_FLUSH_BATCH_SIZE,
+        max_pending_prompts: int = DEFAULT_USAGE_MAX_PENDING_PROMPTS,
+    ):
+        """
+        Initialize recorder.
+
+        Args:
+            registry: Registry the batches are written to
+            flush_interval_s: Seconds between background flushes
+            max_batch_size: Pending events that trigger an early flush
+            max_pending_prompts: Distinct prompt IDs held between flushes
+        """
+        self._registry = registry
+        self.flush_interval_s = flush_interval_s
+        self.max_batch_size = max_batch_size
+        self.max_pending_prompts = max_pending_prompts
+
+        self._pending: Dict[str, UsageDelta] = {}
+        self._pending_events = 0
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._early_flush: Optional[asyncio.Task] = None
+        self._closed = False
+        self.logger = LoggerAdaptor.get_logger("promptregistry.usage_recorder")
+
+        self._recorded = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    def record(
+        self,
+        prompt_id: str,
+        latency_ms: float = 0.0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        success: bool = True
+    ) -> None:
+        """
+        Queue one usage event (non-blocking, no I/O).
+
+        Must be called from a running event loop, which hosts the flush task.
+        """
+        delta = self._pending.get(prompt_id)
+        if delta is None:
+            if len(self._pending) >= self.max_pending_prompts:
+                self._dropped += 1
+                self._schedule_flush()
+                return
+            delta = self._pending[prompt_id] = UsageDelta()
+
+        delta.add(latency_ms, prompt_tokens, completion_tokens, cost, success)
+        self._pending_events += 1
+        self._recorded += 1
+
+        self._ensure_timer()
+        if self._pending_events >= self.max_batch_size:
+            self._schedule_flush()
+
+    def _ensure_timer(self) -> None:
+        """Start the background flush task on the current loop if needed."""
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        if self._timer is None or self._timer.done() or self._timer.get_loop() is not loop:
+            self._timer = loop.create_task(self._run_timer())
+
+    def _schedule_flush(self) -> None:
+        """Start an early flush unless one is already running."""
+        if self._early_flush is None or self._early_flush.done():
+            self._early_flush = asyncio.get_running_loop().create_task(self._flush_quietly())
+
+    async def _run_timer(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.flush_interval_s)
+            # Shielded so close() cannot cancel a flush halfway and lose the batch
+            await asyncio.shield(self._flush_quietly())
+
+    async def _flush_quietly(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            # The batch was re-queued by flush(); never fail the caller
+            self.logger.error("Usage flush failed", error=str(e), pending_events=self._pending_events)
+
+    # =========================================================================
+    # FLUSHING
+    # =========================================================================
+
+    async def flush(self) -> int:
+        """
+        Persist all pending usage.
+
+        Deltas whose label could not be saved are merged back into the
+        pending batch and retried on the next flush. If the registry call
+        raises, the whole batch is re-queued and the error propagates.
+
+        Returns:
+            Number of usage events persisted
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            self._pending_events = 0
+            self._flushes += 1
+
+            try:
+                failed = await self._registry.record_usage_batch(batch)
+            except BaseException:
+                # Includes cancellation: keep the batch for the next flush
+                self._failed_flushes += 1
+                self._requeue(batch)
+                raise
+            if failed:
+                self._failed_flushes += 1
+                self._requeue(failed)
+
+            persisted = sum(d.usage_count for pid, d in batch.items() if pid not in failed)
+            self._flushed += persisted
+            return persisted
+
+    def _requeue(self, failed: Dict[str, UsageDelta]) -> None:
+        """Put failed deltas back in front of events recorded since the flush began."""
+        for prompt_id, delta in failed.items():
+            self._pending_events += delta.usage_count
+            newer = self._pending.get(prompt_id)
+            if newer is not None:
+                delta.merge(newer)
+            self._pending[prompt_id] = delta
+
+    async def close(self) -> None:
+        """Stop the background task and flush pending usage (shutdown hook)."""
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        timer, early_flush = self._timer, self._early_flush
+        self._timer = self._early_flush = None
+        if timer is not None and not timer.done() and timer.get_loop() is loop:
+            timer.cancel()
+        if early_flush is not None and not early_flush.done() and early_flush.get_loop() is loop:
+            await early_flush
+        await self.flush()
+
+    # =========================================================================
+    # INTROSPECTION
+    # =========================================================================
+
+    @property
+    def pending_events(self) -> int:
+        """Usage events waiting to be flushed."""
+        return self._pending_events
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get recorder statistics.
+
+        Returns:
+            Dict with recorded/flushed/dropped event counts, flush counts and
+            current backlog
+        """
+        return {
+            "recorded": self._recorded,
+            "flushed": self._flushed,
+            "dropped": self._dropped,
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "pending_events": self._pending_events,
+            "pending_prompts": len(self._pending),
+        }
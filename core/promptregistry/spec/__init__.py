@@ -9,6 +9,7 @@ from .prompt_models import (
     PromptTemplate,
     PromptRetrievalResult,
     RuntimeMetrics,
+    UsageDelta,
 )
 
 __all__ = [
@@ -18,5 +19,6 @@ __all__ = [
     "PromptTemplate",
     "PromptRetrievalResult",
     "RuntimeMetrics",
+    "UsageDelta",
 ]
 
@@ -143,18 +143,56 @@ class RuntimeMetrics(BaseModel):
         if not success:
             self.error_count += 1
         
-        # Update averages
+        # Update percentile samples
+        self._append_sample(self.latency_samples, latency_ms)
+        self._append_sample(self.total_tokens_samples, total_call_tokens)
+        self._append_sample(self.cost_samples, cost)
+        
+        self._update_derived_metrics()
+    
+    def merge_usage(self, delta: "UsageDelta") -> None:
+        """
+        Apply a batch of usage events aggregated in a UsageDelta.
+        
+        Equivalent to calling record_usage() once per event in the batch.
+        """
+        if delta.usage_count == 0:
+            return
+        
+        self.usage_count += delta.usage_count
+        self.error_count += delta.error_count
+        self._total_latency_ms += delta.latency_ms
+        self._total_prompt_tokens += delta.prompt_tokens
+        self._total_completion_tokens += delta.completion_tokens
+        self._total_tokens += delta.prompt_tokens + delta.completion_tokens
+        self._total_cost += delta.cost
+        self._last_used_at = delta.last_used_at
+        
+        # Track last values
+        self._last_latency_ms = delta.last_latency_ms
+        self._last_prompt_tokens = delta.last_prompt_tokens
+        self._last_completion_tokens = delta.last_completion_tokens
+        self._last_total_tokens = delta.last_prompt_tokens + delta.last_completion_tokens
+        self._last_cost = delta.last_cost
+        
+        # Delta samples are the batch's most recent events, oldest first
+        for latency_ms, total_tokens, cost in zip(
+            delta.latency_samples, delta.total_tokens_samples, delta.cost_samples
+        ):
+            self._append_sample(self.latency_samples, latency_ms)
+            self._append_sample(self.total_tokens_samples, total_tokens)
+            self._append_sample(self.cost_samples, cost)
+        
+        self._update_derived_metrics()
+    
+    def _update_derived_metrics(self) -> None:
+        """Recompute averages, percentiles (nearest-rank) and snapshots."""
         if self.usage_count > 0:
             self._avg_latency_ms = self._total_latency_ms / self.usage_count
             self._avg_tokens = self._total_tokens / self.usage_count
             self._avg_cost = self._total_cost / self.usage_count
             self.success_rate = (self.usage_count - self.error_count) / self.usage_count
         
-        # Update percentile samples and compute p95/p99 (nearest-rank)
-        self._append_sample(self.latency_samples, latency_ms)
-        self._append_sample(self.total_tokens_samples, total_call_tokens)
-        self._append_sample(self.cost_samples, cost)
-        
         self._p95_latency_ms = self._percentile(self.latency_samples, 95)
         self._p99_latency_ms = self._percentile(self.latency_samples, 99)
         self._p95_total_tokens = self._percentile(self.total_tokens_samples, 95)
@@ -297,6 +335,95 @@ class RuntimeMetrics(BaseModel):
         return self._p99_cost
 
 
+class UsageDelta(BaseModel):
+    """
+    Usage events of one prompt aggregated in memory between flushes.
+    
+    Keeps running sums, the last event and a bounded window of the most recent
+    samples, so memory per prompt is constant no matter how many events are
+    added. Applied to storage with RuntimeMetrics.merge_usage().
+    
+    Example:
+        delta = UsageDelta()
+        delta.add(latency_ms=150, prompt_tokens=100, completion_tokens=50)
+        metadata.runtime_metrics.merge_usage(delta)
+    """
+    
+    usage_count: int = Field(default=0, description="Events in the batch")
+    error_count: int = Field(default=0, description="Failed events in the batch")
+    latency_ms: float = Field(default=0.0, description="Summed latency")
+    prompt_tokens: int = Field(default=0, description="Summed prompt tokens")
+    completion_tokens: int = Field(default=0, description="Summed completion tokens")
+    cost: float = Field(default=0.0, description="Summed cost")
+    
+    last_latency_ms: float = Field(default=0.0, description="Latency of the last event")
+    last_prompt_tokens: int = Field(default=0, description="Prompt tokens of the last event")
+    last_completion_tokens: int = Field(default=0, description="Completion tokens of the last event")
+    last_cost: float = Field(default=0.0, description="Cost of the last event")
+    last_used_at: Optional[str] = Field(default=None, description="Time of the last event")
+    
+    latency_samples: List[float] = Field(default_factory=list, description="Most recent latencies")
+    total_tokens_samples: List[int] = Field(default_factory=list, description="Most recent token totals")
+    cost_samples: List[float] = Field(default_factory=list, description="Most recent costs")
+    
+    _max_samples: int = PrivateAttr(default=10)
+    
+    def add(
+        self,
+        latency_ms: float = 0.0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        success: bool = True
+    ) -> None:
+        """Add one usage event to the batch."""
+        self.usage_count += 1
+        if not success:
+            self.error_count += 1
+        self.latency_ms += latency_ms
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost += cost
+        
+        self.last_latency_ms = latency_ms
+        self.last_prompt_tokens = prompt_tokens
+        self.last_completion_tokens = completion_tokens
+        self.last_cost = cost
+        self.last_used_at = datetime.utcnow().isoformat()
+        
+        for samples, value in (
+            (self.latency_samples, latency_ms),
+            (self.total_tokens_samples, prompt_tokens + completion_tokens),
+            (self.cost_samples, cost),
+        ):
+            samples.append(value)
+            if len(samples) > self._max_samples:
+                del samples[0]
+    
+    def merge(self, other: "UsageDelta") -> None:
+        """Fold a later batch into this one (used to re-queue failed flushes)."""
+        if other.usage_count == 0:
+            return
+        self.usage_count += other.usage_count
+        self.error_count += other.error_count
+        self.latency_ms += other.latency_ms
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cost += other.cost
+        self.last_latency_ms = other.last_latency_ms
+        self.last_prompt_tokens = other.last_prompt_tokens
+        self.last_completion_tokens = other.last_completion_tokens
+        self.last_cost = other.last_cost
+        self.last_used_at = other.last_used_at
+        for samples, extra in (
+            (self.latency_samples, other.latency_samples),
+            (self.total_tokens_samples, other.total_tokens_samples),
+            (self.cost_samples, other.cost_samples),
+        ):
+            samples.extend(extra)
+            del samples[:-self._max_samples]
+
+
 class PromptMetadata(BaseModel):
     """
     Metadata for a prompt.
@@ -457,6 +584,16 @@ class PromptMetadata(BaseModel):
         )
         self.update_timestamp()
     
+    def merge_usage(self, delta: UsageDelta) -> None:
+        """
+        Record a batch of runtime usage metrics.
+        
+        Args:
+            delta: Usage events aggregated since the last flush
+        """
+        self.runtime_metrics.merge_usage(delta)
+        self.update_timestamp()
+    
     def mark_immutable(self) -> None:
         """Mark this metadata as immutable (cannot be changed)."""
         self.is_immutable = True
@@ -475,6 +612,9 @@ class PromptTemplate(BaseModel):
     - Conditional blocks: {{#if is_new_user}}Welcome!{{#else}}Welcome back!{{#endif}}
     - Recursive replacement: Re-process output for nested variables
     
+    Content is compiled once (segments plus pre-parsed conditions, shared by
+    content hash) and each render is a single pass over the compiled form.
+    
     Attributes:
         content: The raw template content with {{variables}}
         dynamic_variables: Set of variable names extracted from content
@@ -516,6 +656,10 @@ class PromptTemplate(BaseModel):
     # Private attributes for extracted inline defaults
     _inline_defaults: Dict[str, str] = {}
     
+    # Compiled form of `content` (see runtimes.template_compiler)
+    _compiled: Optional[Any] = None
+    _compiled_source: Optional[str] = None
+    
     def model_post_init(self, __context: Any) -> None:
         """Extract variables after initialization."""
         self._extract_variables()
@@ -622,110 +766,17 @@ class PromptTemplate(BaseModel):
             if missing:
                 raise ValueError(ERROR_MISSING_VARIABLES.format(variables=missing))
         
-        # Start rendering
-        result = self._render_once(self.content, merged, context, strict)
-        
-        # Apply recursive replacement if enabled
-        if self.recursive_replace:
-            result = self._recursive_render(result, merged, context, strict)
-        
-        return result
+        max_depth = self.max_recursion_depth if self.recursive_replace else 0
+        return self._get_compiled().render(merged, {**merged, **context}, strict, max_depth)
     
-    def _render_once(
-        self,
-        content: str,
-        variables: Dict[str, Any],
-        context: Dict[str, Any],
-        strict: bool,
-    ) -> str:
-        """Perform a single pass of variable substitution."""
-        result = content
-        
-        # First, process conditional blocks
-        result = self._process_conditionals(result, {**variables, **context})
-        
-        # Then, substitute variables
-        # Replace {{var|default:value}} and {{var}} patterns
-        def replace_var(match):
-            var_name = match.group(1)
-            inline_default = match.group(2) if match.lastindex >= 2 else None
+    def _get_compiled(self) -> Any:
+        """Get the compiled template, recompiling only if content changed."""
+        if self._compiled is None or self._compiled_source is not self.content:
+            from ..runtimes.template_compiler import compile_template
             
-            if var_name in variables:
-                return str(variables[var_name])
-            elif inline_default is not None:
-                return inline_default
-            elif not strict:
-                return match.group(0)  # Leave as-is
-            else:
-                raise ValueError(f"Missing variable: {var_name}")
-        
-        result = re.sub(VARIABLE_PATTERN, replace_var, result)
-        
-        return result
-    
-    def _recursive_render(
-        self,
-        content: str,
-        variables: Dict[str, Any],
-        context: Dict[str, Any],
-        strict: bool,
-        depth: int = 0,
-    ) -> str:
-        """Recursively render nested variables up to max depth."""
-        if depth >= self.max_recursion_depth:
-            return content
-        
-        # Check if there are still variables to replace
-        if not re.search(VARIABLE_PATTERN, content):
-            return content
-        
-        # Another pass
-        rendered = self._render_once(content, variables, context, strict=False)
-        
-        # If no change, stop
-        if rendered == content:
-            return rendered
-        
-        # Recurse
-        return self._recursive_render(rendered, variables, context, strict, depth + 1)
-    
-    def _process_conditionals(
-        self,
-        content: str,
-        context: Dict[str, Any],
-    ) -> str:
-        """
-        Process conditional blocks using safe Python expression evaluation.
-        
-        Syntax: {{#if condition}}content{{#else}}alt{{#endif}}
-        """
-        from ..runtimes.expression_engine import SafeExpressionEvaluator
-        
-        evaluator = SafeExpressionEvaluator(context)
-        
-        # Process conditional blocks (handles nested blocks)
-        def process_block(match):
-            condition = match.group(1)
-            true_content = match.group(2) if match.lastindex >= 2 else ""
-            false_content = match.group(3) if match.lastindex >= 3 and match.group(3) else ""
-            
-            try:
-                result = evaluator.evaluate(condition)
-                return true_content if result else false_content
-            except Exception:
-                # On evaluation error, keep the false content or empty
-                return false_content
-        
-        # Use a non-greedy pattern with DOTALL for multiline
-        pattern = r'\{\{#if\s+(.+?)\}\}(.*?)(?:\{\{#else\}\}(.*?))?\{\{#endif\}\}'
-        
-        # Keep processing until no more conditionals
-        prev_content = None
-        while prev_content != content:
-            prev_content = content
-            content = re.sub(pattern, process_block, content, flags=re.DOTALL)
-        
-        return content
+            self._compiled = compile_template(self.content)
+            self._compiled_source = self.content
+        return self._compiled
 
 
 class PromptVersion(BaseModel):
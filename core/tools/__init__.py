@@ -36,6 +36,7 @@ from .enum import (
     VariableAssignmentOperator,
     SpeechContextScope,
     TransformExecutionMode,
+    LimiterKeyScope,
 )
 
 # Core spec models (re-export from subpackage)
@@ -93,7 +94,12 @@ from .runtimes.emitters import NoOpEmitter
 from .runtimes.memory import NoOpMemory
 from .runtimes.metrics import NoOpMetrics
 from .runtimes.tracers import NoOpTracer
-from .runtimes.limiters import NoOpLimiter
+from .runtimes.limiters import (
+    NoOpLimiter,
+    TokenBucketLimiter,
+    SlidingWindowLimiter,
+    ConcurrencyLimiter,
+)
 
 # Serialization utilities
 from .serializers import (
@@ -114,6 +120,7 @@ __all__ = [
     "VariableAssignmentOperator",
     "SpeechContextScope",
     "TransformExecutionMode",
+    "LimiterKeyScope",
     "ToolUsage",
     "ToolResult",
     "ToolError",
@@ -164,6 +171,9 @@ __all__ = [
     "NoOpMetrics",
     "NoOpTracer",
     "NoOpLimiter",
+    "TokenBucketLimiter",
+    "SlidingWindowLimiter",
+    "ConcurrencyLimiter",
     # Serialization
     "tool_to_json",
     "tool_to_dict",
@@ -49,6 +49,7 @@ LOG_EGRESS_CHECK = "Checking egress permissions"
 LOG_EGRESS_PASSED = "Egress check passed"
 LOG_EGRESS_SKIPPED = "No security component available - skipping egress check"
 LOG_IDEMPOTENCY_CACHE_HIT = "Using cached result for idempotency"
+LOG_IDEMPOTENCY_IN_FLIGHT_HIT = "Using result of concurrent execution with the same idempotency key"
 LOG_EXECUTION_COMPLETED = "Tool execution completed"
 LOG_EXECUTION_FAILED = "Tool execution failed"
 LOG_HTTP_STARTING = "Starting HTTP tool execution"
@@ -255,6 +256,17 @@ UNKNOWN_TRACER_ERROR = "Unknown tracer implementation: {TRACER_NAME}. Available:
 
 #Limiter constants
 UNKNOWN_LIMITER_ERROR = "Unknown limiter implementation: {LIMITER_NAME}. Available: {AVAILABLE_LIMITERS}"
+TOKEN_BUCKET = "token_bucket"
+SLIDING_WINDOW = "sliding_window"
+CONCURRENCY = "concurrency"
+LIMITER_SCOPE_TOOL = "tool"
+LIMITER_SCOPE_USER = "user"
+LIMITER_SCOPE_TENANT = "tenant"
+LIMITER_KEY_SEPARATOR = ":"
+METRIC_LIMITER_ACQUIRED = "tool.limiter.acquired"
+METRIC_LIMITER_THROTTLED = "tool.limiter.throttled"
+METRIC_LIMITER_WAIT_TIME = "tool.limiter.wait_time"
+LIMITER_INVALID_LIMIT_ERROR = "Limiter limit must be a positive integer, got {LIMIT}"
 
 #Emitter constants
 UNKNOWN_EMITTER_ERROR = "Unknown emitter implementation: {EMITTER_NAME}. Available: {AVAILABLE_EMITTERS}"
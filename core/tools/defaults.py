@@ -48,6 +48,11 @@ DEFAULT_TOOL_TIMEOUT_S = 30
 DEFAULT_RETURN_TYPE = ToolReturnType.JSON
 DEFAULT_RETURN_TARGET = ToolReturnTarget.STEP
 
+# Limiter defaults
+DEFAULT_LIMITER_LIMIT = 10  # Calls per period (rate limiters) or concurrent calls
+DEFAULT_LIMITER_PERIOD_S = 1.0
+DEFAULT_LIMITER_MAX_KEYS = 10_000  # Keys kept per limiter before idle keys are evicted
+
 # Environment defaults
 DEFAULT_ENVIRONMENT = DEFAULT_ENVIRONMENT_STRING
 
@@ -148,6 +153,8 @@ IDEMPOTENCY_DEFAULT_ENABLED = True
 IDEMPOTENCY_DEFAULT_TTL_S = 3600
 IDEMPOTENCY_DEFAULT_PERSIST_RESULT = True
 IDEMPOTENCY_DEFAULT_BYPASS_ON_MISSING_KEY = False
+IDEMPOTENCY_DEFAULT_COALESCE_IN_FLIGHT = True
+IDEMPOTENCY_DEFAULT_EARLY_CACHE_LOOKUP = False
 
 # HTTP/DB defaults
 HTTP_DEFAULT_METHOD = POST
@@ -156,6 +163,9 @@ DB_DEFAULT_DRIVER = DYNAMODB
 # Interruption defaults
 INTERRUPTION_DEFAULT_DISABLED = False  # By default, interruptions are allowed
 
+# Execution defaults
+EXECUTION_DEFAULT_SPECULATIVE = False  # Side-effecting tools must never run early
+
 # Pre-tool speech defaults
 SPEECH_DEFAULT_ENABLED = False
 SPEECH_DEFAULT_MODE = "auto"  # auto, random, constant
@@ -168,4 +178,6 @@ EXECUTION_DEFAULT_MODE = "sequential"  # sequential or parallel
 # Variable assignment defaults
 VARIABLE_ASSIGNMENT_DEFAULT_ENABLED = True
 
-
+# Tool storage defaults
+STORAGE_DEFAULT_LOAD_CONCURRENCY = 16  # Concurrent loads in load_many()
+STORAGE_DEFAULT_SPEC_CACHE_SIZE = 1024  # ETag-validated specs kept per storage
@@ -26,6 +26,9 @@ from .constants import (
     CIRCUIT_BREAKER_STATE_HALF_OPEN,
     TOON,
     DYNAMODB,
+    LIMITER_SCOPE_TOOL,
+    LIMITER_SCOPE_USER,
+    LIMITER_SCOPE_TENANT,
 )
 
 class ToolReturnType(str, Enum):
@@ -148,4 +151,17 @@ class TransformExecutionMode(str, Enum):
     """
     SYNC = "sync"
     ASYNC = "async"
-    AWAIT = "await"
\ No newline at end of file
+    AWAIT = "await"
+
+
+class LimiterKeyScope(str, Enum):
+    """
+    Granularity at which a rate limiter keys its buckets.
+    
+    TOOL: One bucket per tool
+    USER: One bucket per tool and user
+    TENANT: One bucket per tool and tenant
+    """
+    TOOL = LIMITER_SCOPE_TOOL
+    USER = LIMITER_SCOPE_USER
+    TENANT = LIMITER_SCOPE_TENANT
@@ -82,7 +82,13 @@ from .metrics import NoOpMetrics, MetricsFactory
 from .tracers import NoOpTracer, TracerFactory
 
 # Re-export from limiters module
-from .limiters import NoOpLimiter, LimiterFactory
+from .limiters import (
+    NoOpLimiter,
+    TokenBucketLimiter,
+    SlidingWindowLimiter,
+    ConcurrencyLimiter,
+    LimiterFactory,
+)
 
 __all__ = [
     # Core
@@ -121,5 +127,8 @@ __all__ = [
     "TracerFactory",
     # Limiter
     "NoOpLimiter",
+    "TokenBucketLimiter",
+    "SlidingWindowLimiter",
+    "ConcurrencyLimiter",
     "LimiterFactory",
 ]
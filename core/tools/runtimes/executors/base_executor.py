@@ -44,7 +44,8 @@ from ...interfaces.tool_interfaces import IToolExecutor
 from ...spec.tool_types import ToolSpec
 from ...spec.tool_context import ToolContext, ToolUsage
 from ...spec.tool_result import ToolResult
-from ...constants import UTF_8
+from ...constants import UTF_8, IDEMPOTENCY_CACHE_PREFIX
+from ..idempotency.single_flight import DEFAULT_SINGLE_FLIGHT, InFlightCall
 from ..usage_calculators.token_calculators import calculate_tokens_in, calculate_tokens_out
 from ..usage_calculators.cost_calculator import calculate_cost_usd
 from ..usage_calculators.generic_calculator import (
@@ -133,6 +134,85 @@ class BaseToolExecutor(IToolExecutor):
         default_generator = DefaultIdempotencyKeyGenerator()
         return default_generator.generate_key(args, ctx, self.spec)
 
+    async def _lookup_idempotency_early(self, args: Dict[str, Any], ctx: ToolContext) -> Optional[ToolResult]:
+        """
+        Look up a cached idempotent result before validation runs.
+        
+        Only the local tier is consulted (ctx.memory.get_local), so a miss
+        costs one in-process lookup and the regular flow continues. Caches
+        without a local tier skip the early lookup; the regular flow does
+        the one remote lookup. Authorization is still enforced for a hit; validation
+        and egress checks are skipped because the cached result was produced
+        by a call that already passed them and no request is sent.
+        
+        Args:
+            args: Tool execution arguments
+            ctx: Tool execution context
+            
+        Returns:
+            Cached ToolResult, or None on a miss or when early lookup is disabled
+            
+        Raises:
+            Exception: If authorization fails for the cached call
+        """
+        idempotency = self.spec.idempotency
+        if not (idempotency.enabled and idempotency.early_cache_lookup and idempotency.persist_result and ctx.memory):
+            return None
+        get_local = getattr(ctx.memory, "get_local", None)
+        if get_local is None:
+            return None
+        if idempotency.key_fields and idempotency.bypass_on_missing_key:
+            if any(k not in args for k in idempotency.key_fields):
+                return None
+        
+        idempotency_key = self._generate_idempotency_key(args, ctx)
+        cached_result = await get_local(f"{IDEMPOTENCY_CACHE_PREFIX}:{idempotency_key}")
+        if not cached_result:
+            return None
+        
+        if ctx.security:
+            await ctx.security.authorize(ctx, self.spec)
+        ctx.idempotency_key = idempotency_key
+        return ToolResult(**cached_result)
+
+    def _join_in_flight(self, idempotency_key: str) -> Optional[InFlightCall]:
+        """
+        Join the in-flight execution for an idempotency key.
+        
+        Concurrent executions with the same key are coalesced: the first one
+        becomes the leader and runs the tool, the others await its result.
+        
+        Args:
+            idempotency_key: Idempotency key of this execution
+            
+        Returns:
+            InFlightCall handle, or None if coalescing is disabled for the tool
+        """
+        if not self.spec.idempotency.coalesce_in_flight:
+            return None
+        return DEFAULT_SINGLE_FLIGHT.join(f"{self.spec.id}:{idempotency_key}")
+    
+    async def _await_in_flight(self, flight: InFlightCall) -> Optional[ToolResult]:
+        """
+        Await the leader of a coalesced execution (followers only).
+        
+        Args:
+            flight: Follower handle from _join_in_flight
+            
+        Returns:
+            Copy of the leader's ToolResult marked as reused, or None if the
+            leader was cancelled and this execution should run on its own
+            
+        Raises:
+            Exception: The leader's exception
+        """
+        result = await flight.wait()
+        if result is None:
+            return None
+        shared = result.model_copy(deep=True)
+        shared.usage = {**(shared.usage or {}), "idempotency_reused": True}
+        return shared
+    
     def _calculate_usage(self, start_time: float, input_args: Dict[str, Any], output_content: Any) -> ToolUsage:
         """
         Calculate usage statistics for the tool execution.
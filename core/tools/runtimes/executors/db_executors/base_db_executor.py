@@ -49,6 +49,7 @@ from typing import Any, Dict
 
 # Local imports
 from ..base_executor import BaseToolExecutor
+from ...limiters.base_limiter import resolve_limiter_key
 from ....spec.tool_types import DbToolSpec
 from ....spec.tool_context import ToolContext
 from ....spec.tool_result import ToolResult
@@ -66,6 +67,7 @@ from ....constants import (
     LOG_EGRESS_PASSED,
     LOG_EGRESS_SKIPPED,
     LOG_IDEMPOTENCY_CACHE_HIT,
+    LOG_IDEMPOTENCY_IN_FLIGHT_HIT,
     IDEMPOTENCY_CACHE_PREFIX,
     TOOL_EXECUTION_TIME,
     TOOL_EXECUTIONS,
@@ -171,6 +173,7 @@ class BaseDbExecutor(BaseToolExecutor):
         Execute the database tool with common patterns.
         
         This method implements the common execution flow for all database tools:
+        (early_cache_lookup: return a local idempotency hit after authorization)
         1. Validation (if validator available)
         2. Authorization (if security available)
         3. Egress checks (if security available)
@@ -195,7 +198,18 @@ class BaseDbExecutor(BaseToolExecutor):
         # Log execution start
         self.logger.info(LOG_DB_STARTING, **context_data)
         
+        flight = None
         try:
+            # Serve local idempotency hits before validation (early cache mode)
+            early_result = await self._lookup_idempotency_early(args, ctx)
+            if early_result is not None:
+                self.logger.info(
+                    LOG_IDEMPOTENCY_CACHE_HIT,
+                    idempotency_key=ctx.idempotency_key,
+                    **context_data
+                )
+                return early_result
+            
             # Validate parameters if validator is available
             if ctx.validator:
                 self.logger.info(LOG_VALIDATING, **context_data)
@@ -235,6 +249,15 @@ class BaseDbExecutor(BaseToolExecutor):
                         if cached_result:
                             self.logger.info(LOG_IDEMPOTENCY_CACHE_HIT, idempotency_key=idempotency_key, **context_data)
                             return ToolResult(**cached_result)
+                    
+                    # Coalesce with a concurrent execution of the same call
+                    flight = self._join_in_flight(idempotency_key)
+                    if flight and not flight.is_leader:
+                        shared_result = await self._await_in_flight(flight)
+                        if shared_result is not None:
+                            self.logger.info(LOG_IDEMPOTENCY_IN_FLIGHT_HIT, idempotency_key=idempotency_key, **context_data)
+                            return shared_result
+                        flight = None
             
             # Execute using database-specific implementation
             timeout = float(self.spec.timeout_s) if self.spec.timeout_s else None
@@ -251,7 +274,7 @@ class BaseDbExecutor(BaseToolExecutor):
                 return await self._execute_db_operation(args, ctx, timeout)
             
             if ctx.limiter:
-                async with ctx.limiter.acquire(self.spec.tool_name):
+                async with ctx.limiter.acquire(resolve_limiter_key(ctx.limiter, self.spec.tool_name, ctx)):
                     if timeout:
                         result_content = await asyncio.wait_for(_invoke_db(), timeout=timeout)
                     else:
@@ -294,9 +317,14 @@ class BaseDbExecutor(BaseToolExecutor):
                     ttl_s=self.spec.idempotency.ttl_s,
                 )
             
+            if flight:
+                flight.resolve(result)
+            
             return result
         
         except Exception as e:
+            if flight:
+                flight.reject(e)
             execution_time = time.time() - start_time
             self.logger.error(LOG_DB_FAILED,
                 error=str(e),
@@ -314,5 +342,9 @@ class BaseDbExecutor(BaseToolExecutor):
                 warnings=[DB_DEFAULT_ERROR_STATUS_WARNING(self.spec, str(e))]
             )
             return error_result
+        
+        finally:
+            if flight:
+                flight.release()
 
 
@@ -69,6 +69,7 @@ from ....constants import (
     LOG_EGRESS_PASSED,
     LOG_EGRESS_SKIPPED,
     LOG_IDEMPOTENCY_CACHE_HIT,
+    LOG_IDEMPOTENCY_IN_FLIGHT_HIT,
     LOG_EXECUTION_COMPLETED,
     LOG_EXECUTION_FAILED,
     IDEMPOTENCY_CACHE_PREFIX,
@@ -81,7 +82,7 @@ from ....constants import (
     EXECUTION_FAILED,
 )
 from ....defaults import DEFAULT_TOOL_CONTEXT_DATA
-from utils.logging.LoggerAdaptor import LoggerAdaptor
+from utils.logging.LoggerAdaptor import LoggerAdaptor, lazy
 
 
 class BaseFunctionExecutor(BaseToolExecutor):
@@ -121,6 +122,7 @@ class BaseFunctionExecutor(BaseToolExecutor):
         
         This is the Template Method that provides the complete execution flow:
         1. Log execution start
+           (early_cache_lookup: return a local idempotency hit after authorization)
         2. Validate parameters (if validator available)
         3. Authorize execution (if security available)
         4. Check egress permissions (if security available)
@@ -148,7 +150,18 @@ class BaseFunctionExecutor(BaseToolExecutor):
         # Log parameter details
         self.logger.debug(LOG_PARAMETERS, parameters=args, **context_data)
         
+        flight = None
         try:
+            # Serve local idempotency hits before validation (early cache mode)
+            early_result = await self._lookup_idempotency_early(args, ctx)
+            if early_result is not None:
+                self.logger.info(
+                    LOG_IDEMPOTENCY_CACHE_HIT,
+                    idempotency_key=ctx.idempotency_key,
+                    **context_data
+                )
+                return early_result
+            
             # Validate parameters if validator is available
             if ctx.validator:
                 self.logger.info(LOG_VALIDATING, **context_data)
@@ -194,6 +207,19 @@ class BaseFunctionExecutor(BaseToolExecutor):
                                 **context_data
                             )
                             return ToolResult(**cached_result)
+                    
+                    # Coalesce with a concurrent execution of the same call
+                    flight = self._join_in_flight(idempotency_key)
+                    if flight and not flight.is_leader:
+                        shared_result = await self._await_in_flight(flight)
+                        if shared_result is not None:
+                            self.logger.info(
+                                LOG_IDEMPOTENCY_IN_FLIGHT_HIT,
+                                idempotency_key=idempotency_key,
+                                **context_data
+                            )
+                            return shared_result
+                        flight = None
             
             # Execute the actual function (delegate to subclass implementation)
             timeout = self.spec.timeout_s or 30
@@ -203,7 +229,7 @@ class BaseFunctionExecutor(BaseToolExecutor):
             
             # Log successful completion
             self.logger.info(LOG_EXECUTION_COMPLETED,
-                result=str(result_content),
+                result=lazy(lambda: str(result_content)),
                 execution_time_ms=round(execution_time * 1000, 2),
                 **context_data)
             
@@ -233,9 +259,14 @@ class BaseFunctionExecutor(BaseToolExecutor):
                     ttl_s=self.spec.idempotency.ttl_s
                 )
             
+            if flight:
+                flight.resolve(result)
+            
             return result
         
         except Exception as e:
+            if flight:
+                flight.reject(e)
             execution_time = time.time() - start_time
             self.logger.error(LOG_EXECUTION_FAILED,
                 error=str(e),
@@ -254,6 +285,10 @@ class BaseFunctionExecutor(BaseToolExecutor):
                 warnings=[f"{EXECUTION_FAILED}: {str(e)}"]
             )
             return error_result
+        
+        finally:
+            if flight:
+                flight.release()
     
     @abstractmethod
     async def _execute_function(
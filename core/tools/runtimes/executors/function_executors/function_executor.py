@@ -59,6 +59,7 @@ from typing import Any, Dict
 
 # Local imports
 from .base_function_executor import BaseFunctionExecutor
+from ...limiters.base_limiter import resolve_limiter_key
 from ....spec.tool_context import ToolContext
 
 
@@ -126,7 +127,7 @@ class FunctionToolExecutor(BaseFunctionExecutor):
         
         # Execute with optional rate limiting and timeout
         if ctx.limiter:
-            async with ctx.limiter.acquire(self.spec.tool_name):
+            async with ctx.limiter.acquire(resolve_limiter_key(ctx.limiter, self.spec.tool_name, ctx)):
                 if timeout:
                     return await asyncio.wait_for(_invoke(), timeout=timeout)
                 return await _invoke()
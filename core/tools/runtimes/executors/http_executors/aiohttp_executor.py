@@ -30,6 +30,10 @@ Usage:
     
     # Clean up when done
     await executor.close()
+    
+    # Share per-endpoint connection pools with other executors and LLM connectors
+    from utils.http import get_shared_transport
+    executor = AioHttpExecutor(spec, transport=get_shared_transport())
 
 Version: 1.0.0
 """
@@ -45,6 +49,7 @@ try:
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
+from utils.http import PooledTransport
 from .base_http_executor import BaseHttpExecutor
 from ....spec.tool_types import HttpToolSpec
 from ....spec.tool_context import ToolContext
@@ -70,6 +75,7 @@ class AioHttpExecutor(BaseHttpExecutor):
     Attributes:
         spec: HTTP tool specification
         _session: Shared aiohttp ClientSession (connection pool)
+        _transport: Optional per-endpoint pools shared across clients
         _retry_on_status: HTTP status codes that trigger retry
     """
     
@@ -81,6 +87,7 @@ class AioHttpExecutor(BaseHttpExecutor):
         spec: HttpToolSpec,
         session: Optional["aiohttp.ClientSession"] = None,
         retry_on_status: Optional[tuple] = None,
+        transport: Optional[PooledTransport] = None,
     ):
         """
         Initialize AioHttp executor.
@@ -89,6 +96,8 @@ class AioHttpExecutor(BaseHttpExecutor):
             spec: HTTP tool specification
             session: Optional shared aiohttp session (for connection pooling)
             retry_on_status: HTTP status codes that should trigger retry
+            transport: Optional pooled transport; requests then use the
+                connection pool of the target endpoint (ignored if session is set)
         """
         if not AIOHTTP_AVAILABLE:
             raise ImportError(
@@ -100,16 +109,22 @@ class AioHttpExecutor(BaseHttpExecutor):
         self.spec: HttpToolSpec = spec
         self._external_session = session is not None
         self._session: Optional[aiohttp.ClientSession] = session
+        self._transport = transport
         self._retry_on_status = retry_on_status or self.DEFAULT_RETRY_STATUS_CODES
         self.logger = LoggerAdaptor.get_logger(f"{HTTP}.aio.{spec.tool_name}") if LoggerAdaptor else None
     
-    async def _get_session(self) -> "aiohttp.ClientSession":
+    async def _get_session(self, url: Optional[str] = None) -> "aiohttp.ClientSession":
         """
         Get or create the aiohttp session.
         
         Creates a session with appropriate timeout and connection settings
         if one doesn't exist.
+        
+        Args:
+            url: Request URL, used to select the endpoint pool of the transport
         """
+        if self._transport is not None and not self._external_session and url:
+            return self._transport.get_session(url)
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(
                 total=self.spec.timeout_s or 30,
@@ -202,7 +217,7 @@ class AioHttpExecutor(BaseHttpExecutor):
         
         for attempt in range(max_retries + 1):
             try:
-                session = await self._get_session()
+                session = await self._get_session(final_url)
                 request_timeout = aiohttp.ClientTimeout(total=timeout)
                 
                 async with session.request(
@@ -59,11 +59,12 @@ from ....constants import (
     LOG_STARTING_EXECUTION, LOG_PARAMETERS, LOG_VALIDATING, LOG_VALIDATION_PASSED,
     LOG_VALIDATION_SKIPPED, LOG_AUTH_CHECK, LOG_AUTH_PASSED, LOG_AUTH_SKIPPED,
     LOG_EGRESS_CHECK, LOG_EGRESS_PASSED, LOG_EGRESS_SKIPPED, LOG_IDEMPOTENCY_CACHE_HIT,
+    LOG_IDEMPOTENCY_IN_FLIGHT_HIT,
     LOG_EXECUTION_COMPLETED, LOG_EXECUTION_FAILED, IDEMPOTENCY_CACHE_PREFIX,
     TOOL_EXECUTION_TIME, TOOL_EXECUTIONS, STATUS, SUCCESS, TOOL, ERROR, EXECUTION_FAILED,
 )
 from ....defaults import DEFAULT_TOOL_CONTEXT_DATA
-from utils.logging.LoggerAdaptor import LoggerAdaptor
+from utils.logging.LoggerAdaptor import LoggerAdaptor, lazy
 
 
 class BaseHttpExecutor(BaseToolExecutor):
@@ -91,6 +92,7 @@ class BaseHttpExecutor(BaseToolExecutor):
         
         This is the Template Method that provides the complete execution flow:
         1. Log execution start
+           (early_cache_lookup: return a local idempotency hit after authorization)
         2. Validate parameters (if validator available)
         3. Authorize execution (if security available)
         4. Check egress permissions (if security available)
@@ -112,7 +114,17 @@ class BaseHttpExecutor(BaseToolExecutor):
         self.logger.info(LOG_STARTING_EXECUTION, **context_data)
         self.logger.debug(LOG_PARAMETERS, parameters=args, **context_data)
         
+        flight = None
         try:
+            early_result = await self._lookup_idempotency_early(args, ctx)
+            if early_result is not None:
+                self.logger.info(
+                    LOG_IDEMPOTENCY_CACHE_HIT,
+                    idempotency_key=ctx.idempotency_key,
+                    **context_data
+                )
+                return early_result
+            
             if ctx.validator:
                 self.logger.info(LOG_VALIDATING, **context_data)
                 await ctx.validator.validate(args, self.spec)
@@ -152,13 +164,26 @@ class BaseHttpExecutor(BaseToolExecutor):
                                 **context_data
                             )
                             return ToolResult(**cached_result)
+                    
+                    # Coalesce with a concurrent execution of the same call
+                    flight = self._join_in_flight(idempotency_key)
+                    if flight and not flight.is_leader:
+                        shared_result = await self._await_in_flight(flight)
+                        if shared_result is not None:
+                            self.logger.info(
+                                LOG_IDEMPOTENCY_IN_FLIGHT_HIT,
+                                idempotency_key=idempotency_key,
+                                **context_data
+                            )
+                            return shared_result
+                        flight = None
             
             timeout = self.spec.timeout_s or 30
             result_content = await self._execute_http_request(args, ctx, timeout)
             
             execution_time = time.time() - start_time
             self.logger.info(LOG_EXECUTION_COMPLETED,
-                result=str(result_content),
+                result=lazy(lambda: str(result_content)),
                 execution_time_ms=round(execution_time * 1000, 2),
                 **context_data)
             
@@ -182,9 +207,15 @@ class BaseHttpExecutor(BaseToolExecutor):
                     result.model_dump(),
                     ttl_s=self.spec.idempotency.ttl_s
                 )
+            
+            if flight:
+                flight.resolve(result)
+            
             return result
             
         except Exception as e:
+            if flight:
+                flight.reject(e)
             execution_time = time.time() - start_time
             self.logger.error(LOG_EXECUTION_FAILED,
                 error=str(e),
@@ -201,6 +232,10 @@ class BaseHttpExecutor(BaseToolExecutor):
                 warnings=[f"{EXECUTION_FAILED}: {str(e)}"]
             )
             return error_result
+        
+        finally:
+            if flight:
+                flight.release()
     
     @abstractmethod
     async def _execute_http_request(
@@ -13,6 +13,7 @@ from urllib.parse import urlencode, urlparse, urlunparse, parse_qsl
 from urllib.request import Request, urlopen
 
 from .base_http_executor import BaseHttpExecutor
+from ...limiters.base_limiter import resolve_limiter_key
 from ....spec.tool_types import HttpToolSpec
 from ....spec.tool_context import ToolContext
 from ....constants import UTF_8, HTTP
@@ -127,7 +128,7 @@ class HttpToolExecutor(BaseHttpExecutor):
             return await asyncio.to_thread(_do_request)
 
         if ctx.limiter:
-            async with ctx.limiter.acquire(self.spec.tool_name):
+            async with ctx.limiter.acquire(resolve_limiter_key(ctx.limiter, self.spec.tool_name, ctx)):
                 if timeout:
                     http_result = await asyncio.wait_for(_invoke_http(), timeout=timeout)
                 else:
@@ -7,6 +7,8 @@ with proper lifecycle management for containerized environments like Fargate.
 Features:
 =========
 - Shared connection pooling across executors
+- Per-endpoint pools shared with LLM connectors (utils.http.PooledTransport)
+- DNS TTL caching and endpoint warm-up
 - Graceful shutdown with SIGTERM handling
 - Connection limits and timeouts
 - Health check support
@@ -25,6 +27,9 @@ Usage:
     # Get a shared session
     session = await manager.get_session()
     
+    # Get the pooled session of a specific endpoint
+    session = await manager.get_session("https://api.example.com/v1/items")
+    
     # On shutdown (automatically called on SIGTERM)
     await manager.shutdown()
 
@@ -35,10 +40,11 @@ For Fargate:
     async def lifespan(app: FastAPI):
         manager = await get_session_manager()
         await manager.startup()
+        await manager.warm_up(["https://my-resource.openai.azure.com"])
         yield
         await manager.shutdown()
 
-Version: 1.1.0
+Version: 1.2.0
 """
 
 import asyncio
@@ -46,7 +52,7 @@ import atexit
 import signal
 import sys
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from weakref import WeakSet
 import logging
 
@@ -56,6 +62,9 @@ try:
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
+if AIOHTTP_AVAILABLE:
+    from utils.http import PooledTransport, get_shared_transport
+
 
 logger = logging.getLogger("ahf.http.session_manager")
 
@@ -72,6 +81,7 @@ class HttpSessionManager:
     Attributes:
         _session: Shared aiohttp ClientSession
         _connector: TCP connector with connection limits
+        _transport: Per-endpoint pools (shared with LLM connectors by default)
         _executors: Weak references to executors using this manager
         _shutdown_event: Event signaling shutdown in progress
     """
@@ -82,6 +92,7 @@ class HttpSessionManager:
     DEFAULT_TIMEOUT_TOTAL = 30  # Total request timeout
     DEFAULT_TIMEOUT_CONNECT = 10  # Connection timeout
     DEFAULT_KEEPALIVE_TIMEOUT = 30  # Keep-alive timeout
+    DEFAULT_TTL_DNS_CACHE = 300  # DNS cache TTL
     
     def __init__(
         self,
@@ -91,6 +102,8 @@ class HttpSessionManager:
         timeout_connect: float = DEFAULT_TIMEOUT_CONNECT,
         keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
         enable_cleanup_closed: bool = True,
+        ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+        transport: Optional["PooledTransport"] = None,
     ):
         """
         Initialize the session manager.
@@ -102,6 +115,10 @@ class HttpSessionManager:
             timeout_connect: Connection timeout in seconds
             keepalive_timeout: Keep-alive timeout for idle connections
             enable_cleanup_closed: Enable cleanup of closed connections
+            ttl_dns_cache: DNS cache TTL in seconds for the shared session
+            transport: Per-endpoint pools for get_session(url), closed on
+                shutdown; defaults to the process-wide transport used by LLM
+                connectors, which is left open (see shutdown_shared_transport)
         """
         if not AIOHTTP_AVAILABLE:
             raise ImportError(
@@ -115,6 +132,9 @@ class HttpSessionManager:
         self._timeout_connect = timeout_connect
         self._keepalive_timeout = keepalive_timeout
         self._enable_cleanup_closed = enable_cleanup_closed
+        self._ttl_dns_cache = ttl_dns_cache
+        self._transport = transport
+        self._owns_transport = transport is not None
         
         self._session: Optional[aiohttp.ClientSession] = None
         self._connector: Optional[aiohttp.TCPConnector] = None
@@ -156,6 +176,7 @@ class HttpSessionManager:
                 limit_per_host=self._limit_per_host,
                 keepalive_timeout=self._keepalive_timeout,
                 enable_cleanup_closed=self._enable_cleanup_closed,
+                ttl_dns_cache=self._ttl_dns_cache,
                 force_close=False,
             )
             
@@ -218,6 +239,10 @@ class HttpSessionManager:
             if self._connector and not self._connector.closed:
                 await self._connector.close()
             
+            # Close the per-endpoint pools unless shared with LLM connectors
+            if self._owns_transport:
+                await self._transport.close()
+            
             self._session = None
             self._connector = None
             self._is_started = False
@@ -225,12 +250,23 @@ class HttpSessionManager:
             
             logger.info("HTTP Session Manager shutdown complete")
     
-    async def get_session(self) -> aiohttp.ClientSession:
+    @property
+    def transport(self) -> "PooledTransport":
+        """Per-endpoint connection pools (created lazily)."""
+        if self._transport is None:
+            self._transport = get_shared_transport()
+        return self._transport
+    
+    async def get_session(self, url: Optional[str] = None) -> aiohttp.ClientSession:
         """
         Get the shared HTTP session.
         
         Creates a session if one doesn't exist.
         
+        Args:
+            url: Optional request URL; when given, the session of that
+                endpoint's dedicated connection pool is returned
+        
         Returns:
             Shared aiohttp ClientSession
             
@@ -240,6 +276,9 @@ class HttpSessionManager:
         if self._is_shutting_down:
             raise RuntimeError("Session manager is shutting down")
         
+        if url is not None:
+            return self.transport.get_session(url)
+        
         if not self._is_started:
             await self.startup()
         
@@ -248,6 +287,19 @@ class HttpSessionManager:
         
         return self._session
     
+    async def warm_up(self, urls: Iterable[str], timeout: float = 5.0) -> Dict[str, bool]:
+        """
+        Pre-establish keep-alive connections to endpoints.
+        
+        Args:
+            urls: Endpoint URLs to connect to
+            timeout: Per-endpoint timeout in seconds
+            
+        Returns:
+            {origin: True if a connection was established}
+        """
+        return await self.transport.warm_up(urls, timeout=timeout)
+    
     def register_executor(self, executor: Any) -> None:
         """
         Register an executor for lifecycle management.
@@ -281,8 +333,9 @@ class HttpSessionManager:
     @property
     def stats(self) -> Dict[str, Any]:
         """Get session manager statistics."""
+        pools = self._transport.stats() if self._transport is not None else None
         if not self._connector:
-            return {"status": "not_started"}
+            return {"status": "not_started", "pools": pools}
         
         return {
             "status": "healthy" if self.is_healthy else "unhealthy",
@@ -291,7 +344,9 @@ class HttpSessionManager:
             "active_connections": len(self._connector._acquired) if hasattr(self._connector, '_acquired') else 0,
             "limit": self._limit,
             "limit_per_host": self._limit_per_host,
+            "ttl_dns_cache": self._ttl_dns_cache,
             "registered_executors": len(self._executors),
+            "pools": pools,
         }
     
     async def health_check(self) -> Dict[str, Any]:
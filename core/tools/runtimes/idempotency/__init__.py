@@ -68,6 +68,7 @@ from .field_idempotency_key_gen import FieldBasedIdempotencyKeyGenerator
 from .hash_idempotency_key_gen import HashBasedIdempotencyKeyGenerator
 from .custom_idempotency_key_gen import CustomIdempotencyKeyGenerator
 from .idempotency_key_gen_factory import IdempotencyKeyGeneratorFactory
+from .single_flight import SingleFlight, InFlightCall, DEFAULT_SINGLE_FLIGHT
 
 __all__ = [
     "IIdempotencyKeyGenerator",
@@ -76,5 +77,8 @@ __all__ = [
     "HashBasedIdempotencyKeyGenerator",
     "CustomIdempotencyKeyGenerator",
     "IdempotencyKeyGeneratorFactory",
+    "SingleFlight",
+    "InFlightCall",
+    "DEFAULT_SINGLE_FLIGHT",
 ]
 
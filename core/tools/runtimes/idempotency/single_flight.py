@@ -0,0 +1,135 @@
+"""
+Single-Flight Coalescing for Idempotent Tool Executions.
+
+Concurrent executions that share an idempotency key all miss the idempotency
+cache at the same time. SingleFlight lets the first of them (the leader) run
+the tool while the others (followers) await the leader's result.
+
+Flights are kept per event loop: executors running on different loops (e.g.
+a thread with its own asyncio.run()) never share a future.
+"""
+
+import asyncio
+import weakref
+from typing import Any, Dict, Optional
+
+
+class InFlightCall:
+    """
+    Handle for one participant of a coalesced call.
+    
+    The leader runs the tool and must call resolve() or reject(), and always
+    release(). Followers call wait().
+    """
+    
+    __slots__ = ("key", "is_leader", "_future", "_registry")
+    
+    def __init__(self, key: str, is_leader: bool, future: asyncio.Future, registry: "SingleFlight"):
+        self.key = key
+        self.is_leader = is_leader
+        self._future = future
+        self._registry = registry
+    
+    async def wait(self) -> Optional[Any]:
+        """
+        Wait for the leader's result (followers only).
+        
+        Returns:
+            The leader's result, or None if the leader was cancelled
+            
+        Raises:
+            Exception: The leader's exception
+        """
+        try:
+            return await asyncio.shield(self._future)
+        except asyncio.CancelledError:
+            if self._future.cancelled() and not asyncio.current_task().cancelling():
+                # The leader went away; the follower runs on its own
+                return None
+            raise
+    
+    def resolve(self, result: Any) -> None:
+        """Publish the leader's result to the followers."""
+        if self.is_leader and not self._future.done():
+            self._future.set_result(result)
+    
+    def reject(self, error: BaseException) -> None:
+        """Publish the leader's exception to the followers."""
+        if self.is_leader and not self._future.done():
+            self._future.set_exception(error)
+            # Mark retrieved so a call without followers does not warn
+            self._future.exception()
+    
+    def release(self) -> None:
+        """End the leader's flight; unresolved flights are cancelled."""
+        if not self.is_leader:
+            return
+        if not self._future.done():
+            self._future.cancel()
+        self._registry._release(self)
+
+
+class SingleFlight:
+    """
+    Registry of in-flight calls keyed by idempotency key, per event loop.
+    
+    Usage:
+        flight = single_flight.join(key)
+        if not flight.is_leader:
+            result = await flight.wait()
+        else:
+            try:
+                result = await run()
+                flight.resolve(result)
+            except Exception as e:
+                flight.reject(e)
+                raise
+            finally:
+                flight.release()
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def join(self, key: str) -> InFlightCall:
+        """
+        Join the in-flight call for a key in the running loop, becoming its
+        leader if there is none.
+        
+        Args:
+            key: Coalescing key
+            
+        Returns:
+            InFlightCall handle (check is_leader)
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._calls.get(loop)
+        if calls is None:
+            calls = self._calls[loop] = {}
+        
+        future = calls.get(key)
+        if future is not None and (
+            not future.done() or (not future.cancelled() and future.exception() is None)
+        ):
+            # Running, or resolved and still being finalized by the leader
+            return InFlightCall(key, False, future, self)
+        
+        future = loop.create_future()
+        calls[key] = future
+        return InFlightCall(key, True, future, self)
+    
+    def in_flight(self) -> int:
+        """Number of keys currently being executed, across all event loops."""
+        return sum(len(calls) for calls in self._calls.values())
+    
+    def _release(self, call: InFlightCall) -> None:
+        calls = self._calls.get(call._future.get_loop())
+        if calls is not None and calls.get(call.key) is call._future:
+            del calls[call.key]
+
+
+# Process-wide registry shared by all tool executors
+DEFAULT_SINGLE_FLIGHT = SingleFlight()
@@ -1,14 +1,26 @@
 """
 Rate limiter implementations for the tools system.
 
-Provides rate limiting implementations for throttling tool executions.
+Provides rate limiting implementations for throttling tool executions:
+- NoOpLimiter: No throttling
+- TokenBucketLimiter: Steady call rate with bursts
+- SlidingWindowLimiter: Calls per rolling window
+- ConcurrencyLimiter: In-flight calls per key
 """
 
 from .noop_limiter import NoOpLimiter
+from .base_limiter import BaseLimiter, resolve_limiter_key
+from .token_bucket_limiter import TokenBucketLimiter
+from .sliding_window_limiter import SlidingWindowLimiter
+from .concurrency_limiter import ConcurrencyLimiter
 from .limiter_factory import LimiterFactory
 
 __all__ = [
     "NoOpLimiter",
+    "BaseLimiter",
+    "TokenBucketLimiter",
+    "SlidingWindowLimiter",
+    "ConcurrencyLimiter",
     "LimiterFactory",
+    "resolve_limiter_key",
 ]
-
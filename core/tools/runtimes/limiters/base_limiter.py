@@ -0,0 +1,182 @@
+"""
+Base In-Process Limiter.
+
+Shared key handling and metrics for the asyncio limiter implementations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+from ...interfaces.tool_interfaces import IToolLimiter, IToolMetrics
+from ...enum import LimiterKeyScope
+from ...constants import (
+    LIMITER_KEY_SEPARATOR,
+    LIMITER_INVALID_LIMIT_ERROR,
+    METRIC_LIMITER_ACQUIRED,
+    METRIC_LIMITER_THROTTLED,
+    METRIC_LIMITER_WAIT_TIME,
+)
+from ...defaults import DEFAULT_LIMITER_MAX_KEYS
+
+if TYPE_CHECKING:
+    from ...spec.tool_context import ToolContext
+
+# Least recently used keys inspected for eviction per new key
+_EVICTION_SCAN = 16
+
+
+def resolve_limiter_key(limiter: IToolLimiter, tool_name: str, ctx: ToolContext) -> str:
+    """
+    Build the key an executor passes to limiter.acquire().
+    
+    Limiters without a key scope (NoOpLimiter, custom limiters) receive the
+    tool name, as before.
+    
+    Args:
+        limiter: Limiter from the tool context
+        tool_name: Name of the tool being executed
+        ctx: Tool execution context
+        
+    Returns:
+        Limiter key
+    """
+    scope = getattr(limiter, "key_scope", LimiterKeyScope.TOOL)
+    if scope == LimiterKeyScope.USER:
+        return LIMITER_KEY_SEPARATOR.join((tool_name, scope.value, str(ctx.user_id)))
+    if scope == LimiterKeyScope.TENANT:
+        return LIMITER_KEY_SEPARATOR.join((tool_name, scope.value, str(ctx.tenant_id)))
+    return tool_name
+
+
+class BaseLimiter(IToolLimiter):
+    """
+    Base class for in-process asyncio limiters.
+    
+    Subclasses keep one state object per key (see _get_state()) and
+    implement acquire() and _is_idle(). Every acquisition is counted;
+    acquisitions that had to wait are also counted as throttled and their
+    wait time is recorded.
+    
+    Key state lives in an LRU map per event loop, so asyncio primitives are
+    never shared across loops (shared instances stay usable from any loop).
+    Once a loop holds max_keys keys, least recently used keys whose state is
+    back at rest (idle) are evicted; evicting them does not change limits.
+    
+    Metrics (when a metrics collector is given):
+        - tool.limiter.acquired: Acquisitions
+        - tool.limiter.throttled: Acquisitions that had to wait
+        - tool.limiter.wait_time: Wait time in milliseconds (throttled only)
+    """
+    
+    name: str = "base"
+    
+    def __init__(
+        self,
+        limit: int,
+        key_scope: Union[LimiterKeyScope, str] = LimiterKeyScope.TOOL,
+        metrics: Optional[IToolMetrics] = None,
+        max_keys: int = DEFAULT_LIMITER_MAX_KEYS,
+    ):
+        """
+        Initialize limiter.
+        
+        Args:
+            limit: Default limit per key (overridable per acquire() call)
+            key_scope: Whether executors key buckets per tool, user or tenant
+            metrics: Optional metrics collector for limiter counters
+            max_keys: Keys kept per event loop before idle keys are evicted
+        """
+        self.limit = self._check_limit(limit)
+        self.key_scope = LimiterKeyScope(key_scope)
+        self.metrics = metrics
+        self.max_keys = self._check_limit(max_keys)
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._acquired = 0
+        self._throttled = 0
+        self._wait_time_ms = 0.0
+    
+    @staticmethod
+    def _check_limit(limit: Any) -> int:
+        """Validate a limit value."""
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise ValueError(LIMITER_INVALID_LIMIT_ERROR.format(LIMIT=limit))
+        return limit
+    
+    def _effective_limit(self, limit: Optional[int]) -> int:
+        """Limit for a call: the per-call override or the default."""
+        return self.limit if limit is None else self._check_limit(limit)
+    
+    def _get_state(self, key: str, create: Callable[[], Any]) -> Any:
+        """
+        Get the state of a key in the running loop, creating it on first use.
+        
+        Args:
+            key: Limiter key
+            create: Builds the state of a new key
+            
+        Returns:
+            Key state
+        """
+        loop = asyncio.get_running_loop()
+        states = self._states.get(loop)
+        if states is None:
+            states = self._states[loop] = OrderedDict()
+        
+        state = states.get(key)
+        if state is None:
+            if len(states) >= self.max_keys:
+                self._evict_idle(states)
+            state = states[key] = create()
+        else:
+            states.move_to_end(key)
+        return state
+    
+    def _evict_idle(self, states: "OrderedDict[str, Any]") -> None:
+        """Evict idle keys among the least recently used ones."""
+        now = time.monotonic()
+        # Collect first: the dict cannot change size while it is iterated
+        for key in list(islice(states, _EVICTION_SCAN)):
+            if len(states) < self.max_keys:
+                break
+            if self._is_idle(states[key], now):
+                del states[key]
+    
+    def _is_idle(self, state: Any, now: float) -> bool:
+        """Whether a key's state equals a fresh one (safe to evict)."""
+        return False
+    
+    def _key_count(self) -> int:
+        """Keys held across all event loops."""
+        return sum(len(states) for states in self._states.values())
+    
+    async def _record(self, key: str, wait_s: Optional[float]) -> None:
+        """Count an acquisition and emit metrics (wait_s is None if it did not wait)."""
+        self._acquired += 1
+        throttled = wait_s is not None
+        if throttled:
+            self._throttled += 1
+            self._wait_time_ms += wait_s * 1000
+        
+        if self.metrics:
+            tags = {"limiter": self.name, "key": key}
+            await self.metrics.incr(METRIC_LIMITER_ACQUIRED, tags=tags)
+            if throttled:
+                await self.metrics.incr(METRIC_LIMITER_THROTTLED, tags=tags)
+                await self.metrics.timing_ms(METRIC_LIMITER_WAIT_TIME, int(wait_s * 1000), tags=tags)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter counters."""
+        return {
+            "limiter": self.name,
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+            "wait_time_ms": self._wait_time_ms,
+        }
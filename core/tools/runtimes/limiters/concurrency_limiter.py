@@ -0,0 +1,105 @@
+"""
+Concurrency Limiter Implementation.
+
+Caps the number of in-flight tool calls per key.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, Optional, Union
+
+from ...interfaces.tool_interfaces import IToolMetrics
+from ...enum import LimiterKeyScope
+from ...constants import CONCURRENCY
+from ...defaults import DEFAULT_LIMITER_LIMIT, DEFAULT_LIMITER_MAX_KEYS
+from .base_limiter import BaseLimiter
+
+
+class _Slots:
+    """Semaphore for one key, counting callers holding or awaiting a slot."""
+    
+    __slots__ = ("semaphore", "active")
+    
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.active = 0
+
+
+class ConcurrencyLimiter(BaseLimiter):
+    """
+    Per-key semaphore: at most `limit` calls run at once for a key.
+    
+    Unlike the rate limiters, the slot is held for the duration of the
+    `async with` block and released on exit (including on errors and
+    cancellation). Waiters are woken in FIFO order.
+    
+    Usage:
+        limiter = ConcurrencyLimiter(limit=4)
+        
+        async with limiter.acquire("report_generator"):
+            await generate_report()
+    """
+    
+    name = CONCURRENCY
+    
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMITER_LIMIT,
+        key_scope: Union[LimiterKeyScope, str] = LimiterKeyScope.TOOL,
+        metrics: Optional[IToolMetrics] = None,
+        max_keys: int = DEFAULT_LIMITER_MAX_KEYS,
+    ):
+        """
+        Initialize concurrency limiter.
+        
+        Args:
+            limit: Concurrent calls allowed per key
+            key_scope: Whether executors key semaphores per tool, user or tenant
+            metrics: Optional metrics collector for limiter counters
+            max_keys: Semaphores kept before unused ones are evicted
+        """
+        super().__init__(limit=limit, key_scope=key_scope, metrics=metrics, max_keys=max_keys)
+    
+    @asynccontextmanager
+    async def acquire(self, key: str, limit: Optional[int] = None) -> AsyncContextManager[None]:
+        """
+        Hold one slot for the key for the duration of the block.
+        
+        Args:
+            key: Concurrency key
+            limit: Concurrent calls for this key; applied when the key is first seen
+            
+        Yields:
+            None
+        """
+        slots = self._get_state(key, lambda: _Slots(self._effective_limit(limit)))
+        semaphore = slots.semaphore
+        
+        slots.active += 1
+        try:
+            if semaphore.locked():
+                started = time.monotonic()
+                await semaphore.acquire()
+                waited = time.monotonic() - started
+            else:
+                await semaphore.acquire()
+                waited = None
+            
+            try:
+                await self._record(key, waited)
+                yield
+            finally:
+                semaphore.release()
+        finally:
+            slots.active -= 1
+    
+    def _is_idle(self, slots: _Slots, now: float) -> bool:
+        """A semaphore is idle when no caller holds or awaits a slot."""
+        return not slots.active
+    
+    def get_stats(self):
+        """Get limiter counters."""
+        stats = super().get_stats()
+        stats["keys"] = self._key_count()
+        return stats
@@ -8,9 +8,15 @@ from typing import Dict
 
 from ...interfaces.tool_interfaces import IToolLimiter
 from .noop_limiter import NoOpLimiter
+from .token_bucket_limiter import TokenBucketLimiter
+from .sliding_window_limiter import SlidingWindowLimiter
+from .concurrency_limiter import ConcurrencyLimiter
 
 from ...constants import (
     NOOP,
+    TOKEN_BUCKET,
+    SLIDING_WINDOW,
+    CONCURRENCY,
     UNKNOWN_LIMITER_ERROR,
     COMMA,
     SPACE
@@ -23,11 +29,24 @@ class LimiterFactory:
     
     Built-in Limiter Implementations:
         - 'noop': NoOpLimiter - No rate limiting (for testing/development)
+        - 'token_bucket': TokenBucketLimiter - Steady rate with bursts (default limits)
+        - 'sliding_window': SlidingWindowLimiter - Calls per rolling window (default limits)
+        - 'concurrency': ConcurrencyLimiter - In-flight calls per key (default limit)
+    
+    The built-in instances are shared process-wide (key state is kept per
+    event loop, so they work from any loop); register a configured instance
+    to use other limits, a per-user/tenant key scope or metrics.
     
     Usage:
         # Get built-in limiter
         limiter = LimiterFactory.get_limiter('noop')
         
+        # Register a configured in-process limiter
+        LimiterFactory.register(
+            'crm_quota',
+            SlidingWindowLimiter(limit=100, period_s=60, key_scope='tenant')
+        )
+        
         # Register custom limiter implementation
         LimiterFactory.register('redis', RedisLimiter())
         limiter = LimiterFactory.get_limiter('redis')
@@ -35,6 +54,9 @@ class LimiterFactory:
     
     _limiters: Dict[str, IToolLimiter] = {
         NOOP: NoOpLimiter(),
+        TOKEN_BUCKET: TokenBucketLimiter(),
+        SLIDING_WINDOW: SlidingWindowLimiter(),
+        CONCURRENCY: ConcurrencyLimiter(),
     }
     
     @classmethod
@@ -43,7 +65,7 @@ class LimiterFactory:
         Get a limiter implementation by name.
         
         Args:
-            name: Limiter implementation name ('noop', 'redis', etc.)
+            name: Limiter implementation name ('noop', 'token_bucket', 'redis', etc.)
             
         Returns:
             IToolLimiter instance
@@ -0,0 +1,132 @@
+"""
+Sliding Window Limiter Implementation.
+
+Caps tool calls per rolling time window, matching how most HTTP APIs
+enforce their quotas.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, Optional, Union
+
+from ...interfaces.tool_interfaces import IToolMetrics
+from ...enum import LimiterKeyScope
+from ...constants import SLIDING_WINDOW
+from ...defaults import DEFAULT_LIMITER_LIMIT, DEFAULT_LIMITER_MAX_KEYS, DEFAULT_LIMITER_PERIOD_S
+from .base_limiter import BaseLimiter
+
+# Lower bound on a throttled wait, so float rounding cannot spin the loop
+_MIN_WAIT_S = 0.001
+
+
+class _Window:
+    """Sliding window counter state for one key."""
+    
+    __slots__ = ("started_at", "current", "previous", "lock")
+    
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.current = 0
+        self.previous = 0
+        self.lock = asyncio.Lock()
+
+
+class SlidingWindowLimiter(BaseLimiter):
+    """
+    Per-key sliding window: at most `limit` calls in any `period_s` window.
+    
+    Uses the sliding window counter approximation: the count in the rolling
+    window is estimated from the current and previous fixed windows, weighted
+    by their overlap. This keeps memory and acquire() at O(1) per key, unlike
+    a timestamp log. Waiters are served in FIFO order.
+    
+    Usage:
+        limiter = SlidingWindowLimiter(limit=100, period_s=60)
+        
+        async with limiter.acquire("crm_api"):
+            await call_api()
+    """
+    
+    name = SLIDING_WINDOW
+    
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMITER_LIMIT,
+        period_s: float = DEFAULT_LIMITER_PERIOD_S,
+        key_scope: Union[LimiterKeyScope, str] = LimiterKeyScope.TOOL,
+        metrics: Optional[IToolMetrics] = None,
+        max_keys: int = DEFAULT_LIMITER_MAX_KEYS,
+    ):
+        """
+        Initialize sliding window limiter.
+        
+        Args:
+            limit: Calls allowed per window
+            period_s: Window length in seconds
+            key_scope: Whether executors key windows per tool, user or tenant
+            metrics: Optional metrics collector for limiter counters
+            max_keys: Windows kept before expired, idle ones are evicted
+        """
+        super().__init__(limit=limit, key_scope=key_scope, metrics=metrics, max_keys=max_keys)
+        self.period_s = period_s
+    
+    def _wait_time(self, window: _Window, limit: int, now: float) -> float:
+        """Seconds until one more call fits in the window (0 if it fits now)."""
+        elapsed = now - window.started_at
+        if elapsed >= self.period_s:
+            windows_passed = int(elapsed // self.period_s)
+            window.previous = window.current if windows_passed == 1 else 0
+            window.current = 0
+            window.started_at += windows_passed * self.period_s
+            elapsed = now - window.started_at
+        
+        fraction = elapsed / self.period_s
+        estimate = window.previous * (1 - fraction) + window.current
+        if estimate < limit:
+            return 0.0
+        if window.current >= limit:
+            # Full even without the previous window: wait for the next one
+            return max(self.period_s - elapsed, _MIN_WAIT_S)
+        # Wait until the previous window's weight has decayed enough
+        target_fraction = 1 - (limit - window.current) / window.previous
+        return max((target_fraction - fraction) * self.period_s, _MIN_WAIT_S)
+    
+    @asynccontextmanager
+    async def acquire(self, key: str, limit: Optional[int] = None) -> AsyncContextManager[None]:
+        """
+        Count one call for the key, waiting while the window is full.
+        
+        Args:
+            key: Rate limit key
+            limit: Calls per window for this key (default: limiter limit)
+            
+        Yields:
+            None
+        """
+        limit = self._effective_limit(limit)
+        window = self._get_state(key, _Window)
+        
+        started = time.monotonic()
+        throttled = window.lock.locked()
+        async with window.lock:
+            while True:
+                delay = self._wait_time(window, limit, time.monotonic())
+                if not delay:
+                    window.current += 1
+                    break
+                throttled = True
+                await asyncio.sleep(delay)
+        
+        await self._record(key, time.monotonic() - started if throttled else None)
+        yield
+    
+    def _is_idle(self, window: _Window, now: float) -> bool:
+        """A window is idle once both counted windows have passed, with no waiters."""
+        return not window.lock.locked() and now - window.started_at >= 2 * self.period_s
+    
+    def get_stats(self):
+        """Get limiter counters."""
+        stats = super().get_stats()
+        stats["keys"] = self._key_count()
+        return stats
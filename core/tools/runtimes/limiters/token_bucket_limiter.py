@@ -0,0 +1,122 @@
+"""
+Token Bucket Limiter Implementation.
+
+Smooths tool calls to a steady rate while allowing short bursts.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, Optional, Union
+
+from ...interfaces.tool_interfaces import IToolMetrics
+from ...enum import LimiterKeyScope
+from ...constants import TOKEN_BUCKET
+from ...defaults import DEFAULT_LIMITER_LIMIT, DEFAULT_LIMITER_MAX_KEYS, DEFAULT_LIMITER_PERIOD_S
+from .base_limiter import BaseLimiter
+
+
+class _Bucket:
+    """Token bucket state for one key."""
+    
+    __slots__ = ("tokens", "updated_at", "full_at", "lock")
+    
+    def __init__(self, capacity: int):
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.full_at = self.updated_at  # When the bucket is refilled to capacity
+        self.lock = asyncio.Lock()
+
+
+class TokenBucketLimiter(BaseLimiter):
+    """
+    Per-key token bucket: `limit` calls per `period_s`, bursting up to `burst`.
+    
+    Tokens refill continuously. acquire() takes one token, waiting for the
+    next refill when the bucket is empty. Waiters are served in FIFO order
+    (they queue on a per-key asyncio.Lock), and each acquisition is O(1).
+    
+    Usage:
+        limiter = TokenBucketLimiter(limit=5, period_s=1.0)
+        
+        async with limiter.acquire("weather_api"):
+            await call_api()
+        
+        # Per-call override of the rate for this key
+        async with limiter.acquire("search_api", limit=20):
+            await call_api()
+    """
+    
+    name = TOKEN_BUCKET
+    
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMITER_LIMIT,
+        period_s: float = DEFAULT_LIMITER_PERIOD_S,
+        burst: Optional[int] = None,
+        key_scope: Union[LimiterKeyScope, str] = LimiterKeyScope.TOOL,
+        metrics: Optional[IToolMetrics] = None,
+        max_keys: int = DEFAULT_LIMITER_MAX_KEYS,
+    ):
+        """
+        Initialize token bucket limiter.
+        
+        Args:
+            limit: Calls allowed per period (refill rate)
+            period_s: Period length in seconds
+            burst: Bucket capacity (default: limit)
+            key_scope: Whether executors key buckets per tool, user or tenant
+            metrics: Optional metrics collector for limiter counters
+            max_keys: Buckets kept before full, idle ones are evicted
+        """
+        super().__init__(limit=limit, key_scope=key_scope, metrics=metrics, max_keys=max_keys)
+        self.period_s = period_s
+        self.burst = self._check_limit(burst) if burst is not None else None
+    
+    def _capacity(self, limit: int) -> int:
+        return self.burst if self.burst is not None else limit
+    
+    @asynccontextmanager
+    async def acquire(self, key: str, limit: Optional[int] = None) -> AsyncContextManager[None]:
+        """
+        Take one token for the key, waiting if the bucket is empty.
+        
+        Args:
+            key: Rate limit key
+            limit: Calls per period for this key (default: limiter limit)
+            
+        Yields:
+            None
+        """
+        limit = self._effective_limit(limit)
+        bucket = self._get_state(key, lambda: _Bucket(self._capacity(limit)))
+        
+        started = time.monotonic()
+        throttled = bucket.lock.locked()
+        async with bucket.lock:
+            rate = limit / self.period_s
+            capacity = self._capacity(limit)
+            while True:
+                now = time.monotonic()
+                bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated_at) * rate)
+                bucket.updated_at = now
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    bucket.full_at = now + (capacity - bucket.tokens) / rate
+                    break
+                delay = (1 - bucket.tokens) / rate
+                throttled = True
+                await asyncio.sleep(delay)
+        
+        await self._record(key, time.monotonic() - started if throttled else None)
+        yield
+    
+    def _is_idle(self, bucket: _Bucket, now: float) -> bool:
+        """A bucket is idle once refilled to capacity with no waiters."""
+        return not bucket.lock.locked() and now >= bucket.full_at
+    
+    def get_stats(self):
+        """Get limiter counters."""
+        stats = super().get_stats()
+        stats["keys"] = self._key_count()
+        return stats
@@ -7,10 +7,11 @@ Implementations:
 - S3ToolStorage: AWS S3-based storage with versioning support
 """
 
-from .storage_interface import IToolStorage
+from .storage_interface import IToolStorage, ToolListPage
 from .s3_storage import S3ToolStorage
 
 __all__ = [
     "IToolStorage",
+    "ToolListPage",
     "S3ToolStorage",
 ]
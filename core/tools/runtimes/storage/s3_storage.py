@@ -8,16 +8,24 @@ Features:
 - Semantic versioning support (tool_id/version/spec.json)
 - Metadata storage with tool specs
 - Support for custom endpoints (LocalStack testing)
+- ETag-validated in-process spec cache (conditional GETs)
+- Cursor-paginated listing; bucket existence checked once per process
 
 Version: 1.0.0
 """
 
 import json
 import asyncio
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .storage_interface import IToolStorage, ToolStorageResult, ToolVersionInfo
+from .storage_interface import IToolStorage, ToolListPage, ToolStorageResult, ToolVersionInfo
+from ...defaults import STORAGE_DEFAULT_LOAD_CONCURRENCY, STORAGE_DEFAULT_SPEC_CACHE_SIZE
+
+# S3 error codes for a conditional GET whose ETag still matches
+_NOT_MODIFIED_CODES = ("304", "NotModified")
 
 
 class S3ToolStorage(IToolStorage):
@@ -52,12 +60,21 @@ class S3ToolStorage(IToolStorage):
         # Load specific version
         result = await storage.load("my-tool", version="1.0.0")
     
+    Caching:
+        Loaded specs are kept (up to spec_cache_size) with their ETag. Later
+        loads of the same key send If-None-Match and reuse the cached body on
+        304 Not Modified, so unchanged specs are not transferred again. Bucket
+        existence is verified once per process and bucket.
+    
     Environment Variables:
         AWS_ACCESS_KEY_ID: AWS access key
         AWS_SECRET_ACCESS_KEY: AWS secret key
         AWS_DEFAULT_REGION: Default AWS region
     """
     
+    # (endpoint_url, bucket_name) pairs known to exist, shared by all instances
+    _verified_buckets: set = set()
+    
     def __init__(
         self,
         bucket_name: str,
@@ -67,6 +84,7 @@ class S3ToolStorage(IToolStorage):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         use_s3_versioning: bool = False,
+        spec_cache_size: int = STORAGE_DEFAULT_SPEC_CACHE_SIZE,
     ):
         """
         Initialize S3 storage.
@@ -79,6 +97,7 @@ class S3ToolStorage(IToolStorage):
             aws_access_key_id: Optional AWS access key (prefer env vars or IAM)
             aws_secret_access_key: Optional AWS secret key
             use_s3_versioning: Use S3 native versioning (bucket must have it enabled)
+            spec_cache_size: Specs kept in the ETag-validated cache (0 disables it)
         """
         self._bucket_name = bucket_name
         self._region = region
@@ -88,14 +107,22 @@ class S3ToolStorage(IToolStorage):
         self._aws_secret_access_key = aws_secret_access_key
         self._use_s3_versioning = use_s3_versioning
         self._client = None
+        
+        # key -> (etag, body, version_id)
+        self._spec_cache: "OrderedDict[str, Tuple[str, str, Optional[str]]]" = OrderedDict()
+        self._spec_cache_size = spec_cache_size
+        self._spec_cache_lock = threading.Lock()
     
     def _get_client(self):
         """Get or create boto3 S3 client."""
         if self._client is None:
             import boto3
+            from botocore.config import Config
             
             kwargs = {
                 "region_name": self._region,
+                # Room for concurrent load_many() requests
+                "config": Config(max_pool_connections=STORAGE_DEFAULT_LOAD_CONCURRENCY),
             }
             
             if self._endpoint_url:
@@ -119,6 +146,31 @@ class S3ToolStorage(IToolStorage):
         """Get S3 key for tool metadata."""
         return f"{self._prefix}/{tool_id}/metadata.json"
     
+    def _get_cached_spec(self, key: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Get (etag, body, version_id) cached for a key."""
+        with self._spec_cache_lock:
+            entry = self._spec_cache.get(key)
+            if entry is not None:
+                self._spec_cache.move_to_end(key)
+            return entry
+    
+    def _cache_spec(self, key: str, etag: Optional[str], body: str, version_id: Optional[str]) -> None:
+        """Cache a loaded spec body under its ETag."""
+        if not etag or self._spec_cache_size <= 0:
+            return
+        with self._spec_cache_lock:
+            self._spec_cache[key] = (etag, body, version_id)
+            self._spec_cache.move_to_end(key)
+            while len(self._spec_cache) > self._spec_cache_size:
+                self._spec_cache.popitem(last=False)
+    
+    def _invalidate_tool(self, tool_id: str) -> None:
+        """Drop cached specs of a tool after a write."""
+        tool_prefix = f"{self._prefix}/{tool_id}/"
+        with self._spec_cache_lock:
+            for key in [k for k in self._spec_cache if k.startswith(tool_prefix)]:
+                del self._spec_cache[key]
+    
     async def save(
         self,
         tool_id: str,
@@ -215,7 +267,10 @@ class S3ToolStorage(IToolStorage):
                 
                 return response
             
-            response = await asyncio.to_thread(_put_object)
+            try:
+                response = await asyncio.to_thread(_put_object)
+            finally:
+                self._invalidate_tool(tool_id)
             version_id = response.get("VersionId")
             
             return ToolStorageResult(
@@ -266,9 +321,28 @@ class S3ToolStorage(IToolStorage):
                     # For simplicity, we'll use the metadata file
                     pass
                 
-                response = client.get_object(**kwargs)
+                # Conditional GET: reuse the cached body if the ETag still matches
+                cached = self._get_cached_spec(key)
+                if cached is not None:
+                    kwargs["IfNoneMatch"] = cached[0]
+                
+                try:
+                    response = client.get_object(**kwargs)
+                except Exception as e:
+                    error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "")
+                    if cached is None or error_code not in _NOT_MODIFIED_CODES:
+                        raise
+                    etag, body, version_id = cached
+                    return {
+                        "spec": json.loads(body),
+                        "version_id": version_id,
+                        "etag": etag,
+                        "last_modified": None,
+                    }
+                
                 body = response["Body"].read().decode("utf-8")
                 spec = json.loads(body)
+                self._cache_spec(key, response.get("ETag"), body, response.get("VersionId"))
                 
                 return {
                     "spec": spec,
@@ -359,7 +433,10 @@ class S3ToolStorage(IToolStorage):
                     for obj in response.get("Contents", []):
                         client.delete_object(Bucket=self._bucket_name, Key=obj["Key"])
             
-            await asyncio.to_thread(_delete_object)
+            try:
+                await asyncio.to_thread(_delete_object)
+            finally:
+                self._invalidate_tool(tool_id)
             
             return ToolStorageResult(
                 success=True,
@@ -391,6 +468,26 @@ class S3ToolStorage(IToolStorage):
         Returns:
             List of tool identifiers
         """
+        page = await self.list_tools_page(prefix=prefix, limit=limit)
+        return page.tool_ids
+    
+    async def list_tools_page(
+        self,
+        prefix: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> ToolListPage:
+        """
+        List one page of tool identifiers.
+        
+        Args:
+            prefix: Optional prefix filter
+            limit: Maximum number of results on the page
+            cursor: Cursor returned with the previous page (S3 continuation token)
+            
+        Returns:
+            ToolListPage with the identifiers and the next cursor
+        """
         try:
             client = self._get_client()
             
@@ -399,12 +496,15 @@ class S3ToolStorage(IToolStorage):
                 if prefix:
                     search_prefix = f"{self._prefix}/{prefix}"
                 
-                response = client.list_objects_v2(
-                    Bucket=self._bucket_name,
-                    Prefix=search_prefix,
-                    Delimiter="/",
-                    MaxKeys=limit,
-                )
+                kwargs = {
+                    "Bucket": self._bucket_name,
+                    "Prefix": search_prefix,
+                    "Delimiter": "/",
+                    "MaxKeys": limit,
+                }
+                if cursor:
+                    kwargs["ContinuationToken"] = cursor
+                response = client.list_objects_v2(**kwargs)
                 
                 tool_ids = []
                 for common_prefix in response.get("CommonPrefixes", []):
@@ -414,12 +514,13 @@ class S3ToolStorage(IToolStorage):
                     if len(parts) >= 2:
                         tool_ids.append(parts[-1])
                 
-                return tool_ids
+                next_cursor = response.get("NextContinuationToken") if response.get("IsTruncated") else None
+                return ToolListPage(tool_ids=tool_ids, next_cursor=next_cursor)
             
             return await asyncio.to_thread(_list_objects)
             
         except Exception:
-            return []
+            return ToolListPage()
     
     async def list_versions(
         self,
@@ -540,6 +641,10 @@ class S3ToolStorage(IToolStorage):
         Returns:
             True if bucket exists or was created
         """
+        bucket_key = (self._endpoint_url, self._bucket_name)
+        if bucket_key in S3ToolStorage._verified_buckets:
+            return True
+        
         try:
             import botocore.exceptions
             client = self._get_client()
@@ -567,7 +672,10 @@ class S3ToolStorage(IToolStorage):
                 except Exception:
                     return False
             
-            return await asyncio.to_thread(_ensure)
+            exists = await asyncio.to_thread(_ensure)
+            if exists:
+                S3ToolStorage._verified_buckets.add(bucket_key)
+            return exists
             
         except Exception:
             return False
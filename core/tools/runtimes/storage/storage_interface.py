@@ -6,9 +6,12 @@ Defines the abstract interface for tool specification storage backends.
 Version: 1.0.0
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ...defaults import STORAGE_DEFAULT_LOAD_CONCURRENCY
 
 
 @dataclass
@@ -53,6 +56,19 @@ class ToolStorageResult:
     data: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class ToolListPage:
+    """
+    One page of tool identifiers.
+
+    Attributes:
+        tool_ids: Tool identifiers on this page
+        next_cursor: Opaque cursor for the next page (None on the last page)
+    """
+    tool_ids: List[str] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
 class IToolStorage(ABC):
     """
     Abstract interface for tool specification storage.
@@ -196,3 +212,50 @@ class IToolStorage(ABC):
             Latest version string or None if not found
         """
         pass
+
+    async def list_tools_page(
+        self,
+        prefix: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> ToolListPage:
+        """
+        List one page of tool identifiers.
+
+        The default implementation returns a single page from list_tools();
+        backends with native pagination should override it.
+
+        Args:
+            prefix: Optional prefix filter
+            limit: Maximum number of results on the page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            ToolListPage with the identifiers and the next cursor
+        """
+        if cursor:
+            return ToolListPage()
+        return ToolListPage(tool_ids=await self.list_tools(prefix=prefix, limit=limit))
+
+    async def load_many(
+        self,
+        tool_ids: List[str],
+        concurrency: int = STORAGE_DEFAULT_LOAD_CONCURRENCY
+    ) -> List[ToolStorageResult]:
+        """
+        Load the latest specs of several tools concurrently.
+
+        Args:
+            tool_ids: Tool identifiers
+            concurrency: Maximum loads in flight
+
+        Returns:
+            Results in the order of tool_ids
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _load(tool_id: str) -> ToolStorageResult:
+            async with semaphore:
+                return await self.load(tool_id)
+
+        return list(await asyncio.gather(*(_load(tool_id) for tool_id in tool_ids)))
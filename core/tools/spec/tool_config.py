@@ -24,7 +24,10 @@ from ..defaults import (
     IDEMPOTENCY_DEFAULT_TTL_S,
     IDEMPOTENCY_DEFAULT_PERSIST_RESULT,
     IDEMPOTENCY_DEFAULT_BYPASS_ON_MISSING_KEY,
+    IDEMPOTENCY_DEFAULT_COALESCE_IN_FLIGHT,
+    IDEMPOTENCY_DEFAULT_EARLY_CACHE_LOOKUP,
     INTERRUPTION_DEFAULT_DISABLED,
+    EXECUTION_DEFAULT_SPECULATIVE,
     SPEECH_DEFAULT_ENABLED,
     SPEECH_DEFAULT_CONSTANT_MESSAGE,
     VARIABLE_ASSIGNMENT_DEFAULT_ENABLED,
@@ -248,6 +251,28 @@ class IdempotencyConfig(BaseModel):
             order=4,
         )}
     )
+    coalesce_in_flight: bool = Field(
+        default=IDEMPOTENCY_DEFAULT_COALESCE_IN_FLIGHT,
+        json_schema_extra={"ui": ui(
+            display_name="Coalesce Concurrent Calls",
+            widget_type=WidgetType.SWITCH,
+            visible_when="enabled == true",
+            help_text="Concurrent calls with the same key share one execution",
+            group="idempotency",
+            order=5,
+        )}
+    )
+    early_cache_lookup: bool = Field(
+        default=IDEMPOTENCY_DEFAULT_EARLY_CACHE_LOOKUP,
+        json_schema_extra={"ui": ui(
+            display_name="Early Cache Lookup",
+            widget_type=WidgetType.SWITCH,
+            visible_when="enabled == true && persist_result == true",
+            help_text="Serve local cache hits before validation (authorization still runs)",
+            group="idempotency",
+            order=6,
+        )}
+    )
 
 
 class InterruptionConfig(BaseModel):
@@ -419,7 +444,8 @@ class ExecutionConfig(BaseModel):
     Configuration for tool execution behavior relative to speech.
     
     Controls whether to wait for speech to complete before executing
-    the tool, or run both in parallel.
+    the tool, or run both in parallel, and whether the tool may start
+    speculatively before the LLM has finished its response.
     """
     mode: ExecutionMode = Field(
         default=ExecutionMode.SEQUENTIAL,
@@ -450,6 +476,16 @@ class ExecutionConfig(BaseModel):
             order=1,
         )}
     )
+    speculative: bool = Field(
+        default=EXECUTION_DEFAULT_SPECULATIVE,
+        json_schema_extra={"ui": ui(
+            display_name="Speculative Execution",
+            widget_type=WidgetType.SWITCH,
+            help_text="Start the tool while the LLM is still streaming (side-effect-free tools only)",
+            group="execution",
+            order=2,
+        )}
+    )
 
 
 class VariableAssignment(BaseModel):
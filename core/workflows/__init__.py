@@ -87,6 +87,8 @@ from .enum import (
     PassThroughExtractionStrategy,
     # LLM evaluation
     LLMEvaluationMode,
+    # Edge routing
+    EdgeRoutingMode,
 )
 
 # =============================================================================
@@ -156,6 +158,9 @@ from .runtimes import (
     BaseWorkflowRegistry,
     LocalWorkflowRegistry,
     LocalWorkflowStorage,
+    EdgeRouter,
+    JointLLMRouter,
+    LLMVerdictCache,
 )
 
 # =============================================================================
@@ -188,6 +193,7 @@ __all__ = [
     "ConditionJoinOperator",
     "PassThroughExtractionStrategy",
     "LLMEvaluationMode",
+    "EdgeRoutingMode",
     # IO Types
     "IOTypeSpec",
     "InputSpec",
@@ -238,6 +244,9 @@ __all__ = [
     "BaseWorkflowRegistry",
     "LocalWorkflowRegistry",
     "LocalWorkflowStorage",
+    "EdgeRouter",
+    "JointLLMRouter",
+    "LLMVerdictCache",
     # Builders
     "NodeBuilder",
     "EdgeBuilder",
@@ -193,3 +193,10 @@ EXTRACT_STRATEGY_ASK_USER = "ask_user"  # Ask user for the value
 LLM_EVAL_MODE_BINARY = "binary"  # Yes/No evaluation
 LLM_EVAL_MODE_SCORE = "score"  # Score-based evaluation (0.0-1.0)
 LLM_EVAL_MODE_CLASSIFICATION = "classification"  # Classify into categories
+
+# =============================================================================
+# EDGE ROUTING MODES
+# =============================================================================
+
+ROUTING_MODE_SEQUENTIAL = "sequential"  # Evaluate edges one at a time in priority order
+ROUTING_MODE_PARALLEL = "parallel"  # Fan out LLM edges concurrently, cancel losers
@@ -20,6 +20,7 @@ from .constants import (
     FILE_EXT_JSON,
     EXTRACT_STRATEGY_CONTEXT,
     LLM_EVAL_MODE_BINARY,
+    ROUTING_MODE_SEQUENTIAL,
 )
 
 # =============================================================================
@@ -118,6 +119,15 @@ DEFAULT_EDGE_CONDITION_TYPE = EDGE_CONDITION_TYPE_EXPRESSION
 DEFAULT_LLM_EVAL_MODE = LLM_EVAL_MODE_BINARY
 DEFAULT_LLM_SCORE_THRESHOLD = 0.7  # For score-based evaluation
 
+# =============================================================================
+# EDGE ROUTING DEFAULTS
+# =============================================================================
+
+DEFAULT_ROUTING_MODE = ROUTING_MODE_SEQUENTIAL
+DEFAULT_LLM_VERDICT_CACHE_TTL_S = 300.0  # Seconds a memoized LLM verdict stays valid
+DEFAULT_LLM_VERDICT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_JOINT_ROUTING_MIN_CONDITIONS = 2
+
 # =============================================================================
 # PASS-THROUGH FIELD DEFAULTS
 # =============================================================================
@@ -103,6 +103,9 @@ from .constants import (
     LLM_EVAL_MODE_BINARY,
     LLM_EVAL_MODE_SCORE,
     LLM_EVAL_MODE_CLASSIFICATION,
+    # Edge routing modes
+    ROUTING_MODE_SEQUENTIAL,
+    ROUTING_MODE_PARALLEL,
 )
 
 
@@ -316,3 +319,15 @@ class LLMEvaluationMode(str, Enum):
     BINARY = LLM_EVAL_MODE_BINARY
     SCORE = LLM_EVAL_MODE_SCORE
     CLASSIFICATION = LLM_EVAL_MODE_CLASSIFICATION
+
+
+class EdgeRoutingMode(str, Enum):
+    """
+    How a node's outgoing edges are evaluated when routing.
+    
+    SEQUENTIAL: Evaluate edges one at a time in priority order
+    PARALLEL: Evaluate all LLM-backed edges concurrently and cancel the
+              remaining evaluations once the highest-priority match is known
+    """
+    SEQUENTIAL = ROUTING_MODE_SEQUENTIAL
+    PARALLEL = ROUTING_MODE_PARALLEL
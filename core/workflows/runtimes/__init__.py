@@ -6,9 +6,13 @@ This module contains runtime implementations for workflows.
 
 from .base_registry import BaseWorkflowRegistry
 from .local import LocalWorkflowRegistry, LocalWorkflowStorage
+from .routing import EdgeRouter, JointLLMRouter, LLMVerdictCache
 
 __all__ = [
     "BaseWorkflowRegistry",
     "LocalWorkflowRegistry",
     "LocalWorkflowStorage",
+    "EdgeRouter",
+    "JointLLMRouter",
+    "LLMVerdictCache",
 ]
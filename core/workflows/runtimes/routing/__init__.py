@@ -0,0 +1,16 @@
+"""
+Workflow Routing
+
+Edge selection for workflow runtimes, with optional parallel evaluation of
+LLM-backed edge conditions and memoization of their verdicts.
+"""
+
+from .edge_router import EdgeRouter
+from .joint_router import JointLLMRouter
+from .verdict_cache import LLMVerdictCache
+
+__all__ = [
+    "EdgeRouter",
+    "JointLLMRouter",
+    "LLMVerdictCache",
+]
@@ -0,0 +1,209 @@
+"""
+Edge Router
+
+Selects the outgoing edge(s) of a node to traverse, evaluating LLM-backed
+edge conditions either one at a time or all at once.
+
+Routing modes:
+- SEQUENTIAL: Edges are evaluated in priority order until one matches
+- PARALLEL: Every LLM-backed edge is started concurrently; routing resolves
+  as soon as the highest-priority matching edge is known and the remaining
+  evaluations are cancelled
+
+Both modes pick the same edge; PARALLEL bounds routing latency by the
+slowest single LLM call instead of their sum.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Union
+
+from ...defaults import DEFAULT_ROUTING_MODE
+from ...enum import EdgeRoutingMode
+from ...spec.edge_models import EdgeSpec
+from ...spec.workflow_models import WorkflowSpec
+from .verdict_cache import LLMVerdictCache
+
+
+class EdgeRouter:
+    """
+    Routes workflow execution across a node's outgoing edges.
+    
+    Edges are considered in priority order (lowest first, as returned by
+    WorkflowSpec.get_outgoing_edges). Edges without LLM conditions are
+    evaluated synchronously through their compiled conditions.
+    
+    Example:
+        router = EdgeRouter(
+            mode=EdgeRoutingMode.PARALLEL,
+            verdict_cache=LLMVerdictCache(ttl_s=300),
+        )
+        next_node_id = await router.route(workflow, "greeting", context, llm)
+    """
+    
+    def __init__(
+        self,
+        mode: Union[EdgeRoutingMode, str] = DEFAULT_ROUTING_MODE,
+        verdict_cache: Optional[LLMVerdictCache] = None,
+    ):
+        """
+        Initialize the router.
+        
+        Args:
+            mode: Routing mode (sequential or parallel)
+            verdict_cache: Optional cache memoizing LLM condition verdicts
+        """
+        self.mode = EdgeRoutingMode(mode)
+        self.verdict_cache = verdict_cache
+    
+    async def route(
+        self,
+        workflow: WorkflowSpec,
+        node_id: str,
+        context: Dict[str, Any],
+        llm: Optional[Any] = None,
+    ) -> Optional[str]:
+        """
+        Get the next node ID for a node.
+        
+        Args:
+            workflow: Workflow containing the node
+            node_id: Current node ID
+            context: Workflow context for condition evaluation
+            llm: LLM instance for LLM condition evaluation
+            
+        Returns:
+            Target node ID of the selected edge, or None if no edge matches
+        """
+        edge = await self.select_edge(workflow.get_outgoing_edges(node_id), context, llm)
+        return edge.target_node_id if edge else None
+    
+    async def select_edge(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any] = None,
+    ) -> Optional[EdgeSpec]:
+        """
+        Select the first edge (in the given order) that should be traversed.
+        
+        Args:
+            edges: Candidate edges, highest priority first
+            context: Workflow context for condition evaluation
+            llm: LLM instance for LLM condition evaluation
+            
+        Returns:
+            The selected edge, or None if no edge matches
+        """
+        return await self._select_edge(edges, context, llm, self.verdict_cache)
+    
+    async def select_edges(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any] = None,
+    ) -> List[EdgeSpec]:
+        """
+        Select every edge that should be traversed (for fan-out nodes).
+        
+        Args:
+            edges: Candidate edges, highest priority first
+            context: Workflow context for condition evaluation
+            llm: LLM instance for LLM condition evaluation
+            
+        Returns:
+            Matching edges in the given order
+        """
+        return await self._select_edges(edges, context, llm, self.verdict_cache)
+    
+    # =========================================================================
+    # Internals
+    # =========================================================================
+    
+    async def _select_edge(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any],
+        verdict_cache: Optional[LLMVerdictCache],
+    ) -> Optional[EdgeSpec]:
+        """Select the first matching edge using the given verdict cache."""
+        if self.mode == EdgeRoutingMode.PARALLEL:
+            return await self._select_parallel(edges, context, llm, verdict_cache)
+        
+        for edge in edges:
+            if await self._evaluate(edge, context, llm, verdict_cache):
+                return edge
+        return None
+    
+    async def _select_edges(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any],
+        verdict_cache: Optional[LLMVerdictCache],
+    ) -> List[EdgeSpec]:
+        """Select every matching edge using the given verdict cache."""
+        if self.mode == EdgeRoutingMode.PARALLEL:
+            results = await asyncio.gather(
+                *(self._evaluate(edge, context, llm, verdict_cache) for edge in edges)
+            )
+        else:
+            results = [await self._evaluate(edge, context, llm, verdict_cache) for edge in edges]
+        return [edge for edge, matched in zip(edges, results) if matched]
+    
+    async def _evaluate(
+        self,
+        edge: EdgeSpec,
+        context: Dict[str, Any],
+        llm: Optional[Any],
+        verdict_cache: Optional[LLMVerdictCache],
+    ) -> bool:
+        """Evaluate one edge, using the compiled path when no LLM is involved."""
+        if edge.has_llm_conditions():
+            return await edge.should_traverse_async(context, llm, verdict_cache)
+        return edge.should_traverse(context)
+    
+    async def _select_parallel(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any],
+        verdict_cache: Optional[LLMVerdictCache],
+    ) -> Optional[EdgeSpec]:
+        """
+        Start all LLM edges at once and resolve them in priority order.
+        
+        LLM edges ranked below the first matching non-LLM edge are never
+        started. Once an edge resolves true, every lower-priority evaluation
+        still running is cancelled.
+        """
+        pending: Dict[int, asyncio.Task] = {}
+        try:
+            for index, edge in enumerate(edges):
+                if edge.has_llm_conditions():
+                    pending[index] = asyncio.ensure_future(
+                        edge.should_traverse_async(context, llm, verdict_cache)
+                    )
+                elif edge.should_traverse(context):
+                    # Nothing ranked below a matching edge can win
+                    winner = index
+                    break
+            else:
+                winner = None
+            
+            # Resolve higher-priority LLM edges before settling on the winner
+            for index in sorted(pending):
+                if winner is not None and index > winner:
+                    break
+                if await pending.pop(index):
+                    return edges[index]
+            return edges[winner] if winner is not None else None
+        finally:
+            for task in pending.values():
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
@@ -0,0 +1,265 @@
+"""
+Joint LLM Router
+
+Evaluates the LLM conditions of sibling edges in a single structured-output
+request instead of one request per condition.
+
+The condition prompts of every batchable condition (BINARY or CLASSIFICATION
+mode, default system prompt, no few-shot examples) that share an LLM are
+merged into one prompt. The model answers with a JSON object holding one
+verdict per condition, validated through the LLM's structured output handler
+and OutputConfig. Verdicts are written to a verdict cache, so the regular
+edge evaluation then resolves those conditions without further LLM calls.
+
+Conditions the joint response does not cover (parse failure, missing or
+invalid field, failed request) simply miss the cache and fall back to
+per-edge evaluation.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from utils.logging.LoggerAdaptor import LoggerAdaptor
+
+from ...defaults import DEFAULT_ROUTING_MODE, DEFAULT_JOINT_ROUTING_MIN_CONDITIONS
+from ...enum import EdgeRoutingMode, LLMEvaluationMode
+from ...spec.edge_models import EdgeCondition, EdgeSpec
+from .edge_router import EdgeRouter
+from .verdict_cache import LLMVerdictCache
+
+
+JOINT_ROUTER_SYSTEM_PROMPT = (
+    "You are a condition evaluator. Analyze the given context and evaluate each "
+    "of the listed conditions independently. Respond with a JSON object that has "
+    "one field per condition id: true or false for yes/no conditions, or the "
+    "category name for classification conditions."
+)
+
+_BATCHABLE_MODES = (LLMEvaluationMode.BINARY, LLMEvaluationMode.CLASSIFICATION)
+
+# (field id, condition, cache key)
+_Entry = Tuple[str, EdgeCondition, str]
+
+
+class JointLLMRouter(EdgeRouter):
+    """
+    EdgeRouter that batches sibling LLM conditions into one LLM call.
+    
+    Selection semantics are identical to EdgeRouter; only the number of LLM
+    round trips changes. When a shared verdict_cache is configured the joint
+    verdicts are memoized there as well.
+    
+    Example:
+        router = JointLLMRouter(verdict_cache=LLMVerdictCache())
+        next_node_id = await router.route(workflow, "triage", context, llm)
+    """
+    
+    def __init__(
+        self,
+        mode: Union[EdgeRoutingMode, str] = DEFAULT_ROUTING_MODE,
+        verdict_cache: Optional[LLMVerdictCache] = None,
+        min_conditions: int = DEFAULT_JOINT_ROUTING_MIN_CONDITIONS,
+    ):
+        """
+        Initialize the router.
+        
+        Args:
+            mode: Routing mode used for the remaining per-edge evaluation
+            verdict_cache: Optional cache memoizing LLM condition verdicts
+            min_conditions: Minimum batchable conditions per LLM to make a joint call
+        """
+        super().__init__(mode=mode, verdict_cache=verdict_cache)
+        self.min_conditions = min_conditions
+        self.logger = LoggerAdaptor.get_logger("workflows.routing.joint")
+    
+    async def select_edge(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any] = None,
+    ) -> Optional[EdgeSpec]:
+        """Select the first matching edge, batching LLM conditions first."""
+        verdict_cache = await self.prefetch_verdicts(edges, context, llm, first_match=True)
+        return await self._select_edge(edges, context, llm, verdict_cache)
+    
+    async def select_edges(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any] = None,
+    ) -> List[EdgeSpec]:
+        """Select every matching edge, batching LLM conditions first."""
+        verdict_cache = await self.prefetch_verdicts(edges, context, llm)
+        return await self._select_edges(edges, context, llm, verdict_cache)
+    
+    async def prefetch_verdicts(
+        self,
+        edges: List[EdgeSpec],
+        context: Dict[str, Any],
+        llm: Optional[Any] = None,
+        first_match: bool = False,
+    ) -> LLMVerdictCache:
+        """
+        Resolve the batchable LLM conditions of the edges with joint calls.
+        
+        Args:
+            edges: Candidate edges, highest priority first
+            context: Workflow context for condition evaluation
+            llm: LLM instance for LLM condition evaluation
+            first_match: Skip edges ranked below the first matching non-LLM edge
+            
+        Returns:
+            Verdict cache holding the joint verdicts (the shared cache if configured)
+        """
+        verdict_cache = self.verdict_cache or LLMVerdictCache()
+        
+        # Group uncached batchable conditions by the LLM that would evaluate them
+        batches: Dict[int, Tuple[Any, List[_Entry]]] = {}
+        seen = set()
+        for edge in edges:
+            if not edge.has_llm_conditions():
+                if first_match and edge.should_traverse(context):
+                    break
+                continue
+            edge_llm = llm
+            if not edge_llm and edge.pass_through and edge.pass_through.llm_instance:
+                edge_llm = edge.pass_through.llm_instance
+            for condition in edge.get_llm_conditions():
+                if not self._is_batchable(condition):
+                    continue
+                effective_llm = edge_llm or condition.llm_config.llm_instance
+                if not effective_llm:
+                    continue
+                key = verdict_cache.make_key(
+                    condition.llm_config, condition.get_llm_eval_context(context)
+                )
+                if key in seen or key in verdict_cache:
+                    continue
+                seen.add(key)
+                _, entries = batches.setdefault(id(effective_llm), (effective_llm, []))
+                entries.append((f"c{len(entries)}", condition, key))
+        
+        for batch_llm, entries in batches.values():
+            if len(entries) < self.min_conditions:
+                continue
+            verdicts = await self._evaluate_jointly(batch_llm, entries, context)
+            for key, verdict in verdicts.items():
+                verdict_cache.set(key, verdict)
+        
+        return verdict_cache
+    
+    # =========================================================================
+    # Internals
+    # =========================================================================
+    
+    @staticmethod
+    def _is_batchable(condition: EdgeCondition) -> bool:
+        """Whether a condition can be answered as part of a joint prompt."""
+        config = condition.llm_config
+        return (
+            config is not None
+            and config.evaluation_mode in _BATCHABLE_MODES
+            and not config.system_prompt
+            and not config.few_shot_examples
+        )
+    
+    async def _evaluate_jointly(
+        self,
+        llm: Any,
+        entries: List[_Entry],
+        context: Dict[str, Any],
+    ) -> Dict[str, bool]:
+        """Make one joint call; returns raw verdicts by cache key (may be partial)."""
+        from core.llms import LLMContext, OutputConfig, StructuredHandlerFactory
+        
+        output_config = OutputConfig(response_format=self._build_response_format(entries))
+        messages = self._build_messages(entries, context)
+        
+        try:
+            response = await llm.get_answer(messages, LLMContext(), output_config=output_config)
+        except Exception as e:
+            self.logger.warning("Joint routing call failed, falling back per edge", error=str(e))
+            return {}
+        
+        metadata = getattr(response, "metadata", None) or {}
+        answers = metadata.get("structured_output")
+        if answers is None:
+            handler = getattr(llm, "structured_handler", None) or StructuredHandlerFactory.get_handler("basic")
+            parse_result = handler.validate_output(response.content or "", output_config)
+            answers = parse_result.parsed_output if parse_result.success else None
+        if not isinstance(answers, dict):
+            self.logger.warning("Joint routing response could not be parsed, falling back per edge")
+            return {}
+        
+        verdicts = {}
+        for field_id, condition, key in entries:
+            verdict = self._parse_verdict(condition, answers.get(field_id))
+            if verdict is not None:
+                verdicts[key] = verdict
+        return verdicts
+    
+    @staticmethod
+    def _build_messages(entries: List[_Entry], context: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Merge the condition prompts into a single request."""
+        eval_context: Dict[str, Any] = {}
+        lines = []
+        for field_id, condition, _ in entries:
+            eval_context.update(condition.get_llm_eval_context(context))
+            config = condition.llm_config
+            if config.evaluation_mode == LLMEvaluationMode.BINARY:
+                lines.append(f"- {field_id} (yes/no): {config.condition_prompt}")
+            else:
+                options = ", ".join(config.classification_options) or "the appropriate category"
+                lines.append(f"- {field_id} (one of: {options}): {config.condition_prompt}")
+        
+        conditions_text = "\n".join(lines)
+        return [
+            {"role": "system", "content": JOINT_ROUTER_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": f"Context:\n{eval_context}\n\nConditions to evaluate:\n{conditions_text}",
+            },
+        ]
+    
+    @staticmethod
+    def _build_response_format(entries: List[_Entry]) -> Dict[str, Any]:
+        """JSON schema with one verdict field per condition."""
+        properties: Dict[str, Any] = {}
+        for field_id, condition, _ in entries:
+            config = condition.llm_config
+            if config.evaluation_mode == LLMEvaluationMode.BINARY:
+                properties[field_id] = {"type": "boolean"}
+            elif config.classification_options:
+                properties[field_id] = {"type": "string", "enum": list(config.classification_options)}
+            else:
+                properties[field_id] = {"type": "string"}
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "edge_condition_verdicts",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": list(properties),
+                    "additionalProperties": False,
+                },
+            },
+        }
+    
+    @staticmethod
+    def _parse_verdict(condition: EdgeCondition, answer: Any) -> Optional[bool]:
+        """Convert one answer field into a raw verdict, or None if invalid."""
+        config = condition.llm_config
+        if config.evaluation_mode == LLMEvaluationMode.BINARY:
+            if isinstance(answer, bool):
+                return answer
+            if isinstance(answer, str) and answer.strip().upper() in ("YES", "TRUE", "1", "NO", "FALSE", "0"):
+                return answer.strip().upper() in ("YES", "TRUE", "1")
+            return None
+        if not isinstance(answer, str):
+            return None
+        return answer.strip().lower() == (config.expected_classification or "").lower()
@@ -0,0 +1,132 @@
+"""
+LLM Verdict Cache
+
+Memoizes LLM edge-condition verdicts so identical conditions evaluated
+against identical context are not sent to the model again.
+
+Entries are keyed by the condition configuration (prompt, mode, threshold,
+expected classification, system prompt, few-shot examples) plus a hash of the
+context keys the condition includes, and expire after a TTL.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ...defaults import (
+    DEFAULT_LLM_VERDICT_CACHE_TTL_S,
+    DEFAULT_LLM_VERDICT_CACHE_MAX_ENTRIES,
+)
+
+
+class LLMVerdictCache:
+    """
+    Bounded TTL cache of LLM condition verdicts.
+    
+    Intended to be shared across routing turns and sessions; it is safe for
+    concurrent use from a single event loop.
+    
+    Example:
+        cache = LLMVerdictCache(ttl_s=120)
+        router = EdgeRouter(mode=EdgeRoutingMode.PARALLEL, verdict_cache=cache)
+    """
+    
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_LLM_VERDICT_CACHE_TTL_S,
+        max_entries: int = DEFAULT_LLM_VERDICT_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl_s: Seconds a verdict stays valid
+            max_entries: Maximum cached verdicts (least recently used evicted first)
+        """
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, bool]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def make_key(llm_config: Any, eval_context: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a condition and its evaluation context.
+        
+        Args:
+            llm_config: LLMConditionConfig of the condition
+            eval_context: Context subset selected by include_context_keys
+            
+        Returns:
+            Hex digest identifying (condition, context)
+        """
+        condition_part = json.dumps(
+            [
+                llm_config.condition_prompt,
+                llm_config.evaluation_mode.value,
+                llm_config.score_threshold,
+                llm_config.expected_classification,
+                llm_config.classification_options,
+                llm_config.get_system_prompt(),
+                llm_config.few_shot_examples,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        context_hash = hashlib.sha256(
+            json.dumps(eval_context, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return hashlib.sha256(f"{condition_part}|{context_hash}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[bool]:
+        """Get a cached verdict, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        expires_at, verdict = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return verdict
+    
+    def __contains__(self, key: str) -> bool:
+        """Whether a live verdict is cached (not counted as a hit or miss)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return False
+        return True
+    
+    def set(self, key: str, verdict: bool) -> None:
+        """Store a verdict."""
+        self._entries[key] = (time.monotonic() + self.ttl_s, verdict)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached verdicts."""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,224 @@
+"""
+Edge Condition Compiler
+
+Compiles EdgeCondition / EdgeConditionGroup models into a tree of closures
+so per-turn routing does not re-interpret the condition spec:
+- Dotted field paths are split once
+- Operators are bound to a comparison function up front
+- MATCHES patterns are compiled once
+
+The compiled callables have exactly the semantics of
+EdgeCondition.evaluate / EdgeConditionGroup.evaluate (including pending LLM
+condition bookkeeping and error wrapping).
+
+Compiled trees are cached by EdgeSpec and invalidated through a global
+epoch that condition models bump whenever one of their fields is assigned.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from ..enum import ConditionJoinOperator, ConditionOperator, EdgeConditionType
+from ..constants import ERROR_INVALID_CONDITION
+
+if TYPE_CHECKING:
+    from .edge_models import EdgeCondition, EdgeConditionGroup
+
+
+CompiledCondition = Callable[[Dict[str, Any]], bool]
+_Accessor = Callable[[Any], Any]
+
+
+# =============================================================================
+# OPERATORS
+# =============================================================================
+
+
+_OPERATORS: Dict[ConditionOperator, Callable[[Any, Any], bool]] = {
+    ConditionOperator.EQUALS: lambda fv, v: fv == v,
+    ConditionOperator.NOT_EQUALS: lambda fv, v: fv != v,
+    ConditionOperator.GREATER_THAN: lambda fv, v: fv is not None and fv > v,
+    ConditionOperator.LESS_THAN: lambda fv, v: fv is not None and fv < v,
+    ConditionOperator.GREATER_THAN_OR_EQUALS: lambda fv, v: fv is not None and fv >= v,
+    ConditionOperator.LESS_THAN_OR_EQUALS: lambda fv, v: fv is not None and fv <= v,
+    ConditionOperator.CONTAINS: lambda fv, v: v in fv if fv else False,
+    ConditionOperator.NOT_CONTAINS: lambda fv, v: v not in fv if fv else True,
+    ConditionOperator.STARTS_WITH: lambda fv, v: str(fv).startswith(str(v)) if fv else False,
+    ConditionOperator.ENDS_WITH: lambda fv, v: str(fv).endswith(str(v)) if fv else False,
+    ConditionOperator.IN: lambda fv, v: fv in v if v else False,
+    ConditionOperator.NOT_IN: lambda fv, v: fv not in v if v else True,
+    ConditionOperator.IS_NULL: lambda fv, v: fv is None,
+    ConditionOperator.IS_NOT_NULL: lambda fv, v: fv is not None,
+    ConditionOperator.IS_EMPTY: lambda fv, v: not fv if fv is not None else True,
+    ConditionOperator.IS_NOT_EMPTY: lambda fv, v: bool(fv),
+}
+
+
+def _bind_operator(condition: EdgeCondition) -> Callable[[Any], bool]:
+    """Bind the condition's operator and value into a one-argument predicate."""
+    op = condition.operator
+    value = condition.value
+
+    if op == ConditionOperator.MATCHES:
+        try:
+            pattern = re.compile(str(value))
+        except re.error:
+            # Keep lazy failure semantics: only raise when a value is tested
+            raw = str(value)
+            return lambda fv: bool(re.match(raw, str(fv))) if fv else False
+        match = pattern.match
+        return lambda fv: bool(match(str(fv))) if fv else False
+
+    if op == ConditionOperator.CUSTOM:
+        custom_func = condition.custom_func
+        if custom_func:
+            return lambda fv: custom_func(fv, {})
+        return lambda fv: False
+
+    func = _OPERATORS.get(op)
+    if func is None:
+        def unknown(_fv: Any) -> bool:
+            raise ValueError(f"Unknown operator: {op}")
+        return unknown
+    return lambda fv: func(fv, value)
+
+
+def _compile_path(path: str) -> _Accessor:
+    """Compile a dot-notation path into an accessor with pre-split keys."""
+    keys: Tuple[str, ...] = tuple(path.split("."))
+
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda obj: obj.get(key) if isinstance(obj, dict) else None
+
+    def get(obj: Any) -> Any:
+        value = obj
+        for key in keys:
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                return None
+        return value
+
+    return get
+
+
+# =============================================================================
+# CONDITIONS
+# =============================================================================
+
+
+def compile_condition(condition: EdgeCondition) -> CompiledCondition:
+    """
+    Compile a single EdgeCondition into a closure.
+
+    Args:
+        condition: Condition to compile
+
+    Returns:
+        Callable (context) -> bool equivalent to condition.evaluate(context)
+    """
+    condition_type = condition.condition_type
+    negate = condition.negate
+
+    if condition_type == EdgeConditionType.LLM:
+        # LLM conditions are deferred to the async path
+        def pending(context: Dict[str, Any]) -> bool:
+            context.setdefault("_pending_llm_conditions", []).append(condition)
+            return False
+        return pending
+
+    description = (
+        f"{condition_type.value}: {condition.field} "
+        f"{getattr(condition.operator, 'value', '')} {condition.value}"
+    )
+    evaluate = _compile_evaluator(condition)
+
+    def compiled(context: Dict[str, Any]) -> bool:
+        try:
+            result = evaluate(context)
+            return not result if negate else result
+        except Exception as e:
+            raise ValueError(ERROR_INVALID_CONDITION.format(condition=f"{description}: {e}")) from e
+
+    return compiled
+
+
+def _compile_evaluator(condition: EdgeCondition) -> CompiledCondition:
+    """Compile the un-negated, unwrapped evaluation of a condition."""
+    condition_type = condition.condition_type
+
+    if condition_type == EdgeConditionType.FUNCTION:
+        custom_func = condition.custom_func
+        if not custom_func:
+            return _raiser("Custom function is required for FUNCTION conditions")
+        if condition.field:
+            get = _compile_path(condition.field)
+            return lambda context: custom_func(get(context), context)
+        return lambda context: custom_func(None, context)
+
+    if condition_type in (EdgeConditionType.EXPRESSION, EdgeConditionType.DYNAMIC):
+        if not condition.field:
+            return _raiser("Field is required for EXPRESSION/DYNAMIC conditions")
+        get = _compile_path(condition.field)
+        predicate = _bind_operator(condition)
+        return lambda context: predicate(get(context))
+
+    return _raiser(f"Unknown condition type: {condition_type}")
+
+
+def _raiser(message: str) -> CompiledCondition:
+    def fail(_context: Dict[str, Any]) -> bool:
+        raise ValueError(message)
+    return fail
+
+
+# =============================================================================
+# GROUPS
+# =============================================================================
+
+
+def compile_condition_group(group: EdgeConditionGroup) -> CompiledCondition:
+    """
+    Compile an EdgeConditionGroup (and its nested groups) into a closure tree.
+
+    Every member is evaluated, as in EdgeConditionGroup.evaluate, so pending
+    LLM conditions are still recorded and errors still surface.
+
+    Args:
+        group: Condition group to compile
+
+    Returns:
+        Callable (context) -> bool equivalent to group.evaluate(context)
+    """
+    members: List[CompiledCondition] = [compile_condition(c) for c in group.conditions]
+    members.extend(compile_condition_group(g) for g in group.nested_groups)
+
+    if not members:
+        return lambda context: True
+
+    join = all if group.join_operator == ConditionJoinOperator.AND else any
+    return lambda context: join([member(context) for member in members])
+
+
+# =============================================================================
+# INVALIDATION
+# =============================================================================
+
+
+_epoch = 0
+
+
+def mark_conditions_dirty() -> None:
+    """Invalidate every compiled condition tree (called on spec mutation)."""
+    global _epoch
+    _epoch += 1
+
+
+def conditions_epoch() -> int:
+    """Current compile epoch; compiled trees from older epochs are stale."""
+    return _epoch
@@ -50,6 +50,13 @@ from ..constants import (
     ERROR_INVALID_CONDITION,
     ERROR_LLM_CONDITION_EVALUATION_FAILED,
 )
+from .condition_compiler import (
+    CompiledCondition,
+    compile_condition,
+    compile_condition_group,
+    conditions_epoch,
+    mark_conditions_dirty,
+)
 
 
 # =============================================================================
@@ -354,6 +361,19 @@ class EdgeCondition(BaseModel):
     
     model_config = {ARBITRARY_TYPES_ALLOWED: True}
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        mark_conditions_dirty()
+    
+    def compile(self) -> CompiledCondition:
+        """
+        Compile this condition into a closure equivalent to evaluate().
+        
+        Returns:
+            Callable (context) -> bool
+        """
+        return compile_condition(self)
+    
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """
         Evaluate this condition against the given context.
@@ -396,7 +416,8 @@ class EdgeCondition(BaseModel):
     async def evaluate_async(
         self,
         context: Dict[str, Any],
-        llm: Optional[Any] = None
+        llm: Optional[Any] = None,
+        verdict_cache: Optional[Any] = None
     ) -> bool:
         """
         Asynchronously evaluate this condition (required for LLM conditions).
@@ -404,13 +425,14 @@ class EdgeCondition(BaseModel):
         Args:
             context: Dictionary containing workflow variables and node outputs
             llm: LLM instance for LLM condition evaluation
+            verdict_cache: Optional LLMVerdictCache to memoize LLM verdicts
             
         Returns:
             bool: Whether the condition is met
         """
         try:
             if self.condition_type == EdgeConditionType.LLM:
-                result = await self._evaluate_llm(context, llm)
+                result = await self._evaluate_llm(context, llm, verdict_cache)
             elif self.condition_type == EdgeConditionType.FUNCTION:
                 result = self._evaluate_function(context)
             else:
@@ -442,12 +464,21 @@ class EdgeCondition(BaseModel):
         
         return self.custom_func(field_value, context)
     
+    def get_llm_eval_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the subset of context sent to the LLM (include_context_keys)."""
+        return {
+            key: context[key]
+            for key in self.llm_config.include_context_keys
+            if key in context
+        }
+    
     async def _evaluate_llm(
         self,
         context: Dict[str, Any],
-        llm: Optional[Any] = None
+        llm: Optional[Any] = None,
+        verdict_cache: Optional[Any] = None
     ) -> bool:
-        """Evaluate LLM-based condition."""
+        """Evaluate LLM-based condition (memoized if a verdict cache is given)."""
         if not self.llm_config:
             raise ValueError("LLM config is required for LLM conditions")
         
@@ -460,10 +491,14 @@ class EdgeCondition(BaseModel):
             )
         
         # Build context for evaluation
-        eval_context = {}
-        for key in self.llm_config.include_context_keys:
-            if key in context:
-                eval_context[key] = context[key]
+        eval_context = self.get_llm_eval_context(context)
+        
+        cache_key = None
+        if verdict_cache is not None:
+            cache_key = verdict_cache.make_key(self.llm_config, eval_context)
+            cached = verdict_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
         # Build messages for LLM
         messages = [
@@ -487,15 +522,19 @@ class EdgeCondition(BaseModel):
         
         # Parse result based on evaluation mode
         if self.llm_config.evaluation_mode == LLMEvaluationMode.BINARY:
-            return result_text in ("YES", "TRUE", "1")
+            verdict = result_text in ("YES", "TRUE", "1")
         elif self.llm_config.evaluation_mode == LLMEvaluationMode.SCORE:
             try:
                 score = float(result_text)
-                return score >= self.llm_config.score_threshold
+                verdict = score >= self.llm_config.score_threshold
             except ValueError:
-                return False
+                verdict = False
         else:  # CLASSIFICATION
-            return result_text.lower() == (self.llm_config.expected_classification or "").lower()
+            verdict = result_text.lower() == (self.llm_config.expected_classification or "").lower()
+        
+        if cache_key is not None:
+            verdict_cache.set(cache_key, verdict)
+        return verdict
     
     def _get_nested_value(self, obj: Dict[str, Any], path: str) -> Any:
         """Get nested value using dot notation."""
@@ -597,6 +636,22 @@ class EdgeConditionGroup(BaseModel):
         description="Nested condition groups"
     )
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        mark_conditions_dirty()
+    
+    def compile(self) -> CompiledCondition:
+        """
+        Compile this group into a closure tree equivalent to evaluate().
+        
+        Field paths are pre-split, operators pre-bound and regexes
+        pre-compiled, so repeated routing only binds the context.
+        
+        Returns:
+            Callable (context) -> bool
+        """
+        return compile_condition_group(self)
+    
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """
         Evaluate all conditions in this group (synchronous).
@@ -631,7 +686,8 @@ class EdgeConditionGroup(BaseModel):
     async def evaluate_async(
         self,
         context: Dict[str, Any],
-        llm: Optional[Any] = None
+        llm: Optional[Any] = None,
+        verdict_cache: Optional[Any] = None
     ) -> bool:
         """
         Asynchronously evaluate all conditions (supports LLM conditions).
@@ -639,6 +695,7 @@ class EdgeConditionGroup(BaseModel):
         Args:
             context: Dictionary containing workflow variables
             llm: LLM instance for LLM condition evaluation
+            verdict_cache: Optional LLMVerdictCache to memoize LLM verdicts
             
         Returns:
             bool: Whether the condition group is satisfied
@@ -647,12 +704,12 @@ class EdgeConditionGroup(BaseModel):
         
         # Evaluate individual conditions
         for condition in self.conditions:
-            result = await condition.evaluate_async(context, llm)
+            result = await condition.evaluate_async(context, llm, verdict_cache)
             results.append(result)
         
         # Evaluate nested groups
         for group in self.nested_groups:
-            result = await group.evaluate_async(context, llm)
+            result = await group.evaluate_async(context, llm, verdict_cache)
             results.append(result)
         
         if not results:
@@ -673,6 +730,15 @@ class EdgeConditionGroup(BaseModel):
                 return True
         return False
     
+    def get_llm_conditions(self) -> List[EdgeCondition]:
+        """Get all LLM conditions in this group, including nested groups."""
+        llm_conditions = [
+            c for c in self.conditions if c.condition_type == EdgeConditionType.LLM
+        ]
+        for group in self.nested_groups:
+            llm_conditions.extend(group.get_llm_conditions())
+        return llm_conditions
+    
     def get_transfer_rules(self, target_name: str) -> List[str]:
         """
         Get all transfer rules for agent prompts.
@@ -827,10 +893,48 @@ class EdgeSpec(BaseModel):
         POPULATE_BY_NAME: True,
     }
     
+    # Compiled condition tree cache (see get_compiled_conditions)
+    _compiled_conditions: Optional[CompiledCondition] = PrivateAttr(default=None)
+    _compiled_epoch: int = PrivateAttr(default=-1)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "conditions":
+            mark_conditions_dirty()
+    
+    def get_compiled_conditions(self) -> Optional[CompiledCondition]:
+        """
+        Get the compiled condition tree, compiling on first use.
+        
+        The cache is dropped whenever a condition model field is assigned.
+        Call invalidate_compiled_conditions() after mutating condition lists
+        in place (e.g. conditions.conditions.append(...)).
+        
+        Returns:
+            Callable (context) -> bool, or None if the edge has no conditions
+        """
+        if self.conditions is None:
+            return None
+        # Read private state directly: attribute access through pydantic's
+        # __getattr__ costs more than evaluating the compiled tree
+        private = self.__pydantic_private__
+        epoch = conditions_epoch()
+        compiled = private["_compiled_conditions"]
+        if compiled is None or private["_compiled_epoch"] != epoch:
+            compiled = self.conditions.compile()
+            private["_compiled_conditions"] = compiled
+            private["_compiled_epoch"] = epoch
+        return compiled
+    
+    def invalidate_compiled_conditions(self) -> None:
+        """Drop the cached compiled condition tree."""
+        self._compiled_conditions = None
+    
     def should_traverse(self, context: Dict[str, Any]) -> bool:
         """
         Determine if this edge should be traversed based on conditions (synchronous).
         
+        Conditions are evaluated through the cached compiled form.
         Note: For LLM conditions, use should_traverse_async.
         
         Args:
@@ -853,8 +957,9 @@ class EdgeSpec(BaseModel):
         
         # Conditional edges evaluate conditions
         if self.edge_type == EdgeType.CONDITIONAL:
-            if self.conditions:
-                return self.conditions.evaluate(context)
+            compiled = self.get_compiled_conditions()
+            if compiled:
+                return compiled(context)
             return True  # No conditions = always pass
         
         # Fallback edges traverse if primary path failed
@@ -866,7 +971,8 @@ class EdgeSpec(BaseModel):
     async def should_traverse_async(
         self,
         context: Dict[str, Any],
-        llm: Optional[Any] = None
+        llm: Optional[Any] = None,
+        verdict_cache: Optional[Any] = None
     ) -> bool:
         """
         Asynchronously determine if this edge should be traversed (supports LLM conditions).
@@ -874,6 +980,7 @@ class EdgeSpec(BaseModel):
         Args:
             context: Workflow context including variables and node outputs
             llm: LLM instance for LLM condition evaluation
+            verdict_cache: Optional LLMVerdictCache to memoize LLM verdicts
             
         Returns:
             bool: Whether to traverse this edge
@@ -896,7 +1003,7 @@ class EdgeSpec(BaseModel):
                 effective_llm = llm
                 if not effective_llm and self.pass_through and self.pass_through.llm_instance:
                     effective_llm = self.pass_through.llm_instance
-                return await self.conditions.evaluate_async(context, effective_llm)
+                return await self.conditions.evaluate_async(context, effective_llm, verdict_cache)
             return True  # No conditions = always pass
         
         # Fallback edges traverse if primary path failed
@@ -911,6 +1018,12 @@ class EdgeSpec(BaseModel):
             return self.conditions.has_llm_conditions()
         return False
     
+    def get_llm_conditions(self) -> List[EdgeCondition]:
+        """Get all LLM conditions of this edge."""
+        if self.conditions:
+            return self.conditions.get_llm_conditions()
+        return []
+    
     def requires_llm_for_evaluation(self) -> bool:
         """Check if this edge requires an LLM for condition evaluation."""
         return self.has_llm_conditions()
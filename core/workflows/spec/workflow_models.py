@@ -8,10 +8,12 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+from bisect import insort_right
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from itertools import count
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from ..enum import WorkflowStatus, ExecutionState
 from ..defaults import (
@@ -33,6 +35,56 @@ from .node_models import NodeSpec, NodeResult
 from .edge_models import EdgeSpec
 
 
+_edge_map_versions = count(1)
+
+
+class _EdgeMap(dict):
+    """
+    Edge dict that takes a new, process-unique version on every mutation,
+    so the adjacency index can tell it is stale.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = next(_edge_map_versions)
+    
+    def _touch(self) -> None:
+        self.version = next(_edge_map_versions)
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touch()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch()
+    
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._touch()
+        return self
+    
+    def pop(self, *args):
+        self._touch()
+        return super().pop(*args)
+    
+    def popitem(self):
+        self._touch()
+        return super().popitem()
+    
+    def setdefault(self, key, default=None):
+        self._touch()
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._touch()
+    
+    def clear(self):
+        super().clear()
+        self._touch()
+
+
 class WorkflowMetadata(BaseModel):
     """
     Metadata for a workflow.
@@ -133,6 +185,17 @@ class WorkflowSpec(BaseModel):
         POPULATE_BY_NAME: True,
     }
     
+    # Adjacency index (built lazily, see _get_index)
+    _outgoing: Optional[Dict[str, List[EdgeSpec]]] = PrivateAttr(default=None)
+    _incoming: Optional[Dict[str, List[EdgeSpec]]] = PrivateAttr(default=None)
+    _index_key: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    
+    @field_validator("edges", mode="after")
+    @classmethod
+    def _track_edges(cls, edges: Dict[str, EdgeSpec]) -> Dict[str, EdgeSpec]:
+        """Store edges in a map whose mutations the adjacency index can detect."""
+        return edges if isinstance(edges, _EdgeMap) else _EdgeMap(edges)
+    
     def add_node(self, node: NodeSpec) -> None:
         """Add a node to the workflow."""
         self.nodes[node.id] = node
@@ -143,12 +206,14 @@ class WorkflowSpec(BaseModel):
             raise ValueError(ERROR_NODE_NOT_FOUND.format(node_id=node_id))
         
         # Remove connected edges
-        edges_to_remove = [
-            edge_id for edge_id, edge in self.edges.items()
-            if edge.source_node_id == node_id or edge.target_node_id == node_id
-        ]
-        for edge_id in edges_to_remove:
-            del self.edges[edge_id]
+        outgoing, incoming = self._get_index()
+        edges_to_remove = {
+            edge.id: edge
+            for edge in outgoing.get(node_id, []) + incoming.get(node_id, [])
+        }
+        for edge in edges_to_remove.values():
+            del self.edges[edge.id]
+            self._unindex_edge(edge)
         
         del self.nodes[node_id]
     
@@ -160,13 +225,23 @@ class WorkflowSpec(BaseModel):
         if edge.target_node_id not in self.nodes:
             raise ValueError(ERROR_NODE_NOT_FOUND.format(node_id=edge.target_node_id))
         
+        if edge.id in self.edges:
+            # Replacing keeps the original dict position; rebuild to match it
+            self.edges[edge.id] = edge
+            self.invalidate_index()
+            return
+        
+        self._get_index()
         self.edges[edge.id] = edge
+        self._index_edge(edge)
     
     def remove_edge(self, edge_id: str) -> None:
         """Remove an edge from the workflow."""
         if edge_id not in self.edges:
             raise ValueError(ERROR_EDGE_NOT_FOUND.format(edge_id=edge_id))
-        del self.edges[edge_id]
+        self._get_index()
+        edge = self.edges.pop(edge_id)
+        self._unindex_edge(edge)
     
     def get_node(self, node_id: str) -> Optional[NodeSpec]:
         """Get a node by ID."""
@@ -177,18 +252,14 @@ class WorkflowSpec(BaseModel):
         return self.edges.get(edge_id)
     
     def get_outgoing_edges(self, node_id: str) -> List[EdgeSpec]:
-        """Get all edges originating from a node."""
-        return [
-            edge for edge in self.edges.values()
-            if edge.source_node_id == node_id
-        ]
+        """Get all edges originating from a node, ordered by priority."""
+        outgoing, _ = self._get_index()
+        return list(outgoing.get(node_id, ()))
     
     def get_incoming_edges(self, node_id: str) -> List[EdgeSpec]:
         """Get all edges leading to a node."""
-        return [
-            edge for edge in self.edges.values()
-            if edge.target_node_id == node_id
-        ]
+        _, incoming = self._get_index()
+        return list(incoming.get(node_id, ()))
     
     def get_next_nodes(self, node_id: str, context: Dict[str, Any]) -> List[str]:
         """
@@ -201,13 +272,11 @@ class WorkflowSpec(BaseModel):
         Returns:
             List of next node IDs that should be traversed
         """
-        outgoing = self.get_outgoing_edges(node_id)
-        
-        # Sort by priority
-        outgoing.sort(key=lambda e: e.config.priority)
+        # Outgoing edges are kept sorted by priority in the index
+        outgoing, _ = self._get_index()
         
         next_nodes = []
-        for edge in outgoing:
+        for edge in outgoing.get(node_id, ()):
             if edge.should_traverse(context):
                 next_nodes.append(edge.target_node_id)
         
@@ -251,6 +320,7 @@ class WorkflowSpec(BaseModel):
         if not self.start_node_id:
             return False
         
+        outgoing, _ = self._get_index()
         visited: Set[str] = set()
         rec_stack: Set[str] = set()
         
@@ -258,7 +328,7 @@ class WorkflowSpec(BaseModel):
             visited.add(node_id)
             rec_stack.add(node_id)
             
-            for edge in self.get_outgoing_edges(node_id):
+            for edge in outgoing.get(node_id, ()):
                 next_id = edge.target_node_id
                 if next_id not in visited:
                     if dfs(next_id):
@@ -276,19 +346,82 @@ class WorkflowSpec(BaseModel):
         if not self.start_node_id:
             return set(self.nodes.keys())
         
+        outgoing, _ = self._get_index()
         visited: Set[str] = set()
         
         def dfs(node_id: str) -> None:
             if node_id in visited:
                 return
             visited.add(node_id)
-            for edge in self.get_outgoing_edges(node_id):
+            for edge in outgoing.get(node_id, ()):
                 dfs(edge.target_node_id)
         
         dfs(self.start_node_id)
         
         return set(self.nodes.keys()) - visited
     
+    # =========================================================================
+    # Adjacency index
+    # =========================================================================
+    
+    def invalidate_index(self) -> None:
+        """
+        Drop the adjacency index so it is rebuilt on the next graph query.
+        
+        Changes to self.edges itself (adding, replacing or removing entries,
+        or assigning a new dict) are detected automatically; this is needed
+        only after mutating an existing edge's source, target or priority in
+        place.
+        """
+        self._outgoing = None
+        self._incoming = None
+        self._index_key = None
+    
+    def _get_index(self) -> Tuple[Dict[str, List[EdgeSpec]], Dict[str, List[EdgeSpec]]]:
+        """Return (outgoing, incoming) adjacency maps, rebuilding if stale."""
+        # Read private state directly: attribute access through pydantic's
+        # __getattr__ dominates the cost of a lookup
+        private = self.__pydantic_private__
+        edges = self.__dict__["edges"]
+        if type(edges) is not _EdgeMap:
+            # Assigned (or constructed) without validation
+            edges = self.__dict__["edges"] = _EdgeMap(edges)
+        key = (id(edges), edges.version)
+        if private["_outgoing"] is not None and private["_index_key"] == key:
+            return private["_outgoing"], private["_incoming"]
+        
+        outgoing: Dict[str, List[EdgeSpec]] = {}
+        incoming: Dict[str, List[EdgeSpec]] = {}
+        for edge in self.edges.values():
+            outgoing.setdefault(edge.source_node_id, []).append(edge)
+            incoming.setdefault(edge.target_node_id, []).append(edge)
+        for edges in outgoing.values():
+            edges.sort(key=_edge_priority)
+        private["_outgoing"] = outgoing
+        private["_incoming"] = incoming
+        private["_index_key"] = key
+        return outgoing, incoming
+    
+    def _index_edge(self, edge: EdgeSpec) -> None:
+        """Add an edge already stored in self.edges to the index."""
+        insort_right(self._outgoing.setdefault(edge.source_node_id, []), edge, key=_edge_priority)
+        self._incoming.setdefault(edge.target_node_id, []).append(edge)
+        self._index_key = (id(self.edges), self.edges.version)
+    
+    def _unindex_edge(self, edge: EdgeSpec) -> None:
+        """Remove an edge already deleted from self.edges from the index."""
+        for index, node_id in (
+            (self._outgoing, edge.source_node_id),
+            (self._incoming, edge.target_node_id),
+        ):
+            edges = index.get(node_id)
+            if edges is None:
+                continue
+            edges[:] = [e for e in edges if e is not edge]
+            if not edges:
+                del index[node_id]
+        self._index_key = (id(self.edges), self.edges.version)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -332,6 +465,11 @@ class WorkflowSpec(BaseModel):
         )
 
 
+def _edge_priority(edge: EdgeSpec) -> int:
+    """Sort key for routing order (lower priority value first)."""
+    return edge.config.priority
+
+
 class WorkflowVersion(BaseModel):
     """
     A specific version of a workflow.
@@ -4,7 +4,7 @@ Tools API Router
 CRUD endpoints for tool management with S3 storage.
 
 Endpoints:
-- GET /tools - List all tools
+- GET /tools - List tools (cursor-paginated)
 - GET /tools/{tool_id} - Get a specific tool
 - GET /tools/{tool_id}/versions - List tool versions
 - POST /tools - Create a new tool
@@ -116,6 +116,7 @@ class ToolListResponse(BaseModel):
     message: str
     tools: List[ToolMetadata] = Field(default_factory=list)
     total: int = 0
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page, if any")
 
 
 class ToolVersionResponse(BaseModel):
@@ -136,16 +137,29 @@ class SubmitReviewRequest(BaseModel):
 # Helper Functions
 # =============================================================================
 
+_storage: Optional[S3ToolStorage] = None
+_storage_settings = None
+
+
 def get_storage() -> S3ToolStorage:
-    """Get S3 storage instance."""
+    """
+    Get the S3 storage instance.
+    
+    One instance is shared per settings object, so its client and spec
+    cache are reused across requests (reload_settings() creates a new one).
+    """
+    global _storage, _storage_settings
     settings = get_settings()
-    return S3ToolStorage(
-        bucket_name=settings.s3.tools_bucket,
-        region=settings.aws.region,
-        endpoint_url=settings.aws.endpoint_url,
-        aws_access_key_id=settings.aws.access_key_id,
-        aws_secret_access_key=settings.aws.secret_access_key,
-    )
+    if _storage is None or _storage_settings is not settings:
+        _storage = S3ToolStorage(
+            bucket_name=settings.s3.tools_bucket,
+            region=settings.aws.region,
+            endpoint_url=settings.aws.endpoint_url,
+            aws_access_key_id=settings.aws.access_key_id,
+            aws_secret_access_key=settings.aws.secret_access_key,
+        )
+        _storage_settings = settings
+    return _storage
 
 
 def build_tool_spec(request: ToolCreateRequest) -> Dict[str, Any]:
@@ -212,12 +226,14 @@ def extract_metadata(spec: Dict[str, Any], tool_id: str) -> ToolMetadata:
 @router.get("", response_model=ToolListResponse)
 async def list_tools(
     prefix: Optional[str] = Query(default=None, description="Filter by ID prefix"),
-    limit: int = Query(default=100, le=1000, description="Maximum results"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum results"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from a previous page's next_cursor"),
 ):
     """
-    List all tools.
+    List tools, one page at a time.
     
-    Returns a list of tool metadata without full specs.
+    Returns a list of tool metadata without full specs; pass next_cursor
+    back as cursor to get the following page. Specs are loaded concurrently.
     Use GET /tools/{tool_id} to get full spec.
     """
     storage = get_storage()
@@ -229,19 +245,21 @@ async def list_tools(
         )
     
     try:
-        tool_ids = await storage.list_tools(prefix=prefix, limit=limit)
+        page = await storage.list_tools_page(prefix=prefix, limit=limit, cursor=cursor)
+        results = await storage.load_many(page.tool_ids)
         
-        tools_metadata = []
-        for tool_id in tool_ids:
-            result = await storage.load(tool_id)
-            if result.success and result.data:
-                tools_metadata.append(extract_metadata(result.data, tool_id))
+        tools_metadata = [
+            extract_metadata(result.data, tool_id)
+            for tool_id, result in zip(page.tool_ids, results)
+            if result.success and result.data
+        ]
         
         return ToolListResponse(
             success=True,
             message=f"Found {len(tools_metadata)} tools",
             tools=tools_metadata,
             total=len(tools_metadata),
+            next_cursor=page.next_cursor,
         )
         
     except Exception as e:
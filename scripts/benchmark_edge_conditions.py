@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-turn edge routing cost, interpreted vs. compiled conditions.
+
+Builds a node with several conditional outgoing edges (nested AND/OR groups,
+dotted paths, MATCHES patterns) and times routing through:
+- EdgeConditionGroup.evaluate (interpreted, re-splits paths every call)
+- EdgeSpec.should_traverse (cached compiled closure tree)
+
+Usage:
+    python scripts/benchmark_edge_conditions.py [--edges 8] [--turns 20000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.workflows import (
+    ConditionJoinOperator,
+    ConditionOperator,
+    EdgeCondition,
+    EdgeConditionGroup,
+    EdgeSpec,
+    EdgeType,
+)
+
+
+def build_edges(count: int):
+    edges = []
+    for i in range(count):
+        group = EdgeConditionGroup(
+            join_operator=ConditionJoinOperator.AND,
+            conditions=[
+                EdgeCondition(field="variables.session.intent", operator=ConditionOperator.EQUALS, value=f"intent_{i}"),
+                EdgeCondition(field="variables.user.tier", operator=ConditionOperator.IN, value=["gold", "silver"]),
+                EdgeCondition(field="variables.user.phone", operator=ConditionOperator.MATCHES, value=r"\+?\d{10,}"),
+            ],
+            nested_groups=[
+                EdgeConditionGroup(
+                    join_operator=ConditionJoinOperator.OR,
+                    conditions=[
+                        EdgeCondition(field="variables.turn", operator=ConditionOperator.GREATER_THAN, value=2),
+                        EdgeCondition(field="outputs.last.status", operator=ConditionOperator.IS_NOT_NULL),
+                    ],
+                )
+            ],
+        )
+        edges.append(EdgeSpec(
+            id=f"edge_{i}",
+            source_node_id="router",
+            target_node_id=f"node_{i}",
+            edge_type=EdgeType.CONDITIONAL,
+            conditions=group,
+        ))
+    return edges
+
+
+def time_routing(edges, context, turns: int, compiled: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(turns):
+        for edge in edges:
+            if compiled:
+                edge.should_traverse(context)
+            else:
+                edge.conditions.evaluate(context)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edges", type=int, default=8, help="Outgoing conditional edges per node")
+    parser.add_argument("--turns", type=int, default=20000, help="Routing turns to simulate")
+    args = parser.parse_args()
+
+    edges = build_edges(args.edges)
+    context = {
+        "variables": {
+            "session": {"intent": f"intent_{args.edges - 1}"},
+            "user": {"tier": "gold", "phone": "+15551234567"},
+            "turn": 4,
+        },
+        "outputs": {"last": {"status": "ok"}},
+    }
+
+    interpreted = time_routing(edges, context, args.turns, compiled=False)
+    compiled = time_routing(edges, context, args.turns, compiled=True)
+
+    per_turn = lambda total: total / args.turns * 1e6
+    print(f"edges per node:   {args.edges}")
+    print(f"interpreted:      {per_turn(interpreted):8.2f} us/turn")
+    print(f"compiled:         {per_turn(compiled):8.2f} us/turn")
+    print(f"speedup:          {interpreted / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
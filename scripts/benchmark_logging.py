@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of a disabled debug call in LoggerAdaptor.
+
+Mirrors the tool executors' per-call logging (debug with parameters, info
+with the stringified result) on a logger whose handlers only accept INFO,
+as in log_config_prod.json, and compares:
+- eager: the pre-gating path (format, redact, merge context, serialize)
+- gated: logger.debug(...) returning at the level check
+- gated + lazy: the same call with lazy(...) kwargs
+
+Usage:
+    python scripts/benchmark_logging.py [--calls 20000] [--no-redaction]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.logging.LoggerAdaptor import LoggerAdaptor, lazy
+
+
+def build_logger(redaction: bool) -> LoggerAdaptor:
+    config = {
+        "backend": "json",
+        "level": "DEBUG",
+        "redaction": {
+            "enabled": redaction,
+            "patterns": [
+                {"pattern": r"password=\S+", "placeholder": "password=[HIDDEN]"},
+                {"pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "placeholder": "[EMAIL]"},
+            ],
+        },
+        "handlers": {},
+    }
+    logger = LoggerAdaptor("benchmark_logging", config=config)
+    logger.logger.propagate = False
+    logger.logger.addHandler(logging.NullHandler(level=logging.INFO))
+    return logger
+
+
+def timed(calls: int, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="Calls per scenario")
+    parser.add_argument("--no-redaction", action="store_true", help="Disable redaction")
+    args = parser.parse_args()
+
+    logger = build_logger(redaction=not args.no_redaction)
+    parameters = {"city": "Paris", "email": "jane@example.com", "options": {"days": [1, 2, 3], "units": "metric"}}
+    result = {"forecast": [{"day": i, "temp": 20 + i, "summary": "sunny " * 10} for i in range(10)]}
+    context = {"tool_name": "weather", "user_id": "u-1", "session_id": "s-1"}
+
+    scenarios = [
+        ("eager (before)", lambda: logger._emit("DEBUG", "Executing tool", parameters=parameters,
+                                                result=str(result), **context)),
+        ("gated", lambda: logger.debug("Executing tool", parameters=parameters,
+                                       result=str(result), **context)),
+        ("gated + lazy", lambda: logger.debug("Executing tool", parameters=parameters,
+                                              result=lazy(lambda: str(result)), **context)),
+    ]
+
+    baseline = None
+    print(f"{'scenario':<16} {'us/call':>10} {'speedup':>9}")
+    for name, fn in scenarios:
+        per_call = timed(args.calls, fn)
+        baseline = baseline or per_call
+        print(f"{name:<16} {per_call:>10.2f} {baseline / per_call:>8.1f}x")
+
+    LoggerAdaptor.clear_instances()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: incremental vs. re-parsing partial JSON during streaming.
+
+Simulates a structured LLM response streamed in small deltas and compares:
+- parse_partial_json(accumulated) on every delta (quadratic)
+- IncrementalJSONParser.feed(delta) on every delta (linear)
+
+A second table streams a single long string field (an "answer" of N words),
+feeding the incremental parser without and with reading the partial value on
+every delta.
+
+Usage:
+    python scripts/benchmark_partial_json.py [--chunk-size 4] [--sizes 1000 4000 16000]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.converters.incremental_json_parser import IncrementalJSONParser
+from utils.converters.partial_json_parser import parse_partial_json
+
+
+def build_document(target_chars: int) -> str:
+    """Build a structured response of roughly `target_chars` characters."""
+    items = []
+    doc = {"title": "Recommendations", "items": items, "summary": ""}
+    i = 0
+    while len(json.dumps(doc)) < target_chars:
+        items.append({
+            "id": i,
+            "name": f"Item number {i}",
+            "score": round(i * 0.37, 2),
+            "tags": ["alpha", "beta", "gamma"],
+            "available": i % 2 == 0,
+        })
+        i += 1
+    doc["summary"] = "A short closing summary of the recommendations above."
+    return json.dumps(doc)
+
+
+def build_long_string_document(words: int) -> str:
+    """Build a response whose content is one long string field."""
+    return json.dumps({"answer": " ".join(f"word{i % 100}" for i in range(words)), "done": True})
+
+
+def run_reparse(chunks) -> float:
+    start = time.perf_counter()
+    buffer = []
+    for chunk in chunks:
+        buffer.append(chunk)
+        parse_partial_json("".join(buffer))
+    return time.perf_counter() - start
+
+
+def run_incremental(chunks) -> float:
+    start = time.perf_counter()
+    parser = IncrementalJSONParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return time.perf_counter() - start
+
+
+def run_incremental_read(chunks) -> float:
+    start = time.perf_counter()
+    parser = IncrementalJSONParser()
+    for chunk in chunks:
+        parser.feed(chunk).value
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=4, help="Characters per streamed delta (~1 token)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000], help="Document sizes in chars")
+    parser.add_argument("--words", type=int, nargs="+", default=[4000, 16000, 64000], help="Long string sizes in words")
+    args = parser.parse_args()
+
+    print(f"{'chars':>8} {'deltas':>8} {'reparse (ms)':>14} {'incremental (ms)':>18} {'speedup':>9}")
+    for size in args.sizes:
+        document = build_document(size)
+        chunks = [document[i:i + args.chunk_size] for i in range(0, len(document), args.chunk_size)]
+
+        reparse = run_reparse(chunks)
+        incremental = run_incremental(chunks)
+
+        print(
+            f"{len(document):>8} {len(chunks):>8} {reparse * 1000:>14.1f} "
+            f"{incremental * 1000:>18.1f} {reparse / incremental:>8.1f}x"
+        )
+
+    print()
+    print(f"{'words':>8} {'deltas':>8} {'feed only (ms)':>16} {'feed + read (ms)':>18}")
+    for words in args.words:
+        document = build_long_string_document(words)
+        chunks = [document[i:i + args.chunk_size] for i in range(0, len(document), args.chunk_size)]
+
+        feed_only = run_incremental(chunks)
+        feed_read = run_incremental_read(chunks)
+
+        print(f"{words:>8} {len(chunks):>8} {feed_only * 1000:>16.1f} {feed_read * 1000:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Tests for parallel multi-action tool execution.
+
+Covers:
+- Parsing several Action / Action Input pairs and native tool_calls
+- Concurrent execution bounded by max_parallel_actions
+- Per-tool timeouts and isolated failures
+- Deterministic scratchpad order in ReactAgent
+- Combined observations in GoalBasedAgent
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from core.agents import (
+    BasicChecklist,
+    GoalBasedAgent,
+    ReactAgent,
+    StructuredScratchpad,
+    create_agent_spec,
+    create_context,
+)
+from core.agents.constants import DEFAULT_TOOL_TIMEOUT_SECONDS
+from core.llms.spec.llm_result import LLMResponse, LLMStreamChunk
+
+
+PARALLEL_RESPONSE = (
+    "Thought: I can look both up at once.\n"
+    'Action: slow\nAction Input: {"city": "Paris"}\n'
+    'Action: fast\nAction Input: {"city": "Rome"}\n'
+)
+
+
+class ScriptedLLM:
+    """Returns queued responses from get_answer."""
+
+    def __init__(self, responses: List[LLMResponse]):
+        self.responses = list(responses)
+
+    async def get_answer(self, messages, ctx, **kwargs):
+        return self.responses.pop(0)
+
+
+class StreamedLLM:
+    """Streams one response from stream_answer in small chunks."""
+
+    def __init__(self, content: str, chunk_size: int = 8):
+        self.content = content
+        self.chunk_size = chunk_size
+
+    async def stream_answer(self, messages, ctx, **kwargs):
+        for i in range(0, len(self.content), self.chunk_size):
+            yield LLMStreamChunk(content=self.content[i:i + self.chunk_size])
+
+
+class SleepTool:
+    """Tool that sleeps, then echoes its arguments; tracks peak concurrency."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, name: str, delay_s: float, fail: bool = False):
+        self.name = name
+        self.delay_s = delay_s
+        self.fail = fail
+        self.calls: List[Dict[str, Any]] = []
+
+    async def __call__(self, args: Dict[str, Any]) -> str:
+        self.calls.append(args)
+        SleepTool.active += 1
+        SleepTool.peak = max(SleepTool.peak, SleepTool.active)
+        try:
+            await asyncio.sleep(self.delay_s)
+            if self.fail:
+                raise RuntimeError("boom")
+            return f"{self.name}:{args.get('city')}"
+        finally:
+            SleepTool.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    SleepTool.active = 0
+    SleepTool.peak = 0
+
+
+def make_spec(**kwargs):
+    return create_agent_spec(name="parallel", parallel_actions=True, **kwargs)
+
+
+class TestActionParsing:
+    """Tests for BaseAgent action parsing helpers."""
+
+    def test_parse_multiple_actions_in_order(self):
+        """Every action is returned in response order."""
+        agent = ReactAgent(spec=make_spec(), llm=ScriptedLLM([]))
+        assert agent._parse_actions(PARALLEL_RESPONSE) == [
+            ("slow", {"city": "Paris"}),
+            ("fast", {"city": "Rome"}),
+        ]
+
+    def test_actions_after_observation_are_ignored(self):
+        """Actions that follow an imagined observation are dropped."""
+        agent = ReactAgent(spec=make_spec(), llm=ScriptedLLM([]))
+        content = 'Action: a\nAction Input: {}\nObservation: made up\nAction: b\nAction Input: {}'
+        assert agent._parse_actions(content) == [("a", {})]
+
+    def test_parse_native_tool_calls(self):
+        """Azure/OpenAI tool_calls are converted with JSON-decoded arguments."""
+        agent = ReactAgent(spec=make_spec(), llm=ScriptedLLM([]))
+        response = LLMResponse(content="", tool_calls=[
+            {"id": "1", "type": "function",
+             "function": {"name": "slow", "arguments": json.dumps({"city": "Paris"})}},
+            {"id": "2", "type": "function", "function": {"name": "fast", "arguments": "oops"}},
+        ])
+        assert agent._parse_tool_calls(response) == [
+            ("slow", {"city": "Paris"}),
+            ("fast", {"input": "oops"}),
+        ]
+
+
+class TestParallelExecution:
+    """Tests for BaseAgent._execute_tools_parallel."""
+
+    async def test_runs_concurrently_with_bound(self):
+        """Calls overlap but never exceed max_parallel_actions."""
+        tools = [SleepTool(f"t{i}", 0.05) for i in range(5)]
+        agent = ReactAgent(spec=make_spec(max_parallel_actions=2), llm=ScriptedLLM([]), tools=tools)
+
+        results = await agent._execute_tools_parallel(
+            [(t.name, {"city": str(i)}) for i, t in enumerate(tools)], create_context()
+        )
+
+        assert results == [f"t{i}:{i}" for i in range(5)]
+        assert SleepTool.peak == 2
+
+    async def test_timeout_and_failure_are_isolated(self):
+        """A slow or failing call yields an error without affecting the others."""
+        tools = [SleepTool("slow", 1.0), SleepTool("bad", 0, fail=True), SleepTool("ok", 0)]
+        agent = ReactAgent(
+            spec=make_spec(tool_timeout_seconds=0.05), llm=ScriptedLLM([]), tools=tools
+        )
+
+        slow, bad, ok = await agent._execute_tools_parallel(
+            [("slow", {}), ("bad", {}), ("ok", {"city": "x"})], create_context()
+        )
+
+        assert "Timed out" in slow.details["error"]
+        assert bad.details["original_error"] == "boom"
+        assert ok == "ok:x"
+
+    @pytest.mark.parametrize("agent_timeout, expected", [(None, 5), (0.5, 0.5)])
+    def test_tool_timeout_precedence(self, agent_timeout, expected):
+        """The agent-level timeout, when set, overrides the tool spec's timeout_s."""
+        tool = SleepTool("specced", 0)
+        tool.spec = type("Spec", (), {"timeout_s": 5})()
+        agent = ReactAgent(
+            spec=make_spec(tool_timeout_seconds=agent_timeout), llm=ScriptedLLM([]), tools=[tool]
+        )
+        assert agent._get_tool_timeout("specced") == expected
+        assert agent._get_tool_timeout("unknown") == (agent_timeout or DEFAULT_TOOL_TIMEOUT_SECONDS)
+
+
+class TestReactParallelActions:
+    """Tests for ReactAgent with parallel_actions."""
+
+    async def test_observations_recorded_in_response_order(self):
+        """The slow first action is still recorded first."""
+        llm = ScriptedLLM([LLMResponse(content=PARALLEL_RESPONSE)])
+        scratchpad = StructuredScratchpad()
+        scratchpad.add_thought("Earlier turn.")
+        agent = ReactAgent(
+            spec=make_spec(),
+            llm=llm,
+            tools=[SleepTool("slow", 0.05), SleepTool("fast", 0)],
+            scratchpad=scratchpad,
+        )
+
+        result, should_continue = await agent._execute_iteration("q", create_context(), 1, None)
+
+        assert (result, should_continue) == (None, True)
+        entries = [(e["type"], e["content"]) for e in scratchpad.get_entries()]
+        assert entries[2:] == [
+            ("action", "slow"), ("observation", "slow:Paris"),
+            ("action", "fast"), ("observation", "fast:Rome"),
+        ]
+
+    async def test_streamed_actions_run_concurrently(self):
+        """A streamed turn with several actions runs them together, in order."""
+        llm = StreamedLLM(PARALLEL_RESPONSE)
+        slow, fast = SleepTool("slow", 0.05), SleepTool("fast", 0.05)
+        agent = ReactAgent(spec=make_spec(), llm=llm, tools=[slow, fast])
+
+        chunks = [c async for c in agent._stream_iteration("q", create_context(), 1, None)]
+
+        assert SleepTool.peak == 2
+        assert [(c.chunk_type, c.tool_name) for c in chunks if c.tool_name] == [
+            ("action", "slow"), ("action", "fast"),
+            ("observation", "slow"), ("observation", "fast"),
+        ]
+        assert [c.content for c in chunks if c.chunk_type == "observation"] == ["slow:Paris", "fast:Rome"]
+
+    async def test_prompt_allows_several_actions(self):
+        """The built-in prompt only invites multiple actions in parallel mode."""
+        tools = [SleepTool("slow", 0)]
+        parallel = ReactAgent(spec=make_spec(), llm=ScriptedLLM([]), tools=tools)
+        sequential = ReactAgent(spec=create_agent_spec(name="sequential"), llm=ScriptedLLM([]), tools=tools)
+
+        assert await parallel._get_react_prompt_template() == ReactAgent.DEFAULT_PARALLEL_REACT_PROMPT_TEMPLATE
+        assert await sequential._get_react_prompt_template() == ReactAgent.DEFAULT_REACT_PROMPT_TEMPLATE
+
+    async def test_disabled_runs_first_action_only(self):
+        """Without parallel_actions the single-action behavior is unchanged."""
+        llm = ScriptedLLM([LLMResponse(content=PARALLEL_RESPONSE)])
+        slow, fast = SleepTool("slow", 0), SleepTool("fast", 0)
+        agent = ReactAgent(spec=create_agent_spec(name="sequential"), llm=llm, tools=[slow, fast])
+
+        await agent._execute_iteration("q", create_context(), 1, None)
+
+        assert len(slow.calls) == 1
+        assert fast.calls == []
+
+
+class TestGoalBasedParallelActions:
+    """Tests for GoalBasedAgent with parallel_actions."""
+
+    async def test_task_runs_tool_calls_concurrently(self):
+        """Native tool_calls of a task run together; observations are joined in order."""
+        llm = ScriptedLLM([
+            LLMResponse(content="", tool_calls=[
+                {"function": {"name": "slow", "arguments": '{"city": "Paris"}'}},
+                {"function": {"name": "fast", "arguments": '{"city": "Rome"}'}},
+            ]),
+        ])
+        checklist = BasicChecklist()
+        checklist.add_item("Look up weather", priority=1)
+        agent = GoalBasedAgent(
+            spec=make_spec(),
+            llm=llm,
+            tools=[SleepTool("slow", 0.05), SleepTool("fast", 0.05)],
+            checklist=checklist,
+        )
+
+        task = checklist.get_pending_items()[0]
+        result = await agent._execute_task("weather", task, create_context())
+
+        assert result == "slow: slow:Paris\nfast: fast:Rome"
+        assert SleepTool.peak == 2
+
+    async def test_default_prompt_yields_concurrent_actions(self):
+        """The parallel task prompt invites several actions, which then run together."""
+        class PromptFollowingLLM:
+            """Lists several actions only when the prompt allows it."""
+
+            def __init__(self):
+                self.prompts = []
+
+            async def get_answer(self, messages, ctx, **kwargs):
+                prompt = messages[-1]["content"]
+                self.prompts.append(prompt)
+                if "one Action/Action Input pair per call" in prompt:
+                    return LLMResponse(content=PARALLEL_RESPONSE)
+                return LLMResponse(content='Action: slow\nAction Input: {"city": "Paris"}')
+
+        llm = PromptFollowingLLM()
+        agent = GoalBasedAgent(
+            spec=make_spec(),
+            llm=llm,
+            tools=[SleepTool("slow", 0.05), SleepTool("fast", 0.05)],
+        )
+
+        result = await agent._execute_task("weather", {"description": "t"}, create_context())
+
+        assert result == "slow: slow:Paris\nfast: fast:Rome"
+        assert SleepTool.peak == 2
+
+    async def test_task_fails_when_every_action_fails(self):
+        """If no action succeeds, the task raises so it is marked failed."""
+        llm = ScriptedLLM([LLMResponse(content=PARALLEL_RESPONSE)])
+        agent = GoalBasedAgent(
+            spec=make_spec(),
+            llm=llm,
+            tools=[SleepTool("slow", 0, fail=True), SleepTool("fast", 0, fail=True)],
+        )
+
+        with pytest.raises(Exception, match="slow"):
+            await agent._execute_task("weather", {"description": "t"}, create_context())
@@ -0,0 +1,171 @@
+"""
+Tests for speculative tool execution in ReactAgent streaming.
+
+Covers:
+- IncrementalReactParser detection across arbitrary chunk splits
+- Tools that opt in start before the LLM stream finishes
+- Mismatched or final-answer responses cancel the speculative call
+- Tools that do not opt in only run after the stream ends
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import pytest
+
+from core.agents import ReactAgent, create_agent_spec, create_context
+from core.agents.runtimes import IncrementalReactParser, ReactActionCandidate
+
+
+RESPONSE = (
+    "Thought: I need the forecast.\n"
+    "Action: get_weather_forecast_for_city\n"
+    'Action Input: {"city": "Paris", "days": [1, 2]}\n'
+    "Observation:"
+)
+
+
+@dataclass
+class _Chunk:
+    content: str
+
+
+class FakeStreamingLLM:
+    """Streams a fixed response in small chunks and records when it finishes."""
+
+    def __init__(self, response: str, chunk_size: int = 4, delay_s: float = 0.001):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.delay_s = delay_s
+        self.finished = False
+
+    async def stream_answer(self, messages, ctx):
+        for i in range(0, len(self.response), self.chunk_size):
+            await asyncio.sleep(self.delay_s)
+            yield _Chunk(self.response[i:i + self.chunk_size])
+        self.finished = True
+
+
+class RecordingTool:
+    """Tool that records whether the LLM stream had finished when it started."""
+
+    def __init__(self, name: str, llm: FakeStreamingLLM, speculative: bool, delay_s: float = 0.0):
+        self.name = name
+        self.speculative = speculative
+        self.llm = llm
+        self.delay_s = delay_s
+        self.calls: List[Dict[str, Any]] = []
+        self.completed = 0
+
+    async def __call__(self, args: Dict[str, Any]) -> str:
+        self.calls.append({"args": args, "stream_finished": self.llm.finished})
+        await asyncio.sleep(self.delay_s)
+        self.completed += 1
+        return f"sunny in {args.get('city')}"
+
+
+def make_agent(llm, tools):
+    spec = create_agent_spec(name="react", max_iterations=3)
+    return ReactAgent(spec=spec, llm=llm, tools=tools)
+
+
+async def collect(agent):
+    return [c async for c in agent._stream_iteration("weather?", create_context(), 1, None)]
+
+
+class TestIncrementalReactParser:
+    """Tests for IncrementalReactParser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 500])
+    def test_detects_call_across_chunk_splits(self, chunk_size):
+        """The call is found once its JSON object closes, regardless of chunking."""
+        parser = IncrementalReactParser()
+        found = []
+        for i in range(0, len(RESPONSE), chunk_size):
+            candidate = parser.feed(RESPONSE[i:i + chunk_size])
+            if candidate:
+                found.append((candidate, i + chunk_size))
+
+        assert len(found) == 1
+        candidate, position = found[0]
+        assert candidate == ReactActionCandidate(
+            action="get_weather_forecast_for_city",
+            action_input={"city": "Paris", "days": [1, 2]},
+        )
+        assert position >= RESPONSE.index("}")
+        assert parser.is_done
+
+    def test_final_answer_rules_out_speculation(self):
+        """A final answer before any action never yields a candidate."""
+        parser = IncrementalReactParser()
+        assert parser.feed("Thought: done\nFinal Answer: 42") is None
+        assert parser.feed('\nAction: search\nAction Input: {"q": 1}') is None
+        assert parser.is_done
+
+    def test_non_object_input_is_ignored(self):
+        """Only JSON object inputs are speculated on."""
+        parser = IncrementalReactParser()
+        assert parser.feed("Action: search\nAction Input: plain text\n") is None
+        assert parser.is_done
+
+    def test_incomplete_json_waits(self):
+        """An unterminated object is not reported."""
+        parser = IncrementalReactParser()
+        assert parser.feed('Action: search\nAction Input: {"q": "par') is None
+        assert not parser.is_done
+        assert parser.feed('is"}') == ReactActionCandidate("search", {"q": "paris"})
+
+
+class TestReactSpeculativeExecution:
+    """Tests for speculative tool execution in ReactAgent._stream_iteration."""
+
+    async def test_speculative_tool_starts_before_stream_ends(self):
+        """An opted-in tool runs once, started while tokens were still arriving."""
+        llm = FakeStreamingLLM(RESPONSE)
+        tool = RecordingTool("get_weather_forecast_for_city", llm, speculative=True)
+        chunks = await collect(make_agent(llm, [tool]))
+
+        assert len(tool.calls) == 1
+        assert tool.calls[0]["stream_finished"] is False
+        action = next(c for c in chunks if c.chunk_type == "action")
+        assert action.metadata == {"speculative": True}
+        observation = next(c for c in chunks if c.chunk_type == "observation")
+        assert observation.content == "sunny in Paris"
+
+    async def test_non_speculative_tool_waits_for_stream(self):
+        """Tools without opt-in keep the sequential behavior."""
+        llm = FakeStreamingLLM(RESPONSE)
+        tool = RecordingTool("get_weather_forecast_for_city", llm, speculative=False)
+        chunks = await collect(make_agent(llm, [tool]))
+
+        assert tool.calls == [{"args": {"city": "Paris", "days": [1, 2]}, "stream_finished": True}]
+        action = next(c for c in chunks if c.chunk_type == "action")
+        assert action.metadata == {}
+
+    async def test_mismatched_arguments_cancel_speculation(self):
+        """If the final parse disagrees, the speculative call is cancelled and rerun."""
+        # The trailing text makes the full Action Input differ from the JSON prefix
+        response = RESPONSE.replace('[1, 2]}', '[1, 2]} extra')
+        llm = FakeStreamingLLM(response)
+        tool = RecordingTool("get_weather_forecast_for_city", llm, speculative=True, delay_s=0.05)
+        await collect(make_agent(llm, [tool]))
+
+        assert [call["stream_finished"] for call in tool.calls] == [False, True]
+        assert tool.completed == 1
+
+    async def test_closing_stream_cancels_speculation(self):
+        """Abandoning the stream cancels a running speculative call."""
+        llm = FakeStreamingLLM(RESPONSE + " " * 40)
+        tool = RecordingTool("get_weather_forecast_for_city", llm, speculative=True, delay_s=0.05)
+        agent = make_agent(llm, [tool])
+
+        stream = agent._stream_iteration("weather?", create_context(), 1, None)
+        async for _ in stream:
+            if tool.calls:
+                break
+        await stream.aclose()
+        await asyncio.sleep(0.06)
+
+        assert len(tool.calls) == 1
+        assert tool.completed == 0
@@ -0,0 +1,180 @@
+"""
+Tests for Incremental JSON Parser.
+
+Covers:
+- Parity with parse_partial_json on every prefix of a document
+- Arbitrary chunk boundaries (keys, escapes, numbers, literals)
+- Completed-field events
+- Error handling
+"""
+
+import json
+
+import pytest
+
+from utils.converters import IncrementalJSONParser, PartialJSONUpdate
+from utils.converters.partial_json_parser import parse_partial_json
+
+
+DOCUMENT = (
+    '{"name": "Raj", "age": 18, "score": -1.5e3, '
+    '"tags": ["a", "b", 3.5, true, null, false], '
+    '"nested": {"x": {"y": [1, 2, {"z": 0.25}]}, "w": "text"}, '
+    '"empty_list": [], "empty_obj": {}}'
+)
+
+
+def feed_all(parser: IncrementalJSONParser, chunks) -> PartialJSONUpdate:
+    update = None
+    for chunk in chunks:
+        update = parser.feed(chunk)
+    return update
+
+
+class TestIncrementalJsonParser:
+    """Tests for IncrementalJSONParser."""
+
+    # ========================================================================
+    # Parity with parse_partial_json
+    # ========================================================================
+
+    @pytest.mark.parametrize("document", [
+        DOCUMENT,
+        '[1, 2, [3, 4], {"a": "b"}, "s"]',
+        '{"a" : 1 , "b":2}',
+        'true',
+    ])
+    def test_matches_partial_parser_on_every_prefix(self, document):
+        """Feeding char by char matches re-parsing each prefix."""
+        parser = IncrementalJSONParser()
+        for end in range(1, len(document) + 1):
+            update = parser.feed(document[end - 1])
+            prefix = document[:end]
+            # parse_partial_json strips the buffer, which trims trailing
+            # whitespace inside an open string; skip those prefixes
+            if prefix != prefix.rstrip():
+                continue
+            assert update.value == parse_partial_json(prefix), prefix
+        assert parser.is_complete
+        assert parser.value == json.loads(document)
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 1000])
+    def test_chunk_sizes(self, size):
+        """Result does not depend on where chunks are split."""
+        parser = IncrementalJSONParser()
+        chunks = [DOCUMENT[i:i + size] for i in range(0, len(DOCUMENT), size)]
+        update = feed_all(parser, chunks)
+        assert update.is_complete
+        assert update.value == json.loads(DOCUMENT)
+
+    # ========================================================================
+    # Streaming edge cases
+    # ========================================================================
+
+    def test_incomplete_key(self):
+        """{"Nam -> {"Nam": None}, then the key is replaced as it grows."""
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"Nam').value == {"Nam": None}
+        assert parser.feed('e": "R').value == {"Name": "R"}
+
+    def test_empty_next_key(self):
+        """{"Name": "Raj"," -> {"Name": "Raj", "": None}"""
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"Name": "Raj","').value == {"Name": "Raj", "": None}
+
+    def test_partial_numbers(self):
+        """Truncated numbers are completed like parse_partial_json."""
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"a": -').value == {"a": 0}
+        assert parser.feed('1.').value == {"a": -1.0}
+        assert parser.feed('5e').value == {"a": -1.5}
+        assert parser.feed('2,').value == {"a": -150.0}
+
+    def test_partial_literals(self):
+        """Truncated literals resolve to their value."""
+        parser = IncrementalJSONParser()
+        assert parser.feed('[t').value == [True]
+        assert parser.feed('rue, f').value == [True, False]
+        assert parser.feed('alse, n').value == [True, False, None]
+
+    def test_escapes_split_across_chunks(self):
+        """Escape sequences split over chunk boundaries decode correctly."""
+        parser = IncrementalJSONParser()
+        chunks = ['{"a": "x\\', 'n\\u00', 'e9 \\ud83d', '\\ude00"}']
+        update = feed_all(parser, chunks)
+        assert update.value == {"a": "x\né 😀"}
+
+    def test_open_string_hides_dangling_escape(self):
+        """A trailing backslash is not exposed in the partial value."""
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"a": "say \\').value == {"a": "say "}
+        assert parser.feed('"hi\\""}').value == {"a": 'say "hi"'}
+
+    def test_long_string_read_only_when_needed(self):
+        """An open string is materialized on read, between any number of feeds."""
+        parser = IncrementalJSONParser()
+        parser.feed('{"answer": "')
+        for _ in range(2000):
+            parser.feed("word ")
+        assert parser.value == {"answer": "word " * 2000}
+        parser.feed('more", "k')
+        assert parser.value == {"answer": "word " * 2000 + "more", "k": None}
+        assert parser.feed('ey": 1}').value == {"answer": "word " * 2000 + "more", "key": 1}
+
+    # ========================================================================
+    # Completed-field events
+    # ========================================================================
+
+    def test_completed_fields_events(self):
+        """Top-level fields are reported once, when their value completes."""
+        parser = IncrementalJSONParser()
+        assert parser.feed('{"name": "Ra').completed_fields == []
+        assert parser.feed('j", "age"').completed_fields == ["name"]
+        assert parser.feed(': 18').completed_fields == []
+        assert parser.feed(', "items": [{"a": 1}').completed_fields == ["age"]
+        update = parser.feed(']}')
+        assert update.completed_fields == ["items"]
+        assert update.is_complete
+        assert parser.completed_fields == ["name", "age", "items"]
+
+    def test_nested_fields_not_reported(self):
+        """Only top-level fields produce completion events."""
+        parser = IncrementalJSONParser()
+        update = parser.feed('{"outer": {"inner": 1, "other": 2}')
+        assert update.completed_fields == ["outer"]
+
+    # ========================================================================
+    # Errors and lifecycle
+    # ========================================================================
+
+    def test_invalid_input_sets_error(self):
+        """Invalid JSON stops parsing and keeps the last good value."""
+        parser = IncrementalJSONParser()
+        update = parser.feed('{"a": 1, "b": x')
+        assert update.error is not None
+        assert update.value == {"a": 1, "b": None}
+        assert parser.feed('"ignored"}').value == {"a": 1, "b": None}
+
+    def test_trailing_text_ignored_after_completion(self):
+        """Text after the root value does not change the result."""
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1}\n```')
+        assert parser.is_complete
+        assert parser.error is None
+        assert parser.value == {"a": 1}
+
+    def test_reset(self):
+        """reset() starts a new document."""
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1}')
+        parser.reset()
+        assert parser.value is None
+        assert parser.feed('[1]').value == [1]
+        assert parser.completed_fields == []
+
+    def test_empty_delta(self):
+        """Empty deltas are no-ops."""
+        parser = IncrementalJSONParser()
+        update = parser.feed("")
+        assert update.value is None
+        assert not update.is_complete
@@ -0,0 +1,133 @@
+"""
+Tests for the structured output schema registry.
+
+Covers:
+- One compilation per (model, strict), LRU eviction
+- Equivalence with pydantic_to_openai_schema and parse_structured_response
+- Splicing the pre-serialized response_format into request bodies
+- Read-only shared response_format
+"""
+
+import copy
+import json
+import pickle
+from typing import List
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from utils.converters import (
+    SchemaRegistry,
+    dumps_payload,
+    parse_structured_response,
+    pydantic_to_openai_schema,
+)
+
+
+class Address(BaseModel):
+    city: str
+    zip_code: str
+
+
+class Classification(BaseModel):
+    """Intent classification."""
+    intent: str
+    confidence: float
+    tags: List[str]
+    address: Address
+
+
+VALID = '{"intent": "refund", "confidence": 0.9, "tags": ["a"], "address": {"city": "Oslo", "zip_code": "0150"}}'
+
+
+class TestSchemaRegistry:
+    """Tests for SchemaRegistry lookups and validation."""
+
+    def test_compiled_once_per_model_and_strict(self):
+        registry = SchemaRegistry()
+        first = registry.get(Classification)
+        assert registry.get(Classification) is first
+        assert registry.get(Classification, strict=False) is not first
+        assert (registry.hits, registry.misses) == (1, 2)
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_response_format_matches_converter(self, strict):
+        compiled = SchemaRegistry().get(Classification, strict=strict)
+        expected = pydantic_to_openai_schema(Classification, strict=strict)
+        assert compiled.response_format == expected
+        assert json.loads(compiled.response_format.json) == expected
+
+    def test_lru_eviction(self):
+        registry = SchemaRegistry(max_size=1)
+        registry.get(Classification)
+        registry.get(Address)
+        assert len(registry) == 1
+        registry.get(Classification)
+        assert registry.misses == 3
+
+    @pytest.mark.parametrize("content", [
+        VALID,
+        f"```json\n{VALID}\n```",
+        f"Here you go: {VALID}",
+    ])
+    def test_validate_matches_parse_structured_response(self, content):
+        compiled = SchemaRegistry().get(Classification)
+        assert compiled.validate(content) == parse_structured_response(content, Classification)
+
+    def test_validate_raises_on_schema_mismatch(self):
+        compiled = SchemaRegistry().get(Classification)
+        with pytest.raises(ValidationError):
+            compiled.validate('{"intent": "refund"}')
+        with pytest.raises(ValueError):
+            compiled.validate("no json here")
+
+
+class TestDumpsPayload:
+    """Tests for splicing the cached response_format into request bodies."""
+
+    def test_spliced_body_round_trips(self):
+        compiled = SchemaRegistry().get(Classification)
+        payload = {"messages": [{"role": "user", "content": "hi \"there\""}], "temperature": 0.2,
+                   "response_format": compiled.response_format}
+        assert json.loads(dumps_payload(payload)) == payload
+        assert compiled.response_format.json in dumps_payload(payload)
+
+    @pytest.mark.parametrize("payload", [
+        {"messages": []},
+        {"response_format": {"type": "json_object"}},
+        [1, 2],
+    ])
+    def test_plain_payloads_unchanged(self, payload):
+        assert dumps_payload(payload) == json.dumps(payload)
+
+    def test_only_response_format(self):
+        compiled = SchemaRegistry().get(Address)
+        payload = {"response_format": compiled.response_format}
+        assert json.loads(dumps_payload(payload)) == payload
+
+
+class TestSerializedResponseFormat:
+    """Tests for the shared, read-only response_format."""
+
+    @pytest.mark.parametrize("mutate", [
+        lambda rf: rf.update(type="json_object"),
+        lambda rf: rf.__setitem__("type", "json_object"),
+        lambda rf: rf["json_schema"].pop("strict"),
+        lambda rf: rf["json_schema"]["schema"]["required"].append("extra"),
+    ])
+    def test_mutation_rejected(self, mutate):
+        response_format = SchemaRegistry().get(Classification).response_format
+        before = response_format.json
+        with pytest.raises(TypeError):
+            mutate(response_format)
+        assert response_format.json == before
+
+    def test_copies_are_plain_and_mutable(self):
+        response_format = SchemaRegistry().get(Classification).response_format
+        mutable = copy.deepcopy(response_format)
+        mutable["json_schema"]["schema"]["required"].append("extra")
+        assert type(mutable) is dict
+        assert "extra" not in response_format["json_schema"]["schema"]["required"]
+
+        restored = pickle.loads(pickle.dumps(response_format))
+        assert restored == response_format and restored.json == response_format.json
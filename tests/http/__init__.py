@@ -0,0 +1 @@
+"""Tests for HTTP utilities."""
@@ -0,0 +1,195 @@
+"""
+Tests for the pooled HTTP transport.
+
+Covers:
+- Per-endpoint pools and connection reuse (keep-alive)
+- Warm-up and pool statistics
+- Rebuilding pools for a new event loop
+- HttpSessionManager and AzureConnector integration
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.llms.providers.azure.connector import AzureConnector
+from core.tools.runtimes.executors.http_executors.session_manager import HttpSessionManager
+from utils.http import PooledTransport, get_shared_transport, reset_shared_transport
+
+
+def make_app(status: int = 200):
+    seen = []
+
+    async def handler(request):
+        seen.append((request.method, request.path, request.headers.get("api-key")))
+        if status != 200:
+            return web.Response(status=status)
+        return web.json_response({"ok": True, "port": request.url.port})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app, seen
+
+
+@pytest.fixture
+async def servers():
+    started = []
+
+    async def start(status: int = 200):
+        app, seen = make_app(status)
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
+        started.append(server)
+        return str(server.make_url("")).rstrip("/"), seen
+
+    yield start
+    for server in started:
+        await server.close()
+
+
+class TestPooledTransport:
+    """Tests for PooledTransport."""
+
+    async def test_connections_reused_per_endpoint(self, servers):
+        """Sequential requests to one endpoint reuse a single connection."""
+        url, _ = await servers()
+        transport = PooledTransport()
+        try:
+            for _ in range(5):
+                async with transport.get_session(url).get(f"{url}/ping") as response:
+                    assert response.status == 200
+                    await response.read()
+
+            stats = transport.stats()["endpoints"][PooledTransport.origin(url)]
+            assert stats["requests"] == 5
+            assert stats["connections_created"] == 1
+            assert stats["connections_reused"] == 4
+            assert stats["idle"] == 1
+        finally:
+            await transport.close()
+
+    async def test_separate_pools_per_origin(self, servers):
+        first, _ = await servers()
+        second, _ = await servers()
+        transport = PooledTransport(endpoint_limits={second: 3})
+        try:
+            assert transport.get_session(f"{first}/a") is transport.get_session(f"{first}/b")
+            assert transport.get_session(first) is not transport.get_session(second)
+            stats = transport.stats()
+            assert stats["pools"] == 2
+            assert stats["endpoints"][PooledTransport.origin(second)]["limit"] == 3
+        finally:
+            await transport.close()
+
+    async def test_warm_up_preconnects(self, servers):
+        """After warm-up the first real request reuses the warm connection."""
+        url, seen = await servers()
+        transport = PooledTransport()
+        try:
+            assert await transport.warm_up([f"{url}/x", url]) == {PooledTransport.origin(url): True}
+            assert seen == [("HEAD", "/", None)]
+
+            async with transport.get_session(url).get(f"{url}/ping") as response:
+                await response.read()
+            stats = transport.stats()["endpoints"][PooledTransport.origin(url)]
+            assert stats["connections_created"] == 1
+        finally:
+            await transport.close()
+
+    async def test_warm_up_failure_reported(self):
+        transport = PooledTransport()
+        try:
+            result = await transport.warm_up(["http://127.0.0.1:1"], timeout=1.0)
+            assert result == {"http://127.0.0.1:1": False}
+        finally:
+            await transport.close()
+
+    def test_pools_rebuilt_for_new_loop(self):
+        """A pool from a closed event loop is replaced, not reused."""
+        transport = PooledTransport()
+
+        async def get():
+            return transport.get_session("http://127.0.0.1:9")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+        asyncio.run(transport.close())
+
+    def test_relative_url_rejected(self):
+        with pytest.raises(ValueError):
+            PooledTransport.origin("/relative/path")
+
+
+class TestTransportIntegration:
+    """Integration with HttpSessionManager and AzureConnector."""
+
+    async def test_session_manager_endpoint_sessions(self, servers):
+        url, _ = await servers()
+        manager = HttpSessionManager(transport=PooledTransport())
+        try:
+            session = await manager.get_session(f"{url}/items")
+            async with session.get(f"{url}/items") as response:
+                assert response.status == 200
+            stats = manager.stats
+            assert stats["pools"]["endpoints"][PooledTransport.origin(url)]["requests"] == 1
+            assert await manager.get_session() is not session
+        finally:
+            await manager.shutdown(timeout=0)
+        assert manager.transport.stats()["pools"] == 0
+
+    async def test_session_manager_leaves_shared_transport_open(self, servers):
+        """Shutting the manager down keeps the pools LLM connectors share."""
+        url, _ = await servers()
+        reset_shared_transport()
+        manager = HttpSessionManager()
+        try:
+            session = await manager.get_session(url)
+            await manager.get_session()
+            await manager.shutdown(timeout=0)
+            assert not session.closed
+            assert get_shared_transport().stats()["pools"] == 1
+        finally:
+            await get_shared_transport().close()
+            reset_shared_transport()
+
+    async def test_azure_failover_keeps_endpoint_pools(self, servers):
+        """Failover switches pools and sends the backup's key per request."""
+        primary, primary_seen = await servers(status=503)
+        backup, backup_seen = await servers()
+        connector = AzureConnector({
+            "api_key": "primary-key",
+            "endpoint": primary,
+            "deployment_name": "gpt",
+            "backups": [{"endpoint": backup, "api_key": "backup-key"}],
+        })
+        transport = PooledTransport()
+        connector._transport = transport
+        try:
+            response = await connector.request("chat/completions", {"messages": []})
+            assert response["ok"] is True
+            assert primary_seen[0][2] == "primary-key"
+            assert backup_seen[0][2] == "backup-key"
+
+            endpoints = transport.stats()["endpoints"]
+            assert set(endpoints) == {PooledTransport.origin(primary), PooledTransport.origin(backup)}
+            assert not endpoints[PooledTransport.origin(primary)]["closed"]
+        finally:
+            await transport.close()
+
+    async def test_azure_owned_session(self, servers):
+        url, seen = await servers()
+        connector = AzureConnector({
+            "api_key": "key",
+            "endpoint": url,
+            "deployment_name": "gpt",
+            "shared_pool": False,
+        })
+        try:
+            assert await connector.warm_up() == {}
+            await connector.request("chat/completions", {"messages": []})
+            assert seen[0][2] == "key"
+        finally:
+            await connector.close()
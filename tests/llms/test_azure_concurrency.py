@@ -0,0 +1,200 @@
+"""
+Concurrency tests for AzureBaseLLM.
+
+One LLM instance serves many concurrent get_answer/stream_answer calls with
+different structured output schemas. Per-call state lives in an
+LLMRequestState, so every call must be validated against its own schema.
+"""
+
+import asyncio
+import json
+import random
+from typing import Any, AsyncIterator, Dict
+
+import pytest
+from pydantic import BaseModel
+
+from core.llms.enum import LLMProvider, ModelFamily
+from core.llms.providers.azure.base_implementation import AzureBaseLLM
+from core.llms.providers.base.connector import BaseConnector
+from core.llms.runtimes.handlers import BasicStructuredHandler
+from core.llms.runtimes.transformers import AzureGPT4Transformer
+from core.llms.spec import LLMRequestState, ModelMetadata, OutputConfig, ResponseMode, create_context
+
+
+CONCURRENT_CALLS = 300
+
+
+class Weather(BaseModel):
+    city: str
+    request_id: int
+
+
+class Invoice(BaseModel):
+    total: float
+    request_id: int
+
+
+class Ticket(BaseModel):
+    title: str
+    priority: int
+    request_id: int
+
+
+SCHEMAS = [Weather, Invoice, Ticket]
+
+SAMPLE_VALUES = {
+    "city": "Paris",
+    "total": 12.5,
+    "title": "Broken build",
+    "priority": 2,
+}
+
+
+class SchemaEchoConnector(BaseConnector):
+    """
+    Connector that answers with JSON for the schema in the payload
+    (plain text without one).
+
+    Sleeps a random amount before answering so calls interleave.
+    """
+
+    def __init__(self):
+        super().__init__({"timeout": 30})
+
+    def _content(self, payload: Dict[str, Any]) -> str:
+        request_id = int(payload["messages"][-1]["content"])
+        if "response_format" not in payload:
+            return f"plain text {request_id}"
+        schema = payload["response_format"]["json_schema"]["schema"]
+        values = {name: SAMPLE_VALUES.get(name) for name in schema["properties"]}
+        values["request_id"] = request_id
+        return json.dumps(values)
+
+    async def request(self, endpoint: str, payload: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        await asyncio.sleep(random.uniform(0, 0.01))
+        return {
+            "choices": [{
+                "message": {"role": "assistant", "content": self._content(payload)},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
+        }
+
+    async def stream_request(self, endpoint: str, payload: Dict[str, Any], **kwargs: Any) -> AsyncIterator[str]:
+        content = self._content(payload)
+        for start in range(0, len(content), 7):
+            await asyncio.sleep(random.uniform(0, 0.002))
+            delta = {"choices": [{"delta": {"content": content[start:start + 7]}}]}
+            yield f"data: {json.dumps(delta)}"
+        yield "data: [DONE]"
+
+    async def test_connection(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def llm():
+    metadata = ModelMetadata(
+        model_name="test-azure-concurrency",
+        display_name="Test Azure Concurrency",
+        provider=LLMProvider.AZURE,
+        model_family=ModelFamily.AZURE_GPT_4_1_MINI,
+        max_context_length=128000,
+        max_output_tokens=1024,
+    )
+    return AzureBaseLLM(metadata=metadata, connector=SchemaEchoConnector())
+
+
+def _call_args(request_id: int):
+    schema = SCHEMAS[request_id % len(SCHEMAS)]
+    messages = [{"role": "user", "content": str(request_id)}]
+    output_config = OutputConfig(response_format=schema, response_mode=ResponseMode.STRICT)
+    return schema, messages, output_config
+
+
+class TestAzureBaseLLMConcurrency:
+    """Stress tests for one AzureBaseLLM shared by many coroutines."""
+
+    async def test_concurrent_get_answer_uses_own_schema(self, llm):
+        async def call(request_id: int):
+            schema, messages, output_config = _call_args(request_id)
+            response = await llm.get_answer(messages, create_context(), output_config=output_config)
+            return schema, request_id, response
+
+        results = await asyncio.gather(*(call(i) for i in range(CONCURRENT_CALLS)))
+
+        for schema, request_id, response in results:
+            output = response.metadata["structured_output"]
+            assert type(output) is schema
+            assert output.request_id == request_id
+            assert response.metadata["parse_attempts"] == 1
+
+    async def test_concurrent_stream_answer_uses_own_schema(self, llm):
+        async def call(request_id: int):
+            schema, messages, output_config = _call_args(request_id)
+            chunks = [
+                chunk async for chunk in
+                llm.stream_answer(messages, create_context(), output_config=output_config)
+            ]
+            return schema, request_id, chunks[-1]
+
+        results = await asyncio.gather(*(call(i) for i in range(CONCURRENT_CALLS)))
+
+        for schema, request_id, final_chunk in results:
+            assert final_chunk.is_final
+            assert final_chunk.metadata["validation_status"] == "success"
+            output = final_chunk.metadata["structured_output"]
+            assert type(output) is schema
+            assert output.request_id == request_id
+
+    async def test_mixed_text_and_structured_calls(self, llm):
+        """Plain text calls running alongside structured ones stay plain."""
+        async def structured(request_id: int):
+            _, messages, output_config = _call_args(request_id)
+            response = await llm.get_answer(messages, create_context(), output_config=output_config)
+            return response.metadata["structured_output"].request_id == request_id
+
+        async def text(request_id: int):
+            messages = [{"role": "user", "content": str(request_id)}]
+            response = await llm.get_answer(messages, create_context())
+            return (
+                response.content == f"plain text {request_id}"
+                and "structured_output" not in response.metadata
+            )
+
+        calls = [structured(i) if i % 2 else text(i) for i in range(CONCURRENT_CALLS)]
+        assert all(await asyncio.gather(*calls))
+
+
+class TestStructuredHandlerRequestState:
+    """BasicStructuredHandler keeps the resolved schema on the request state."""
+
+    def test_schema_stored_on_state_not_handler(self):
+        handler = BasicStructuredHandler()
+        weather = LLMRequestState(output_config=OutputConfig(response_format=Weather))
+        invoice = LLMRequestState(output_config=OutputConfig(response_format=Invoice))
+
+        handler.prepare_request({}, weather.output_config, state=weather)
+        handler.prepare_request({}, invoice.output_config, state=invoice)
+
+        assert weather.response_schema is Weather
+        assert invoice.response_schema is Invoice
+        assert handler.get_response_schema() is None
+
+        result = handler.validate_output('{"city": "Oslo", "request_id": 1}', weather.output_config, state=weather)
+        assert isinstance(result.parsed_output, Weather)
+
+
+class TestTransformerIsStateless:
+    """AzureGPT4Transformer is shared by concurrent calls and keeps no per-call state."""
+
+    def test_transform_leaves_transformer_unchanged(self):
+        transformer = AzureGPT4Transformer()
+        before = dict(vars(transformer))
+
+        weather = transformer.transform({"response_format": Weather}, metadata=None)
+        invoice = transformer.transform({"response_format": Invoice}, metadata=None)
+
+        assert vars(transformer) == before
+        assert weather["response_format"]["json_schema"]["name"] != invoice["response_format"]["json_schema"]["name"]
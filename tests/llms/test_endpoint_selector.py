@@ -0,0 +1,278 @@
+"""
+Tests for health-scored Azure endpoint selection.
+
+Covers:
+- EndpointSelector scoring, cooldowns and hedge delays
+- AzureConnector routing by score, 429 handling and hedging
+- Endpoint scores in get_backup_status()
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.llms.exceptions import ProviderError, RateLimitError, ServiceUnavailableError
+from core.llms.providers.azure import AzureConnector, EndpointSelector
+from utils.http import PooledTransport
+
+
+class TestEndpointSelector:
+    """Tests for EndpointSelector."""
+
+    def test_unsampled_endpoints_keep_config_order(self):
+        selector = EndpointSelector(["a", "b", "c"])
+        assert selector.select() == 0
+        assert selector.select(exclude=[0]) == 1
+        assert selector.select(exclude=[0, 1, 2]) is None
+
+    def test_prefers_lower_latency(self):
+        selector = EndpointSelector(["a", "b"])
+        for _ in range(5):
+            selector.record_success(0, 0.9)
+            selector.record_success(1, 0.2)
+        assert selector.select() == 1
+
+    def test_errors_penalize(self):
+        selector = EndpointSelector(["a", "b"])
+        selector.record_success(0, 0.2)
+        selector.record_failure(0)
+        selector.record_success(1, 0.3)
+        assert selector.select() == 1
+
+    def test_in_flight_spreads_load(self):
+        """A busy endpoint loses to an idle one with similar latency."""
+        selector = EndpointSelector(["a", "b"])
+        selector.record_success(0, 0.2)
+        for _ in range(3):
+            selector.start(0)
+        assert selector.select() == 1
+        for _ in range(3):
+            selector.finish(0)
+        assert selector.select() == 0
+
+    def test_throttle_cooldown(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("core.llms.providers.azure.endpoint_selector.time.monotonic", lambda: now[0])
+        selector = EndpointSelector(["a", "b"])
+        selector.record_throttle(0, retry_after_s=30)
+        selector.record_throttle(1, retry_after_s=10)
+
+        # All endpoints cooling down: the one that recovers first
+        assert selector.select() == 1
+        now[0] += 11
+        assert selector.select() == 1
+        now[0] += 20
+        assert selector.select() == 0
+
+    def test_consecutive_failures_cool_down(self):
+        selector = EndpointSelector(["a", "b"], failure_threshold=2)
+        selector.record_failure(0)
+        assert selector.endpoints[0].cooldown_until == 0.0
+        selector.record_failure(0)
+        assert selector.select() == 1
+
+    def test_hedge_delay_requires_samples(self):
+        selector = EndpointSelector(["a"], hedge_min_samples=3)
+        selector.record_success(0, 0.1)
+        assert selector.hedge_delay(0) is None
+        selector.record_success(0, 0.2)
+        selector.record_success(0, 0.3)
+        assert selector.hedge_delay(0) == 0.3
+
+    def test_status(self):
+        selector = EndpointSelector(["a", "b"])
+        selector.record_success(0, 0.25)
+        status = selector.status()
+        assert [s["endpoint"] for s in status] == ["a", "b"]
+        assert status[0]["p50_ms"] == 250.0
+        assert status[1]["samples"] == 0 and status[1]["available"]
+
+
+def make_app(status: int = 200, delay_s: float = 0.0, retry_after: str = None, break_stream: bool = False):
+    seen = []
+
+    async def handler(request):
+        seen.append(request.headers.get("api-key"))
+        await asyncio.sleep(delay_s)
+        if break_stream:
+            response = web.StreamResponse()
+            await response.prepare(request)
+            await response.write(b"data: partial\n")
+            await asyncio.sleep(0.05)
+            request.transport.close()
+            return response
+        if status == 429:
+            return web.Response(status=429, headers={"Retry-After": retry_after} if retry_after else {})
+        if status != 200:
+            return web.Response(status=status)
+        return web.json_response({"served_by": request.headers.get("api-key")})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app, seen
+
+
+@pytest.fixture
+async def servers():
+    started = []
+
+    async def start(**kwargs):
+        app, seen = make_app(**kwargs)
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
+        started.append(server)
+        return str(server.make_url("")).rstrip("/"), seen
+
+    yield start
+    for server in started:
+        await server.close()
+
+
+async def make_connector(primary, backup, **config):
+    connector = AzureConnector({
+        "api_key": "primary",
+        "endpoint": primary,
+        "deployment_name": "gpt",
+        "backups": [{"endpoint": backup, "api_key": "backup"}],
+        "endpoint_selection": "health_scored",
+        **config,
+    })
+    connector._transport = PooledTransport()
+    return connector
+
+
+class TestConnectorSelection:
+    """AzureConnector with health-scored selection."""
+
+    async def test_throttled_endpoint_is_skipped(self, servers):
+        """A 429 fails over and keeps the endpoint out until Retry-After."""
+        primary, primary_seen = await servers(status=429, retry_after="60")
+        backup, _ = await servers()
+        connector = await make_connector(primary, backup)
+        try:
+            assert (await connector.request("chat/completions", {}))["served_by"] == "backup"
+            assert (await connector.request("chat/completions", {}))["served_by"] == "backup"
+            assert len(primary_seen) == 1
+
+            status = connector.get_backup_status()
+            assert status["selection_strategy"] == "health_scored"
+            primary_score = status["endpoint_scores"][0]
+            assert primary_score["type"] == "primary"
+            assert not primary_score["available"]
+            assert primary_score["cooldown_remaining_s"] > 50
+            assert status["endpoint_scores"][1]["samples"] == 2
+        finally:
+            await connector._transport.close()
+
+    async def test_no_failover_raises(self, servers):
+        primary, _ = await servers(status=429)
+        backup, _ = await servers()
+        connector = await make_connector(primary, backup)
+        try:
+            with pytest.raises(RateLimitError):
+                await connector.request("chat/completions", {}, auto_failover=False)
+        finally:
+            await connector._transport.close()
+
+    async def test_hedges_slow_request(self, servers):
+        """A request slower than the endpoint's p95 is hedged to the backup."""
+        primary, primary_seen = await servers(delay_s=1.0)
+        backup, backup_seen = await servers()
+        connector = await make_connector(primary, backup, hedge_requests=True)
+        selector = connector.endpoint_selector
+        for _ in range(selector.hedge_min_samples):
+            selector.record_success(0, 0.01)
+            selector.record_success(1, 0.05)
+        try:
+            result = await asyncio.wait_for(connector.request("chat/completions", {}), timeout=0.8)
+            assert result["served_by"] == "backup"
+            assert len(primary_seen) == 1 and len(backup_seen) == 1
+            assert selector.endpoints[0].in_flight == 0
+        finally:
+            await connector._transport.close()
+
+    async def test_fast_response_beats_hedge_delay(self, servers):
+        """A response inside the hedge delay is returned without a hedge."""
+        primary, primary_seen = await servers()
+        backup, backup_seen = await servers()
+        connector = await make_connector(primary, backup, hedge_requests=True)
+        selector = connector.endpoint_selector
+        for _ in range(selector.hedge_min_samples):
+            selector.record_success(0, 5.0)
+        try:
+            result = await connector.request("chat/completions", {})
+            assert result["served_by"] == "primary"
+            assert len(primary_seen) == 1 and backup_seen == []
+        finally:
+            await connector._transport.close()
+
+    async def test_fast_failure_inside_hedge_delay_fails_over(self, servers):
+        """A failure inside the hedge delay keeps its error and fails over."""
+        primary, _ = await servers(status=503)
+        backup, _ = await servers()
+        connector = await make_connector(primary, backup, hedge_requests=True)
+        selector = connector.endpoint_selector
+        for _ in range(selector.hedge_min_samples):
+            selector.record_success(0, 0.001)
+            selector.record_success(1, 5.0)
+        try:
+            assert (await connector.request("chat/completions", {}))["served_by"] == "backup"
+        finally:
+            await connector._transport.close()
+
+        down, _ = await servers(status=503)
+        connector = await make_connector(primary, down, hedge_requests=True)
+        for _ in range(connector.endpoint_selector.hedge_min_samples):
+            connector.endpoint_selector.record_success(0, 5.0)
+        try:
+            with pytest.raises(ServiceUnavailableError):
+                await connector.request("chat/completions", {})
+        finally:
+            await connector._transport.close()
+
+    async def test_failover_mode_starts_at_current_endpoint(self, servers):
+        primary, primary_seen = await servers()
+        backup, backup_seen = await servers()
+        connector = await make_connector(primary, backup, endpoint_selection="failover")
+        connector.endpoint_selector.record_success(1, 0.001)
+        try:
+            assert (await connector.request("chat/completions", {}))["served_by"] == "primary"
+            assert backup_seen == []
+        finally:
+            await connector._transport.close()
+
+    async def test_failover_is_the_default(self):
+        connector = AzureConnector({
+            "api_key": "primary", "endpoint": "https://primary.example", "deployment_name": "gpt",
+            "backups": [{"endpoint": "https://backup.example"}],
+        })
+        assert connector.get_backup_status()["selection_strategy"] == "failover"
+
+    async def test_stream_broken_after_first_chunk_raises(self, servers):
+        """A stream is not restarted elsewhere once output was yielded."""
+        primary, _ = await servers(break_stream=True)
+        backup, backup_seen = await servers()
+        connector = await make_connector(primary, backup)
+        chunks = []
+        try:
+            with pytest.raises(ProviderError):
+                async for chunk in connector.stream_request("chat/completions", {}):
+                    chunks.append(chunk)
+            assert chunks == ["data: partial\n"]
+            assert backup_seen == []
+        finally:
+            await connector._transport.close()
+
+    async def test_stream_fails_over_by_score(self, servers):
+        primary, _ = await servers(status=503)
+        backup, _ = await servers()
+        connector = await make_connector(primary, backup)
+        try:
+            chunks = [chunk async for chunk in connector.stream_request("chat/completions", {})]
+            assert "backup" in "".join(chunks)
+            assert connector.endpoint_selector.endpoints[0].error_rate == 1.0
+            assert connector.get_current_endpoint_info()["type"] == "backup"
+        finally:
+            await connector._transport.close()
@@ -0,0 +1,192 @@
+"""
+Tests for the LLM response cache.
+
+Covers:
+- Key building (exact vs normalized, deterministic-only)
+- Memory and SQLite backends (TTL, LRU, persistence)
+- AzureBaseLLM integration: cached answers, streamed replay, metrics
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict
+
+import pytest
+from pydantic import BaseModel
+
+from core.llms.enum import CacheKeyMode, LLMProvider, ModelFamily
+from core.llms.providers.azure.base_implementation import AzureBaseLLM
+from core.llms.providers.base.connector import BaseConnector
+from core.llms.runtimes.cache import InMemoryResponseCache, LLMResponseCache, SQLiteResponseCache
+from core.llms.spec import ModelMetadata, OutputConfig, create_context
+
+
+class Route(BaseModel):
+    route: str
+
+
+class CountingConnector(BaseConnector):
+    """Connector answering with a fixed route, counting provider calls."""
+
+    def __init__(self):
+        super().__init__({"timeout": 30})
+        self.deployment_name = "routing"
+        self.requests = 0
+        self.streams = 0
+
+    async def request(self, endpoint: str, payload: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        self.requests += 1
+        return {
+            "choices": [{"message": {"role": "assistant", "content": '{"route": "billing"}'},
+                         "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
+        }
+
+    async def stream_request(self, endpoint: str, payload: Dict[str, Any], **kwargs: Any) -> AsyncIterator[str]:
+        self.streams += 1
+        for piece in ["Hel", "lo", " there"]:
+            yield f"data: {json.dumps({'choices': [{'delta': {'content': piece}}]})}"
+        yield "data: [DONE]"
+
+    async def test_connection(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def connector():
+    return CountingConnector()
+
+
+@pytest.fixture
+def llm(connector):
+    metadata = ModelMetadata(
+        model_name="test-response-cache",
+        display_name="Test Response Cache",
+        provider=LLMProvider.AZURE,
+        model_family=ModelFamily.AZURE_GPT_4_1_MINI,
+        max_context_length=128000,
+        max_output_tokens=1024,
+    )
+    llm = AzureBaseLLM(metadata=metadata, connector=connector)
+    return llm.set_response_cache(LLMResponseCache(InMemoryResponseCache()))
+
+
+MESSAGES = [{"role": "user", "content": "Route: refund for order 42"}]
+
+
+class TestCacheKeys:
+    """Tests for key building."""
+
+    def test_exact_and_normalized_keys(self):
+        spaced = {"messages": [{"role": "user", "content": "  route   this\n"}], "temperature": 0}
+        plain = {"messages": [{"role": "user", "content": "route this"}], "temperature": 0}
+
+        exact = LLMResponseCache()
+        assert exact.make_key("m", spaced) != exact.make_key("m", plain)
+
+        normalized = LLMResponseCache(key_mode=CacheKeyMode.NORMALIZED)
+        assert normalized.make_key("m", spaced) == normalized.make_key("m", plain)
+
+    def test_key_depends_on_model_parameters_and_order_insensitive(self):
+        cache = LLMResponseCache()
+        payload = {"messages": MESSAGES, "temperature": 0, "max_tokens": 10}
+        assert cache.make_key("m", payload) == cache.make_key("m", dict(reversed(payload.items())))
+        assert cache.make_key("m", payload) != cache.make_key("other", payload)
+        assert cache.make_key("m", payload) != cache.make_key("m", {**payload, "max_tokens": 11})
+
+    def test_nondeterministic_requests_bypass(self):
+        cache = LLMResponseCache()
+        assert cache.make_key("m", {"messages": MESSAGES, "temperature": 0.7}) is None
+        assert cache.make_key("m", {"messages": MESSAGES}) is None
+        assert cache.metrics.bypassed == 2
+        assert LLMResponseCache(deterministic_only=False).make_key("m", {"messages": MESSAGES})
+
+
+class TestBackends:
+    """Tests for the storage backends."""
+
+    async def test_memory_lru_and_ttl(self):
+        backend = InMemoryResponseCache(max_entries=2)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")
+        await backend.set("c", 3)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+
+        await backend.set("expired", 1, ttl_seconds=-1)
+        assert await backend.get("expired") is None
+
+    async def test_sqlite_persists_and_expires(self, tmp_path):
+        path = tmp_path / "cache" / "llm.sqlite"
+        backend = SQLiteResponseCache(path)
+        await backend.set("key", {"choices": [1]}, ttl_seconds=60)
+        await backend.set("expired", ["line"], ttl_seconds=-1)
+        backend.close()
+
+        reopened = SQLiteResponseCache(path)
+        assert await reopened.get("key") == {"choices": [1]}
+        assert await reopened.get("expired") is None
+        await reopened.delete("key")
+        assert await reopened.get("key") is None
+        reopened.close()
+
+    async def test_sqlite_prunes_to_max_entries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.llms.runtimes.cache.sqlite_cache.RESPONSE_CACHE_PRUNE_INTERVAL", 5)
+        backend = SQLiteResponseCache(tmp_path / "llm.sqlite", max_entries=3)
+        for i in range(10):
+            await backend.set(f"k{i}", i)
+        assert len(backend) == 3
+        assert await backend.get("k9") == 9
+        backend.close()
+
+
+class TestAzureResponseCaching:
+    """Tests for caching in AzureBaseLLM."""
+
+    async def test_deterministic_answer_served_from_cache(self, llm, connector):
+        output_config = OutputConfig(response_format=Route)
+        first = await llm.get_answer(MESSAGES, create_context(), output_config=output_config, temperature=0)
+        second = await llm.get_answer(MESSAGES, create_context(), output_config=output_config, temperature=0)
+
+        assert connector.requests == 1
+        assert second.metadata["cache_hit"] is True
+        assert second.metadata["structured_output"] == first.metadata["structured_output"] == Route(route="billing")
+        assert llm.response_cache.get_metrics() == {
+            "hits": 1, "misses": 1, "stores": 1, "bypassed": 0, "errors": 0, "hit_rate": 0.5,
+        }
+
+    async def test_nondeterministic_answer_not_cached(self, llm, connector):
+        for _ in range(2):
+            await llm.get_answer(MESSAGES, create_context(), temperature=0.7)
+        assert connector.requests == 2
+        assert llm.response_cache.metrics.bypassed == 2
+
+    async def test_stream_replayed_chunk_by_chunk(self, llm, connector):
+        async def collect():
+            return [chunk async for chunk in llm.stream_answer(MESSAGES, create_context(), temperature=0)]
+
+        live = await collect()
+        replayed = await collect()
+
+        assert connector.streams == 1
+        assert [c.content for c in replayed] == [c.content for c in live] == ["Hel", "lo", " there", ""]
+        assert replayed[-1].is_final
+        assert llm.response_cache.metrics.hits == 1
+
+    async def test_interrupted_stream_not_cached(self, llm, connector):
+        async for _ in llm.stream_answer(MESSAGES, create_context(), temperature=0):
+            break
+        await asyncio.sleep(0)
+        assert llm.response_cache.metrics.stores == 0
+
+    async def test_backend_failure_falls_back_to_provider(self, llm, connector):
+        class BrokenBackend(InMemoryResponseCache):
+            async def get(self, key):
+                raise OSError("disk full")
+
+        llm.set_response_cache(LLMResponseCache(BrokenBackend()))
+        response = await llm.get_answer(MESSAGES, create_context(), temperature=0)
+
+        assert response.content == '{"route": "billing"}'
+        assert llm.response_cache.metrics.errors == 1
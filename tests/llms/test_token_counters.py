@@ -0,0 +1,180 @@
+"""
+Tests for token counters.
+
+Covers:
+- Heuristic counts (unchanged from the previous estimate)
+- Per-content count cache and incremental stream counts
+- History trimming and BaseLLM.fit_messages
+- Factory selection and the tiktoken counter (when installed)
+"""
+
+import pytest
+
+from core.llms.constants import DEFAULT_TIKTOKEN_ENCODING
+from core.llms.enum import LLMProvider, ModelFamily
+from core.llms.providers.azure.base_implementation import AzureBaseLLM
+from core.llms.runtimes.token_counters import (
+    BaseTokenCounter,
+    HeuristicTokenCounter,
+    TIKTOKEN_AVAILABLE,
+    TiktokenTokenCounter,
+    TokenCounterFactory,
+    trim_messages,
+)
+from core.llms.runtimes.token_counters.tiktoken_token_counter import is_encoding_cached
+from core.llms.spec import ModelMetadata
+
+
+class CountingTokenCounter(BaseTokenCounter):
+    """One token per word, recording every tokenized text."""
+
+    def __init__(self):
+        super().__init__()
+        self.tokenized = []
+
+    def count_chunk(self, text):
+        self.tokenized.append(text)
+        return len(text.split())
+
+
+def words(n, word="word"):
+    return " ".join([word] * n)
+
+
+class TestHeuristicTokenCounter:
+    """Tests for the character-based estimate."""
+
+    def test_matches_previous_estimate(self):
+        messages = [
+            {"role": "system", "content": "x" * 10},
+            {"role": "user", "content": [{"type": "text", "text": "y" * 7}, {"type": "image_url"}]},
+        ]
+        # (17 chars // 4) + 2 messages * 4 overhead
+        assert HeuristicTokenCounter().count_messages(messages) == 4 + 8
+
+    def test_stream_counts_total_characters(self):
+        stream = HeuristicTokenCounter().start_stream()
+        for chunk in ["ab", "cd", "ef", "gh"]:
+            stream.add(chunk)
+        assert stream.count == 2
+
+
+class TestBaseTokenCounter:
+    """Tests for caching, streaming and trimming."""
+
+    def test_history_tokenized_once(self):
+        counter = CountingTokenCounter()
+        history = [{"role": "user", "content": words(50, f"turn{i}")} for i in range(3)]
+
+        counter.count_messages(history)
+        counter.count_messages(history + [{"role": "user", "content": words(40)}])
+
+        assert len(counter.tokenized) == 4
+
+    def test_short_texts_not_cached(self):
+        counter = CountingTokenCounter()
+        counter.count_text("hi there")
+        counter.count_text("hi there")
+        assert counter.tokenized == ["hi there", "hi there"]
+
+    def test_stream_counts_each_chunk_once(self):
+        counter = CountingTokenCounter()
+        stream = counter.start_stream()
+        for chunk in ["one two ", "three ", "", "four"]:
+            stream.add(chunk)
+        assert stream.count == 4
+        assert counter.tokenized == ["one two ", "three ", "four"]
+
+    def test_trim_keeps_system_and_last_message(self):
+        counter = CountingTokenCounter()
+        messages = [
+            {"role": "system", "content": words(10)},
+            {"role": "user", "content": words(100)},
+            {"role": "assistant", "content": words(100)},
+            {"role": "user", "content": words(10)},
+        ]
+        trimmed = trim_messages(messages, 40, counter)
+        assert trimmed == [messages[0], messages[3]]
+        assert counter.trim_messages(messages, 10_000) == messages
+
+    def test_trim_drops_tool_results_with_their_call(self):
+        counter = CountingTokenCounter()
+        messages = [
+            {"role": "user", "content": words(20)},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}]},
+            {"role": "tool", "content": words(200), "tool_call_id": "1"},
+            {"role": "assistant", "content": words(5)},
+            {"role": "user", "content": words(5)},
+        ]
+        trimmed = counter.trim_messages(messages, 30)
+        assert [m["role"] for m in trimmed] == ["assistant", "user"]
+
+
+    def test_trim_keeps_call_of_trailing_tool_result(self):
+        counter = CountingTokenCounter()
+        messages = [
+            {"role": "system", "content": words(5)},
+            {"role": "user", "content": words(100)},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}]},
+            {"role": "tool", "content": words(5), "tool_call_id": "1"},
+        ]
+        trimmed = counter.trim_messages(messages, 25)
+        assert [m["role"] for m in trimmed] == ["system", "assistant", "tool"]
+
+    def test_count_chunk_is_abstract(self):
+        with pytest.raises(TypeError):
+            BaseTokenCounter()
+
+
+class TestTokenCounterFactory:
+    """Tests for counter selection."""
+
+    def test_auto_falls_back_to_heuristic(self):
+        counter = TokenCounterFactory.get_counter()
+        cached = TIKTOKEN_AVAILABLE and is_encoding_cached(DEFAULT_TIKTOKEN_ENCODING)
+        assert isinstance(counter, TiktokenTokenCounter if cached else HeuristicTokenCounter)
+        assert TokenCounterFactory.get_counter() is counter
+
+    def test_auto_never_downloads_an_encoding(self, tmp_path, monkeypatch):
+        """Without a locally cached encoding, 'auto' uses the heuristic counter."""
+        monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+        monkeypatch.delitem(TokenCounterFactory._counters, "auto", raising=False)
+        monkeypatch.delitem(TokenCounterFactory._counters, "tiktoken", raising=False)
+
+        assert not is_encoding_cached(DEFAULT_TIKTOKEN_ENCODING)
+        assert isinstance(TokenCounterFactory.get_counter(), HeuristicTokenCounter)
+        assert "tiktoken" not in TokenCounterFactory._counters
+
+    def test_unknown_counter(self):
+        with pytest.raises(ValueError, match="Unknown token counter"):
+            TokenCounterFactory.get_counter("missing")
+
+    def test_tiktoken_counts(self):
+        pytest.importorskip("tiktoken")
+        counter = TiktokenTokenCounter("cl100k_base")
+        assert counter.count_text("hello world") == 2
+        assert counter.count_text("<|endoftext|>") > 1  # Counted as plain text
+
+
+class TestLLMTokenAccounting:
+    """Tests for token counting on BaseLLM."""
+
+    @pytest.fixture
+    def llm(self):
+        metadata = ModelMetadata(
+            model_name="test-token-counter",
+            display_name="Test Token Counter",
+            provider=LLMProvider.AZURE,
+            model_family=ModelFamily.AZURE_GPT_4_1_MINI,
+            max_context_length=100,
+            max_output_tokens=20,
+        )
+        return AzureBaseLLM(metadata=metadata, connector=None).set_token_counter(CountingTokenCounter())
+
+    def test_fit_messages_reserves_output_tokens(self, llm):
+        messages = [{"role": "user", "content": words(50)}, {"role": "user", "content": words(30)}]
+        assert llm.fit_messages(messages) == messages[1:]
+        assert llm.fit_messages(messages, max_output_tokens=1) == messages
+
+    def test_estimate_uses_counter(self, llm):
+        assert llm._estimate_tokens([{"role": "user", "content": words(3)}]) == 3 + 4
@@ -0,0 +1,217 @@
+"""
+Test suite for AsyncLogHandler.
+
+Covers:
+- Records are written by the background writer, in order and in batches
+- Overflow policies of the bounded buffer
+- flush()/close() guarantees, including LoggerAdaptor.shutdown()
+- Selection from handler configuration
+
+Pytest Markers:
+===============
+- logger: All tests in this module
+"""
+
+import io
+import logging
+import threading
+import time
+
+import pytest
+
+from utils.logging import AsyncLogHandler, LoggerAdaptor, OverflowPolicy
+
+
+class SlowHandler(logging.Handler):
+    """Handler that blocks until released, recording what it wrote."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.release_event = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.release_event.wait(5)
+        self.messages.append(record.getMessage())
+
+
+class BlockingStream(io.StringIO):
+    """Stream whose writes block until released, counting writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.release_event = threading.Event()
+        self.writes = 0
+
+    def write(self, text):
+        self.release_event.wait(5)
+        self.writes += 1
+        return super().write(text)
+
+
+def make_record(message, level=logging.INFO, args=None):
+    return logging.LogRecord("async_test", level, __file__, 1, message, args, None)
+
+
+@pytest.mark.logger
+class TestAsyncLogHandler:
+    """Tests for AsyncLogHandler emission."""
+
+    def test_writes_in_order_with_batched_stream_writes(self):
+        """Records queued behind a slow write go out in one write."""
+        stream = BlockingStream()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(logging.Formatter("%(message)s"))
+        handler = AsyncLogHandler(target, batch_size=100)
+
+        for i in range(10):
+            handler.handle(make_record("msg %d", args=(i,)))
+        stream.release_event.set()
+
+        assert handler.flush()
+        assert stream.getvalue().splitlines() == [f"msg {i}" for i in range(10)]
+        assert stream.writes < 10
+        handler.close()
+
+    def test_emit_does_not_wait_for_slow_sink(self):
+        """The caller returns while the sink is still blocked."""
+        target = SlowHandler()
+        handler = AsyncLogHandler(target)
+
+        handler.handle(make_record("first"))
+        handler.handle(make_record("second"))
+        assert target.messages == []
+
+        target.release_event.set()
+        assert handler.flush()
+        assert target.messages == ["first", "second"]
+        handler.close()
+
+    @pytest.mark.parametrize("policy, expected", [
+        (OverflowPolicy.DROP_OLDEST, ["m0", "m3", "m4"]),
+        (OverflowPolicy.DROP_NEWEST, ["m0", "m1", "m2"]),
+        ("block", ["m0", "m3", "m4"]),
+    ])
+    def test_overflow_policies(self, policy, expected):
+        """A full buffer drops per policy; block drops only after its timeout."""
+        target = SlowHandler()
+        handler = AsyncLogHandler(target, capacity=2, overflow_policy=policy,
+                                  batch_size=1, block_timeout_seconds=0.01)
+        handler.handle(make_record("m0"))
+        while handler._buffer:  # Wait until m0 is in flight
+            time.sleep(0.001)
+        for i in range(1, 5):
+            handler.handle(make_record(f"m{i}"))
+
+        target.release_event.set()
+        handler.close()
+        assert target.messages == expected
+        assert handler.dropped == 2
+
+    def test_close_drains_and_closes_target(self):
+        """close() writes everything still buffered, then closes the target."""
+        target = SlowHandler()
+        target.release_event.set()
+        handler = AsyncLogHandler(target)
+        for i in range(50):
+            handler.handle(make_record(f"m{i}"))
+        handler.close()
+        handler.handle(make_record("after close"))
+
+        assert target.messages == [f"m{i}" for i in range(50)]
+
+    def test_level_follows_target(self):
+        """Records below the target level are not written."""
+        target = SlowHandler()
+        target.setLevel(logging.WARNING)
+        target.release_event.set()
+        handler = AsyncLogHandler(target)
+        assert handler.level == logging.WARNING
+
+        handler.handle(make_record("info"))
+        handler.handle(make_record("warn", level=logging.WARNING))
+        handler.close()
+        assert target.messages == ["warn"]
+
+
+@pytest.mark.logger
+class TestAsyncLogHandlerConfig:
+    """Tests for selecting async emission from configuration."""
+
+    def test_async_handler_from_config_flushed_on_shutdown(self, tmp_path):
+        """'async' in a handler config wraps it; shutdown() writes everything."""
+        config = {
+            "backend": "standard",
+            "level": "INFO",
+            "log_directory": str(tmp_path),
+            "handlers": {
+                "file": {"type": "file", "level": "INFO", "filename": "async.log",
+                         "async": {"capacity": 100, "overflow_policy": "block"}},
+            },
+        }
+        logger = LoggerAdaptor("async_config_test", config=config)
+        logger.logger.propagate = False
+        (handler,) = logger.logger.handlers
+        assert isinstance(handler, AsyncLogHandler)
+        assert handler.overflow_policy is OverflowPolicy.BLOCK
+        assert isinstance(handler.target, logging.FileHandler)
+
+        for i in range(20):
+            logger.info(f"line {i}")
+        logger.shutdown()
+
+        assert (tmp_path / "async.log").read_text().splitlines() == [f"line {i}" for i in range(20)]
+        assert not handler._writer.is_alive()
+
+    def test_loggers_share_one_handler_per_sink(self, tmp_path):
+        """Loggers configured with the same sink share one buffer and writer thread."""
+        config = {
+            "backend": "standard",
+            "level": "INFO",
+            "log_directory": str(tmp_path),
+            "handlers": {
+                "console": {"type": "console", "level": "INFO", "async": True},
+                "file": {"type": "file", "level": "INFO", "filename": "shared.log", "async": True},
+            },
+        }
+        threads_before = threading.active_count()
+        loggers = [LoggerAdaptor(f"shared_sink_test_{i}", config=config) for i in range(20)]
+        assert threading.active_count() - threads_before == 2
+
+        console, file_handler = loggers[0].logger.handlers
+        for logger in loggers:
+            logger.logger.propagate = False
+            assert logger.logger.handlers == [console, file_handler]
+            logger.info(f"from {logger.name}")
+
+        for logger in loggers[:-1]:
+            logger.shutdown()
+        assert file_handler._writer.is_alive()
+        loggers[-1].shutdown()
+        assert not file_handler._writer.is_alive()
+        assert len((tmp_path / "shared.log").read_text().splitlines()) == 20
+
+    def test_unknown_handler_type_with_async_is_skipped(self, tmp_path):
+        """An unknown handler type with 'async' is skipped, not wrapped."""
+        config = {
+            "backend": "standard",
+            "level": "INFO",
+            "log_directory": str(tmp_path),
+            "handlers": {
+                "bogus": {"type": "syslog", "level": "INFO", "async": True},
+                "file": {"type": "file", "level": "INFO", "filename": "known.log", "async": True},
+            },
+        }
+        logger = LoggerAdaptor("unknown_async_handler_test", config=config)
+        logger.logger.propagate = False
+        (handler,) = logger.logger.handlers
+        assert isinstance(handler.target, logging.FileHandler)
+        assert logger._create_handler(config["handlers"]["bogus"], {}) is None
+        logger.shutdown()
+
+    def test_async_true_uses_defaults(self):
+        """'async': true wraps with the default settings."""
+        handler = AsyncLogHandler.from_config(logging.NullHandler(), True)
+        assert handler.capacity > 0
+        assert handler.overflow_policy is OverflowPolicy.DROP_OLDEST
+        handler.close()
@@ -21,10 +21,13 @@ Pytest Markers:
 - delayed: All tests in this module
 """
 
+import json
+import threading
 import pytest
 from unittest.mock import Mock, patch
 from queue import Empty
-from utils.logging.DelayedLogger import DelayedLogger
+from utils.logging.DelayedLogger import TRUNCATION_MARKER, DelayedLogger
+from utils.logging.Enum import DelayedOverflowPolicy
 from utils.logging.LoggerAdaptor import LoggerAdaptor
 
 
@@ -385,3 +388,152 @@ class TestDelayedLoggerThreading:
                     dl._worker_thread.join(timeout=2.0)
             except Exception:
                 pass
+
+
+@pytest.mark.delayed
+class TestDelayedLoggerMemoryBudget:
+    """Test cases for queue accounting and the memory budget."""
+
+    @pytest.fixture
+    def budget_logger(self):
+        """Provide a DelayedLogger whose worker does not drain the queue."""
+        logger = Mock(spec=['_log_standard', 'isEnabledFor', 'backend', 'context', 'redaction_manager'])
+        logger.isEnabledFor.return_value = True
+        logger.backend = 'standard'
+        logger.context = {}
+        logger.redaction_manager = None
+        dl = DelayedLogger(logger)
+        dl.delayed_logging_enabled = True
+        with patch.object(DelayedLogger, '_start_worker_thread'):
+            dl._initialize_queue()
+        yield dl
+        dl.delayed_logging_spill_path = None
+        dl.shutdown()
+
+    @staticmethod
+    def logged_messages(dl):
+        return [c.args[1] for c in dl.logger._log_standard.call_args_list]
+
+    @staticmethod
+    def encoded_size(entry):
+        payload = [entry['message'], entry['kwargs'], entry['context']]
+        return len(json.dumps(payload, default=str, ensure_ascii=False).encode('utf-8'))
+
+    def test_exact_byte_accounting(self, budget_logger):
+        """Queued bytes equal the encoded entry sizes and return to zero when drained."""
+        budget_logger.info_delayed("héllo", user_id="123", attempt=2)
+        budget_logger.info_delayed("world")
+
+        entries = list(budget_logger._log_queue.queue)
+        assert budget_logger.get_queue_metrics()['queue_bytes'] == sum(e['size_bytes'] for e in entries)
+        assert entries[0]['size_bytes'] == len('["héllo", {"user_id": "123", "attempt": 2}, {}]'.encode('utf-8'))
+        assert entries[1]['size_bytes'] == self.encoded_size(entries[1])
+
+        budget_logger.flush_delayed_logs()
+        metrics = budget_logger.get_queue_metrics()
+        assert (metrics['queue_depth'], metrics['queue_bytes']) == (0, 0)
+        assert self.logged_messages(budget_logger) == ["héllo", "world"]
+
+    def test_size_check_does_not_touch_queue(self, budget_logger):
+        """Reading the size neither dequeues nor reorders entries."""
+        for i in range(5):
+            budget_logger.info_delayed(f"m{i}")
+        budget_logger._get_queue_size_kb()
+        assert [e['message'] for e in budget_logger._log_queue.queue] == [f"m{i}" for i in range(5)]
+
+    def test_flush_policy_keeps_budget(self, budget_logger):
+        """An entry that does not fit flushes the queue first."""
+        budget_logger.delayed_logging_max_queue_kb = 0.1  # 102 bytes
+        for i in range(10):
+            budget_logger.info_delayed(f"message number {i}")
+            assert budget_logger._queue_bytes <= 102
+
+        budget_logger.flush_delayed_logs()
+        assert self.logged_messages(budget_logger) == [f"message number {i}" for i in range(10)]
+        assert budget_logger.get_queue_metrics()['early_flushes'] > 0
+
+    def test_drop_debug_policy(self, budget_logger):
+        """DEBUG entries are dropped or evicted before anything else."""
+        budget_logger.delayed_logging_max_queue_kb = 0.1
+        budget_logger.delayed_logging_overflow_policy = DelayedOverflowPolicy.DROP_DEBUG
+        for i in range(3):
+            budget_logger.debug_delayed(f"debug entry {i}")
+        budget_logger.info_delayed("info entry")
+        budget_logger.debug_delayed("debug entry 3")
+
+        budget_logger.flush_delayed_logs()
+        logged = self.logged_messages(budget_logger)
+        assert "info entry" in logged and "debug entry 3" not in logged
+        assert budget_logger.get_queue_metrics()['dropped_entries'] == 5 - len(logged)
+
+    def test_spill_policy_preserves_order(self, budget_logger, tmp_path):
+        """Overflow goes to the spill file and is replayed after the queue."""
+        budget_logger.delayed_logging_max_queue_kb = 0.1
+        budget_logger.delayed_logging_overflow_policy = DelayedOverflowPolicy.SPILL
+        budget_logger.delayed_logging_spill_path = str(tmp_path / "spill.jsonl")
+        for i in range(10):
+            budget_logger.info_delayed(f"message number {i}")
+
+        metrics = budget_logger.get_queue_metrics()
+        assert metrics['queue_bytes'] <= 102
+        assert metrics['spilled_entries'] == metrics['spill_pending'] > 0
+
+        budget_logger.flush_delayed_logs()
+        assert self.logged_messages(budget_logger) == [f"message number {i}" for i in range(10)]
+        assert budget_logger.get_queue_metrics()['spill_pending'] == 0
+
+    def test_oversized_entry_truncated_or_dropped(self, budget_logger):
+        """An entry larger than the whole budget is truncated to fit, or dropped."""
+        budget_logger.delayed_logging_max_queue_kb = 0.1
+        budget_logger.info_delayed("x" * 1000)
+        budget_logger.info_delayed("y", blob="z" * 1000)
+
+        assert budget_logger._queue_bytes <= 102
+        budget_logger.flush_delayed_logs()
+        (message,) = self.logged_messages(budget_logger)
+        assert message.startswith("xxx") and message.endswith(TRUNCATION_MARKER)
+        metrics = budget_logger.get_queue_metrics()
+        assert (metrics['truncated_entries'], metrics['dropped_entries']) == (1, 1)
+
+    def test_non_string_kwargs_accounted_in_full(self, budget_logger):
+        """Large lists, nested dicts and other objects count their encoded size."""
+        budget_logger.info_delayed("list", items=list(range(100_000)))
+        budget_logger.info_delayed("nested", payload={"a": {"b": ["é" * 1000, {"c": 1.5}]}})
+        budget_logger.info_delayed("object", value=object())
+
+        entries = list(budget_logger._log_queue.queue)
+        assert [e['size_bytes'] for e in entries] == [self.encoded_size(e) for e in entries]
+        assert entries[0]['size_bytes'] > 500_000
+        assert entries[1]['size_bytes'] > 2000  # "é" is two bytes in UTF-8
+
+    def test_large_non_string_kwargs_respect_budget(self, budget_logger):
+        """Non-string kwargs that do not fit the budget are not queued."""
+        budget_logger.delayed_logging_max_queue_kb = 1
+        for _ in range(5):
+            budget_logger.info_delayed("rows", rows=[{"id": i} for i in range(1000)])
+            assert budget_logger._queue_bytes <= 1024
+        assert budget_logger.get_queue_metrics()['dropped_entries'] == 5
+
+    def test_budget_holds_under_concurrent_logging(self, budget_logger):
+        """Concurrent producers never push the queue past the ceiling."""
+        budget_logger.delayed_logging_max_queue_kb = 0.5
+
+        def produce(n):
+            for i in range(200):
+                budget_logger.info_delayed(f"thread {n} message {i}")
+
+        threads = [threading.Thread(target=produce, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert budget_logger.get_queue_metrics()['peak_queue_bytes'] <= 512
+        budget_logger.flush_delayed_logs()
+        assert len(self.logged_messages(budget_logger)) == 1600
+
+    def test_budget_from_config(self):
+        dl = DelayedLogger(Mock())
+        dl.configure({"delayed_logging": {"enabled": False, "max_queue_kb": 64, "overflow_policy": "spill"}})
+        assert dl.delayed_logging_max_queue_kb == 64
+        assert dl.delayed_logging_overflow_policy is DelayedOverflowPolicy.SPILL
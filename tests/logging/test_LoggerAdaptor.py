@@ -38,10 +38,11 @@ Pytest Markers:
 
 import pytest
 import json
+import logging
 import os
 import tempfile
 from unittest.mock import Mock, patch, mock_open
-from utils.logging.LoggerAdaptor import LoggerAdaptor
+from utils.logging.LoggerAdaptor import LoggerAdaptor, lazy
 from utils.logging.Enum import Environment, LoggingFormat, RedactionConfig
 
 
@@ -1065,6 +1066,51 @@ class TestLoggerAdaptor:
     # LoggerAdaptor only provides the log_duration method for direct duration logging
 
 
+@pytest.mark.logger
+class TestLevelGating:
+    """Tests for level-gated and lazy logging."""
+
+    @pytest.fixture
+    def gated_logger(self):
+        """Logger at DEBUG whose only handler accepts INFO, as in the prod config."""
+        config = {"backend": "json", "level": "DEBUG", "handlers": {}}
+        logger = LoggerAdaptor("gating_test", config=config)
+        # Standalone logger: no handlers leaked from other tests or the root
+        logger.logger = logging.Logger("gating_test", logging.DEBUG)
+        handler = logging.NullHandler()
+        handler.setLevel(logging.INFO)
+        logger.logger.addHandler(handler)
+        return logger
+
+    def test_handler_levels_gate_records(self, gated_logger):
+        """A level below every handler is disabled even if the logger allows it."""
+        assert gated_logger.logger.isEnabledFor(logging.DEBUG)
+        assert not gated_logger.isEnabledFor("DEBUG")
+        assert gated_logger.isEnabledFor("INFO")
+        assert gated_logger.isEnabledFor(logging.ERROR)
+
+    def test_disabled_call_does_no_work(self, gated_logger):
+        """Disabled calls skip formatting and never evaluate lazy values."""
+        compute = Mock(return_value="expensive")
+        with patch.object(gated_logger, '_emit') as mock_emit:
+            gated_logger.debug("Executing tool", result=lazy(compute))
+            mock_emit.assert_not_called()
+        compute.assert_not_called()
+
+    def test_lazy_values_resolved_when_emitted(self, gated_logger):
+        """Enabled calls receive the computed values."""
+        with patch.object(gated_logger, '_emit') as mock_emit:
+            gated_logger.info(lazy(lambda: "done"), result=lazy(lambda: 42), tool="x")
+            mock_emit.assert_called_once_with('INFO', "done", result=42, tool="x")
+
+    def test_no_handlers_uses_last_resort_level(self):
+        """Without handlers only records the last-resort handler accepts are enabled."""
+        logger = LoggerAdaptor("gating_no_handlers", config={"backend": "standard", "level": "DEBUG"})
+        logger.logger = logging.Logger("gating_no_handlers", logging.DEBUG)
+        assert not logger.isEnabledFor("INFO")
+        assert logger.isEnabledFor("WARNING")
+
+
 @pytest.mark.logger
 class TestLoggingFormat:
     """Test cases for LoggingFormat enum."""
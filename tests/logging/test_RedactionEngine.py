@@ -0,0 +1,138 @@
+"""
+Test suite for RedactionEngine and RedactionManager key rules.
+
+Covers:
+- Same result as chained substitution, including overlapping prod patterns
+- Literal/digit prefilter
+- Template placeholders
+- Engine rebuild when patterns change, and key-based rules
+
+Pytest Markers:
+===============
+- logger: All tests in this module
+"""
+
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from utils.logging.RedactionEngine import RedactionEngine
+from utils.logging.RedactionManager import RedactionManager
+
+CONFIG = {
+    "enabled": True,
+    "patterns": [
+        {"pattern": r"password=\S+", "placeholder": "password=[HIDDEN]", "flags": ["ignorecase"]},
+        {"pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "placeholder": "[EMAIL]"},
+        {"pattern": r"\b\d{3}-\d{2}-\d{4}\b", "placeholder": "[SSN]"},
+    ],
+}
+
+PROD_CONFIG = json.loads(
+    (Path(__file__).parents[2] / "utils/logging/Config/log_config_prod.json").read_text()
+)["redaction"]
+
+
+def chained(manager, message):
+    """Reference result: one sub() per pattern, last configured first."""
+    for pattern, placeholder in reversed(manager.redaction_patterns):
+        message = pattern.sub(placeholder, message)
+    return message
+
+
+@pytest.mark.logger
+class TestRedactionEngine:
+    """Tests for the prefiltered chained engine."""
+
+    @pytest.mark.parametrize("message, expected", [
+        ("PASSWORD=hunter2 sent to a@b.io", "password=[HIDDEN] sent to [EMAIL]"),
+        ("ssn 123-45-6789", "ssn [SSN]"),
+        ("[redact]secret[/REDACT] ok", "[REDACTED] ok"),
+        ("nothing to see", "nothing to see"),
+    ])
+    def test_matches_chained_substitution(self, message, expected):
+        """Non-overlapping matches give the same result as one sub() per pattern."""
+        manager = RedactionManager(CONFIG)
+        assert manager.redact_message(message) == expected == chained(manager, message)
+
+    @pytest.mark.parametrize("message, expected", [
+        ("password=4111 1111 1111 1111", "password=[HIDDEN]"),
+        ("secret=555 123 4567", "secret=[HIDDEN]"),
+        ("call 555 123 4567 or mail a@b.io", "call [PHONE_REDACTED] or mail [EMAIL_REDACTED]"),
+    ])
+    def test_overlapping_prod_patterns(self, message, expected):
+        """Every pattern sees the output of the previous one, as in chained substitution."""
+        manager = RedactionManager(PROD_CONFIG)
+        assert manager.redact_message(message) == expected == chained(manager, message)
+
+    def test_differential_against_chained_prod_patterns(self):
+        """Random messages built from prod-pattern fragments redact exactly like the chain."""
+        manager = RedactionManager(PROD_CONFIG)
+        fragments = [
+            "password=", "PassWord=", "token=", "api-key=", "apikey=", "secret=", "4111", "1111",
+            "555", "123", "4567", "-", " ", "(", ")", "+1", "a@b.io", "x.y@mail.com", "[redact]",
+            "[/redact]", "12-3456", "ok", "=", "K", "\u212a", "\u0663",
+        ]
+        rng = random.Random(19)
+        for _ in range(5000):
+            message = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            assert manager.redact_message(message) == chained(manager, message), message
+
+    def test_prefilter_skips_regex_work(self):
+        """Strings without any required literal or digit are not scanned."""
+        engine = RedactionManager(CONFIG)._get_engine()
+        assert not engine.might_match("plain status update")
+        assert engine.might_match("Password=x")
+        assert engine.might_match("user@host")
+        assert not engine.might_match("call 555")  # SSN pattern requires "-"
+        assert engine.might_match("call 555-0100")
+        assert engine.might_match("pässword")  # Non-ASCII is always scanned
+
+    def test_unanalyzable_pattern_disables_prefilter(self):
+        """Alternations have no single required literal, so every string is scanned."""
+        engine = RedactionEngine([(re.compile("cat|dog"), "[PET]")])
+        assert engine.might_match("plain")
+        assert engine.redact("hot dog") == "hot [PET]"
+
+    def test_template_placeholders(self):
+        """Backreferences and template placeholders keep their sub() semantics."""
+        engine = RedactionEngine([
+            (re.compile(r"(\w)\1"), "<\\1\\1>"),
+            (re.compile(r"key=(\w+)"), "key=***"),
+        ])
+        assert engine.redact("key=abc ll") == "key=*** <ll>"
+
+
+@pytest.mark.logger
+class TestRedactionManagerKeys:
+    """Tests for engine rebuilds and key rules in RedactionManager."""
+
+    def test_added_pattern_rebuilds_engine(self):
+        manager = RedactionManager(CONFIG)
+        assert manager.redact_message("token=abc") == "token=abc"
+        manager.redaction_patterns.append((re.compile(r"token=\S+"), "token=[HIDDEN]"))
+        assert manager.redact_message("token=abc") == "token=[HIDDEN]"
+
+    def test_key_rules(self):
+        """Safe keys are returned as-is; redact keys are fully replaced."""
+        manager = RedactionManager({**CONFIG, "redact_keys": ["Authorization"]})
+        data = {
+            "trace_id": "123-45-6789",
+            "timestamp": 1700000000,
+            "authorization": "Bearer abc",
+            "details": {"contact": "a@b.io", "Request_ID": "a@b.io"},
+        }
+
+        assert manager.redact_data(data) == {
+            "trace_id": "123-45-6789",
+            "timestamp": 1700000000,
+            "authorization": "[REDACTED]",
+            "details": {"contact": "[EMAIL]", "Request_ID": "a@b.io"},
+        }
+
+    def test_safe_keys_configurable(self):
+        manager = RedactionManager({**CONFIG, "safe_keys": []})
+        assert manager.redact_data({"trace_id": "123-45-6789"}) == {"trace_id": "[SSN]"}
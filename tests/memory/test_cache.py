@@ -0,0 +1,163 @@
+"""
+Tests for the in-process cache implementations.
+
+Covers:
+- LRUCache eviction, TTL expiry, set_if_absent, locks and stats
+- TieredCache read-through, write-through and L1 TTL bounding
+- CacheFactory registration
+"""
+
+import asyncio
+
+import pytest
+
+from core.memory import CacheFactory, LRUCache, TieredCache
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    async def test_get_set_delete(self):
+        cache = LRUCache()
+        await cache.set("a", {"v": 1})
+        assert await cache.get("a") == {"v": 1}
+        await cache.delete("a")
+        assert await cache.get("a") is None
+
+    async def test_evicts_least_recently_used(self):
+        """Reading an entry protects it from eviction."""
+        cache = LRUCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    async def test_ttl_expiry(self, monkeypatch):
+        """Entries expire after their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("core.memory.cache.lru_cache.time.monotonic", lambda: now[0])
+        cache = LRUCache(default_ttl_s=10)
+        await cache.set("default", 1)
+        await cache.set("short", 2, ttl_s=1)
+
+        now[0] += 5
+        assert await cache.get("short") is None
+        assert await cache.get("default") == 1
+        now[0] += 10
+        assert await cache.get("default") is None
+        assert len(cache) == 0
+
+    async def test_set_if_absent(self):
+        cache = LRUCache()
+        assert await cache.set_if_absent("k", 1)
+        assert not await cache.set_if_absent("k", 2)
+        assert await cache.get("k") == 1
+
+    async def test_lock_serializes_and_is_released(self):
+        """Lock holders for one key run one at a time; locks are dropped after use."""
+        cache = LRUCache()
+        active, peak = [0], [0]
+
+        async def worker():
+            async with cache.lock("res"):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.001)
+                active[0] -= 1
+
+        await asyncio.gather(*(worker() for _ in range(5)))
+        assert peak[0] == 1
+        assert cache._locks == {}
+
+    async def test_stats(self):
+        cache = LRUCache()
+        await cache.set("a", 1)
+        await cache.get("a")
+        await cache.get("missing")
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
+
+
+class TestTieredCache:
+    """Tests for TieredCache."""
+
+    async def test_read_through_populates_l1(self):
+        remote = LRUCache()
+        await remote.set("k", "v")
+        cache = TieredCache(remote=remote)
+
+        assert await cache.get_local("k") is None
+        assert await cache.get("k") == "v"
+        assert await cache.get_local("k") == "v"
+
+    async def test_write_through_and_delete(self):
+        remote = LRUCache()
+        cache = TieredCache(remote=remote)
+        await cache.set("k", "v", ttl_s=3600)
+        assert await remote.get("k") == "v"
+        assert await cache.get_local("k") == "v"
+
+        await cache.delete("k")
+        assert await remote.get("k") is None
+        assert await cache.get("k") is None
+
+    async def test_l1_ttl_is_bounded(self, monkeypatch):
+        """L1 never serves a value longer than l1_ttl_s."""
+        now = [1000.0]
+        monkeypatch.setattr("core.memory.cache.lru_cache.time.monotonic", lambda: now[0])
+        cache = TieredCache(remote=LRUCache(), l1_ttl_s=5)
+        await cache.set("k", "v", ttl_s=3600)
+
+        now[0] += 6
+        assert await cache.get_local("k") is None
+        assert await cache.get("k") == "v"
+
+    async def test_l2_hit_not_kept_in_l1_past_remote_ttl(self, monkeypatch):
+        """L2 hits are mirrored for at most the entry's remaining TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("core.memory.cache.lru_cache.time.monotonic", lambda: now[0])
+        remote = LRUCache()
+        await remote.set("k", "v", ttl_s=10)
+        cache = TieredCache(remote=remote, l1_ttl_s=60)
+
+        now[0] += 8
+        assert await cache.get("k") == "v"
+        assert await cache.get_local("k") == "v"
+        now[0] += 3
+        assert await cache.get_local("k") is None
+        assert await cache.get("k") is None
+
+    async def test_l2_hit_without_get_ttl_not_mirrored(self):
+        class PlainCache(LRUCache):
+            get_ttl = None
+
+        remote = PlainCache()
+        await remote.set("k", "v")
+        cache = TieredCache(remote=remote)
+        assert await cache.get("k") == "v"
+        assert await cache.get_local("k") is None
+
+    async def test_set_if_absent_decided_by_remote(self):
+        remote = LRUCache()
+        await remote.set("k", "remote")
+        cache = TieredCache(remote=remote)
+        assert not await cache.set_if_absent("k", "local")
+        assert await cache.get_local("k") is None
+        assert await cache.set_if_absent("new", 1)
+        assert await cache.get_local("new") == 1
+
+
+class TestCacheFactory:
+    """CacheFactory exposes the LRU cache."""
+
+    def test_lru_registered(self):
+        assert isinstance(CacheFactory.get_cache("lru"), LRUCache)
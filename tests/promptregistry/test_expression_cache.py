@@ -0,0 +1,142 @@
+"""
+Tests for compiled and cached SafeExpressionEvaluator expressions.
+
+Covers:
+- Process-wide LRU cache with hit/miss stats
+- Constant folding (and what must not be folded)
+- Parity with node-by-node evaluation, including errors
+"""
+
+import ast
+
+import pytest
+
+from core.promptregistry.runtimes import ExpressionError, SafeExpressionEvaluator
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    SafeExpressionEvaluator.clear_cache()
+    yield
+    SafeExpressionEvaluator.clear_cache()
+
+
+def walk(expression, context):
+    """Evaluate with the reference tree walker."""
+    return SafeExpressionEvaluator(context)._walk(ast.parse(expression, mode="eval"))
+
+
+class TestExpressionCache:
+    """Tests for the compiled expression cache."""
+
+    def test_repeated_evaluation_hits_cache(self):
+        """Each distinct expression is compiled once."""
+        for days in range(5):
+            SafeExpressionEvaluator({"days": days}).evaluate("days > 2")
+
+        stats = SafeExpressionEvaluator.get_cache_stats()
+        assert (stats["misses"], stats["hits"], stats["size"]) == (1, 4, 1)
+
+    def test_syntax_errors_are_cached(self):
+        """Invalid expressions raise every time without re-parsing."""
+        for _ in range(2):
+            with pytest.raises(ExpressionError, match="Invalid expression syntax"):
+                SafeExpressionEvaluator().evaluate("a ==")
+        assert SafeExpressionEvaluator.get_cache_stats()["misses"] == 1
+
+    def test_blank_expression_is_false(self):
+        """Blank expressions are not cached and evaluate to False."""
+        assert SafeExpressionEvaluator.compile("  ") is None
+        assert SafeExpressionEvaluator().evaluate("") is False
+
+
+class TestConstantFolding:
+    """Tests for compile-time folding."""
+
+    @pytest.mark.parametrize("expression, value", [
+        ("1 + 2 * 3", 7),
+        ("len('abc') > 2 and 'yes'", "yes"),
+        ("(1, 'a')[1]", "a"),
+        ("'x' if 2 > 1 else y", "x"),
+    ])
+    def test_constant_expressions_fold(self, expression, value):
+        compiled = SafeExpressionEvaluator.compile(expression)
+        assert compiled.is_constant
+        assert compiled({}) == value
+
+    def test_mutable_results_are_not_shared(self):
+        """List literals are rebuilt per evaluation."""
+        compiled = SafeExpressionEvaluator.compile("[1, 2]")
+        assert not compiled.is_constant
+        assert compiled({}) is not compiled({})
+
+    @pytest.mark.parametrize("expression, value", [
+        ("False and 9 ** 9 ** 8", False),
+        ("True or 'a' * 10 ** 8", True),
+        ("1 if True else 'a' * 10 ** 8", 1),
+        ("(0 and 1 << 10 ** 9) or 'ok'", "ok"),
+    ])
+    def test_skipped_operands_not_computed(self, expression, value):
+        """Compiling does no work that evaluation would short-circuit."""
+        assert SafeExpressionEvaluator({}).evaluate(expression) == value
+
+    @pytest.mark.parametrize("expression", [
+        "9 ** 9 ** 8",
+        "'ab' * 10 ** 6",
+        "1 << 10 ** 6",
+        "str(2 ** 5000)",
+        "not (True and not False)",
+    ])
+    def test_unbounded_results_left_to_runtime(self, expression):
+        """Size-growing operations beyond the caps are not folded."""
+        assert not SafeExpressionEvaluator.compile(expression).is_constant
+
+    def test_failing_constants_raise_when_reached(self):
+        """A constant error is not folded and respects short-circuiting."""
+        evaluator = SafeExpressionEvaluator({"ok": True})
+        assert evaluator.evaluate("ok or 1 / 0") is True
+        with pytest.raises(ExpressionError, match="division by zero"):
+            evaluator.evaluate("not ok or 1 / 0")
+
+
+class TestParity:
+    """Compiled closures behave like the node-by-node evaluator."""
+
+    CONTEXT = {"user": {"name": "Alice", "age": 30}, "tags": ["a"], "s": "ab", "n": 0}
+
+    @pytest.mark.parametrize("expression", [
+        "user['age'] >= 18 and user['name'] == 'Alice'",
+        "user.name",
+        "missing or n",
+        "1 < n < 3",
+        "'a' in tags and s.upper() == 'AB'",
+        "tags[5]",
+        "min(user['age'], 10) if tags else -1",
+        "{'k': n, 'j': [s]}",
+    ])
+    def test_values_match(self, expression):
+        evaluator = SafeExpressionEvaluator(self.CONTEXT)
+        assert evaluator.evaluate(expression) == walk(expression, self.CONTEXT)
+
+    @pytest.mark.parametrize("expression, message", [
+        ("s._secret", "private attributes"),
+        ("n @ n", "Unsupported operator"),
+        ("(lambda: 1)()", "Unsupported expression type"),
+        ("n()", "Cannot call non-callable"),
+    ])
+    def test_errors_match(self, expression, message):
+        with pytest.raises(ExpressionError, match=message):
+            walk(expression, self.CONTEXT)
+        with pytest.raises(ExpressionError, match=message):
+            SafeExpressionEvaluator(self.CONTEXT).evaluate(expression)
+
+    def test_unsupported_branch_not_reached(self):
+        """Unsupported constructs only fail if evaluation reaches them."""
+        assert SafeExpressionEvaluator({"a": 1}).evaluate("a or (lambda: 1)") == 1
+
+    def test_oversized_expression_keeps_node_budget(self):
+        """Node limits still count only evaluated nodes."""
+        expression = " or ".join(["flag"] + ["x"] * 150)
+        assert SafeExpressionEvaluator({"flag": True}).evaluate(expression) is True
+        with pytest.raises(ExpressionError, match="too complex"):
+            SafeExpressionEvaluator({}).evaluate(expression)
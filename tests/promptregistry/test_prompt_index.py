@@ -0,0 +1,232 @@
+"""
+Tests for the prompt registry secondary index.
+
+Covers:
+- ID lookups, filtered listing and search without a full storage scan
+- Search parity with substring semantics
+- Index maintenance on save/delete
+- Revalidation only when the storage generation changes
+- Persistence and incremental rebuild on startup
+"""
+
+import os
+
+import pytest
+
+from core.promptregistry import (
+    LocalFileStorage,
+    LocalPromptRegistry,
+    PromptEnvironment,
+    PromptIndex,
+    PromptMetadata,
+)
+
+
+class CountingStorage(LocalFileStorage):
+    """File storage that counts loads."""
+
+    def __init__(self, path):
+        super().__init__(str(path))
+        self.loads = 0
+
+    async def load(self, key):
+        self.loads += 1
+        return await super().load(key)
+
+
+class DictStorage:
+    """In-memory storage without change fingerprints."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def save(self, key, data):
+        self.data[key] = data
+
+    async def load(self, key):
+        return self.data.get(key)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def exists(self, key):
+        return key in self.data
+
+    async def list_keys(self, prefix=None):
+        return sorted(k for k in self.data if prefix is None or k.startswith(prefix))
+
+
+def make_registry(path):
+    return LocalPromptRegistry(storage=CountingStorage(path))
+
+
+@pytest.fixture
+async def registry(tmp_path):
+    registry = make_registry(tmp_path)
+    await registry.save_prompt(
+        "greeting", "Hello {name}, welcome!",
+        PromptMetadata(category="user", tags=["support", "en"], description="Friendly greeting"),
+    )
+    await registry.save_prompt(
+        "farewell", "Goodbye and take care.",
+        PromptMetadata(tags=["support"], model_target="gpt-4", environment=PromptEnvironment.DEV),
+    )
+    await registry.save_prompt("router", "Route the ticket to a queue.", PromptMetadata(category="tool"))
+    await registry.rebuild_index()
+    registry.storage.loads = 0
+    return registry
+
+
+class TestPromptIndex:
+    """Tests for PromptIndex lookups."""
+
+    async def test_id_lookup_without_scan(self, tmp_path, registry):
+        """A fresh registry resolves IDs from the persisted index."""
+        entry = await registry.get_prompt_entry("router")
+        prompt_id = entry.versions[0].metadata.id
+
+        reopened = make_registry(tmp_path)
+        assert await reopened._find_label_by_id(prompt_id) == "router"
+        assert reopened.storage.loads == 0
+
+    async def test_list_filters(self, registry):
+        """Filters are answered from the index."""
+        assert await registry.list_prompts() == ["farewell", "greeting", "router"]
+        assert await registry.list_prompts(tags=["support", "en"]) == ["greeting"]
+        assert await registry.list_prompts(category="tool") == ["router"]
+        assert await registry.list_prompts(environment=PromptEnvironment.DEV) == ["farewell"]
+        assert await registry.list_prompts(model="gpt-4") == ["farewell"]
+        assert registry.storage.loads == 0
+
+    @pytest.mark.parametrize("query, expected", [
+        ("greet", ["greeting"]),
+        ("SUPPORT", ["farewell", "greeting"]),
+        ("take care", ["farewell"]),
+        ("care take", []),
+        ("{name}", ["greeting"]),
+        ("", ["farewell", "greeting", "router"]),
+    ])
+    async def test_search_matches_substring_semantics(self, registry, query, expected):
+        """Results equal a case-insensitive substring search."""
+        results = await registry.search_prompts(query)
+        assert [e.label for e in results] == expected
+
+    async def test_search_loads_only_candidates(self, registry):
+        """Only entries containing the query are loaded."""
+        await registry.search_prompts("queue")
+        assert registry.storage.loads == 1
+
+    async def test_search_with_filters(self, registry):
+        """Category and environment narrow the candidates."""
+        assert await registry.search_prompts("support", category="user") != []
+        assert await registry.search_prompts("support", environment=PromptEnvironment.PROD) != []
+        assert await registry.search_prompts("goodbye", environment=PromptEnvironment.PROD) == []
+
+
+class TestIndexMaintenance:
+    """Tests for keeping the index current."""
+
+    async def test_save_and_delete_update_index(self, registry):
+        """New versions and deletions are reflected immediately."""
+        await registry.save_prompt("router", "Escalate urgent tickets.", PromptMetadata(version="1.1.0", tags=["ops"]))
+        assert await registry.list_prompts(tags=["ops"]) == ["router"]
+        assert [e.label for e in await registry.search_prompts("escalate")] == ["router"]
+
+        prompt_id = (await registry.get_prompt_entry("farewell")).versions[0].metadata.id
+        await registry.delete_prompt("farewell")
+        assert await registry.list_prompts(tags=["support"]) == ["greeting"]
+        assert await registry._find_label_by_id(prompt_id) is None
+
+    async def test_startup_reindexes_changed_files_only(self, tmp_path, registry):
+        """Externally edited or removed files are re-indexed on startup."""
+        external = make_registry(tmp_path)
+        await external.storage.save("greeting", {
+            **(await external.storage.load("greeting")), "tags": ["billing"],
+        })
+        await external.storage.delete("router")
+
+        reopened = make_registry(tmp_path)
+        assert await reopened.list_prompts(tags=["billing"]) == ["greeting"]
+        assert await reopened.list_prompts() == ["farewell", "greeting"]
+        assert reopened.storage.loads == 1
+
+    async def test_changes_from_other_registries_are_visible(self, tmp_path, registry):
+        """Reads revalidate the index against storage fingerprints."""
+        other = make_registry(tmp_path)
+        await other.save_prompt("greet", "Hi there.", PromptMetadata(tags=["short"]))
+        prompt_id = (await other.get_prompt_entry("greet")).versions[0].metadata.id
+        await other.delete_prompt("router")
+
+        assert await registry.list_prompts() == ["farewell", "greet", "greeting"]
+        assert await registry._find_label_by_id(prompt_id) == "greet"
+
+    async def test_quiet_storage_is_not_rescanned(self, tmp_path, registry, monkeypatch):
+        """Reads skip the per-file scan until the storage generation changes."""
+        os.utime(tmp_path, ns=(10**18, 10**18))
+        await registry.list_prompts()
+
+        scans = []
+        fingerprints = registry.storage._sync_fingerprints
+        monkeypatch.setattr(registry.storage, "_sync_fingerprints", lambda: scans.append(1) or fingerprints())
+        for _ in range(3):
+            await registry.list_prompts()
+        assert scans == []
+
+        other = make_registry(tmp_path)
+        await other.save_prompt("greet", "Hi there.", PromptMetadata())
+        assert await registry.list_prompts() == ["farewell", "greet", "greeting", "router"]
+        assert len(scans) == 1
+
+    def test_fingerprints_skip_files_deleted_after_listing(self, registry, monkeypatch):
+        """A file removed between listing and stat is left out."""
+        monkeypatch.setattr(registry.storage, "_sync_list_keys", lambda prefix=None: ["gone", "greeting"])
+        assert list(registry.storage._sync_fingerprints()) == ["greeting"]
+
+    async def test_id_miss_rescans_storage_without_fingerprints(self):
+        """Storages without fingerprints are rescanned when an ID is not indexed."""
+        storage = DictStorage()
+        registry = LocalPromptRegistry(storage=storage)
+        await registry.save_prompt("greet", "Hi there.", PromptMetadata())
+        assert await registry.list_prompts() == ["greet"]
+
+        other = LocalPromptRegistry(storage=storage)
+        await other.save_prompt("greet", "Hello there.", PromptMetadata(version="1.1.0"))
+        prompt_id = (await other.get_prompt_entry("greet")).versions[-1].metadata.id
+
+        assert await registry._find_label_by_id(prompt_id) == "greet"
+
+    async def test_index_writes_are_batched(self, registry, monkeypatch):
+        """Consecutive saves write the index at most once per interval."""
+        writes = []
+        save_index = registry.storage.save_index
+
+        async def counting_save_index(data):
+            writes.append(data)
+            await save_index(data)
+
+        monkeypatch.setattr(registry.storage, "save_index", counting_save_index)
+        for i in range(5):
+            await registry.save_prompt(f"bulk_{i}", "Bulk prompt.", PromptMetadata())
+        assert len(writes) <= 1
+
+        await registry.close()
+        assert sorted(writes[-1]["entries"]) == sorted(await registry.list_prompts())
+
+    async def test_metrics_updates_do_not_reindex(self, tmp_path, registry):
+        """Usage recording keeps the index and persists fingerprints on close()."""
+        prompt_id = (await registry.get_prompt_entry("greeting")).versions[0].metadata.id
+        await registry.record_usage(prompt_id, latency_ms=5)
+        await registry.close()
+
+        reopened = make_registry(tmp_path)
+        await reopened.list_prompts()
+        assert reopened.storage.loads == 0
+
+    async def test_rebuild_index(self, registry):
+        """rebuild_index() indexes every stored prompt."""
+        assert await registry.rebuild_index() == 3
+
+    def test_unknown_format_is_ignored(self):
+        """A persisted index from another format version is discarded."""
+        assert PromptIndex.from_dict({"format_version": -1, "entries": {}}) is None
+        assert PromptIndex.from_dict(PromptIndex().to_dict()) is not None
@@ -0,0 +1,95 @@
+"""
+Tests for compiled prompt templates.
+
+Covers:
+- Compilation is shared by content hash and done once per content
+- Conditions are parsed at compile time, not per render
+- Nested and unbalanced conditional blocks
+- Recursive replacement of inserted values
+"""
+
+import pytest
+
+from core.promptregistry import PromptTemplate, PromptVersion
+from core.promptregistry.runtimes import SafeExpressionEvaluator
+from core.promptregistry.runtimes.template_compiler import (
+    clear_template_cache,
+    compile_template,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_template_cache()
+    yield
+    clear_template_cache()
+
+
+class TestCompileCache:
+    """Tests for compile caching."""
+
+    def test_versions_share_compilation(self):
+        """Versions with equal content reuse one compiled template."""
+        first = PromptVersion(version="1.0.0", content="Hi {{name}}")
+        second = PromptVersion(version="1.0.1", content="Hi {{name}}")
+        first.render({"name": "a"})
+        second.render({"name": "b"})
+        assert first.template._compiled is second.template._compiled
+
+    def test_content_change_recompiles(self):
+        """Reassigning content is picked up on the next render."""
+        template = PromptTemplate(content="A {{x}}")
+        assert template.render({"x": 1}) == "A 1"
+        template.content = "B {{x}}"
+        assert template.render({"x": 1}) == "B 1"
+
+    def test_conditions_parsed_once(self, monkeypatch):
+        """Rendering many times does not re-parse conditions."""
+        calls = []
+        original = SafeExpressionEvaluator.compile
+        monkeypatch.setattr(
+            SafeExpressionEvaluator, "compile",
+            staticmethod(lambda expr: calls.append(expr) or original(expr)),
+        )
+        template = PromptTemplate(content="{{#if a > 1}}big{{#else}}small{{#endif}}")
+
+        results = [template.render(context={"a": a}) for a in range(3)]
+
+        assert results == ["small", "small", "big"]
+        assert calls == ["a > 1"]
+
+
+class TestCompiledRendering:
+    """Tests for single-pass rendering semantics."""
+
+    def test_nested_blocks(self):
+        """Inner blocks are evaluated within their outer branch."""
+        template = PromptTemplate(
+            content="{{#if a}}A{{#if b}}B{{#else}}b{{#endif}}!{{#else}}none{{#endif}}"
+        )
+        assert template.render(context={"a": True, "b": False}) == "Ab!"
+        assert template.render(context={"a": False, "b": True}) == "none"
+
+    def test_unbalanced_tags_are_literal(self):
+        """Unterminated or stray tags are kept as text."""
+        compiled = compile_template("x {{#endif}} {{#if a}}y {{v}}")
+        assert compiled.render({"v": 1}, {"a": True}) == "x {{#endif}} {{#if a}}y 1"
+
+    def test_invalid_condition_takes_else_branch(self):
+        """A condition that does not parse behaves as false."""
+        template = PromptTemplate(content="{{#if a ==}}yes{{#else}}no{{#endif}}")
+        assert template.render() == "no"
+
+    def test_strict_missing_variable_raises(self):
+        """Strict rendering still rejects missing variables."""
+        with pytest.raises(ValueError):
+            PromptTemplate(content="{{x}}").render({})
+        assert PromptTemplate(content="{{x}}").render({}, strict=False) == "{{x}}"
+
+    def test_recursive_values_are_rendered(self):
+        """Inserted values are rendered up to max_recursion_depth levels."""
+        template = PromptTemplate(content="{{a}}", recursive_replace=True, max_recursion_depth=3)
+        assert template.render({"a": "p {{a}}"}, strict=False) == "p p p p {{a}}"
+        assert template.render(
+            {"a": "{{#if on}}{{b}}{{#endif}}", "b": "B"}, context={"on": True}
+        ) == "B"
@@ -0,0 +1,213 @@
+"""
+Tests for batched prompt usage recording.
+
+Covers:
+- UsageDelta / RuntimeMetrics.merge_usage parity with record_usage
+- record_usage() queues instead of writing when batching is enabled
+- Size-threshold, timer and close() flushes
+- Bounded pending prompts and re-queueing of failed saves
+"""
+
+import asyncio
+
+import pytest
+
+from core.promptregistry import (
+    LocalFileStorage,
+    LocalPromptRegistry,
+    PromptMetadata,
+    RuntimeMetrics,
+    UsageDelta,
+)
+
+
+class CountingStorage(LocalFileStorage):
+    """File storage that counts saves and can fail the next N saves."""
+
+    def __init__(self, path):
+        super().__init__(str(path))
+        self.saves = 0
+        self.fail_next = 0
+
+    async def save(self, key, data):
+        if self.fail_next:
+            self.fail_next -= 1
+            raise OSError("disk full")
+        self.saves += 1
+        await super().save(key, data)
+
+
+@pytest.fixture
+async def registry(tmp_path):
+    registry = LocalPromptRegistry(storage=CountingStorage(tmp_path))
+    yield registry
+    await registry.close()
+
+
+async def save_prompt(registry, label="greeting"):
+    prompt_id = await registry.save_prompt(label, "Hello!", PromptMetadata())
+    registry.storage.saves = 0
+    return prompt_id
+
+
+class TestUsageDelta:
+    """Tests for UsageDelta aggregation."""
+
+    def test_merge_matches_per_event_recording(self):
+        """Applying a delta gives the same metrics as recording each event."""
+        direct, batched, delta = RuntimeMetrics(), RuntimeMetrics(), UsageDelta()
+        for i in range(25):
+            event = dict(
+                latency_ms=float(i * 7 % 13), prompt_tokens=i, completion_tokens=2,
+                cost=0.5, success=i % 5 != 0,
+            )
+            direct.record_usage(**event)
+            delta.add(**event)
+        batched.merge_usage(delta)
+
+        assert batched.usage_count == direct.usage_count == 25
+        assert batched.error_count == direct.error_count == 5
+        assert batched.success_rate == direct.success_rate
+        assert batched.latency_samples == direct.latency_samples
+        assert batched.total_tokens_samples == direct.total_tokens_samples
+        assert batched.total_tokens == direct.total_tokens
+        assert batched.p95_latency_ms == direct.p95_latency_ms
+        assert batched.last_prompt_tokens == direct.last_prompt_tokens == 24
+        assert batched.avg_cost == pytest.approx(direct.avg_cost)
+
+    def test_samples_are_bounded(self):
+        """A delta keeps a constant-size sample window."""
+        delta = UsageDelta()
+        for i in range(1000):
+            delta.add(latency_ms=i)
+        assert delta.usage_count == 1000
+        assert delta.latency_samples == [float(i) for i in range(990, 1000)]
+
+
+class TestPromptUsageRecorder:
+    """Tests for registry usage batching."""
+
+    async def test_record_usage_is_deferred(self, registry):
+        """Events are aggregated in memory and written once per flush."""
+        prompt_id = await save_prompt(registry)
+        registry.enable_usage_batching(flush_interval_s=60)
+
+        for _ in range(50):
+            await registry.record_usage(prompt_id, latency_ms=10, prompt_tokens=5)
+        assert registry.storage.saves == 0
+
+        assert await registry.flush_usage() == 50
+        assert registry.storage.saves == 1
+        metrics = await registry.get_runtime_metrics(prompt_id)
+        assert metrics.usage_count == 50
+        assert metrics.total_prompt_tokens == 250
+
+    async def test_one_save_per_label(self, registry):
+        """Several versions of one prompt are flushed with a single save."""
+        first = await save_prompt(registry)
+        second = await registry.save_prompt("greeting", "Hi!", PromptMetadata(model_target="gpt-4"))
+        registry.storage.saves = 0
+        registry.enable_usage_batching(flush_interval_s=60)
+
+        await registry.record_usage(first, latency_ms=1)
+        await registry.record_usage(second, latency_ms=2)
+        await registry.flush_usage()
+
+        assert registry.storage.saves == 1
+        assert (await registry.get_runtime_metrics(second)).usage_count == 1
+
+    async def test_batch_size_triggers_flush(self, registry):
+        """Reaching max_batch_size flushes without waiting for the timer."""
+        prompt_id = await save_prompt(registry)
+        recorder = registry.enable_usage_batching(flush_interval_s=60, max_batch_size=5)
+
+        for _ in range(5):
+            await registry.record_usage(prompt_id)
+        for _ in range(20):
+            if recorder.get_stats()["flushed"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert recorder.get_stats()["flushed"] == 5
+        assert recorder.pending_events == 0
+
+    async def test_timer_flush(self, registry):
+        """The background task flushes on its interval."""
+        prompt_id = await save_prompt(registry)
+        recorder = registry.enable_usage_batching(flush_interval_s=0.02)
+
+        await registry.record_usage(prompt_id)
+        await asyncio.sleep(0.1)
+
+        assert recorder.get_stats()["flushed"] == 1
+        assert registry.storage.saves == 1
+
+    async def test_close_flushes_and_disables_batching(self, registry):
+        """close() persists pending usage; later calls write directly."""
+        prompt_id = await save_prompt(registry)
+        registry.enable_usage_batching(flush_interval_s=60)
+
+        await registry.record_usage(prompt_id)
+        await registry.close()
+        assert registry.storage.saves == 1
+
+        await registry.record_usage(prompt_id)
+        assert registry.storage.saves == 2
+
+    async def test_pending_prompts_are_bounded(self, registry):
+        """Events for prompt IDs beyond the cap are dropped and counted."""
+        first = await save_prompt(registry, "a")
+        second = await save_prompt(registry, "b")
+        recorder = registry.enable_usage_batching(flush_interval_s=60, max_pending_prompts=1)
+
+        await registry.record_usage(first)
+        await registry.record_usage(second)
+
+        assert recorder.get_stats()["dropped"] == 1
+        assert recorder.get_stats()["pending_prompts"] <= 1
+
+    async def test_failed_save_is_requeued(self, registry):
+        """A storage error keeps the batch for the next flush."""
+        prompt_id = await save_prompt(registry)
+        recorder = registry.enable_usage_batching(flush_interval_s=60)
+
+        await registry.record_usage(prompt_id)
+        registry.storage.fail_next = 1
+        assert await registry.flush_usage() == 0
+        assert recorder.pending_events == 1
+
+        await registry.record_usage(prompt_id)
+        assert await registry.flush_usage() == 2
+        assert (await registry.get_runtime_metrics(prompt_id)).usage_count == 2
+
+    async def test_registry_error_requeues_batch(self, registry, monkeypatch):
+        """A batch call that raises keeps every pending delta for the next flush."""
+        prompt_id = await save_prompt(registry)
+        recorder = registry.enable_usage_batching(flush_interval_s=60)
+        await registry.record_usage(prompt_id)
+        await registry.record_usage(prompt_id)
+
+        async def broken_lookup(prompt_id):
+            raise OSError("index unavailable")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(registry, "_find_label_by_id", broken_lookup)
+            with pytest.raises(OSError):
+                await recorder.flush()
+            assert recorder.pending_events == 2
+            await recorder._flush_quietly()  # Logged, not raised
+            assert recorder.get_stats()["failed_flushes"] == 2
+
+        await registry.record_usage(prompt_id)
+        assert await registry.flush_usage() == 3
+        assert (await registry.get_runtime_metrics(prompt_id)).usage_count == 3
+
+    async def test_concurrent_recording(self, registry):
+        """Concurrent callers do not lose updates."""
+        prompt_id = await save_prompt(registry)
+        registry.enable_usage_batching(flush_interval_s=0.01, max_batch_size=7)
+
+        await asyncio.gather(*(registry.record_usage(prompt_id) for _ in range(100)))
+        await registry.close()
+
+        assert (await registry.get_runtime_metrics(prompt_id)).usage_count == 100
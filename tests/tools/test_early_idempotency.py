@@ -0,0 +1,143 @@
+"""
+Test suite for early idempotency cache lookup.
+
+Test Structure:
+===============
+1. TestEarlyIdempotencyLookup - Cache hits served before validation, with authorization
+
+Usage:
+    pytest tests/tools/test_early_idempotency.py -v
+"""
+
+import uuid
+
+import pytest
+
+from core.memory import CacheFactory, LRUCache, TieredCache
+from core.tools.runtimes.executors import FunctionToolExecutor
+from core.tools.spec.tool_context import ToolContext
+from tests.tools.mocks import MockSecurity, MockValidator
+from tests.tools.tool_implementations import create_division_tool_spec
+
+
+ARGS = {"numerator": 10, "denominator": 2}
+
+
+def make_executor(early_cache_lookup: bool = True):
+    calls = []
+
+    async def divide(args):
+        calls.append(args)
+        return {"result": args["numerator"] / args["denominator"]}
+
+    spec = create_division_tool_spec()
+    spec.id = f"tool-division-{uuid.uuid4()}"
+    spec.idempotency.early_cache_lookup = early_cache_lookup
+    return FunctionToolExecutor(spec, divide), calls
+
+
+def make_context(security=None) -> ToolContext:
+    return ToolContext(
+        user_id="user-1",
+        session_id="session-1",
+        memory=TieredCache(remote=LRUCache()),
+        validator=MockValidator(),
+        security=security or MockSecurity(),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEarlyIdempotencyLookup:
+    """Early lookup skips validation for cached calls but keeps authorization."""
+
+    async def test_hit_skips_validation(self):
+        executor, calls = make_executor()
+        ctx = make_context()
+
+        first = await executor.execute(ARGS, ctx)
+        second = await executor.execute(ARGS, ctx)
+
+        assert len(calls) == 1
+        assert second.content == first.content
+        assert len(ctx.validator.validations) == 1
+        assert len(ctx.security.authorizations) == 2
+        assert len(ctx.security.egress_checks) == 1
+
+    async def test_hit_still_requires_authorization(self):
+        executor, calls = make_executor()
+        ctx = make_context()
+        await executor.execute(ARGS, ctx)
+
+        ctx.security = MockSecurity(should_fail_auth=True)
+        result = await executor.execute(ARGS, ctx)
+
+        assert "Authorization failed" in result.content["error"]
+        assert len(calls) == 1
+
+    async def test_remote_only_hit_goes_through_full_flow(self):
+        """Values only in the remote tier are served after validation."""
+        executor, calls = make_executor()
+        ctx = make_context()
+        await executor.execute(ARGS, ctx)
+        ctx.memory.local.clear()
+
+        await executor.execute(ARGS, ctx)
+        assert len(calls) == 1
+        assert len(ctx.validator.validations) == 2
+
+    async def test_untiered_cache_is_read_once_per_call(self):
+        """Without a local tier the early lookup is skipped, not sent remote."""
+        class RemoteCache:
+            """Cache with no get_local, like a network store."""
+
+            def __init__(self):
+                self.store = LRUCache()
+                self.gets = 0
+
+            async def get(self, key):
+                self.gets += 1
+                return await self.store.get(key)
+
+            async def set(self, key, value, ttl_s=None):
+                await self.store.set(key, value, ttl_s)
+
+            async def set_if_absent(self, key, value, ttl_s=None):
+                return await self.store.set_if_absent(key, value, ttl_s)
+
+            async def delete(self, key):
+                await self.store.delete(key)
+
+            def lock(self, key, ttl_s=10):
+                return self.store.lock(key, ttl_s)
+
+        executor, calls = make_executor()
+        ctx = make_context()
+        ctx.memory = RemoteCache()
+
+        await executor.execute(ARGS, ctx)
+        assert ctx.memory.gets == 1
+        await executor.execute(ARGS, ctx)
+        assert ctx.memory.gets == 2
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("cache_name", ["lru", "tiered"])
+    async def test_factory_caches_serve_early_hits(self, cache_name):
+        """The caches registered in CacheFactory support the early lookup."""
+        executor, calls = make_executor()
+        ctx = make_context()
+        ctx.memory = CacheFactory.get_cache(cache_name)
+
+        await executor.execute(ARGS, ctx)
+        await executor.execute(ARGS, ctx)
+
+        assert len(calls) == 1
+        assert len(ctx.validator.validations) == 1
+
+    async def test_disabled_by_default(self):
+        executor, _ = make_executor(early_cache_lookup=False)
+        ctx = make_context()
+
+        await executor.execute(ARGS, ctx)
+        await executor.execute(ARGS, ctx)
+        assert len(ctx.validator.validations) == 2
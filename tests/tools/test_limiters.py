@@ -0,0 +1,289 @@
+"""
+Test suite for the in-process limiter implementations.
+
+Test Structure:
+===============
+1. TestTokenBucketLimiter - Rate, bursts, per-call limits
+2. TestSlidingWindowLimiter - Calls per rolling window
+3. TestConcurrencyLimiter - In-flight calls per key
+4. TestLimiterKeys - Per-tool/user/tenant keys and the factory
+
+Usage:
+    pytest tests/tools/test_limiters.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.tools import (
+    ConcurrencyLimiter,
+    LimiterKeyScope,
+    NoOpLimiter,
+    SlidingWindowLimiter,
+    TokenBucketLimiter,
+)
+from core.tools.runtimes.limiters import LimiterFactory, resolve_limiter_key
+from core.tools.spec import ToolContext
+from tests.tools.mocks import MockMetrics
+
+
+async def acquire_times(limiter, key, count, limit=None):
+    """Acquire `count` times concurrently; return completion offsets in seconds."""
+    start = time.monotonic()
+    order = []
+
+    async def worker(i):
+        async with limiter.acquire(key, limit=limit):
+            order.append((i, time.monotonic() - start))
+
+    await asyncio.gather(*(worker(i) for i in range(count)))
+    return order
+
+
+@pytest.mark.unit
+@pytest.mark.implementations
+@pytest.mark.asyncio
+class TestTokenBucketLimiter:
+    """Test suite for TokenBucketLimiter."""
+
+    async def test_burst_then_rate(self):
+        """The bucket allows `limit` calls at once, then refills at the rate."""
+        limiter = TokenBucketLimiter(limit=5, period_s=0.1)
+        order = await acquire_times(limiter, "api", 7)
+
+        elapsed = [t for _, t in order]
+        assert max(elapsed[:5]) < 0.015
+        # 2 extra calls at 50 calls/s take ~40ms
+        assert 0.03 <= elapsed[-1] < 0.1
+
+    async def test_fifo_order(self):
+        """Waiters are served in arrival order."""
+        limiter = TokenBucketLimiter(limit=1, period_s=0.01)
+        order = await acquire_times(limiter, "api", 5)
+        assert [i for i, _ in order] == [0, 1, 2, 3, 4]
+
+    async def test_keys_are_independent(self):
+        """Separate keys have separate buckets."""
+        limiter = TokenBucketLimiter(limit=1, period_s=10)
+        async with limiter.acquire("a"):
+            pass
+        start = time.monotonic()
+        async with limiter.acquire("b"):
+            pass
+        assert time.monotonic() - start < 0.01
+
+    async def test_per_call_limit_override(self):
+        """The acquire() limit overrides the default rate for the key."""
+        limiter = TokenBucketLimiter(limit=1, period_s=0.1)
+        order = await acquire_times(limiter, "api", 4, limit=4)
+        assert max(t for _, t in order) < 0.015
+
+    async def test_metrics_and_stats(self):
+        """Acquisitions and throttled waits are counted."""
+        metrics = MockMetrics()
+        limiter = TokenBucketLimiter(limit=1, period_s=0.02, metrics=metrics)
+        await acquire_times(limiter, "api", 3)
+
+        assert metrics.get_incr_count("tool.limiter.acquired") == 3
+        assert metrics.get_incr_count("tool.limiter.throttled") == 2
+        assert len(metrics.timings) == 2
+        stats = limiter.get_stats()
+        assert stats["acquired"] == 3
+        assert stats["throttled"] == 2
+        assert stats["keys"] == 1
+
+    async def test_cancelled_waiter_does_not_consume(self):
+        """A waiter cancelled while throttled leaves its token for the next."""
+        limiter = TokenBucketLimiter(limit=1, period_s=0.05)
+        async with limiter.acquire("api"):
+            pass
+
+        async def wait():
+            async with limiter.acquire("api"):
+                pass
+
+        task = asyncio.create_task(wait())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        start = time.monotonic()
+        await acquire_times(limiter, "api", 1)
+        assert time.monotonic() - start < 0.05
+
+    def test_invalid_limit(self):
+        """Non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(limit=0)
+
+
+@pytest.mark.unit
+@pytest.mark.implementations
+@pytest.mark.asyncio
+class TestSlidingWindowLimiter:
+    """Test suite for SlidingWindowLimiter."""
+
+    async def test_limit_per_window(self):
+        """At most `limit` calls complete within one window."""
+        limiter = SlidingWindowLimiter(limit=3, period_s=0.1)
+        order = await acquire_times(limiter, "api", 5)
+
+        elapsed = sorted(t for _, t in order)
+        assert max(elapsed[:3]) < 0.015
+        assert elapsed[3] >= 0.09
+
+    async def test_fifo_order(self):
+        """Waiters are served in arrival order."""
+        limiter = SlidingWindowLimiter(limit=1, period_s=0.01)
+        order = await acquire_times(limiter, "api", 4)
+        assert [i for i, _ in order] == [0, 1, 2, 3]
+
+    async def test_previous_window_decays(self):
+        """Calls from the previous window count with decaying weight."""
+        limiter = SlidingWindowLimiter(limit=2, period_s=0.1)
+        await acquire_times(limiter, "api", 2)
+        await asyncio.sleep(0.15)
+        # Half of the previous window overlaps: estimate is ~1, one call fits
+        start = time.monotonic()
+        await acquire_times(limiter, "api", 1)
+        assert time.monotonic() - start < 0.015
+
+    async def test_metrics(self):
+        """Throttled acquisitions are reported."""
+        metrics = MockMetrics()
+        limiter = SlidingWindowLimiter(limit=1, period_s=0.02, metrics=metrics)
+        await acquire_times(limiter, "api", 2)
+        assert metrics.get_incr_count("tool.limiter.throttled") == 1
+
+
+@pytest.mark.unit
+@pytest.mark.implementations
+@pytest.mark.asyncio
+class TestConcurrencyLimiter:
+    """Test suite for ConcurrencyLimiter."""
+
+    async def test_caps_in_flight_calls(self):
+        """No more than `limit` blocks run at the same time."""
+        limiter = ConcurrencyLimiter(limit=2)
+        running = 0
+        peak = 0
+
+        async def worker():
+            nonlocal running, peak
+            async with limiter.acquire("api"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        assert peak == 2
+
+    async def test_slot_released_on_error(self):
+        """The slot is released when the block raises."""
+        limiter = ConcurrencyLimiter(limit=1)
+        with pytest.raises(RuntimeError):
+            async with limiter.acquire("api"):
+                raise RuntimeError("boom")
+        await asyncio.wait_for(acquire_times(limiter, "api", 1), timeout=0.1)
+
+    async def test_fifo_order(self):
+        """Waiters are served in arrival order."""
+        limiter = ConcurrencyLimiter(limit=1)
+        order = await acquire_times(limiter, "api", 4)
+        assert [i for i, _ in order] == [0, 1, 2, 3]
+
+
+@pytest.mark.unit
+@pytest.mark.implementations
+@pytest.mark.asyncio
+class TestLimiterEviction:
+    """Bounded key state."""
+
+    async def test_idle_buckets_evicted(self):
+        """Past max_keys, refilled buckets are evicted; draining ones are kept."""
+        slow = TokenBucketLimiter(limit=1, period_s=60, max_keys=2)
+        for key in ("a", "b", "c"):
+            async with slow.acquire(key):
+                pass
+        assert slow.get_stats()["keys"] == 3
+
+        fast = TokenBucketLimiter(limit=1000, period_s=0.001, max_keys=2)
+        for key in ("a", "b"):
+            async with fast.acquire(key):
+                pass
+        await asyncio.sleep(0.01)
+        async with fast.acquire("c"):
+            pass
+        assert fast.get_stats()["keys"] == 2
+
+    async def test_expired_windows_evicted(self):
+        """Windows are evicted once both counted windows have passed."""
+        limiter = SlidingWindowLimiter(limit=5, period_s=0.005, max_keys=1)
+        async with limiter.acquire("a"):
+            pass
+        await asyncio.sleep(0.02)
+        async with limiter.acquire("b"):
+            pass
+        assert limiter.get_stats()["keys"] == 1
+
+    async def test_held_semaphores_kept(self):
+        """Semaphores with callers in flight are never evicted."""
+        limiter = ConcurrencyLimiter(limit=1, max_keys=1)
+        async with limiter.acquire("a"):
+            async with limiter.acquire("b"):
+                assert limiter.get_stats()["keys"] == 2
+        async with limiter.acquire("c"):
+            pass
+        assert limiter.get_stats()["keys"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.implementations
+class TestLimiterLoops:
+    """Shared limiters across event loops."""
+
+    @pytest.mark.parametrize("name", ["token_bucket", "sliding_window", "concurrency"])
+    def test_factory_limiter_usable_from_new_loops(self, name):
+        """Factory singletons keep asyncio state per loop."""
+        limiter = LimiterFactory.get_limiter(name)
+
+        async def use():
+            await asyncio.gather(*(acquire_times(limiter, "loops", 3) for _ in range(2)))
+
+        asyncio.run(use())
+        asyncio.run(use())
+
+
+@pytest.mark.unit
+@pytest.mark.implementations
+class TestLimiterKeys:
+    """Key scoping and factory registration."""
+
+    @pytest.mark.parametrize("scope, expected", [
+        (LimiterKeyScope.TOOL, "search"),
+        (LimiterKeyScope.USER, "search:user:u1"),
+        (LimiterKeyScope.TENANT, "search:tenant:t1"),
+    ])
+    def test_scoped_keys(self, scope, expected):
+        """Executor keys follow the limiter's key scope."""
+        ctx = ToolContext(user_id="u1", tenant_id="t1")
+        limiter = TokenBucketLimiter(key_scope=scope)
+        assert resolve_limiter_key(limiter, "search", ctx) == expected
+
+    def test_unscoped_limiters_get_tool_name(self):
+        """Limiters without a key scope keep receiving the tool name."""
+        ctx = ToolContext(user_id="u1")
+        assert resolve_limiter_key(NoOpLimiter(), "search", ctx) == "search"
+
+    @pytest.mark.parametrize("name, cls", [
+        ("token_bucket", TokenBucketLimiter),
+        ("sliding_window", SlidingWindowLimiter),
+        ("concurrency", ConcurrencyLimiter),
+    ])
+    def test_factory_registration(self, name, cls):
+        """Built-in limiters are available from LimiterFactory."""
+        assert isinstance(LimiterFactory.get_limiter(name), cls)
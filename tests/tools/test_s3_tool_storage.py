@@ -19,8 +19,10 @@ Usage:
     uv run pytest tests/tools/test_s3_tool_storage.py -v -m "not requires_s3"
 """
 
+import io
 import os
 import json
+import time
 import pytest
 from datetime import datetime
 from typing import Dict, Any
@@ -483,5 +485,103 @@ class TestStorageExamples:
         assert "Authorization" in spec_dict["headers"]
 
 
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client calls used by listing and loading."""
+    
+    def __init__(self, tool_ids, prefix="test-tools"):
+        self.objects = {
+            f"{prefix}/{tool_id}/spec.json": json.dumps({"tool_name": tool_id, "description": "d"})
+            for tool_id in tool_ids
+        }
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        self.calls.append(("get_object", Key, IfNoneMatch))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        self.in_flight -= 1
+        body = self.objects[Key]
+        etag = f'"{hash(body)}"'
+        if IfNoneMatch == etag:
+            error = Exception("Not Modified")
+            error.response = {"Error": {"Code": "304"}}
+            raise error
+        return {"Body": io.BytesIO(body.encode("utf-8")), "ETag": etag}
+    
+    def list_objects_v2(self, Bucket, Prefix, Delimiter, MaxKeys, ContinuationToken=None):
+        self.calls.append(("list_objects_v2", ContinuationToken))
+        tool_ids = sorted({key.split("/")[1] for key in self.objects})
+        start = int(ContinuationToken or 0)
+        page = tool_ids[start:start + MaxKeys]
+        truncated = start + MaxKeys < len(tool_ids)
+        return {
+            "CommonPrefixes": [{"Prefix": f"test-tools/{t}/"} for t in page],
+            "IsTruncated": truncated,
+            "NextContinuationToken": str(start + MaxKeys) if truncated else None,
+        }
+    
+    def head_bucket(self, Bucket):
+        self.calls.append(("head_bucket", Bucket))
+
+
+class TestS3StorageListingAndCaching:
+    """Unit tests for paginated listing, concurrent loads and the spec cache."""
+    
+    @pytest.fixture
+    def storage(self):
+        storage = get_test_storage()
+        storage._client = FakeS3Client([f"tool-{i:02d}" for i in range(25)])
+        return storage
+    
+    async def test_cursor_pagination(self, storage: S3ToolStorage):
+        """Pages follow the continuation token until the last page."""
+        seen, cursor = [], None
+        while True:
+            page = await storage.list_tools_page(limit=10, cursor=cursor)
+            seen.extend(page.tool_ids)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == [f"tool-{i:02d}" for i in range(25)]
+        assert await storage.list_tools(limit=5) == [f"tool-{i:02d}" for i in range(5)]
+    
+    async def test_load_many_is_concurrent_and_ordered(self, storage: S3ToolStorage):
+        """Loads overlap up to the concurrency bound and keep input order."""
+        tool_ids = [f"tool-{i:02d}" for i in range(20)]
+        results = await storage.load_many(tool_ids, concurrency=4)
+        
+        assert [r.data["tool_name"] for r in results] == tool_ids
+        assert 1 < storage._client.max_in_flight <= 4
+    
+    async def test_conditional_get_reuses_cached_spec(self, storage: S3ToolStorage):
+        """A second load sends If-None-Match and uses the cached body on 304."""
+        first = await storage.load("tool-01")
+        second = await storage.load("tool-01")
+        
+        gets = [c for c in storage._client.calls if c[0] == "get_object"]
+        assert gets[0][2] is None and gets[1][2] is not None
+        assert second.success and second.data == first.data
+        assert second.data is not first.data
+    
+    async def test_changed_spec_is_reloaded(self, storage: S3ToolStorage):
+        """A changed object (new ETag) replaces the cached spec."""
+        await storage.load("tool-01")
+        storage._client.objects["test-tools/tool-01/spec.json"] = json.dumps({"tool_name": "renamed"})
+        assert (await storage.load("tool-01")).data["tool_name"] == "renamed"
+    
+    async def test_bucket_existence_checked_once(self, storage: S3ToolStorage, monkeypatch):
+        """ensure_bucket_exists() hits S3 once per bucket for the process."""
+        monkeypatch.setattr(S3ToolStorage, "_verified_buckets", set())
+        other = get_test_storage()
+        other._client = storage._client
+        
+        assert await storage.ensure_bucket_exists()
+        assert await other.ensure_bucket_exists()
+        assert [c for c in storage._client.calls if c[0] == "head_bucket"] == [("head_bucket", TEST_BUCKET)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,171 @@
+"""
+Test suite for single-flight coalescing of idempotent tool executions.
+
+Test Structure:
+===============
+1. TestSingleFlight - Registry leader/follower semantics
+2. TestExecutorCoalescing - Concurrent identical calls through FunctionToolExecutor
+
+Usage:
+    pytest tests/tools/test_single_flight.py -v
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from core.tools.runtimes.executors import FunctionToolExecutor
+from core.tools.runtimes.idempotency import SingleFlight
+from core.tools.spec.tool_context import ToolContext
+from tests.tools.mocks import MockMemory
+from tests.tools.tool_implementations import create_division_tool_spec
+
+
+def make_counting_tool(delay_s: float = 0.02, fail: bool = False):
+    """Division tool whose function counts invocations."""
+    calls = []
+
+    async def divide(args):
+        calls.append(args)
+        await asyncio.sleep(delay_s)
+        if fail:
+            raise RuntimeError("backend down")
+        return {"result": args["numerator"] / args["denominator"]}
+
+    spec = create_division_tool_spec()
+    spec.id = f"tool-division-{uuid.uuid4()}"
+    return spec, divide, calls
+
+
+def make_context() -> ToolContext:
+    return ToolContext(user_id="user-1", session_id="session-1", memory=MockMemory())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Test suite for the SingleFlight registry."""
+
+    async def test_leader_and_followers(self):
+        """The first caller leads; later callers get the leader's result."""
+        registry = SingleFlight()
+        leader = registry.join("k")
+        follower = registry.join("k")
+        assert leader.is_leader and not follower.is_leader
+
+        waiting = asyncio.create_task(follower.wait())
+        leader.resolve("value")
+        leader.release()
+        assert await waiting == "value"
+        assert registry.in_flight() == 0
+
+    async def test_exception_propagates(self):
+        """Followers receive the leader's exception."""
+        registry = SingleFlight()
+        leader = registry.join("k")
+        follower = registry.join("k")
+
+        leader.reject(ValueError("boom"))
+        leader.release()
+        with pytest.raises(ValueError, match="boom"):
+            await follower.wait()
+
+    async def test_cancelled_leader_releases_followers(self):
+        """If the leader never resolves, followers get None and run themselves."""
+        registry = SingleFlight()
+        leader = registry.join("k")
+        follower = registry.join("k")
+
+        waiting = asyncio.create_task(follower.wait())
+        await asyncio.sleep(0)
+        leader.release()
+        assert await waiting is None
+        assert registry.join("k").is_leader
+
+    async def test_failed_flight_not_reused(self):
+        """A new caller after a failure becomes a new leader."""
+        registry = SingleFlight()
+        leader = registry.join("k")
+        leader.reject(RuntimeError("boom"))
+        assert registry.join("k").is_leader
+
+    async def test_flights_are_per_event_loop(self):
+        """A call on another loop leads its own flight instead of awaiting ours."""
+        registry = SingleFlight()
+        leader = registry.join("k")
+
+        async def join_elsewhere():
+            other = registry.join("k")
+            other.release()
+            return other.is_leader
+
+        assert await asyncio.to_thread(asyncio.run, join_elsewhere())
+        assert not registry.join("k").is_leader
+        leader.release()
+        assert registry.in_flight() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExecutorCoalescing:
+    """Concurrent identical executions share one function call."""
+
+    async def test_concurrent_calls_run_once(self):
+        """Followers await the leader and get the same content."""
+        spec, divide, calls = make_counting_tool()
+        executor = FunctionToolExecutor(spec, divide)
+        ctx = make_context()
+        args = {"numerator": 10, "denominator": 2}
+
+        results = await asyncio.gather(*(executor.execute(args, ctx) for _ in range(8)))
+
+        assert len(calls) == 1
+        assert all(r.content == results[0].content for r in results)
+        reused = [r for r in results if r.usage.get("idempotency_reused")]
+        assert len(reused) == 7
+
+    async def test_different_args_not_coalesced(self):
+        """Calls with different idempotency keys run independently."""
+        spec, divide, calls = make_counting_tool()
+        executor = FunctionToolExecutor(spec, divide)
+        ctx = make_context()
+
+        await asyncio.gather(*(
+            executor.execute({"numerator": n, "denominator": 2}, ctx) for n in range(4)
+        ))
+        assert len(calls) == 4
+
+    async def test_leader_failure_shared(self):
+        """A failing leader fails the followers without re-running the function."""
+        spec, divide, calls = make_counting_tool(fail=True)
+        executor = FunctionToolExecutor(spec, divide)
+        ctx = make_context()
+        args = {"numerator": 1, "denominator": 1}
+
+        results = await asyncio.gather(*(executor.execute(args, ctx) for _ in range(4)))
+
+        assert len(calls) == 1
+        assert all("backend down" in r.content["error"] for r in results)
+
+    async def test_coalescing_can_be_disabled(self):
+        """coalesce_in_flight=False restores independent executions."""
+        spec, divide, calls = make_counting_tool()
+        spec.idempotency.coalesce_in_flight = False
+        executor = FunctionToolExecutor(spec, divide)
+        ctx = make_context()
+        args = {"numerator": 10, "denominator": 2}
+
+        await asyncio.gather(*(executor.execute(args, ctx) for _ in range(3)))
+        assert len(calls) == 3
+
+    async def test_sequential_calls_use_cache(self):
+        """After the flight completes, the idempotency cache serves repeats."""
+        spec, divide, calls = make_counting_tool(delay_s=0)
+        executor = FunctionToolExecutor(spec, divide)
+        ctx = make_context()
+        args = {"numerator": 10, "denominator": 2}
+
+        await executor.execute(args, ctx)
+        await executor.execute(args, ctx)
+        assert len(calls) == 1
@@ -0,0 +1,172 @@
+"""
+Tests for edge condition evaluation and the compiled condition tree.
+
+Covers:
+- Parity between EdgeConditionGroup.evaluate and the compiled closures
+- Pending LLM condition bookkeeping and error wrapping
+- Cache invalidation when a spec is mutated
+"""
+
+import pytest
+
+from core.workflows import (
+    ConditionJoinOperator,
+    ConditionOperator,
+    EdgeCondition,
+    EdgeConditionGroup,
+    EdgeConditionType,
+    EdgeSpec,
+    EdgeType,
+    LLMConditionConfig,
+)
+
+
+CONTEXT = {
+    "variables": {"intent": "booking", "count": 3, "tags": ["vip", "new"], "name": "Alice"},
+    "current_node": "greeting",
+    "empty": "",
+}
+
+
+def expr(field, operator, value=None, negate=False):
+    return EdgeCondition(field=field, operator=operator, value=value, negate=negate)
+
+
+def conditional_edge(group):
+    return EdgeSpec(
+        id="edge",
+        source_node_id="a",
+        target_node_id="b",
+        edge_type=EdgeType.CONDITIONAL,
+        conditions=group,
+    )
+
+
+class TestCompiledConditions:
+    """Compiled closures match interpreted evaluation."""
+
+    @pytest.mark.parametrize("condition", [
+        expr("variables.intent", ConditionOperator.EQUALS, "booking"),
+        expr("variables.intent", ConditionOperator.NOT_EQUALS, "booking"),
+        expr("variables.count", ConditionOperator.GREATER_THAN, 2),
+        expr("variables.count", ConditionOperator.LESS_THAN_OR_EQUALS, 2),
+        expr("variables.missing", ConditionOperator.GREATER_THAN, 2),
+        expr("variables.tags", ConditionOperator.CONTAINS, "vip"),
+        expr("variables.tags", ConditionOperator.NOT_CONTAINS, "vip"),
+        expr("variables.name", ConditionOperator.STARTS_WITH, "Al"),
+        expr("variables.name", ConditionOperator.ENDS_WITH, "ce"),
+        expr("variables.name", ConditionOperator.MATCHES, r"A\w+e"),
+        expr("variables.name", ConditionOperator.MATCHES, r"^z"),
+        expr("variables.intent", ConditionOperator.IN, ["booking", "cancel"]),
+        expr("variables.intent", ConditionOperator.NOT_IN, ["booking"]),
+        expr("variables.missing", ConditionOperator.IS_NULL),
+        expr("variables.intent", ConditionOperator.IS_NOT_NULL),
+        expr("empty", ConditionOperator.IS_EMPTY),
+        expr("empty", ConditionOperator.IS_NOT_EMPTY),
+        expr("current_node", ConditionOperator.EQUALS, "greeting", negate=True),
+        expr("current_node.deeper", ConditionOperator.IS_NULL),
+        EdgeCondition(
+            condition_type=EdgeConditionType.FUNCTION,
+            field="variables.count",
+            custom_func=lambda value, ctx: value * 2 == 6,
+        ),
+    ])
+    def test_condition_parity(self, condition):
+        """compile() returns the same result as evaluate()."""
+        assert condition.compile()(CONTEXT) == condition.evaluate(CONTEXT)
+
+    @pytest.mark.parametrize("join", [ConditionJoinOperator.AND, ConditionJoinOperator.OR])
+    def test_group_parity(self, join):
+        """Nested groups compile to the same result."""
+        group = EdgeConditionGroup(
+            join_operator=join,
+            conditions=[
+                expr("variables.intent", ConditionOperator.EQUALS, "booking"),
+                expr("variables.count", ConditionOperator.GREATER_THAN, 5),
+            ],
+            nested_groups=[
+                EdgeConditionGroup(
+                    join_operator=ConditionJoinOperator.OR,
+                    conditions=[expr("variables.tags", ConditionOperator.CONTAINS, "vip")],
+                )
+            ],
+        )
+        assert group.compile()(CONTEXT) == group.evaluate(CONTEXT)
+
+    def test_empty_group_passes(self):
+        """A group without conditions always passes."""
+        assert EdgeConditionGroup().compile()(CONTEXT) is True
+
+    def test_llm_condition_marked_pending(self):
+        """LLM conditions are deferred exactly like evaluate()."""
+        condition = EdgeCondition(
+            condition_type=EdgeConditionType.LLM,
+            llm_config=LLMConditionConfig(condition_prompt="user wants to book"),
+        )
+        context = dict(CONTEXT)
+        assert condition.compile()(context) is False
+        assert context["_pending_llm_conditions"] == [condition]
+
+    def test_errors_are_wrapped(self):
+        """Evaluation errors surface as ValueError like evaluate(), chained to the cause."""
+        condition = expr("variables.name", ConditionOperator.GREATER_THAN, 5)
+        with pytest.raises(ValueError, match="Invalid edge condition") as exc_info:
+            condition.compile()(CONTEXT)
+        assert isinstance(exc_info.value.__cause__, TypeError)
+
+    def test_missing_field_raises_on_evaluation(self):
+        """Invalid conditions still compile and fail when evaluated."""
+        compiled = EdgeCondition(operator=ConditionOperator.EQUALS, value=1).compile()
+        with pytest.raises(ValueError, match="Field is required"):
+            compiled(CONTEXT)
+
+
+class TestEdgeSpecCompiledCache:
+    """EdgeSpec caches the compiled tree and invalidates it on mutation."""
+
+    def test_should_traverse_uses_cached_tree(self):
+        """The compiled tree is built once and reused."""
+        edge = conditional_edge(EdgeConditionGroup(
+            conditions=[expr("variables.intent", ConditionOperator.EQUALS, "booking")]
+        ))
+        assert edge.should_traverse(CONTEXT)
+        compiled = edge.get_compiled_conditions()
+        assert edge.should_traverse(CONTEXT)
+        assert edge.get_compiled_conditions() is compiled
+
+    def test_condition_field_assignment_invalidates(self):
+        """Assigning to a condition field recompiles on next use."""
+        condition = expr("variables.intent", ConditionOperator.EQUALS, "booking")
+        edge = conditional_edge(EdgeConditionGroup(conditions=[condition]))
+        assert edge.should_traverse(CONTEXT)
+
+        condition.value = "cancel"
+        assert not edge.should_traverse(CONTEXT)
+
+    def test_replacing_conditions_invalidates(self):
+        """Assigning a new condition group recompiles."""
+        edge = conditional_edge(EdgeConditionGroup(
+            conditions=[expr("variables.intent", ConditionOperator.EQUALS, "booking")]
+        ))
+        assert edge.should_traverse(CONTEXT)
+
+        edge.conditions = EdgeConditionGroup(
+            conditions=[expr("variables.intent", ConditionOperator.EQUALS, "cancel")]
+        )
+        assert not edge.should_traverse(CONTEXT)
+
+    def test_in_place_list_mutation_with_explicit_invalidate(self):
+        """In-place list edits are picked up after invalidate_compiled_conditions()."""
+        group = EdgeConditionGroup(
+            conditions=[expr("variables.intent", ConditionOperator.EQUALS, "booking")]
+        )
+        edge = conditional_edge(group)
+        assert edge.should_traverse(CONTEXT)
+
+        group.conditions.append(expr("variables.count", ConditionOperator.GREATER_THAN, 10))
+        edge.invalidate_compiled_conditions()
+        assert not edge.should_traverse(CONTEXT)
+
+    def test_no_conditions_always_traverses(self):
+        """Conditional edges without conditions always pass."""
+        assert conditional_edge(None).should_traverse(CONTEXT)
@@ -0,0 +1,348 @@
+"""
+Tests for EdgeRouter and LLMVerdictCache.
+
+Covers:
+- Sequential and parallel modes select the same edge
+- Parallel mode runs LLM conditions concurrently and cancels losers
+- Verdict memoization keyed by condition and included context
+- Joint routing of sibling LLM conditions in one structured call
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.workflows import (
+    ConditionOperator,
+    EdgeCondition,
+    EdgeConditionGroup,
+    EdgeConditionType,
+    EdgeRouter,
+    EdgeRoutingMode,
+    EdgeSpec,
+    EdgeType,
+    JointLLMRouter,
+    LLMConditionConfig,
+    LLMEvaluationMode,
+    LLMVerdictCache,
+    NodeSpec,
+    WorkflowSpec,
+)
+from core.workflows.spec.edge_models import EdgeConfig
+
+
+class FakeLLM:
+    """Answers YES for prompts in `yes`, after a per-prompt delay."""
+
+    def __init__(self, yes, delays=None):
+        self.yes = set(yes)
+        self.delays = delays or {}
+        self.calls = []
+        self.cancelled = []
+
+    async def get_answer(self, messages, ctx):
+        prompt = messages[-1]["content"].rsplit("\n", 1)[-1]
+        self.calls.append(prompt)
+        try:
+            await asyncio.sleep(self.delays.get(prompt, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt)
+            raise
+        return SimpleNamespace(content="YES" if prompt in self.yes else "NO")
+
+
+def llm_edge(edge_id, target, prompt, priority, context_keys=None):
+    config = LLMConditionConfig(condition_prompt=prompt)
+    if context_keys is not None:
+        config.include_context_keys = context_keys
+    return EdgeSpec(
+        id=edge_id,
+        source_node_id="start",
+        target_node_id=target,
+        edge_type=EdgeType.CONDITIONAL,
+        config=EdgeConfig(priority=priority),
+        conditions=EdgeConditionGroup(conditions=[
+            EdgeCondition(condition_type=EdgeConditionType.LLM, llm_config=config)
+        ]),
+    )
+
+
+def expr_edge(edge_id, target, value, priority):
+    return EdgeSpec(
+        id=edge_id,
+        source_node_id="start",
+        target_node_id=target,
+        edge_type=EdgeType.CONDITIONAL,
+        config=EdgeConfig(priority=priority),
+        conditions=EdgeConditionGroup(conditions=[
+            EdgeCondition(field="intent", operator=ConditionOperator.EQUALS, value=value)
+        ]),
+    )
+
+
+def make_workflow(edges):
+    workflow = WorkflowSpec(id="wf", name="Workflow", start_node_id="start")
+    for node_id in {"start"} | {e.target_node_id for e in edges}:
+        workflow.add_node(NodeSpec(id=node_id, name=node_id))
+    for edge in edges:
+        workflow.add_edge(edge)
+    return workflow
+
+
+class TestEdgeRouter:
+    """Tests for EdgeRouter edge selection."""
+
+    @pytest.mark.parametrize("mode", list(EdgeRoutingMode))
+    async def test_highest_priority_match_wins(self, mode):
+        """Both modes pick the highest-priority matching edge."""
+        workflow = make_workflow([
+            llm_edge("e1", "book", "wants booking", priority=1),
+            llm_edge("e2", "cancel", "wants cancel", priority=2),
+            llm_edge("e3", "other", "anything else", priority=3),
+        ])
+        llm = FakeLLM(yes={"wants cancel", "anything else"})
+
+        router = EdgeRouter(mode=mode)
+        assert await router.route(workflow, "start", {}, llm) == "cancel"
+
+    @pytest.mark.parametrize("mode", list(EdgeRoutingMode))
+    async def test_no_match(self, mode):
+        """None is returned when no edge matches."""
+        workflow = make_workflow([llm_edge("e1", "book", "wants booking", priority=1)])
+        router = EdgeRouter(mode=mode)
+        assert await router.route(workflow, "start", {}, FakeLLM(yes=[])) is None
+
+    async def test_parallel_latency_is_slowest_call(self):
+        """LLM conditions run concurrently in parallel mode."""
+        edges = [llm_edge(f"e{i}", f"n{i}", f"prompt {i}", priority=i) for i in range(4)]
+        llm = FakeLLM(yes={"prompt 3"}, delays={f"prompt {i}": 0.05 for i in range(4)})
+
+        start = time.perf_counter()
+        edge = await EdgeRouter(mode=EdgeRoutingMode.PARALLEL).select_edge(edges, {}, llm)
+        elapsed = time.perf_counter() - start
+
+        assert edge.id == "e3"
+        assert elapsed < 0.15
+
+    async def test_parallel_cancels_lower_priority_edges(self):
+        """Once a higher-priority edge matches, slower losers are cancelled."""
+        edges = [
+            llm_edge("e1", "fast", "fast", priority=1),
+            llm_edge("e2", "slow", "slow", priority=2),
+        ]
+        llm = FakeLLM(yes={"fast", "slow"}, delays={"slow": 10})
+
+        edge = await EdgeRouter(mode=EdgeRoutingMode.PARALLEL).select_edge(edges, {}, llm)
+        assert edge.id == "e1"
+        assert llm.cancelled == ["slow"]
+
+    async def test_matching_expression_edge_skips_lower_llm_edges(self):
+        """LLM edges ranked below a matching expression edge never start."""
+        edges = [
+            llm_edge("e1", "llm_high", "high", priority=1),
+            expr_edge("e2", "expr", "booking", priority=2),
+            llm_edge("e3", "llm_low", "low", priority=3),
+        ]
+        llm = FakeLLM(yes={"low"})
+
+        edge = await EdgeRouter(mode=EdgeRoutingMode.PARALLEL).select_edge(
+            edges, {"intent": "booking"}, llm
+        )
+        assert edge.id == "e2"
+        assert llm.calls == ["high"]
+
+    @pytest.mark.parametrize("mode", list(EdgeRoutingMode))
+    async def test_select_edges_returns_all_matches(self, mode):
+        """select_edges returns every match in priority order."""
+        edges = [
+            llm_edge("e1", "a", "a", priority=1),
+            expr_edge("e2", "b", "booking", priority=2),
+            llm_edge("e3", "c", "c", priority=3),
+        ]
+        llm = FakeLLM(yes={"c"})
+
+        matches = await EdgeRouter(mode=mode).select_edges(edges, {"intent": "booking"}, llm)
+        assert [e.id for e in matches] == ["e2", "e3"]
+
+
+class TestLLMVerdictCache:
+    """Tests for verdict memoization."""
+
+    async def test_repeated_routing_hits_cache(self):
+        """Identical condition and context are only sent to the LLM once."""
+        cache = LLMVerdictCache()
+        router = EdgeRouter(mode=EdgeRoutingMode.PARALLEL, verdict_cache=cache)
+        edges = [llm_edge("e1", "book", "wants booking", priority=1, context_keys=["msg"])]
+        llm = FakeLLM(yes={"wants booking"})
+
+        for _ in range(3):
+            assert (await router.select_edge(edges, {"msg": "book a table"}, llm)).id == "e1"
+        assert len(llm.calls) == 1
+        assert cache.stats()["hits"] == 2
+
+    async def test_context_change_misses(self):
+        """A different value for an included context key is a new entry."""
+        router = EdgeRouter(verdict_cache=LLMVerdictCache())
+        edges = [llm_edge("e1", "book", "wants booking", priority=1, context_keys=["msg"])]
+        llm = FakeLLM(yes={"wants booking"})
+
+        await router.select_edge(edges, {"msg": "book a table"}, llm)
+        await router.select_edge(edges, {"msg": "cancel it"}, llm)
+        # Keys outside include_context_keys do not affect the key
+        await router.select_edge(edges, {"msg": "cancel it", "other": 1}, llm)
+        assert len(llm.calls) == 2
+
+    async def test_negated_condition_shares_cached_verdict(self):
+        """The cache stores the raw verdict; negation is applied afterwards."""
+        cache = LLMVerdictCache()
+        config = LLMConditionConfig(condition_prompt="wants booking")
+        llm = FakeLLM(yes={"wants booking"})
+
+        plain = EdgeCondition(condition_type=EdgeConditionType.LLM, llm_config=config)
+        negated = EdgeCondition(condition_type=EdgeConditionType.LLM, llm_config=config, negate=True)
+        assert await plain.evaluate_async({}, llm, cache) is True
+        assert await negated.evaluate_async({}, llm, cache) is False
+        assert len(llm.calls) == 1
+
+    def test_ttl_expiry(self):
+        """Entries expire after the TTL."""
+        cache = LLMVerdictCache(ttl_s=0.0)
+        cache.set("k", True)
+        time.sleep(0.001)
+        assert cache.get("k") is None
+
+    def test_membership_is_not_counted(self):
+        """`in` checks for a live verdict without touching hit/miss stats."""
+        cache = LLMVerdictCache()
+        cache.set("k", True)
+        assert "k" in cache
+        assert "other" not in cache
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        cache = LLMVerdictCache(max_entries=2)
+        cache.set("a", True)
+        cache.set("b", False)
+        cache.get("a")
+        cache.set("c", True)
+        assert cache.get("b") is None
+        assert cache.get("a") is True
+        assert cache.stats()["size"] == 2
+
+
+class FakeJointLLM(FakeLLM):
+    """Answers joint requests with `joint_answer` and single prompts like FakeLLM."""
+
+    def __init__(self, yes, joint_answer):
+        super().__init__(yes)
+        self.joint_answer = joint_answer
+        self.joint_calls = []
+
+    async def get_answer(self, messages, ctx, output_config=None):
+        if output_config is None:
+            return await super().get_answer(messages, ctx)
+        self.joint_calls.append(messages)
+        return SimpleNamespace(content=self.joint_answer, metadata={})
+
+
+def classification_edge(edge_id, target, expected, priority):
+    config = LLMConditionConfig(
+        condition_prompt="what does the user want",
+        evaluation_mode=LLMEvaluationMode.CLASSIFICATION,
+        classification_options=["book", "cancel"],
+        expected_classification=expected,
+    )
+    return EdgeSpec(
+        id=edge_id,
+        source_node_id="start",
+        target_node_id=target,
+        edge_type=EdgeType.CONDITIONAL,
+        config=EdgeConfig(priority=priority),
+        conditions=EdgeConditionGroup(conditions=[
+            EdgeCondition(condition_type=EdgeConditionType.LLM, llm_config=config)
+        ]),
+    )
+
+
+class TestJointLLMRouter:
+    """Tests for batching sibling LLM conditions into one call."""
+
+    async def test_single_round_trip(self):
+        """All sibling conditions are answered by one joint call."""
+        edges = [
+            llm_edge("e1", "book", "wants booking", priority=1),
+            llm_edge("e2", "cancel", "wants cancel", priority=2),
+            llm_edge("e3", "other", "anything else", priority=3),
+        ]
+        llm = FakeJointLLM(yes=[], joint_answer=json.dumps({"c0": False, "c1": True, "c2": True}))
+
+        edge = await JointLLMRouter().select_edge(edges, {}, llm)
+        assert edge.id == "e2"
+        assert len(llm.joint_calls) == 1
+        assert llm.calls == []
+        user_prompt = llm.joint_calls[0][-1]["content"]
+        assert "c0 (yes/no): wants booking" in user_prompt
+
+    async def test_classification_verdicts(self):
+        """Classification answers are compared with each edge's expected label."""
+        edges = [
+            classification_edge("e1", "book", "book", priority=1),
+            classification_edge("e2", "cancel", "cancel", priority=2),
+        ]
+        llm = FakeJointLLM(yes=[], joint_answer=json.dumps({"c0": "cancel", "c1": "cancel"}))
+
+        matches = await JointLLMRouter().select_edges(edges, {}, llm)
+        assert [e.id for e in matches] == ["e2"]
+        assert len(llm.joint_calls) == 1
+
+    async def test_parse_failure_falls_back_per_edge(self):
+        """Unparseable joint output falls back to per-edge evaluation."""
+        edges = [
+            llm_edge("e1", "book", "wants booking", priority=1),
+            llm_edge("e2", "cancel", "wants cancel", priority=2),
+        ]
+        llm = FakeJointLLM(yes={"wants cancel"}, joint_answer="not json")
+
+        edge = await JointLLMRouter().select_edge(edges, {}, llm)
+        assert edge.id == "e2"
+        assert llm.calls == ["wants booking", "wants cancel"]
+
+    async def test_missing_field_falls_back_for_that_condition(self):
+        """Conditions absent from the joint answer are evaluated individually."""
+        edges = [
+            llm_edge("e1", "book", "wants booking", priority=1),
+            llm_edge("e2", "cancel", "wants cancel", priority=2),
+        ]
+        llm = FakeJointLLM(yes={"wants cancel"}, joint_answer=json.dumps({"c0": False}))
+
+        edge = await JointLLMRouter().select_edge(edges, {}, llm)
+        assert edge.id == "e2"
+        assert llm.calls == ["wants cancel"]
+
+    async def test_single_condition_not_batched(self):
+        """Below min_conditions the regular per-edge path is used."""
+        edges = [llm_edge("e1", "book", "wants booking", priority=1)]
+        llm = FakeJointLLM(yes={"wants booking"}, joint_answer="{}")
+
+        assert (await JointLLMRouter().select_edge(edges, {}, llm)).id == "e1"
+        assert llm.joint_calls == []
+
+    async def test_shared_cache_reused_across_turns(self):
+        """Joint verdicts are memoized in the configured verdict cache."""
+        edges = [
+            llm_edge("e1", "book", "wants booking", priority=1),
+            llm_edge("e2", "cancel", "wants cancel", priority=2),
+        ]
+        llm = FakeJointLLM(yes=[], joint_answer=json.dumps({"c0": True, "c1": False}))
+        cache = LLMVerdictCache()
+        router = JointLLMRouter(verdict_cache=cache)
+
+        for _ in range(2):
+            assert (await router.select_edge(edges, {}, llm)).id == "e1"
+        assert len(llm.joint_calls) == 1
+        # Prefetch probes are not lookups: every routed verdict was a hit
+        assert cache.stats()["misses"] == 0
@@ -0,0 +1,180 @@
+"""
+Tests for WorkflowSpec graph queries and the adjacency index.
+
+Covers:
+- Outgoing/incoming lookups and priority ordering
+- Incremental index maintenance on add/remove
+- Rebuild after direct mutation of the edges dict
+- Validation (cycles, disconnected nodes)
+"""
+
+import pytest
+
+from core.workflows import EdgeSpec, NodeSpec, WorkflowSpec
+from core.workflows.spec.edge_models import EdgeConfig
+
+
+def make_workflow(node_ids):
+    workflow = WorkflowSpec(id="wf", name="Workflow", start_node_id=node_ids[0])
+    for node_id in node_ids:
+        workflow.add_node(NodeSpec(id=node_id, name=node_id))
+    return workflow
+
+
+def make_edge(edge_id, source, target, priority=100):
+    return EdgeSpec(
+        id=edge_id,
+        source_node_id=source,
+        target_node_id=target,
+        config=EdgeConfig(priority=priority),
+    )
+
+
+class TestWorkflowAdjacencyIndex:
+    """Tests for the WorkflowSpec adjacency index."""
+
+    def test_outgoing_sorted_by_priority(self):
+        """Outgoing edges come back in priority order, ties by insertion."""
+        workflow = make_workflow(["a", "b", "c", "d"])
+        workflow.add_edge(make_edge("e1", "a", "b", priority=5))
+        workflow.add_edge(make_edge("e2", "a", "c", priority=1))
+        workflow.add_edge(make_edge("e3", "a", "d", priority=5))
+
+        assert [e.id for e in workflow.get_outgoing_edges("a")] == ["e2", "e1", "e3"]
+        assert workflow.get_next_nodes("a", {}) == ["c", "b", "d"]
+
+    def test_incoming_edges(self):
+        """Incoming edges are indexed by target."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "c"))
+        workflow.add_edge(make_edge("e2", "b", "c"))
+
+        assert {e.id for e in workflow.get_incoming_edges("c")} == {"e1", "e2"}
+        assert workflow.get_incoming_edges("a") == []
+
+    def test_returned_lists_are_copies(self):
+        """Mutating a returned list does not corrupt the index."""
+        workflow = make_workflow(["a", "b"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+
+        workflow.get_outgoing_edges("a").clear()
+        assert len(workflow.get_outgoing_edges("a")) == 1
+
+    def test_remove_edge_updates_index(self):
+        """remove_edge drops the edge from both directions."""
+        workflow = make_workflow(["a", "b"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        workflow.get_outgoing_edges("a")  # build index
+
+        workflow.remove_edge("e1")
+        assert workflow.get_outgoing_edges("a") == []
+        assert workflow.get_incoming_edges("b") == []
+
+    def test_remove_node_removes_connected_edges(self):
+        """remove_node removes incoming, outgoing and self-loop edges."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        workflow.add_edge(make_edge("e2", "b", "c"))
+        workflow.add_edge(make_edge("e3", "b", "b"))
+        workflow.add_edge(make_edge("e4", "a", "c"))
+
+        workflow.remove_node("b")
+        assert set(workflow.edges) == {"e4"}
+        assert [e.id for e in workflow.get_outgoing_edges("a")] == ["e4"]
+        assert [e.id for e in workflow.get_incoming_edges("c")] == ["e4"]
+
+    def test_replacing_edge_reindexes(self):
+        """Re-adding an edge id with new endpoints moves it in the index."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        workflow.get_outgoing_edges("a")
+
+        workflow.add_edge(make_edge("e1", "b", "c"))
+        assert workflow.get_outgoing_edges("a") == []
+        assert [e.id for e in workflow.get_outgoing_edges("b")] == ["e1"]
+
+    def test_direct_edges_mutation_rebuilds(self):
+        """Writing to the edges dict directly is picked up."""
+        workflow = make_workflow(["a", "b"])
+        workflow.get_outgoing_edges("a")
+
+        workflow.edges["e1"] = make_edge("e1", "a", "b")
+        assert [e.id for e in workflow.get_outgoing_edges("a")] == ["e1"]
+
+    def test_replacing_edge_under_same_key(self):
+        """Replacing an edge in the dict (same id, same size) is picked up."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        workflow.get_outgoing_edges("a")
+
+        workflow.edges["e1"] = make_edge("e1", "a", "c")
+        assert [e.target_node_id for e in workflow.get_outgoing_edges("a")] == ["c"]
+        assert [e.id for e in workflow.get_incoming_edges("c")] == ["e1"]
+
+        workflow.edges.update({"e1": make_edge("e1", "b", "c")})
+        assert workflow.get_outgoing_edges("a") == []
+
+    def test_assigned_and_copied_edges_tracked(self):
+        """A newly assigned dict and deep copies keep tracking replacements."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.edges = {"e1": make_edge("e1", "a", "b")}
+        assert [e.target_node_id for e in workflow.get_outgoing_edges("a")] == ["b"]
+        workflow.edges["e1"] = make_edge("e1", "a", "c")
+        assert [e.target_node_id for e in workflow.get_outgoing_edges("a")] == ["c"]
+
+        copy = workflow.model_copy(deep=True)
+        copy.get_outgoing_edges("a")
+        copy.edges["e1"] = make_edge("e1", "b", "c")
+        assert copy.get_outgoing_edges("a") == []
+        assert [e.target_node_id for e in workflow.get_outgoing_edges("a")] == ["c"]
+
+    def test_invalidate_after_priority_change(self):
+        """invalidate_index() picks up in-place priority changes."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "b", priority=1))
+        workflow.add_edge(make_edge("e2", "a", "c", priority=2))
+
+        workflow.edges["e2"].config.priority = 0
+        workflow.invalidate_index()
+        assert [e.id for e in workflow.get_outgoing_edges("a")] == ["e2", "e1"]
+
+    def test_from_dict_round_trip(self):
+        """Deserialized workflows index their edges."""
+        workflow = make_workflow(["a", "b"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+
+        restored = WorkflowSpec.from_dict(workflow.to_dict())
+        assert [e.id for e in restored.get_outgoing_edges("a")] == ["e1"]
+
+
+class TestWorkflowValidation:
+    """Tests for WorkflowSpec.validate()."""
+
+    def test_valid_chain(self):
+        """A simple chain validates cleanly."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        workflow.add_edge(make_edge("e2", "b", "c"))
+        assert workflow.validate() == []
+
+    def test_cycle_detected(self):
+        """Cycles are reported."""
+        workflow = make_workflow(["a", "b"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        workflow.add_edge(make_edge("e2", "b", "a"))
+        assert workflow._has_cycle()
+
+    def test_disconnected_nodes(self):
+        """Unreachable nodes are reported."""
+        workflow = make_workflow(["a", "b", "c"])
+        workflow.add_edge(make_edge("e1", "a", "b"))
+        assert workflow._find_disconnected_nodes() == {"c"}
+
+    @pytest.mark.parametrize("size", [300])
+    def test_large_workflow(self, size):
+        """Large linear workflows validate without repeated edge scans."""
+        node_ids = [f"n{i}" for i in range(size)]
+        workflow = make_workflow(node_ids)
+        for i in range(size - 1):
+            workflow.add_edge(make_edge(f"e{i}", node_ids[i], node_ids[i + 1]))
+        assert workflow.validate() == []
@@ -3,8 +3,9 @@ Converters for LLM output transformations.
 
 This module provides utilities for converting between different output formats:
 - JSON schema generation from Pydantic models
+- Cached, pre-serialized structured output schemas per model
 - Response parsing and validation (complete and partial)
-- Streaming JSON parsing
+- Streaming JSON parsing (stateless and incremental)
 - JSON to TOON conversion (text-oriented object notation)
 """
 
@@ -19,6 +20,13 @@ from .json_schema_converter import (
     extract_json_from_text,
     get_partial_json_fields,
 )
+from .schema_registry import (
+    SchemaRegistry,
+    CompiledSchema,
+    SerializedResponseFormat,
+    get_schema_registry,
+    dumps_payload,
+)
 from .partial_json_parser import (
     parse_partial_json,
     parse_json_markdown,
@@ -26,11 +34,21 @@ from .partial_json_parser import (
     get_partial_json_progress,
     get_partial_json_dict,
 )
+from .incremental_json_parser import (
+    IncrementalJSONParser,
+    PartialJSONUpdate,
+)
 
 __all__ = [
     # Schema conversion
     "pydantic_to_openai_schema",
     "json_object_schema",
+    # Schema registry
+    "SchemaRegistry",
+    "CompiledSchema",
+    "SerializedResponseFormat",
+    "get_schema_registry",
+    "dumps_payload",
     # Complete JSON parsing
     "validate_json_response",
     "validate_json_dict",
@@ -45,5 +63,8 @@ __all__ = [
     "get_partial_json_progress",
     "get_partial_json_fields",
     "get_partial_json_dict",
+    # Incremental streaming JSON parsing
+    "IncrementalJSONParser",
+    "PartialJSONUpdate",
 ]
 
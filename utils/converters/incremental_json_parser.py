@@ -0,0 +1,466 @@
+"""
+Incremental JSON Parser for Streaming LLM Outputs.
+
+Stateful counterpart to `parse_partial_json`. Instead of re-parsing the whole
+accumulated buffer on every streamed delta, the parser keeps its tokenizer
+state and container stack between chunks, so each `feed()` only touches the
+new characters.
+
+The parsed value is built in place: containers are created once and filled as
+tokens arrive. The currently open scalar (e.g. a string that is still being
+generated) is only materialized when the partial value is read, so feeding
+without reading costs O(delta) even inside one very long string.
+
+Partial semantics match `parse_partial_json`:
+1. {"Nam -> {"Nam": None}
+2. {"Name": -> {"Name": None}
+3. {"Name": "Ra -> {"Name": "Ra"}
+4. {"Name": "Raj", -> {"Name": "Raj"}
+5. {"Name": "Raj"," -> {"Name": "Raj", "": None}
+6. {"age": 1. -> {"age": 1.0}
+7. {"ok": t -> {"ok": True}
+
+Example:
+    parser = IncrementalJSONParser()
+    for delta in ['{"name": "Ra', 'j", "age"', ': 18}']:
+        update = parser.feed(delta)
+        print(update.value, update.completed_fields)
+    # {'name': 'Ra'} []
+    # {'name': 'Raj', 'age': None} ['name']
+    # {'name': 'Raj', 'age': 18} ['age']
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+
+# Parser frame modes
+_EXPECT_KEY = 0
+_EXPECT_COLON = 1
+_EXPECT_VALUE = 2
+_EXPECT_COMMA = 3
+
+# Scalar kinds
+_STRING = 0
+_NUMBER = 1
+_LITERAL = 2
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+_STRING_RUN = re.compile(r'[^"\\]+')
+_NUMBER_RUN = re.compile(r"[-+0-9.eE]+")
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_LITERALS = {
+    "t": ("true", True),
+    "f": ("false", False),
+    "n": ("null", None),
+}
+
+
+@dataclass
+class PartialJSONUpdate:
+    """
+    Result of feeding one delta into an IncrementalJSONParser.
+
+    Attributes:
+        completed_fields: Top-level fields whose values completed in this delta
+        is_complete: Whether the root JSON value has been fully parsed
+        error: Parse error message, if the stream stopped being valid JSON
+    """
+
+    completed_fields: List[str] = field(default_factory=list)
+    is_complete: bool = False
+    error: Optional[str] = None
+    _parser: Optional["IncrementalJSONParser"] = field(default=None, repr=False, compare=False)
+
+    @property
+    def value(self) -> Any:
+        """Current partial value of the parser (live object, built on access)."""
+        return self._parser.value if self._parser is not None else None
+
+
+class _Frame:
+    """Open container on the parser stack."""
+
+    __slots__ = ("container", "is_dict", "mode", "key")
+
+    def __init__(self, container: Any, is_dict: bool):
+        self.container = container
+        self.is_dict = is_dict
+        self.mode = _EXPECT_KEY if is_dict else _EXPECT_VALUE
+        self.key: Optional[str] = None
+
+
+class _Scalar:
+    """Scalar token that is still being read."""
+
+    __slots__ = ("kind", "parts", "slot", "is_key", "escape", "unicode", "surrogates", "literal")
+
+    def __init__(self, kind: int, slot: Optional[Tuple[Any, Any]], is_key: bool = False):
+        self.kind = kind
+        self.parts: List[str] = []
+        self.slot = slot
+        self.is_key = is_key
+        self.escape = False
+        self.unicode: Optional[str] = None
+        self.surrogates = False
+        self.literal: Optional[Tuple[str, Any]] = None
+
+    def text(self) -> str:
+        """Decoded text read so far."""
+        parts = self.parts
+        if len(parts) > 1:
+            # Compact so the next read only joins what arrived since this one
+            parts[:] = ["".join(parts)]
+        text = parts[0] if parts else ""
+        if self.surrogates:
+            text = text.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+        return text
+
+
+class IncrementalJSONParser:
+    """
+    Stateful streaming JSON parser.
+
+    Feed it the deltas of a streamed JSON document; each call costs O(delta)
+    and returns the current partial value together with the top-level fields
+    that were completed by that delta. Reading the value materializes the open
+    scalar, which costs O(its length), so only read it when it is needed.
+
+    The returned value is a live object that later feeds keep mutating. Copy it
+    (e.g. `copy.deepcopy`) if a stable snapshot is needed.
+
+    Example:
+        parser = IncrementalJSONParser()
+        async for chunk in llm.stream_answer(messages, ctx):
+            update = parser.feed(chunk.content)
+            for name in update.completed_fields:
+                print(f"{name} ready: {update.value[name]}")
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all state and start a new document."""
+        self._root: Any = None
+        self._has_root = False
+        self._stack: List[_Frame] = []
+        self._scalar: Optional[_Scalar] = None
+        self._provisional: Optional[Tuple[dict, str]] = None
+        self._stale = False
+        self._completed_fields: List[str] = []
+        self._new_fields: List[str] = []
+        self._done = False
+        self._error: Optional[str] = None
+        self._consumed = 0
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    @property
+    def value(self) -> Any:
+        """Current partial value (None until the root value starts)."""
+        if self._stale:
+            self._stale = False
+            self._apply_provisional()
+        return self._root
+
+    @property
+    def completed_fields(self) -> List[str]:
+        """Top-level fields whose values have been fully parsed, in order."""
+        return list(self._completed_fields)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the root JSON value has been fully parsed."""
+        return self._done
+
+    @property
+    def error(self) -> Optional[str]:
+        """Parse error, if the input stopped being valid JSON."""
+        return self._error
+
+    def feed(self, delta: str) -> PartialJSONUpdate:
+        """
+        Consume the next streamed delta.
+
+        Args:
+            delta: Newly received text
+
+        Returns:
+            PartialJSONUpdate with the current value and newly completed fields
+        """
+        self._new_fields = []
+        if delta and not self._done and self._error is None:
+            self._retract_provisional()
+            self._consume(delta)
+            self._consumed += len(delta)
+            self._stale = self._scalar is not None
+        return PartialJSONUpdate(
+            completed_fields=self._new_fields,
+            is_complete=self._done,
+            error=self._error,
+            _parser=self,
+        )
+
+    # ========================================================================
+    # Tokenizer
+    # ========================================================================
+
+    def _consume(self, s: str) -> None:
+        i = 0
+        n = len(s)
+        while i < n and self._error is None:
+            scalar = self._scalar
+            if scalar is not None:
+                if scalar.kind == _STRING:
+                    i = self._consume_string(scalar, s, i)
+                elif scalar.kind == _NUMBER:
+                    i = self._consume_number(scalar, s, i)
+                else:
+                    i = self._consume_literal(scalar, s, i)
+                continue
+
+            ch = s[i]
+            if ch in _WHITESPACE:
+                i += 1
+                continue
+            if self._done:
+                return
+
+            if not self._stack:
+                if self._start_value(ch, None, i):
+                    i += 1
+                continue
+
+            frame = self._stack[-1]
+            mode = frame.mode
+            if mode == _EXPECT_VALUE:
+                if not frame.is_dict and ch == "]":
+                    self._close_container()
+                    i += 1
+                    continue
+                if frame.is_dict:
+                    slot = (frame.container, frame.key)
+                else:
+                    frame.container.append(None)
+                    slot = (frame.container, len(frame.container) - 1)
+                frame.mode = _EXPECT_COMMA
+                if self._start_value(ch, slot, i):
+                    i += 1
+            elif mode == _EXPECT_COMMA:
+                if ch == ",":
+                    frame.mode = _EXPECT_KEY if frame.is_dict else _EXPECT_VALUE
+                elif ch == ("}" if frame.is_dict else "]"):
+                    self._close_container()
+                else:
+                    self._fail(ch, i)
+                i += 1
+            elif mode == _EXPECT_KEY:
+                if ch == '"':
+                    self._scalar = _Scalar(_STRING, None, is_key=True)
+                elif ch == "}":
+                    self._close_container()
+                else:
+                    self._fail(ch, i)
+                i += 1
+            else:
+                if ch == ":":
+                    frame.mode = _EXPECT_VALUE
+                else:
+                    self._fail(ch, i)
+                i += 1
+
+    def _start_value(self, ch: str, slot: Optional[Tuple[Any, Any]], pos: int) -> bool:
+        """Start a value at `slot`. Returns True if `ch` was consumed."""
+        if ch == "{":
+            container: Any = {}
+            self._assign(slot, container)
+            self._stack.append(_Frame(container, True))
+            return True
+        if ch == "[":
+            container = []
+            self._assign(slot, container)
+            self._stack.append(_Frame(container, False))
+            return True
+        if ch == '"':
+            self._assign(slot, "")
+            self._scalar = _Scalar(_STRING, slot)
+            return True
+        if ch in _NUMBER_START:
+            self._assign(slot, 0)
+            self._scalar = _Scalar(_NUMBER, slot)
+            return False
+        literal = _LITERALS.get(ch)
+        if literal is not None:
+            self._assign(slot, literal[1])
+            scalar = _Scalar(_LITERAL, slot)
+            scalar.literal = literal
+            self._scalar = scalar
+            return False
+        self._fail(ch, pos)
+        return True
+
+    def _consume_string(self, scalar: _Scalar, s: str, i: int) -> int:
+        n = len(s)
+        while i < n:
+            if scalar.unicode is not None:
+                take = s[i:i + 4 - len(scalar.unicode)]
+                scalar.unicode += take
+                i += len(take)
+                if len(scalar.unicode) == 4:
+                    try:
+                        code = int(scalar.unicode, 16)
+                    except ValueError:
+                        self._error = f"Invalid unicode escape at position {self._consumed + i}"
+                        return n
+                    if 0xD800 <= code <= 0xDFFF:
+                        scalar.surrogates = True
+                    scalar.parts.append(chr(code))
+                    scalar.unicode = None
+                continue
+            if scalar.escape:
+                ch = s[i]
+                scalar.escape = False
+                if ch == "u":
+                    scalar.unicode = ""
+                else:
+                    decoded = _ESCAPES.get(ch)
+                    if decoded is None:
+                        self._fail(ch, i)
+                        return n
+                    scalar.parts.append(decoded)
+                i += 1
+                continue
+            match = _STRING_RUN.match(s, i)
+            if match:
+                scalar.parts.append(match.group())
+                i = match.end()
+                continue
+            if s[i] == "\\":
+                scalar.escape = True
+                i += 1
+                continue
+            # Closing quote
+            self._scalar = None
+            text = scalar.text()
+            if scalar.is_key:
+                frame = self._stack[-1]
+                frame.key = text
+                frame.container[text] = None
+                frame.mode = _EXPECT_COLON
+            else:
+                self._assign(scalar.slot, text)
+                self._value_completed()
+            return i + 1
+        return i
+
+    def _consume_number(self, scalar: _Scalar, s: str, i: int) -> int:
+        match = _NUMBER_RUN.match(s, i)
+        if match:
+            scalar.parts.append(match.group())
+            i = match.end()
+        if i < len(s):
+            # Any other character terminates the number and is re-read by the frame
+            self._scalar = None
+            text = "".join(scalar.parts)
+            try:
+                value = _to_number(text)
+            except ValueError:
+                self._error = f"Invalid number {text!r} at position {self._consumed + i}"
+                return len(s)
+            self._assign(scalar.slot, value)
+            self._value_completed()
+        return i
+
+    def _consume_literal(self, scalar: _Scalar, s: str, i: int) -> int:
+        word, value = scalar.literal
+        read = sum(len(p) for p in scalar.parts)
+        take = s[i:i + len(word) - read]
+        if not word.startswith(take, read):
+            self._fail(take, i)
+            return len(s)
+        scalar.parts.append(take)
+        i += len(take)
+        if read + len(take) == len(word):
+            self._scalar = None
+            self._assign(scalar.slot, value)
+            self._value_completed()
+        return i
+
+    # ========================================================================
+    # Value tree
+    # ========================================================================
+
+    def _assign(self, slot: Optional[Tuple[Any, Any]], value: Any) -> None:
+        if slot is None:
+            self._root = value
+            self._has_root = True
+        else:
+            slot[0][slot[1]] = value
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        self._value_completed()
+
+    def _value_completed(self) -> None:
+        if not self._stack:
+            self._done = True
+            return
+        if len(self._stack) == 1:
+            frame = self._stack[0]
+            if frame.is_dict and frame.key is not None:
+                self._completed_fields.append(frame.key)
+                self._new_fields.append(frame.key)
+
+    def _apply_provisional(self) -> None:
+        """Expose the open scalar (or half-read key) in the value tree."""
+        scalar = self._scalar
+        if scalar is None:
+            return
+        if scalar.is_key:
+            container = self._stack[-1].container
+            key = scalar.text()
+            if key not in container:
+                container[key] = None
+                self._provisional = (container, key)
+        elif scalar.kind == _STRING:
+            self._assign(scalar.slot, scalar.text())
+        elif scalar.kind == _NUMBER:
+            try:
+                self._assign(scalar.slot, _to_number("".join(scalar.parts), partial=True))
+            except ValueError:
+                pass
+
+    def _retract_provisional(self) -> None:
+        if self._provisional is not None:
+            container, key = self._provisional
+            container.pop(key, None)
+            self._provisional = None
+
+    def _fail(self, token: str, pos: int) -> None:
+        self._error = f"Unexpected {token!r} at position {self._consumed + pos}"
+
+
+def _to_number(text: str, partial: bool = False) -> Any:
+    """Convert a (possibly truncated) JSON number token."""
+    if partial:
+        if text in ("", "-"):
+            return 0
+        if text[-1] in ".eE+-":
+            text += "0"
+    if "." in text or "e" in text or "E" in text:
+        return float(text)
+    return int(text)
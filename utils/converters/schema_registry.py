@@ -0,0 +1,249 @@
+"""
+Structured Output Schema Registry.
+
+Caches everything derived from a Pydantic response model, computed once per
+(model class, strict flag) instead of on every request:
+
+- The OpenAI response_format dict (as built by pydantic_to_openai_schema)
+- The same fragment pre-serialized to JSON, spliced into request bodies by
+  dumps_payload() instead of re-encoding the schema per request
+- A pydantic TypeAdapter used to validate responses straight from JSON
+
+Usage:
+    compiled = get_schema_registry().get(CustomerResponse)
+    params["response_format"] = compiled.response_format
+    body = dumps_payload(payload)            # splices compiled.response_format.json
+    obj = compiled.validate(response.content)
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .json_schema_converter import parse_structured_response, pydantic_to_openai_schema
+
+T = TypeVar('T', bound=BaseModel)
+
+DEFAULT_SCHEMA_CACHE_SIZE = 256
+
+_RESPONSE_FORMAT_KEY = "response_format"
+
+
+def _read_only(self, *args: Any, **kwargs: Any) -> None:
+    raise TypeError(f"{type(self).__name__} is read-only; copy.deepcopy() it to modify")
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to their read-only variants."""
+    if isinstance(value, dict):
+        return _FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert read-only dicts and lists to plain ones."""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class _FrozenDict(dict):
+    """Dict rejecting mutation; deep copies are plain, mutable dicts."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return _thaw(self)
+
+    def __reduce__(self):
+        return (_freeze, (_thaw(self),))
+
+
+class _FrozenList(list):
+    """List rejecting mutation; deep copies are plain, mutable lists."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return _thaw(self)
+
+    def __reduce__(self):
+        return (_freeze, (_thaw(self),))
+
+
+class SerializedResponseFormat(_FrozenDict):
+    """
+    Read-only OpenAI response_format dict carrying its pre-serialized JSON.
+
+    Behaves as the plain dict for reads; dumps_payload() writes `json`
+    instead of encoding the dict. Shared between requests, so the dict and
+    everything nested in it reject mutation (which would leave `json`
+    stale); copy.deepcopy() returns a plain, mutable copy.
+
+    Attributes:
+        json: Compact JSON encoding of the dict
+    """
+
+    __slots__ = ("json",)
+
+    def __init__(self, value: Dict[str, Any]):
+        super().__init__({key: _freeze(item) for key, item in value.items()})
+        self.json = json.dumps(value, separators=(",", ":"))
+
+    def __reduce__(self):
+        return (SerializedResponseFormat, (_thaw(self),))
+
+
+@dataclass(frozen=True)
+class CompiledSchema(Generic[T]):
+    """
+    Precomputed structured output artifacts for one response model.
+
+    Attributes:
+        model_class: Pydantic model class
+        strict: Whether the OpenAI schema is strict
+        response_format: OpenAI response_format (with pre-serialized JSON)
+        adapter: TypeAdapter validating the model
+    """
+
+    model_class: Type[T]
+    strict: bool
+    response_format: SerializedResponseFormat
+    adapter: TypeAdapter
+
+    def validate(self, content: str) -> Optional[T]:
+        """
+        Validate response content against the model.
+
+        Plain JSON is validated in one step by the adapter; content wrapped
+        in markdown or surrounded by text falls back to
+        parse_structured_response() (same results and errors as before).
+
+        Args:
+            content: Response content from the LLM
+
+        Returns:
+            Validated model instance, or None for empty content
+
+        Raises:
+            ValidationError: If the JSON does not match the model
+            ValueError: If no JSON can be extracted from the content
+        """
+        try:
+            return self.adapter.validate_json(content)
+        except ValidationError as e:
+            if not all(error["type"] == "json_invalid" for error in e.errors()):
+                raise
+        return parse_structured_response(content, self.model_class, partial=False)
+
+
+class SchemaRegistry:
+    """
+    Thread-safe LRU cache of CompiledSchema per (model class, strict).
+
+    Attributes:
+        max_size: Maximum number of cached models
+        hits: Lookups served from the cache
+        misses: Lookups that compiled a schema
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SCHEMA_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[type, bool], CompiledSchema]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, model_class: Type[T], strict: bool = True) -> CompiledSchema[T]:
+        """
+        Get the compiled schema for a model, computing it on first use.
+
+        Args:
+            model_class: Pydantic model class
+            strict: Whether to build a strict OpenAI schema
+
+        Returns:
+            CompiledSchema for (model_class, strict)
+        """
+        key = (model_class, bool(strict))
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return compiled
+
+        compiled = CompiledSchema(
+            model_class=model_class,
+            strict=bool(strict),
+            response_format=SerializedResponseFormat(pydantic_to_openai_schema(model_class, strict=strict)),
+            adapter=TypeAdapter(model_class),
+        )
+        with self._lock:
+            self.misses += 1
+            # Another thread may have compiled it meanwhile; keep the first
+            compiled = self._cache.setdefault(key, compiled)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop all cached schemas (e.g. after redefining models in tests)."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_registry: Optional[SchemaRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Get the process-wide schema registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SchemaRegistry()
+    return _registry
+
+
+def dumps_payload(payload: Any) -> str:
+    """
+    Serialize a request payload, splicing in a pre-serialized response_format.
+
+    Drop-in replacement for json.dumps when building request bodies.
+
+    Args:
+        payload: Request payload
+
+    Returns:
+        JSON string
+    """
+    if not isinstance(payload, dict):
+        return json.dumps(payload)
+    response_format = payload.get(_RESPONSE_FORMAT_KEY)
+    if not isinstance(response_format, SerializedResponseFormat):
+        return json.dumps(payload)
+
+    rest = {key: value for key, value in payload.items() if key != _RESPONSE_FORMAT_KEY}
+    fragment = f'"{_RESPONSE_FORMAT_KEY}": {response_format.json}'
+    if not rest:
+        return "{" + fragment + "}"
+    return json.dumps(rest)[:-1] + ", " + fragment + "}"
@@ -0,0 +1,21 @@
+"""
+HTTP utilities shared by LLM connectors and HTTP tools.
+
+Available:
+- PooledTransport: Per-endpoint aiohttp connection pools with keep-alive and DNS caching
+- get_shared_transport: Process-wide PooledTransport
+"""
+
+from .pooled_transport import (
+    PooledTransport,
+    get_shared_transport,
+    shutdown_shared_transport,
+    reset_shared_transport,
+)
+
+__all__ = [
+    "PooledTransport",
+    "get_shared_transport",
+    "shutdown_shared_transport",
+    "reset_shared_transport",
+]
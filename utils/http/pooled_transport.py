@@ -0,0 +1,341 @@
+"""
+Pooled HTTP Transport.
+
+Shared aiohttp transport with one connection pool per endpoint (origin), used
+by both LLM connectors and HTTP tool executors so that TCP/TLS connections to
+the same host are reused across callers.
+
+Features:
+=========
+- Per-endpoint TCPConnector pools (scheme://host:port), optional per-endpoint limits
+- HTTP keep-alive and DNS TTL caching
+- Warm-up of endpoint pools on startup (pre-established TLS connections)
+- Connection statistics (created vs. reused connections, requests, in use)
+- Pools are bound to their event loop and transparently rebuilt for a new loop
+
+Usage:
+======
+    from utils.http import get_shared_transport
+    
+    transport = get_shared_transport()
+    await transport.warm_up(["https://eastus.openai.azure.com"])
+    
+    session = transport.get_session("https://eastus.openai.azure.com/openai/...")
+    async with session.post(url, json=payload, headers=headers) as response:
+        ...
+    
+    # On shutdown
+    await shutdown_shared_transport()
+
+Version: 1.0.0
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from utils.logging.LoggerAdaptor import LoggerAdaptor
+
+
+@dataclass
+class _EndpointPool:
+    """Connection pool state for one origin."""
+    connector: aiohttp.TCPConnector
+    session: aiohttp.ClientSession
+    loop: asyncio.AbstractEventLoop
+    created_at: float = field(default_factory=time.time)
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+
+
+class PooledTransport:
+    """
+    Per-endpoint aiohttp connection pools shared across clients.
+    
+    Each origin gets its own TCPConnector and ClientSession, so limits and
+    keep-alive apply per endpoint and a failover to another endpoint does not
+    disturb connections held to the previous one. Sessions carry no default
+    headers; callers pass auth headers per request.
+    
+    Attributes:
+        limit: Maximum connections per endpoint pool
+        limit_per_host: Maximum connections per resolved host in a pool
+        keepalive_timeout: Seconds an idle connection is kept open
+        ttl_dns_cache: Seconds DNS results are cached (None = forever)
+        endpoint_limits: Per-origin overrides of `limit`
+    """
+    
+    DEFAULT_LIMIT = 100  # Max connections per endpoint pool
+    DEFAULT_LIMIT_PER_HOST = 0  # 0 = bounded only by DEFAULT_LIMIT
+    DEFAULT_KEEPALIVE_TIMEOUT = 60  # Keep idle TLS connections for reuse
+    DEFAULT_TTL_DNS_CACHE = 300  # Re-resolve endpoints every 5 minutes
+    DEFAULT_TIMEOUT_TOTAL = 60  # Default session timeout (requests may override)
+    DEFAULT_TIMEOUT_CONNECT = 10
+    DEFAULT_WARM_UP_TIMEOUT = 5.0
+    
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+        timeout_total: float = DEFAULT_TIMEOUT_TOTAL,
+        timeout_connect: float = DEFAULT_TIMEOUT_CONNECT,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the transport (pools are created lazily per endpoint).
+        
+        Args:
+            limit: Maximum connections per endpoint pool
+            limit_per_host: Maximum connections per host within a pool (0 = no extra cap)
+            keepalive_timeout: Keep-alive timeout for idle connections
+            ttl_dns_cache: DNS cache TTL in seconds
+            timeout_total: Default total timeout of pooled sessions
+            timeout_connect: Connection timeout in seconds
+            endpoint_limits: Optional {url_or_origin: limit} overrides
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout_total = timeout_total
+        self.timeout_connect = timeout_connect
+        self.endpoint_limits = {
+            self.origin(url): value for url, value in (endpoint_limits or {}).items()
+        }
+        self._pools: Dict[str, _EndpointPool] = {}
+        self.logger = LoggerAdaptor.get_logger("http.pooled_transport")
+    
+    @staticmethod
+    def origin(url: str) -> str:
+        """
+        Normalize a URL to its pool key (scheme://host[:port]).
+        
+        Args:
+            url: Full URL or origin
+            
+        Returns:
+            Lower-cased origin of the URL
+        """
+        parts = urlsplit(url)
+        if not parts.scheme or not parts.netloc:
+            raise ValueError(f"URL must be absolute to select a connection pool: {url!r}")
+        return f"{parts.scheme}://{parts.netloc}".lower()
+    
+    def set_endpoint_limit(self, url: str, limit: int) -> None:
+        """
+        Set the connection limit of one endpoint (applies to new pools).
+        
+        Args:
+            url: Endpoint URL or origin
+            limit: Maximum connections for the endpoint
+        """
+        self.endpoint_limits[self.origin(url)] = limit
+    
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Get the pooled session for the endpoint of `url`.
+        
+        Must be called from a running event loop. Pools created on another
+        (e.g. closed) loop are discarded and rebuilt.
+        
+        Args:
+            url: Request URL or origin
+            
+        Returns:
+            ClientSession bound to the endpoint's connection pool
+        """
+        key = self.origin(url)
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(key)
+        if pool is not None and (pool.loop is not loop or pool.session.closed):
+            self._discard(key, pool)
+            pool = None
+        if pool is None:
+            pool = self._pools[key] = self._create_pool(key, loop)
+        return pool.session
+    
+    def _create_pool(self, key: str, loop: asyncio.AbstractEventLoop) -> _EndpointPool:
+        connector = aiohttp.TCPConnector(
+            limit=self.endpoint_limits.get(key, self.limit),
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            force_close=False,
+        )
+        pool: _EndpointPool
+        
+        async def on_request_start(session, context, params):
+            pool.requests += 1
+        
+        async def on_connection_create_end(session, context, params):
+            pool.connections_created += 1
+        
+        async def on_connection_reuseconn(session, context, params):
+            pool.connections_reused += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout_total, connect=self.timeout_connect),
+            trace_configs=[trace_config],
+        )
+        pool = _EndpointPool(connector=connector, session=session, loop=loop)
+        self.logger.debug("Created connection pool", endpoint=key)
+        return pool
+    
+    def _discard(self, key: str, pool: _EndpointPool) -> None:
+        """Drop a pool; close it if its loop is still usable."""
+        self._pools.pop(key, None)
+        if pool.session.closed:
+            return
+        if pool.loop.is_closed():
+            # Transports died with their loop; mark the pool closed without I/O
+            pool.connector._close()
+            return
+        try:
+            if pool.loop is asyncio.get_running_loop():
+                pool.loop.create_task(pool.session.close())
+            else:
+                asyncio.run_coroutine_threadsafe(pool.session.close(), pool.loop)
+        except RuntimeError:
+            pass
+    
+    async def warm_up(
+        self,
+        urls: Iterable[str],
+        timeout: float = DEFAULT_WARM_UP_TIMEOUT,
+    ) -> Dict[str, bool]:
+        """
+        Open a keep-alive connection to each endpoint ahead of traffic.
+        
+        Sends a HEAD request to every origin so the DNS lookup and TLS
+        handshake happen at startup. Any HTTP status counts as success.
+        
+        Args:
+            urls: Endpoint URLs (deduplicated by origin)
+            timeout: Per-endpoint timeout in seconds
+            
+        Returns:
+            {origin: True if a connection was established}
+        """
+        origins = list(dict.fromkeys(self.origin(url) for url in urls))
+        
+        async def warm(origin: str) -> bool:
+            session = self.get_session(origin)
+            try:
+                async with session.head(
+                    origin, allow_redirects=False, timeout=aiohttp.ClientTimeout(total=timeout)
+                ):
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning("Warm-up failed", endpoint=origin, error=str(e))
+                return False
+        
+        results = await asyncio.gather(*(warm(origin) for origin in origins))
+        return dict(zip(origins, results))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get per-endpoint pool statistics.
+        
+        Returns:
+            Dict with pool count and {origin: stats} for every open pool
+        """
+        endpoints = {}
+        for key, pool in self._pools.items():
+            connector = pool.connector
+            acquired = getattr(connector, "_acquired", ())
+            idle = getattr(connector, "_conns", {})
+            endpoints[key] = {
+                "limit": connector.limit,
+                "in_use": len(acquired),
+                "idle": sum(len(conns) for conns in idle.values()),
+                "requests": pool.requests,
+                "connections_created": pool.connections_created,
+                "connections_reused": pool.connections_reused,
+                "closed": pool.session.closed,
+            }
+        return {
+            "pools": len(self._pools),
+            "keepalive_timeout": self.keepalive_timeout,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "endpoints": endpoints,
+        }
+    
+    async def close_endpoint(self, url: str) -> None:
+        """
+        Close the pool of a single endpoint.
+        
+        Args:
+            url: Endpoint URL or origin
+        """
+        pool = self._pools.pop(self.origin(url), None)
+        if pool and not pool.session.closed:
+            await pool.session.close()
+    
+    async def close(self) -> None:
+        """Close every pool (pools of other event loops are closed on their loop)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        pools, self._pools = self._pools, {}
+        for key, pool in pools.items():
+            if pool.loop is loop and not pool.session.closed:
+                await pool.session.close()
+            else:
+                self._discard(key, pool)
+
+
+# =============================================================================
+# Shared Instance
+# =============================================================================
+
+_shared_transport: Optional[PooledTransport] = None
+_sync_lock = threading.Lock()
+
+
+def get_shared_transport(**kwargs) -> PooledTransport:
+    """
+    Get the process-wide pooled transport (singleton).
+    
+    Args:
+        **kwargs: Arguments passed to PooledTransport on first call
+        
+    Returns:
+        Shared PooledTransport instance
+    """
+    global _shared_transport
+    
+    if _shared_transport is None:
+        with _sync_lock:
+            if _shared_transport is None:
+                _shared_transport = PooledTransport(**kwargs)
+    
+    return _shared_transport
+
+
+async def shutdown_shared_transport() -> None:
+    """Close all pools of the shared transport."""
+    if _shared_transport is not None:
+        await _shared_transport.close()
+
+
+def reset_shared_transport() -> None:
+    """Reset the shared transport (for testing)."""
+    global _shared_transport
+    with _sync_lock:
+        _shared_transport = None
@@ -0,0 +1,315 @@
+"""
+AsyncLogHandler - Non-blocking log emission through a background writer.
+
+Wraps a regular handler (console, file, rotating file) so that emitting a
+record only appends it to a bounded in-memory ring buffer. A background
+writer thread drains the buffer in batches and writes them to the wrapped
+handler, so slow stdout or file sinks no longer add latency to the caller
+(typically the asyncio event loop).
+
+- Bounded buffer with a configurable overflow policy
+  (drop_oldest, drop_newest or block with a timeout)
+- Batched writes: plain stream/file handlers get one write and one flush
+  per batch
+- flush() waits until everything queued so far has been written;
+  close() (called by LoggerAdaptor.shutdown() and logging.shutdown())
+  drains the buffer before closing the wrapped handler
+- shared() gives every logger configured with the same sink one handler
+  (one buffer, one writer thread); release_shared() closes it with the last user
+
+Enabled per handler in the logging config:
+    "handlers": {
+        "file": {
+            "type": "rotating_file",
+            "filename": "app.log",
+            "async": {"capacity": 10000, "overflow_policy": "drop_oldest", "batch_size": 256}
+        }
+    }
+
+("async": true uses the defaults below.)
+"""
+
+import logging
+import logging.handlers
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from utils.logging.Enum import OverflowPolicy
+
+DEFAULT_CAPACITY = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_BLOCK_TIMEOUT_SECONDS = 1.0
+DEFAULT_FLUSH_TIMEOUT_SECONDS = 5.0
+
+
+class AsyncLogHandler(logging.Handler):
+    """
+    Handler that hands records to a background writer thread.
+
+    The wrapper takes the wrapped handler's level, so level gating
+    (LoggerAdaptor.isEnabledFor) is unchanged.
+
+    Attributes:
+        target: Wrapped handler that performs the actual writes
+        capacity: Maximum number of buffered records
+        overflow_policy: What emit() does when the buffer is full
+        batch_size: Maximum records written per batch
+        dropped: Number of records discarded because the buffer was full
+    """
+
+    _shared: dict[str, 'AsyncLogHandler'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        block_timeout_seconds: float = DEFAULT_BLOCK_TIMEOUT_SECONDS,
+        flush_timeout_seconds: float = DEFAULT_FLUSH_TIMEOUT_SECONDS,
+    ):
+        super().__init__(target.level)
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("capacity and batch_size must be positive")
+        self.target = target
+        self.capacity = capacity
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.batch_size = batch_size
+        self.block_timeout_seconds = block_timeout_seconds
+        self.flush_timeout_seconds = flush_timeout_seconds
+        self.dropped = 0
+        self._shared_key: str | None = None
+        self._refs = 0
+
+        self._buffer: deque[logging.LogRecord] = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._writer = threading.Thread(
+            target=self._run, name=f"AsyncLogHandler-{target.name or type(target).__name__}", daemon=True
+        )
+        self._writer.start()
+
+    @classmethod
+    def from_config(cls, target: logging.Handler, options: dict[str, Any] | bool) -> 'AsyncLogHandler':
+        """
+        Wrap a handler using a handler config's "async" value.
+
+        Args:
+            target: Configured handler to wrap
+            options: True for defaults, or a dict of constructor arguments
+
+        Returns:
+            AsyncLogHandler wrapping target
+        """
+        options = options if isinstance(options, dict) else {}
+        return cls(
+            target,
+            capacity=options.get('capacity', DEFAULT_CAPACITY),
+            overflow_policy=options.get('overflow_policy', OverflowPolicy.DROP_OLDEST),
+            batch_size=options.get('batch_size', DEFAULT_BATCH_SIZE),
+            block_timeout_seconds=options.get('block_timeout_seconds', DEFAULT_BLOCK_TIMEOUT_SECONDS),
+            flush_timeout_seconds=options.get('flush_timeout_seconds', DEFAULT_FLUSH_TIMEOUT_SECONDS),
+        )
+
+    @classmethod
+    def shared(
+        cls,
+        key: str,
+        build_target: Callable[[], logging.Handler | None],
+        options: dict[str, Any] | bool,
+    ) -> 'AsyncLogHandler | None':
+        """
+        Get the handler of a sink, creating it on first use.
+
+        Each call takes a reference that must be returned with release_shared().
+
+        Args:
+            key: Sink identity (same key, same handler)
+            build_target: Creates the wrapped handler on first use; may
+                return None for a sink that cannot be built
+            options: "async" config value, see from_config()
+
+        Returns:
+            Shared AsyncLogHandler for the sink, or None if build_target()
+            returned None
+        """
+        with cls._shared_lock:
+            handler = cls._shared.get(key)
+            if handler is None or handler._closed:
+                target = build_target()
+                if target is None:
+                    return None
+                handler = cls.from_config(target, options)
+                handler._shared_key = key
+                cls._shared[key] = handler
+            handler._refs += 1
+            return handler
+
+    def release_shared(self) -> None:
+        """Return a reference taken by shared(); the last one closes the handler."""
+        with AsyncLogHandler._shared_lock:
+            if self._shared_key is not None:
+                self._refs -= 1
+                if self._refs > 0:
+                    return
+        self.close()
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        """Formatting happens in the wrapped handler."""
+        self.target.setFormatter(fmt)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record; never writes on the calling thread."""
+        try:
+            self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._buffer) >= self.capacity:
+                if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                if self.overflow_policy is OverflowPolicy.BLOCK:
+                    deadline = time.monotonic() + self.block_timeout_seconds
+                    while len(self._buffer) >= self.capacity and not self._closed:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    if self._closed:
+                        return
+                if len(self._buffer) >= self.capacity:
+                    # DROP_OLDEST, or BLOCK after the timeout expired
+                    self._buffer.popleft()
+                    self.dropped += 1
+            self._buffer.append(record)
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every record queued so far has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (default: flush_timeout_seconds)
+
+        Returns:
+            True if the buffer was drained within the timeout
+        """
+        if threading.current_thread() is self._writer:
+            return False
+        timeout = self.flush_timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while (self._buffer or self._in_flight) and self._writer.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            drained = not (self._buffer or self._in_flight)
+        if not drained:
+            # Writer is gone; write what is left here
+            self._drain_inline()
+        return True
+
+    def close(self) -> None:
+        """Drain the buffer, stop the writer and close the wrapped handler."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        with AsyncLogHandler._shared_lock:
+            if AsyncLogHandler._shared.get(self._shared_key) is self:
+                del AsyncLogHandler._shared[self._shared_key]
+        if threading.current_thread() is not self._writer:
+            self._writer.join(self.flush_timeout_seconds)
+        self._drain_inline()
+        try:
+            self.target.close()
+        finally:
+            super().close()
+
+    @property
+    def pending(self) -> int:
+        """Number of records queued or being written."""
+        with self._condition:
+            return len(self._buffer) + self._in_flight
+
+    def _prepare(self, record: logging.LogRecord) -> None:
+        """Make the record independent of caller state before queueing."""
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+
+    def _run(self) -> None:
+        """Writer loop: wait for records, write them in batches."""
+        while True:
+            with self._condition:
+                while not self._buffer and not self._closed:
+                    self._condition.wait()
+                if not self._buffer:
+                    return
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                self._in_flight = len(batch)
+                self._condition.notify_all()  # Wake producers blocked on a full buffer
+
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    def _drain_inline(self) -> None:
+        """Write remaining records on the calling thread."""
+        with self._condition:
+            batch = list(self._buffer)
+            self._buffer.clear()
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, records: list[logging.LogRecord]) -> None:
+        """Write records to the wrapped handler, batching plain streams."""
+        target = self.target
+        records = [r for r in records if r.levelno >= target.level]
+        if not records:
+            return
+
+        stream = getattr(target, 'stream', None)
+        if (
+            not isinstance(target, logging.StreamHandler)
+            or isinstance(target, logging.handlers.BaseRotatingHandler)
+            or stream is None
+        ):
+            # Rotating handlers decide per record; others go through handle()
+            for record in records:
+                target.handle(record)
+            return
+
+        lines = []
+        for record in records:
+            if not target.filter(record):
+                continue
+            try:
+                lines.append(target.format(record) + target.terminator)
+            except Exception:
+                target.handleError(record)
+        if not lines:
+            return
+
+        target.acquire()
+        try:
+            stream.write("".join(lines))
+            target.flush()
+        except Exception:
+            target.handleError(records[-1])
+        finally:
+            target.release()
@@ -22,6 +22,25 @@ RECOMMENDATIONS FOR LAMBDA:
 - Consider Lambda Powertools for structured logging instead
 - Use CloudWatch Logs for centralized log management
 
+MEMORY BUDGET
+=============
+Each entry's payload (message, kwargs, context) is serialized once on
+enqueue; its UTF-8 JSON size is recorded then and subtracted on dequeue, and
+the encoded payload is reused if the entry is spilled. queue_size_kb is the soft
+threshold at which the caller flushes the queue; max_queue_kb is a hard
+ceiling above it that the in-memory queue never exceeds, even under
+concurrent logging. An entry larger than max_queue_kb on its own has its
+message truncated to fit, or is dropped if that is not enough.
+overflow_policy decides what happens to an entry that does not fit:
+- flush: flush the queue on the caller first (default)
+- drop_debug: drop the entry if it is DEBUG, else evict queued DEBUG
+  entries (oldest first), then flush if it still does not fit
+- spill: append it to a JSON-lines spill file (spill_path, default a
+  temporary file), replayed in order after the in-memory queue
+
+get_queue_metrics() reports depth, bytes, drops, truncations, spills and
+early flushes.
+
 Usage:
     from utils.logging.DelayedLogger import DelayedLogger
 
@@ -30,12 +49,21 @@ Usage:
     delayed_logger.flush_delayed_logs()  # Manual flush
 """
 
+import json
 import os
+import tempfile
 import threading
 from datetime import datetime
 from queue import Queue, Empty
-from typing import Any, Dict, Optional
-from utils.logging.Enum import LoggingFormat
+from typing import Any, Dict, List, Optional, Tuple
+from utils.logging.Enum import LoggingFormat, DelayedOverflowPolicy
+from utils.logging.LoggerAdaptor import resolve_lazy
+
+TRUNCATION_MARKER = "...[truncated]"
+
+# Spill lines: entry metadata with the encoded payload spliced in
+_SPILL_HEADER_KEYS = ('level', 'backend', 'timestamp')
+_SPILL_PAYLOAD_KEY = 'payload'
 
 
 class DelayedLogger:
@@ -58,6 +86,22 @@ class DelayedLogger:
         self.delayed_logging_size_kb = 0  # 0 = immediate
         self.delayed_logging_flush_on_exception = True
         self.delayed_logging_flush_on_completion = True
+        self.delayed_logging_max_queue_kb = 0  # 0 = no memory budget
+        self.delayed_logging_overflow_policy = DelayedOverflowPolicy.FLUSH
+        self.delayed_logging_spill_path: Optional[str] = None
+
+        # Queue accounting (estimated bytes of the queued entries); producers
+        # hold _enqueue_lock from the budget check until the entry is queued
+        self._accounting_lock = threading.Lock()
+        self._enqueue_lock = threading.RLock()
+        self._queue_bytes = 0
+        self._reset_metrics()
+
+        # Spill file state
+        self._spill_lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._spill_file: Optional[str] = None
+        self._spill_pending = 0
 
         # Check if running on Lambda and disable delayed logging if so
         if self._is_running_on_lambda():
@@ -80,6 +124,10 @@ class DelayedLogger:
         self.delayed_logging_size_kb = delayed_config.get('queue_size_kb', 0)
         self.delayed_logging_flush_on_exception = delayed_config.get('flush_on_exception', True)
         self.delayed_logging_flush_on_completion = delayed_config.get('flush_on_completion', True)
+        self.delayed_logging_max_queue_kb = delayed_config.get('max_queue_kb', 0)
+        self.delayed_logging_overflow_policy = DelayedOverflowPolicy(
+            delayed_config.get('overflow_policy', DelayedOverflowPolicy.FLUSH.value))
+        self.delayed_logging_spill_path = delayed_config.get('spill_path')
 
         # Check if running on Lambda
         if self._is_running_on_lambda():
@@ -107,6 +155,8 @@ class DelayedLogger:
     def _initialize_queue(self):
         """Initialize the log queue and worker thread."""
         self._log_queue: Queue = Queue()
+        with self._accounting_lock:
+            self._queue_bytes = 0
         self._worker_thread: Optional[threading.Thread] = None
         self._stop_worker = threading.Event()
         self._start_worker_thread()
@@ -151,10 +201,16 @@ class DelayedLogger:
                     break
 
                 # Process the log entry
+                self._on_dequeue(log_entry)
                 self._process_delayed_log_entry(log_entry)
 
             except Empty:
-                # Timeout occurred, check if we should continue
+                # Idle: replay spilled entries, then check if we should continue
+                if self._spill_pending and self._replay_lock.acquire(blocking=False):
+                    try:
+                        self._replay_spill()
+                    finally:
+                        self._replay_lock.release()
                 continue
             except Exception as e:
                 # Log any errors that occur during processing
@@ -200,6 +256,13 @@ class DelayedLogger:
             self._log_message_immediate(level, *args, **kwargs)
             return
 
+        # Drop disabled levels before queueing; lazy values are resolved now,
+        # while the state they capture is current
+        is_enabled = getattr(self.logger, 'isEnabledFor', None)
+        if is_enabled is not None and not is_enabled(level):
+            return
+        args, kwargs = resolve_lazy(args, kwargs)
+
         # Create log entry
         message = self._format_message(*args)
         log_entry = {
@@ -211,8 +274,10 @@ class DelayedLogger:
             'context': getattr(self.logger, 'context', {}).copy()
         }
 
-        # Add to queue
-        self._log_queue.put(log_entry)
+        # Add to queue (or handle overflow)
+        encoded = self._encode(log_entry)
+        log_entry['size_bytes'] = len(encoded.encode('utf-8'))
+        self._enqueue(log_entry, encoded)
 
         # Check if we should flush based on size
         if self.delayed_logging_size_kb > 0:
@@ -243,30 +308,193 @@ class DelayedLogger:
         return message
 
     def _get_queue_size_kb(self) -> float:
-        """Get approximate size of queue in KB."""
-        total_size = 0
-        try:
-            # Sample a few entries to estimate size
-            queue_size = self._log_queue.qsize()
-            sample_size = min(10, queue_size)
+        """Get the exact size of the in-memory queue in KB."""
+        return self._queue_bytes / 1024
 
-            for _ in range(sample_size):
-                try:
-                    entry = self._log_queue.get(timeout=0.1)
-                    entry_size = len(str(entry).encode('utf-8'))
-                    total_size += entry_size
-                    self._log_queue.put(entry)  # Put it back
-                except Empty:
-                    break
+    def get_queue_metrics(self) -> Dict[str, Any]:
+        """
+        Get delayed queue metrics.
 
-            # Extrapolate for full queue
-            if sample_size > 0:
-                estimated_size = (total_size / sample_size) * queue_size
-                return estimated_size / 1024  # Convert to KB
-        except Exception:
-            pass
+        Returns:
+            Dictionary with queue_depth, queue_bytes, max_queue_bytes,
+            peak_queue_bytes, dropped_entries, truncated_entries,
+            spilled_entries, spill_pending and early_flushes
+        """
+        queue = getattr(self, '_log_queue', None)
+        with self._accounting_lock:
+            return {
+                'queue_depth': queue.qsize() if queue is not None else 0,
+                'queue_bytes': self._queue_bytes,
+                'max_queue_bytes': self._max_queue_bytes(),
+                'peak_queue_bytes': self._peak_queue_bytes,
+                'dropped_entries': self._dropped_entries,
+                'truncated_entries': self._truncated_entries,
+                'spilled_entries': self._spilled_entries,
+                'spill_pending': self._spill_pending,
+                'early_flushes': self._early_flushes,
+            }
+
+    def _reset_metrics(self):
+        self._peak_queue_bytes = 0
+        self._dropped_entries = 0
+        self._truncated_entries = 0
+        self._spilled_entries = 0
+        self._early_flushes = 0
+
+    def _max_queue_bytes(self) -> int:
+        return int(self.delayed_logging_max_queue_kb * 1024)
+
+    @staticmethod
+    def _encode(log_entry: Dict[str, Any]) -> str:
+        """Serialize an entry's payload (message, kwargs, context) as JSON."""
+        payload = (log_entry['message'], log_entry['kwargs'], log_entry.get('context', {}))
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+    def _enqueue(self, log_entry: Dict[str, Any], encoded: str):
+        """Queue an entry within the memory budget."""
+        max_bytes = self._max_queue_bytes()
+        with self._enqueue_lock:
+            if max_bytes and log_entry['size_bytes'] > max_bytes:
+                truncated = self._truncate(log_entry, max_bytes)
+                if truncated is None:
+                    return
+                log_entry, encoded = truncated
+            size = log_entry['size_bytes']
+            if max_bytes and self._queue_bytes + size > max_bytes:
+                if not self._make_room(log_entry, encoded, max_bytes):
+                    return
+
+            if self._spill_pending:
+                # Keep order: once spilling, newer entries follow the spilled ones
+                self._spill(log_entry, encoded)
+                return
+
+            with self._accounting_lock:
+                self._queue_bytes += size
+                self._peak_queue_bytes = max(self._peak_queue_bytes, self._queue_bytes)
+            self._log_queue.put(log_entry)
+
+    def _truncate(self, log_entry: Dict[str, Any], max_bytes: int) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Shorten the message of an entry larger than the whole budget.
 
-        return 0.0
+        Every character encodes to at least one byte, so dropping the
+        overflow in characters always brings the entry within budget.
+
+        Returns:
+            (entry with a truncated message, its encoding), or None (dropped)
+            if the rest of the entry alone does not fit
+        """
+        message = log_entry['message']
+        keep = len(message) - (log_entry['size_bytes'] - max_bytes) - len(TRUNCATION_MARKER)
+        if keep >= 0:
+            log_entry = dict(log_entry, message=message[:keep] + TRUNCATION_MARKER)
+            encoded = self._encode(log_entry)
+            log_entry['size_bytes'] = len(encoded.encode('utf-8'))
+        with self._accounting_lock:
+            if keep < 0 or log_entry['size_bytes'] > max_bytes:
+                self._dropped_entries += 1
+                return None
+            self._truncated_entries += 1
+        return log_entry, encoded
+
+    def _make_room(self, log_entry: Dict[str, Any], encoded: str, max_bytes: int) -> bool:
+        """
+        Apply the overflow policy to an entry that does not fit (caller
+        holds _enqueue_lock).
+
+        Returns:
+            True if the entry should now be queued in memory
+        """
+        policy = self.delayed_logging_overflow_policy
+        size = log_entry['size_bytes']
+
+        if policy is DelayedOverflowPolicy.SPILL:
+            self._spill(log_entry, encoded)
+            return False
+
+        if policy is DelayedOverflowPolicy.DROP_DEBUG:
+            if log_entry['level'] == 'DEBUG':
+                with self._accounting_lock:
+                    self._dropped_entries += 1
+                return False
+            self._evict_debug(max_bytes - size)
+            if self._queue_bytes + size <= max_bytes:
+                return True
+
+        # FLUSH, or DROP_DEBUG without enough DEBUG entries to evict
+        with self._accounting_lock:
+            self._early_flushes += 1
+        self.flush_delayed_logs()
+        return True
+
+    def _evict_debug(self, target_bytes: int):
+        """Remove queued DEBUG entries, oldest first, until at most target_bytes remain."""
+        queue = self._log_queue
+        with queue.mutex:
+            kept = []
+            for entry in queue.queue:
+                if (self._queue_bytes > target_bytes and isinstance(entry, dict)
+                        and entry.get('level') == 'DEBUG'):
+                    self._on_dequeue(entry)
+                    with self._accounting_lock:
+                        self._dropped_entries += 1
+                    continue
+                kept.append(entry)
+            queue.queue.clear()
+            queue.queue.extend(kept)
+
+    def _on_dequeue(self, log_entry: Any):
+        """Release the accounted bytes of a dequeued entry."""
+        if isinstance(log_entry, dict):
+            with self._accounting_lock:
+                self._queue_bytes = max(0, self._queue_bytes - log_entry.get('size_bytes', 0))
+
+    def _spill(self, log_entry: Dict[str, Any], encoded: str):
+        """Append an entry to the spill file, splicing in its encoded payload."""
+        header = json.dumps({key: log_entry.get(key) for key in _SPILL_HEADER_KEYS}, default=str)
+        line = f'{header[:-1]}, "{_SPILL_PAYLOAD_KEY}": {encoded}}}\n'
+        with self._spill_lock:
+            if self._spill_file is None:
+                self._spill_file = self.delayed_logging_spill_path or self._create_spill_file()
+            with open(self._spill_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self._spill_pending += 1
+        with self._accounting_lock:
+            self._spilled_entries += 1
+
+    @staticmethod
+    def _create_spill_file() -> str:
+        fd, path = tempfile.mkstemp(prefix='delayed_log_spill_', suffix='.jsonl')
+        os.close(fd)
+        return path
+
+    def _replay_spill(self):
+        """Process spilled entries in order until the spill file is empty (caller holds _replay_lock)."""
+        while self._spill_pending:
+            with self._spill_lock:
+                try:
+                    with open(self._spill_file, 'r+', encoding='utf-8') as f:
+                        lines: List[str] = f.readlines()
+                        f.seek(0)
+                        f.truncate()
+                except OSError:
+                    lines = []
+                if not lines:
+                    self._spill_pending = 0
+                    return
+
+            for line in lines:
+                try:
+                    log_entry = json.loads(line)
+                    log_entry['message'], log_entry['kwargs'], log_entry['context'] = (
+                        log_entry.pop(_SPILL_PAYLOAD_KEY))
+                except ValueError:
+                    continue  # Partially written line
+                self._process_delayed_log_entry(log_entry)
+            with self._spill_lock:
+                # Entries spilled meanwhile stay pending, keeping new ones behind them
+                self._spill_pending = max(0, self._spill_pending - len(lines))
 
     def flush_delayed_logs(self):
         """Force flush all delayed log entries."""
@@ -277,10 +505,16 @@ class DelayedLogger:
         while True:
             try:
                 log_entry = self._log_queue.get_nowait()
+                self._on_dequeue(log_entry)
                 self._process_delayed_log_entry(log_entry)
             except Empty:
                 break
 
+        # Then everything that overflowed to the spill file
+        if self._spill_pending:
+            with self._replay_lock:
+                self._replay_spill()
+
     def flush_on_exception(self):
         """Flush delayed logs when an exception occurs."""
         if self.delayed_logging_enabled and self.delayed_logging_flush_on_exception:
@@ -299,6 +533,15 @@ class DelayedLogger:
         # Stop worker thread
         self._shutdown_queue()
 
+        # Remove a temporary spill file (a configured spill_path is kept)
+        with self._spill_lock:
+            if self._spill_file and not self.delayed_logging_spill_path and not self._spill_pending:
+                try:
+                    os.remove(self._spill_file)
+                except OSError:
+                    pass
+                self._spill_file = None
+
     # Delayed logging methods
     def debug_delayed(self, *args, **kwargs):
         """Log debug message with delayed processing."""
@@ -40,7 +40,23 @@ class RedactionConfig(Enum):
     ENABLED = "enabled"
     PLACEHOLDER = "placeholder"
     PATTERNS = "patterns"
+    SAFE_KEYS = "safe_keys"
+    REDACT_KEYS = "redact_keys"
 
 class RedactionPattern(Enum):
     """Enumeration for redaction pattern types."""
-    CREDIT_CARD = "credit_card"
\ No newline at end of file
+    CREDIT_CARD = "credit_card"
+
+
+class OverflowPolicy(Enum):
+    """Enumeration for what an async handler does when its buffer is full."""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
+class DelayedOverflowPolicy(Enum):
+    """Enumeration for what DelayedLogger does when its memory budget is reached."""
+    FLUSH = "flush"
+    DROP_DEBUG = "drop_debug"
+    SPILL = "spill"
@@ -4,11 +4,49 @@ import logging
 import logging.handlers
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from datetime import datetime
 from utils.logging.RedactionManager import RedactionManager
 from utils.logging.Enum import LoggingFormat, RedactionConfig
 from utils.logging.ConfigManager import ConfigManager
+from utils.logging.AsyncLogHandler import AsyncLogHandler
+
+
+class LazyValue:
+    """
+    Log argument computed only if the record is actually emitted.
+
+    Usage:
+    ```python
+    logger.debug("Tool result", result=lazy(lambda: str(result)))
+    ```
+    """
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    def resolve(self) -> Any:
+        """Compute the value."""
+        return self.fn()
+
+
+def lazy(fn: Callable[[], Any]) -> LazyValue:
+    """Wrap a zero-argument callable as a lazily evaluated log argument."""
+    return LazyValue(fn)
+
+
+def resolve_lazy(args: tuple, kwargs: dict[str, Any]) -> tuple[tuple, dict[str, Any]]:
+    """Evaluate LazyValue message args and kwargs (top level only)."""
+    if any(isinstance(arg, LazyValue) for arg in args):
+        args = tuple(arg.resolve() if isinstance(arg, LazyValue) else arg for arg in args)
+    if any(isinstance(value, LazyValue) for value in kwargs.values()):
+        kwargs = {
+            key: value.resolve() if isinstance(value, LazyValue) else value
+            for key, value in kwargs.items()
+        }
+    return args, kwargs
 
 
 class LoggerAdaptor:
@@ -25,6 +63,12 @@ class LoggerAdaptor:
     - Context management for structured logging
     - Automatic configuration reloading
     - Programmatic configuration support
+    - Level gating: calls below the logger/handler levels return before any
+      formatting, redaction or serialization; wrap expensive kwargs in
+      lazy(...) so they are only computed for emitted records
+    - Non-blocking emission: handlers with "async" in their config write
+      through a bounded buffer and a background thread (AsyncLogHandler);
+      shutdown() flushes them
 
     Usage:
     ```python
@@ -70,6 +114,7 @@ class LoggerAdaptor:
     Note: Duration logging and delayed logging are now available in separate modules:
     - utils.logging.DurationLogger for timing operations
     - utils.logging.DelayedLogger for asynchronous logging
+    - utils.logging.AsyncLogHandler for background handler writes
     """
 
     _instances = {}
@@ -186,7 +231,10 @@ class LoggerAdaptor:
 
     def _configure_logger(self, config: dict[str, Any]):
         """Configure the logger based on configuration."""
-        # Clear existing handlers
+        # Clear existing handlers (releasing shared async ones)
+        for handler in self.logger.handlers:
+            if isinstance(handler, AsyncLogHandler):
+                handler.release_shared()
         self.logger.handlers.clear()
 
         # Set log level
@@ -221,7 +269,37 @@ class LoggerAdaptor:
         handler_config: dict[str, Any],
         formatters: dict[str, logging.Formatter],
     ) -> logging.Handler | None:
-        """Create a handler from configuration."""
+        """
+        Create a handler from configuration.
+
+        Handlers with an "async" entry are shared: every logger configured
+        with the same sink writes through one AsyncLogHandler (one buffer
+        and one writer thread). The sink is built before it is wrapped, so an
+        unknown handler type yields None rather than an empty wrapper.
+        """
+        async_options = handler_config.get('async')
+        if async_options:
+            formatter = formatters.get(handler_config.get('formatter', 'default'))
+            sink_key = json.dumps(
+                [
+                    handler_config,
+                    LoggerAdaptor._config.get('log_directory'),
+                    formatter._fmt if formatter else None,
+                    formatter.datefmt if formatter else None,
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            return AsyncLogHandler.shared(
+                sink_key, lambda: self._create_sync_handler(handler_config, formatters), async_options)
+        return self._create_sync_handler(handler_config, formatters)
+
+    def _create_sync_handler(
+        self,
+        handler_config: dict[str, Any],
+        formatters: dict[str, logging.Formatter],
+    ) -> logging.Handler | None:
+        """Create the handler that writes to a configured sink."""
         handler_type = handler_config.get('type')
         formatter_name = handler_config.get('formatter', 'default')
         level_str = handler_config.get('level', 'INFO').upper()
@@ -305,8 +383,47 @@ class LoggerAdaptor:
             return redacted_message, redacted_kwargs
         return message, kwargs
 
+    def isEnabledFor(self, level: int | str) -> bool:
+        """
+        Check whether a record at `level` would reach at least one handler.
+
+        Unlike logging.Logger.isEnabledFor, this also honors handler levels
+        (e.g. logger at DEBUG with only INFO handlers is disabled for DEBUG).
+
+        Args:
+            level: Level number or name ('DEBUG', 'INFO', ...)
+
+        Returns:
+            True if the record would be emitted
+        """
+        levelno = level if isinstance(level, int) else logging.getLevelName(level.upper())
+        if not self.logger.isEnabledFor(levelno):
+            return False
+
+        # Mirror logging.Logger.callHandlers
+        found = False
+        logger = self.logger
+        while logger:
+            for handler in logger.handlers:
+                found = True
+                if levelno >= handler.level:
+                    return True
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        if not found and logging.lastResort is not None:
+            return levelno >= logging.lastResort.level
+        return False
+
     def _log_message(self, level: str, *args, **kwargs):
-        """Log message based on backend type."""
+        """Log message based on backend type (no-op for disabled levels)."""
+        if not self.isEnabledFor(level):
+            return
+        args, kwargs = resolve_lazy(args, kwargs)
+        self._emit(level, *args, **kwargs)
+
+    def _emit(self, level: str, *args, **kwargs):
+        """Format, redact and write a record without level checks."""
         message = self._format_message(*args)
         redacted_message, redacted_kwargs = self._redact_if_enabled(
             message, **kwargs)
@@ -548,7 +665,10 @@ class LoggerAdaptor:
             for handler in self.logger.handlers[:]:
                 try:
                     handler.flush()
-                    handler.close()
+                    if isinstance(handler, AsyncLogHandler):
+                        handler.release_shared()  # Closed with its last logger
+                    else:
+                        handler.close()
                     self.logger.removeHandler(handler)
                 except Exception:
                     pass
@@ -0,0 +1,165 @@
+"""
+RedactionEngine - Prefiltered chained redaction.
+
+Patterns are applied in turn, exactly like one `pattern.sub` per pattern
+(last configured first, so custom patterns override defaults), and every
+pattern sees the output of the ones before it. This is not a single scan
+over a combined alternation: an alternation keeps only the leftmost of
+overlapping matches and never rescans placeholders, so it leaks text that
+the chain redacts. What the engine saves is the regex work of patterns that
+cannot match:
+
+- Prefilter: each pattern's required literal ("password=", "@", "[redact]")
+  or required digit is derived when compiling, and the pattern is skipped
+  unless the current text contains it
+- Requirements are re-checked after every substitution, so a placeholder
+  that introduces a literal still reaches the patterns after it
+- Patterns without a derivable requirement always run
+
+A message that satisfies no requirement skips regex work entirely. Cost
+still grows with the number of patterns whose requirement is present (e.g.
+every digit-gated pattern runs on a line with a timestamp).
+
+Usage:
+    engine = RedactionEngine([(re.compile(r"token=\\S+", re.I), "token=[HIDDEN]")])
+    engine.redact("Token=abc")  # "token=[HIDDEN]"
+"""
+
+import re
+from typing import Optional
+
+try:
+    from re import _parser as _sre_parse, _constants as _sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+_DIGITS = "0123456789"
+_ANY_DIGIT = re.compile(r"\d")
+
+# Prefilter requirement kinds
+_REQUIRES_LITERAL = "literal"
+_REQUIRES_LITERAL_CI = "literal_ci"  # Lower-cased literal of an IGNORECASE pattern
+_REQUIRES_DIGIT = "digit"
+
+
+class RedactionEngine:
+    """
+    Prefiltered form of an ordered list of redaction patterns.
+
+    Attributes:
+        patterns: Patterns in configuration order, as (compiled, placeholder)
+    """
+
+    def __init__(self, patterns: list[tuple[re.Pattern, str]]):
+        self.patterns = list(patterns)
+        # (pattern, placeholder, requirement) in application order
+        self._chain: list[tuple[re.Pattern, str, Optional[tuple[str, ...]]]] = []
+        self._compile()
+
+    def redact(self, message: str) -> str:
+        """
+        Redact a string, skipping patterns whose requirement is absent.
+
+        Args:
+            message: Text to redact
+
+        Returns:
+            Redacted text (the same object if nothing can match)
+        """
+        lowered = None  # message.lower(), shared by case-insensitive checks
+        for pattern, placeholder, requirement in self._chain:
+            if requirement is not None and requirement[0] == _REQUIRES_LITERAL_CI and message.isascii():
+                if lowered is None:
+                    lowered = message.lower()
+                if requirement[1] not in lowered:
+                    continue
+            elif not _satisfies(message, requirement):
+                continue
+            redacted = pattern.sub(placeholder, message)
+            if redacted is not message:
+                message, lowered = redacted, None
+        return message
+
+    def might_match(self, message: str) -> bool:
+        """Cheap check; False means no pattern can match `message`."""
+        return any(_satisfies(message, requirement) for _, _, requirement in self._chain)
+
+    def _compile(self) -> None:
+        """Derive the prefilter requirement of every pattern."""
+        for pattern, placeholder in reversed(self.patterns):
+            requirement = _requirement(pattern)
+            if requirement is not None and requirement[0] == _REQUIRES_LITERAL and pattern.flags & re.IGNORECASE:
+                requirement = (_REQUIRES_LITERAL_CI, requirement[1].lower())
+            self._chain.append((pattern, placeholder, requirement))
+
+
+def _satisfies(message: str, requirement: Optional[tuple[str, ...]]) -> bool:
+    """Whether `message` contains what every match of a pattern must contain."""
+    if requirement is None:
+        return True
+    if requirement[0] == _REQUIRES_DIGIT:
+        # \d also matches non-ASCII digits
+        return _ANY_DIGIT.search(message) is not None
+    if requirement[0] == _REQUIRES_LITERAL_CI:
+        # Unicode case folding is not covered by the lowered literal
+        return not message.isascii() or requirement[1] in message.lower()
+    return requirement[1] in message
+
+
+def _requirement(pattern: re.Pattern) -> Optional[tuple[str, ...]]:
+    """
+    Derive something every match must contain.
+
+    Returns:
+        (_REQUIRES_LITERAL, text) for the longest mandatory literal run,
+        (_REQUIRES_DIGIT,) if every match contains a digit, or None
+    """
+    runs: list[str] = []
+    needs_digit = [False]
+    try:
+        _collect(list(_sre_parse.parse(pattern.pattern, pattern.flags)), runs, needs_digit)
+    except Exception:
+        return None
+    longest = max(runs, key=len, default="")
+    if longest:
+        return (_REQUIRES_LITERAL, longest)
+    if needs_digit[0]:
+        return (_REQUIRES_DIGIT,)
+    return None
+
+
+def _collect(items: list, runs: list[str], needs_digit: list[bool]) -> None:
+    """Collect mandatory literal runs of a parsed sequence."""
+    c = _sre_constants
+    current = ""
+    for op, value in items:
+        if op is c.LITERAL:
+            current += chr(value)
+            continue
+        if current:
+            runs.append(current)
+            current = ""
+        if op is c.SUBPATTERN:
+            if value[1] or value[2]:
+                raise ValueError("scoped flags change literal matching")
+            _collect(list(value[-1]), runs, needs_digit)
+        elif op in (c.MAX_REPEAT, c.MIN_REPEAT) and value[0] >= 1:
+            # The body occurs at least once, but runs do not continue across it
+            _collect(list(value[2]), runs, needs_digit)
+        elif op is c.IN and value and all(_is_digit_item(item) for item in value):
+            needs_digit[0] = True
+    if current:
+        runs.append(current)
+
+
+def _is_digit_item(item: tuple) -> bool:
+    op, value = item
+    c = _sre_constants
+    if op is c.CATEGORY:
+        return value is c.CATEGORY_DIGIT
+    if op is c.RANGE:
+        return ord("0") <= value[0] and value[1] <= ord("9")
+    if op is c.LITERAL:
+        return chr(value) in _DIGITS
+    return False
@@ -4,14 +4,44 @@
 import re
 from typing import Any
 
+from utils.logging.RedactionEngine import RedactionEngine
+
+# Structural fields whose values are never redacted (override with "safe_keys")
+DEFAULT_SAFE_KEYS = (
+    "timestamp",
+    "level",
+    "logger",
+    "trace_id",
+    "span_id",
+    "request_id",
+    "duration_ms",
+    "duration_seconds",
+)
+
 
 class RedactionManager:
-    """Manages data redaction based on regex patterns and special tags."""
+    """
+    Manages data redaction based on regex patterns and special tags.
+
+    Patterns are applied in turn by a RedactionEngine, which skips those
+    whose required literal is absent; it is rebuilt whenever
+    redaction_patterns changes.
+
+    Key rules for redact_data() (matched case-insensitively):
+    - safe_keys: values are returned unchanged, without scanning
+    - redact_keys: values are replaced by the placeholder entirely
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
         self.redaction_placeholder = config.get("placeholder", "[REDACTED]")
         self.redaction_patterns = self._compile_patterns()
+        self.safe_keys = frozenset(
+            key.lower() for key in config.get("safe_keys", DEFAULT_SAFE_KEYS))
+        self.redact_keys = frozenset(
+            key.lower() for key in config.get("redact_keys", ()))
+        self._engine: RedactionEngine | None = None
+        self._engine_source: tuple[tuple[re.Pattern, str], ...] = ()
 
     def _compile_patterns(self) -> list[tuple[re.Pattern, str]]:
         """Compile redaction patterns from configuration."""
@@ -76,25 +106,38 @@ class RedactionManager:
         """Apply redaction patterns to a message."""
         if not isinstance(message, str):
             return str(message)
-
-        redacted_message = message
-
-        # Apply patterns in reverse order so custom patterns override defaults
-        for pattern, placeholder in reversed(self.redaction_patterns):
-            redacted_message = pattern.sub(placeholder, redacted_message)
-
-        return redacted_message
+        return self._get_engine().redact(message)
 
     def redact_data(self, data: Any) -> Any:
         """Recursively redact data in various formats."""
+        return self._redact_value(data, self._get_engine())
+
+    def _redact_value(self, data: Any, engine: RedactionEngine) -> Any:
         if isinstance(data, str):
-            return self.redact_message(data)
+            return engine.redact(data)
         if isinstance(data, dict):
-            return {key: self.redact_data(value)
+            return {key: self._redact_item(key, value, engine)
                     for key, value in data.items()}
         if isinstance(data, list):
-            return [self.redact_data(item) for item in data]
+            return [self._redact_value(item, engine) for item in data]
         if isinstance(data, tuple):
-            return tuple(self.redact_data(item) for item in data)
+            return tuple(self._redact_value(item, engine) for item in data)
         # Convert to string and redact for other types
-        return self.redact_message(str(data))
+        return engine.redact(str(data))
+
+    def _redact_item(self, key: Any, value: Any, engine: RedactionEngine) -> Any:
+        if isinstance(key, str):
+            lowered = key.lower()
+            if lowered in self.safe_keys:
+                return value
+            if lowered in self.redact_keys:
+                return self.redaction_placeholder
+        return self._redact_value(value, engine)
+
+    def _get_engine(self) -> RedactionEngine:
+        """Get the compiled engine, rebuilding it if patterns were changed."""
+        source = tuple(self.redaction_patterns)
+        if self._engine is None or source != self._engine_source:
+            self._engine = RedactionEngine(list(source))
+            self._engine_source = source
+        return self._engine
@@ -7,13 +7,15 @@ Provides unified logging infrastructure with support for:
 - Redaction of sensitive data
 - Duration logging with decorators
 - Delayed/async logging
+- Non-blocking handler writes (AsyncLogHandler)
 - Workflow metrics collection
 
 Version: 2.0.0
 """
 
-from .LoggerAdaptor import LoggerAdaptor, WorkflowMetrics
+from .LoggerAdaptor import LoggerAdaptor, WorkflowMetrics, LazyValue, lazy
 from .DelayedLogger import DelayedLogger
+from .AsyncLogHandler import AsyncLogHandler
 from .DurationLogger import (
     DurationLogger,
     DurationContext,
@@ -24,6 +26,7 @@ from .DurationLogger import (
 )
 from .ConfigManager import ConfigManager
 from .RedactionManager import RedactionManager
+from .RedactionEngine import RedactionEngine
 from .Enum import (
     LogLevel,
     LoggingFormat,
@@ -32,6 +35,8 @@ from .Enum import (
     LogConfig,
     RedactionConfig,
     RedactionPattern,
+    OverflowPolicy,
+    DelayedOverflowPolicy,
 )
 from .workflow_decorators import (
     metrics_context,
@@ -47,8 +52,12 @@ from .workflow_decorators import (
 __all__ = [
     # Core Logger
     "LoggerAdaptor",
+    "LazyValue",
+    "lazy",
     # Delayed Logger
     "DelayedLogger",
+    # Async Handler
+    "AsyncLogHandler",
     # Duration Logger
     "DurationLogger",
     "DurationContext",
@@ -60,6 +69,7 @@ __all__ = [
     "ConfigManager",
     # Redaction
     "RedactionManager",
+    "RedactionEngine",
     # Enums
     "LogLevel",
     "LoggingFormat",
@@ -68,6 +78,8 @@ __all__ = [
     "LogConfig",
     "RedactionConfig",
     "RedactionPattern",
+    "OverflowPolicy",
+    "DelayedOverflowPolicy",
     # Workflow Metrics
     "WorkflowMetrics",
     "metrics_context",